@@ -0,0 +1,89 @@
+"""Full-game throughput for every pairing of the prebuilt decks"""
+from itertools import combinations_with_replacement
+from typing import Callable, Dict, List, Tuple
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import GameConfig, build_engine, game_seed
+from v3.models.match.game_logger import EventSink
+from v3.models.match.lockstep_kernel import LockstepBattle, np
+
+from harness import BenchResult, measure
+
+BENCH_SEED = 2024
+
+DECKS: Dict[str, Callable] = {
+    "basic_grass": BasicGrassDeck,
+    "basic_fire": BasicFireDeck,
+    "intermediate_grass": IntermediateGrassDeck,
+}
+
+
+class _DecisionCounter(EventSink):
+    """Counts the actions players choose (one "action" event per decision)"""
+
+    def __init__(self):
+        self.decisions = 0
+
+    def emit(self, turn, event, data):
+        if event == "action":
+            self.decisions += 1
+
+
+def _deck(name: str) -> Tuple[List, List[str]]:
+    builder = DECKS[name]()
+    energy_types = [getattr(Energy.Type, energy_type.upper()) for energy_type in builder.get_energy_types()]
+    return builder.get_deck(), energy_types
+
+
+def matchups() -> List[Tuple[str, str]]:
+    return list(combinations_with_replacement(DECKS, 2))
+
+
+def bench_matchup(deck1_name: str, deck2_name: str, games: int, repeat: int) -> BenchResult:
+    """Play the same seeded games `repeat` times; reports games/sec and decisions/sec"""
+    deck1, energy1 = _deck(deck1_name)
+    deck2, energy2 = _deck(deck2_name)
+    config = GameConfig(deck1, deck2, energy1, energy2)
+    counter = _DecisionCounter()
+
+    def run():
+        counter.decisions = 0
+        for i in range(games):
+            build_engine(config, game_seed(BENCH_SEED, i), events=counter).start_battle()
+
+    result = measure(f"game/{deck1_name}_vs_{deck2_name}", "games", run, ops_per_run=games, repeat=repeat)
+    decisions_per_sec = counter.decisions / result.best_seconds if result.best_seconds else 0.0
+    result.extra = {"decisions_per_game": float(f"{counter.decisions / games:.4g}"),
+                    "decisions_per_sec": float(f"{decisions_per_sec:.4g}")}
+    return result
+
+
+# Lockstep games per scalar game in a run: the kernel only pays off on large batches
+LOCKSTEP_BATCH = 500
+
+
+def bench_lockstep(deck1_name: str, deck2_name: str, games: int, repeat: int) -> BenchResult:
+    """Play one seeded batch of games on the NumPy lockstep kernel; reports games/sec and turns/sec"""
+    deck1, energy1 = _deck(deck1_name)
+    deck2, energy2 = _deck(deck2_name)
+    battle = LockstepBattle(deck1, deck2, energy1, energy2)
+    turns = []
+
+    def run():
+        turns[:] = battle.run(games, seed=BENCH_SEED).turns
+
+    result = measure(f"lockstep/{deck1_name}_vs_{deck2_name}", "games", run, ops_per_run=games, repeat=repeat)
+    turns_per_sec = sum(turns) / result.best_seconds if result.best_seconds else 0.0
+    result.extra = {"turns_per_game": float(f"{sum(turns) / games:.4g}"),
+                    "turns_per_sec": float(f"{turns_per_sec:.4g}")}
+    return result
+
+
+def run(games: int = 20, repeat: int = 3) -> List[BenchResult]:
+    results = [bench_matchup(deck1, deck2, games, repeat) for deck1, deck2 in matchups()]
+    if np is not None:
+        results.append(bench_lockstep("basic_grass", "basic_fire", games * LOCKSTEP_BATCH, repeat))
+    return results
@@ -0,0 +1,124 @@
+"""Micro-benchmarks for the hot paths behind a game: action generation, effect parsing,
+energy checks, deck setup and card import"""
+import contextlib
+import copy
+import io
+from typing import List
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.cards.energy import Energy
+from v3.models.cards.energy_math import ENERGY_ORDER
+from v3.models.match.batch_runner import GameConfig, build_engine
+from v3.models.match.effects.effect_parser import EffectParser
+
+from harness import BenchResult, measure
+
+
+def _midgame_engine(turns: int = 6):
+    """A seeded grass vs fire game played a few turns in, so players have boards and hands"""
+    config = GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                        [Energy.Type.GRASS], [Energy.Type.FIRE])
+    engine = build_engine(config, seed=11)
+    engine._setup_game()
+    while engine.turn < turns and not engine._is_game_over():
+        engine._execute_turn()
+    return engine
+
+
+def bench_get_actions(calls: int, repeat: int) -> List[BenchResult]:
+    engine = _midgame_engine()
+    player = engine._get_current_player()
+
+    def get_actions():
+        for _ in range(calls):
+            player._get_actions()
+
+    def get_legal_actions():
+        for _ in range(calls):
+            player.get_legal_actions(engine)
+
+    return [measure("micro/player_get_actions", "calls", get_actions, calls, repeat),
+            measure("micro/player_get_legal_actions", "calls", get_legal_actions, calls, repeat)]
+
+
+def _effect_texts() -> List[str]:
+    importer = JsonCardImporter.shared()
+    texts = []
+    for pokemon in importer.pokemon.values():
+        texts.extend(ability.effect for ability in pokemon.abilities if ability and ability.effect)
+        texts.extend(attack.ability.effect for attack in pokemon.attacks if attack.ability and attack.ability.effect)
+    for cards in (importer.items, importer.supporters, importer.tools):
+        texts.extend(card.ability.effect for card in cards.values() if card.ability and card.ability.effect)
+    return texts
+
+
+def bench_effect_parser(rounds: int, repeat: int) -> BenchResult:
+    texts = _effect_texts()
+
+    def parse():
+        for _ in range(rounds):
+            for text in texts:
+                EffectParser.parse_multiple(text)
+
+    return measure("micro/effect_parser_parse_multiple", "texts", parse, rounds * len(texts), repeat)
+
+
+def bench_can_afford(rounds: int, repeat: int) -> BenchResult:
+    """_can_afford_attack for every attack of every card, at a spread of attached energy"""
+    importer = JsonCardImporter.shared()
+    checks = []
+    for i, card in enumerate(importer.pokemon.values()):
+        pokemon = card.instantiate()
+        pokemon.equipped_energies[ENERGY_ORDER[i % len(ENERGY_ORDER)]] = 1 + i % 3
+        pokemon.equipped_energies[Energy.Type.GRASS] += i % 2
+        checks.extend((pokemon, attack) for attack in pokemon.attacks)
+
+    def afford():
+        for _ in range(rounds):
+            for pokemon, attack in checks:
+                pokemon._can_afford_attack(attack)
+
+    return measure("micro/can_afford_attack", "checks", afford, rounds * len(checks), repeat)
+
+
+def bench_deck_setup(decks: int, repeat: int) -> List[BenchResult]:
+    """Per-game deck setup: deepcopy (old path) against instantiate (what games use now)"""
+    deck = BasicGrassDeck().get_deck()
+
+    def deepcopy_decks():
+        for _ in range(decks):
+            copy.deepcopy(deck)
+
+    def instantiate_decks():
+        for _ in range(decks):
+            [card.instantiate() for card in deck]
+
+    return [measure("micro/deck_setup_deepcopy", "decks", deepcopy_decks, decks, repeat),
+            measure("micro/deck_setup_instantiate", "decks", instantiate_decks, decks, repeat)]
+
+
+def bench_card_import(loads: int, repeat: int) -> List[BenchResult]:
+    """JsonCardImporter load from the JSON files and from the compiled cache"""
+    JsonCardImporter.shared()  # Makes sure the cache file exists
+
+    def load(use_cache: bool):
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(loads):
+                    JsonCardImporter().import_from_json(use_cache=use_cache)
+        return run
+
+    return [measure("micro/card_import_json", "loads", load(False), loads, repeat),
+            measure("micro/card_import_cache", "loads", load(True), loads, repeat)]
+
+
+def run(scale: int = 1, repeat: int = 5) -> List[BenchResult]:
+    results = []
+    results.extend(bench_get_actions(200 * scale, repeat))
+    results.append(bench_effect_parser(20 * scale, repeat))
+    results.append(bench_can_afford(200 * scale, repeat))
+    results.extend(bench_deck_setup(200 * scale, repeat))
+    results.extend(bench_card_import(5 * scale, repeat))
+    return results
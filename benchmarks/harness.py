@@ -0,0 +1,91 @@
+"""Timing, JSON output and baseline comparison shared by the benchmark scripts"""
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class BenchResult:
+    """One benchmark: ops_per_sec is the best of `repeat` timed runs (higher is better)"""
+    name: str
+    unit: str  # What one op is, e.g. "games" or "calls"
+    ops_per_run: int
+    repeat: int
+    best_seconds: float
+    ops_per_sec: float
+    extra: Optional[Dict[str, float]] = None  # Secondary rates, e.g. decisions/sec
+
+
+def measure(name: str, unit: str, run: Callable[[], None], ops_per_run: int, repeat: int = 5,
+            setup: Optional[Callable[[], None]] = None) -> BenchResult:
+    """Time run() `repeat` times (setup() untimed before each) and keep the fastest run"""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return BenchResult(name=name, unit=unit, ops_per_run=ops_per_run, repeat=repeat,
+                       best_seconds=_round(best), ops_per_sec=_round(ops_per_run / best if best else 0.0))
+
+
+def _round(value: float) -> float:
+    """Four significant digits keeps the JSON diffable across runs"""
+    return float(f"{value:.4g}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def to_json(results: List[BenchResult]) -> Dict:
+    """Stable report: fixed schema, results sorted by name, no timestamps"""
+    return {
+        "schema": SCHEMA_VERSION,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "results": {result.name: {key: value for key, value in asdict(result).items() if key != "name"}
+                    for result in sorted(results, key=lambda r: r.name)},
+    }
+
+
+def write_json(results: List[BenchResult], path: str):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(to_json(results), file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Benchmarks slower than baseline by more than tolerance (0.10 = 10%), as report lines"""
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        before = baseline.get("results", {}).get(name)
+        if not before or not before["ops_per_sec"]:
+            continue
+        change = result["ops_per_sec"] / before["ops_per_sec"] - 1.0
+        line = f"{name}: {before['ops_per_sec']:.4g} -> {result['ops_per_sec']:.4g} {result['unit']}/s ({change:+.1%})"
+        print(("REGRESSION " if change < -tolerance else "           ") + line)
+        if change < -tolerance:
+            regressions.append(line)
+    return regressions
+
+
+def print_result(result: BenchResult):
+    line = f"{result.name:<46} {result.ops_per_sec:>12.4g} {result.unit}/s"
+    for key, value in sorted((result.extra or {}).items()):
+        line += f"  {key}={value:.4g}"
+    print(line)
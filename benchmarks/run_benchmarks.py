@@ -0,0 +1,70 @@
+"""Run the throughput benchmarks and optionally compare against a saved baseline.
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json --tolerance 0.10
+
+Exits 1 when --compare finds a benchmark slower than the baseline by more than the tolerance.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import bench_games
+import bench_micro
+from harness import compare, print_result, to_json, write_json
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulator throughput benchmarks")
+    parser.add_argument("--only", choices=["games", "micro"], help="Run one group only")
+    parser.add_argument("--games", type=int, default=20, help="Games per matchup per run (default: 20)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark; the best is kept (default: 3)")
+    parser.add_argument("--quick", action="store_true", help="Small workload for a smoke run")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier --output")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed slowdown against the baseline before failing (default: 0.10)")
+    args = parser.parse_args()
+
+    games, repeat = args.games, args.repeat
+    if args.quick:
+        games, repeat = min(games, 3), 1
+
+    results = []
+    # Importer progress output would drown the report
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            if args.only in (None, "games"):
+                results.extend(bench_games.run(games=games, repeat=repeat))
+            if args.only in (None, "micro"):
+                results.extend(bench_micro.run(repeat=repeat))
+        finally:
+            sys.stdout = stdout
+
+    for result in sorted(results, key=lambda r: r.name):
+        print_result(result)
+
+    if args.output:
+        write_json(results, args.output)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nCompared with {args.compare} (tolerance {args.tolerance:.0%}):")
+        regressions = compare(to_json(results), baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
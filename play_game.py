@@ -12,15 +12,23 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from v3.importers.json_card_importer import JsonCardImporter
 from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.game_profiler import PhaseProfiler
+from v3.models.match.game_record import GameRecorder, RecordWriter
+from v3.models.match.match_stats import mean_interval
+from v3.models.match.matchup_tables import MatchupTables
 from v3.models.match.player import Player
 from v3.models.match.game_rules import GameRules
 from v3.models.agents.random_agent import RandomAgent
 from v3.models.agents.human_agent import HumanAgent
+from v3.models.agents.ismcts_agent import ISMCTSAgent
 from v3.models.cards.energy import Energy
 from v3.models.cards.card import Card
 from v3.decks.basic_grass_deck import BasicGrassDeck
 from v3.decks.intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
 from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.deck_generators import (
+    create_aggressive_deck, create_basic_deck, create_evolution_deck, create_mixed_type_deck, infer_energy_types,
+)
 
 # Map deck names to deck classes
 DECK_MAP = {
@@ -34,252 +42,6 @@ DECK_MAP = {
 }
 
 
-def create_basic_deck(importer: JsonCardImporter, energy_type: Energy.Type, deck_size: int = 20):
-    """Create a basic deck from available Pokemon cards (max 2 copies per card)
-    Note: energy_type is used for Energy Zone generation, not for filtering Pokemon"""
-    from copy import deepcopy
-    from collections import Counter
-    
-    deck = []
-    
-    # Get all available Pokemon
-    available_pokemon = list(importer.pokemon.values())
-    
-    if not available_pokemon:
-        print("Error: No Pokemon cards found in JSON file!")
-        return None
-    
-    # Get all Basic Pokemon (don't filter by energy type - use all available)
-    basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
-    
-    if not basic_pokemon:
-        print("Error: No Basic Pokemon found!")
-        return None
-    
-    # Sort by energy type preference (prefer Pokemon matching the chosen energy type)
-    def sort_key(p):
-        if p.element == energy_type:
-            return 0  # Prefer matching energy type
-        return 1
-    
-    basic_pokemon.sort(key=sort_key)
-    
-    # Create deck with max 2 copies of each card
-    # Track how many of each card ID we've added
-    card_counts = Counter()
-    max_copies = 2
-    
-    # First pass: add up to 2 copies of each unique card
-    for pokemon in basic_pokemon:
-        card_id = pokemon.id
-        if card_counts[card_id] < max_copies:
-            copies_to_add = min(max_copies - card_counts[card_id], deck_size - len(deck))
-            for _ in range(copies_to_add):
-                deck.append(deepcopy(pokemon))
-                card_counts[card_id] += 1
-                if len(deck) >= deck_size:
-                    break
-        if len(deck) >= deck_size:
-            break
-    
-    # If we still need more cards, add more copies (but still max 2 per card)
-    # Cycle through available cards
-    while len(deck) < deck_size:
-        added_any = False
-        for pokemon in basic_pokemon:
-            card_id = pokemon.id
-            if card_counts[card_id] < max_copies and len(deck) < deck_size:
-                deck.append(deepcopy(pokemon))
-                card_counts[card_id] += 1
-                added_any = True
-                if len(deck) >= deck_size:
-                    break
-        if not added_any or len(deck) >= deck_size:
-            break
-    
-    # If still not enough cards, we need to allow more copies (but warn)
-    if len(deck) < deck_size:
-        print(f"Warning: Only {len(basic_pokemon)} unique Basic Pokemon available.")
-        print(f"Adding extra copies to reach {deck_size} cards (exceeding 2-copy limit).")
-        while len(deck) < deck_size:
-            for pokemon in basic_pokemon:
-                if len(deck) >= deck_size:
-                    break
-                deck.append(deepcopy(pokemon))
-    
-    return deck[:deck_size]
-
-
-def create_evolution_deck(importer: JsonCardImporter, base_pokemon_name: str, deck_size: int = 20):
-    """Create a deck focused on an evolution chain (e.g., Bulbasaur -> Ivysaur -> Venusaur)"""
-    from copy import deepcopy
-    from collections import Counter
-    
-    deck = []
-    available_pokemon = list(importer.pokemon.values())
-    
-    if not available_pokemon:
-        return None
-    
-    # Find the evolution chain
-    base = None
-    stage1 = []
-    stage2 = []
-    
-    for pokemon in available_pokemon:
-        if pokemon.name == base_pokemon_name and pokemon.subtype == Card.Subtype.BASIC:
-            base = pokemon
-        elif pokemon.evolves_from == base_pokemon_name:
-            if pokemon.subtype == Card.Subtype.STAGE_1:
-                stage1.append(pokemon)
-            elif pokemon.subtype == Card.Subtype.STAGE_2:
-                stage2.append(pokemon)
-    
-    if not base:
-        print(f"Error: Base Pokemon '{base_pokemon_name}' not found!")
-        return None
-    
-    # Build deck: 8-10 base, 4-6 stage1, 2-4 stage2, fill rest with base
-    card_counts = Counter()
-    max_copies = 2
-    
-    # Add base Pokemon (8-10 copies)
-    base_count = min(10, deck_size - 6)  # Leave room for evolutions
-    for _ in range(base_count):
-        if card_counts[base.id] < max_copies * 5:  # Allow more base Pokemon
-            deck.append(deepcopy(base))
-            card_counts[base.id] += 1
-    
-    # Add Stage 1 (4-6 copies)
-    if stage1:
-        stage1_pokemon = stage1[0]
-        stage1_count = min(6, deck_size - len(deck) - 2)
-        for _ in range(stage1_count):
-            if card_counts[stage1_pokemon.id] < max_copies * 3:
-                deck.append(deepcopy(stage1_pokemon))
-                card_counts[stage1_pokemon.id] += 1
-    
-    # Add Stage 2 (2-4 copies)
-    if stage2:
-        stage2_pokemon = stage2[0]
-        stage2_count = min(4, deck_size - len(deck))
-        for _ in range(stage2_count):
-            if card_counts[stage2_pokemon.id] < max_copies * 2:
-                deck.append(deepcopy(stage2_pokemon))
-                card_counts[stage2_pokemon.id] += 1
-    
-    # Fill remaining with base Pokemon
-    while len(deck) < deck_size:
-        deck.append(deepcopy(base))
-    
-    return deck[:deck_size]
-
-
-def create_mixed_type_deck(importer: JsonCardImporter, energy_types: list[Energy.Type], deck_size: int = 20):
-    """Create a deck with multiple energy types"""
-    from copy import deepcopy
-    from collections import Counter
-    
-    deck = []
-    available_pokemon = list(importer.pokemon.values())
-    
-    if not available_pokemon:
-        return None
-    
-    # Get Basic Pokemon of any specified type
-    basic_pokemon = []
-    for energy_type in energy_types:
-        matching = [p for p in available_pokemon 
-                   if p.subtype == Card.Subtype.BASIC and p.element == energy_type]
-        basic_pokemon.extend(matching)
-    
-    if not basic_pokemon:
-        basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
-    
-    if not basic_pokemon:
-        return None
-    
-    # Create deck with max 2 copies per card
-    card_counts = Counter()
-    max_copies = 2
-    
-    # Distribute cards across types
-    cards_per_type = deck_size // len(energy_types) if energy_types else deck_size
-    
-    for energy_type in energy_types:
-        type_pokemon = [p for p in basic_pokemon if p.element == energy_type]
-        for pokemon in type_pokemon:
-            if len(deck) >= deck_size:
-                break
-            if card_counts[pokemon.id] < max_copies:
-                copies = min(max_copies - card_counts[pokemon.id], deck_size - len(deck))
-                for _ in range(copies):
-                    deck.append(deepcopy(pokemon))
-                    card_counts[pokemon.id] += 1
-    
-    # Fill remaining slots
-    while len(deck) < deck_size:
-        for pokemon in basic_pokemon:
-            if len(deck) >= deck_size:
-                break
-            if card_counts[pokemon.id] < max_copies:
-                deck.append(deepcopy(pokemon))
-                card_counts[pokemon.id] += 1
-    
-    return deck[:deck_size]
-
-
-def create_aggressive_deck(importer: JsonCardImporter, energy_type: Energy.Type, deck_size: int = 20):
-    """Create an aggressive deck focused on high-damage Pokemon"""
-    from copy import deepcopy
-    from collections import Counter
-    
-    deck = []
-    available_pokemon = list(importer.pokemon.values())
-    
-    if not available_pokemon:
-        return None
-    
-    # Filter for Basic Pokemon with attacks that do damage
-    basic_pokemon = [
-        p for p in available_pokemon 
-        if p.subtype == Card.Subtype.BASIC and p.element == energy_type
-    ]
-    
-    if not basic_pokemon:
-        basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
-    
-    # Sort by attack damage (highest first)
-    def get_max_damage(pokemon):
-        if pokemon.attacks:
-            return max((a.damage for a in pokemon.attacks), default=0)
-        return 0
-    
-    basic_pokemon.sort(key=get_max_damage, reverse=True)
-    
-    # Create deck prioritizing high-damage Pokemon
-    card_counts = Counter()
-    max_copies = 2
-    
-    for pokemon in basic_pokemon:
-        if len(deck) >= deck_size:
-            break
-        if card_counts[pokemon.id] < max_copies:
-            copies = min(max_copies - card_counts[pokemon.id], deck_size - len(deck))
-            for _ in range(copies):
-                deck.append(deepcopy(pokemon))
-                card_counts[pokemon.id] += 1
-    
-    # Fill remaining
-    while len(deck) < deck_size:
-        for pokemon in basic_pokemon:
-            if len(deck) >= deck_size:
-                break
-            deck.append(deepcopy(pokemon))
-    
-    return deck[:deck_size]
-
-
 def print_game_state(engine: BattleEngine):
     """Print current game state"""
     current = engine._get_current_player()
@@ -347,6 +109,24 @@ Examples:
 
   # Run multiple simulations
   python3 play_game.py --simulations 10
+
+  # Reproducible run
+  python3 play_game.py --simulations 100 --seed 42
+
+  # Spread a large batch across 8 processes
+  python3 play_game.py --simulations 100000 --workers 8
+
+  # Up to 10000 games, stopping once every win rate is known to ±2%
+  python3 play_game.py --deck1_type grass --deck2_type fire --simulations 10000 --precision 0.02 --workers 8
+
+  # Seat-balanced score of Player 1's deck: each of 2000 tapes played with the seats both ways
+  python3 play_game.py --deck1_type grass --deck2_type fire --simulations 2000 --paired
+
+  # Does the search agent beat RandomAgent with this deck? Both arms play the same tapes
+  python3 play_game.py --deck1_type grass --deck2_type fire --simulations 500 --paired --compare-player1 ismcts
+
+  # Win rates from a million games on the NumPy lockstep kernel
+  python3 play_game.py --deck1_type grass --deck2_type fire --simulations 1000000 --lockstep
         """
     )
     
@@ -366,15 +146,15 @@ Examples:
     
     parser.add_argument(
         "--player1", 
-        choices=["human", "random"], 
+        choices=["human", "random", "ismcts"], 
         default="random",
-        help="Player 1 agent type (default: random)"
+        help="Player 1 agent type (default: random; ismcts searches each decision)"
     )
     parser.add_argument(
         "--player2", 
-        choices=["human", "random"], 
+        choices=["human", "random", "ismcts"], 
         default="random",
-        help="Player 2 agent type (default: random)"
+        help="Player 2 agent type (default: random; ismcts searches each decision)"
     )
     parser.add_argument(
         "--simulations",
@@ -382,11 +162,75 @@ Examples:
         default=1,
         help="Number of games to simulate (default: 1)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run simulations across N processes (default: run serially in this process)"
+    )
+    parser.add_argument(
+        "--lockstep",
+        action="store_true",
+        help="Play AI vs AI simulations all at once on the NumPy lockstep kernel. Both seats play "
+             "the kernel's fixed greedy policy, so the win rates are a separate metric, not comparable "
+             "with normal games; decks with cards the kernel does not support are refused"
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        default=None,
+        help="Stop early once every outcome rate's 95%% interval is within ± this (e.g. 0.02)"
+    )
+    parser.add_argument(
+        "--sprt",
+        type=float,
+        default=None,
+        metavar="DELTA",
+        help="Stop early once an SPRT of 50%%-DELTA vs 50%%+DELTA Player 1 decisive wins decides"
+    )
+    parser.add_argument(
+        "--min-games",
+        type=int,
+        default=100,
+        help="Games to play before --precision or --sprt may stop the run (default: 100)"
+    )
+    parser.add_argument(
+        "--paired",
+        action="store_true",
+        help="Play each game's randomness tape twice with the seats swapped and report Player 1's "
+             "deck score (win 1, draw 0.5) with its 95%% interval"
+    )
+    parser.add_argument(
+        "--compare-player1",
+        choices=["random", "ismcts"],
+        default=None,
+        metavar="AGENT",
+        help="With --paired, also play Player 1's deck as AGENT on the same tapes and report the "
+             "score difference (random or ismcts)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible games (default: random)"
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
         help="Enable debug output"
     )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="Time game phases, actions and effects and write the totals as JSON to PATH"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="Write a game record of every game to PATH as NDJSON (gzip-compressed for .gz)"
+    )
     parser.add_argument(
         "--energy1",
         choices=["Grass", "Fire", "Water", "Electric", "Lightning", "Psychic", "Rock", "Fighting", "Dark", "Darkness", "Metal", "Normal"],
@@ -413,12 +257,20 @@ Examples:
     )
     
     args = parser.parse_args()
+    adaptive = args.precision is not None or args.sprt is not None
+    if adaptive and args.lockstep:
+        parser.error("--precision and --sprt stop normal game batches, not --lockstep")
+    if args.paired and (adaptive or args.lockstep or args.profile or args.record):
+        parser.error("--paired cannot be combined with --precision, --sprt, --lockstep, --profile or --record")
+    if args.compare_player1 and not args.paired:
+        parser.error("--compare-player1 needs --paired")
+    if args.paired and "human" in (args.player1, args.player2):
+        parser.error("--paired plays AI vs AI games only")
     
     # Load cards from JSON
     print("Loading cards from JSON...")
-    importer = JsonCardImporter()
     try:
-        importer.import_from_json()
+        importer = JsonCardImporter.shared()
         print(f"✓ Loaded {len(importer.pokemon)} Pokemon cards")
     except Exception as e:
         print(f"Error loading cards: {e}")
@@ -508,21 +360,7 @@ Examples:
     # Determine actual energy types needed for deck1 based on Pokemon in deck
     # (only if not already set by pre-built deck)
     if energy1_types is None:
-        deck1_energy_types = set()
-        for card in deck1:
-            if hasattr(card, 'element'):
-                deck1_energy_types.add(card.element)
-        # Always include Normal for Colorless costs
-        deck1_energy_types.add(Energy.Type.NORMAL)
-        # Use the most common type, or fall back to chosen type
-        if deck1_energy_types:
-            energy1_type = max(deck1_energy_types, key=lambda e: sum(1 for c in deck1 if hasattr(c, 'element') and c.element == e))
-            if Energy.Type.NORMAL in deck1_energy_types and len(deck1_energy_types) > 1:
-                deck1_energy_types.remove(Energy.Type.NORMAL)
-                energy1_type = list(deck1_energy_types)[0] if deck1_energy_types else Energy.Type.NORMAL
-            energy1_types = [energy1_type, Energy.Type.NORMAL] if energy1_type != Energy.Type.NORMAL else [Energy.Type.NORMAL]
-        else:
-            energy1_types = [energy1_type, Energy.Type.NORMAL]
+        energy1_types = infer_energy_types(deck1)
     
     # Player 2 deck
     if deck2_name and deck2_name.lower() in DECK_MAP:
@@ -589,47 +427,118 @@ Examples:
     # Determine actual energy types needed for deck2 based on Pokemon in deck
     # (only if not already set by pre-built deck)
     if energy2_types is None:
-        deck2_energy_types = set()
-        for card in deck2:
-            if hasattr(card, 'element'):
-                deck2_energy_types.add(card.element)
-        # Always include Normal for Colorless costs
-        deck2_energy_types.add(Energy.Type.NORMAL)
-        # Use the most common type, or fall back to chosen type
-        if deck2_energy_types:
-            energy2_type = max(deck2_energy_types, key=lambda e: sum(1 for c in deck2 if hasattr(c, 'element') and c.element == e))
-            if Energy.Type.NORMAL in deck2_energy_types and len(deck2_energy_types) > 1:
-                deck2_energy_types.remove(Energy.Type.NORMAL)
-                energy2_type = list(deck2_energy_types)[0] if deck2_energy_types else Energy.Type.NORMAL
-            energy2_types = [energy2_type, Energy.Type.NORMAL] if energy2_type != Energy.Type.NORMAL else [Energy.Type.NORMAL]
-        else:
-            energy2_types = [energy2_type, Energy.Type.NORMAL]
+        energy2_types = infer_energy_types(deck2)
     
     print(f"✓ Decks created (20 cards each)")
     print(f"  Player 1 energy types: {[str(e) for e in energy1_types]}")
     print(f"  Player 2 energy types: {[str(e) for e in energy2_types]}\n")
     
     # Create agents
-    agent1_class = HumanAgent if args.player1 == "human" else RandomAgent
-    agent2_class = HumanAgent if args.player2 == "human" else RandomAgent
+    agent_classes = {"human": HumanAgent, "random": RandomAgent, "ismcts": ISMCTSAgent}
+    agent1_class = agent_classes[args.player1]
+    agent2_class = agent_classes[args.player2]
     
     # Run simulations
     results = {"Player 1": 0, "Player 2": 0, "Draw": 0}
+    profiler = PhaseProfiler() if args.profile else None
+    record_writer = RecordWriter(args.record) if args.record else None
+    
+    # Lockstep, adaptive and parallel batch modes (AI vs AI only - human games need this terminal)
+    lockstep = args.lockstep and args.player1 != "human" and args.player2 != "human"
+    adaptive = adaptive and args.player1 != "human" and args.player2 != "human"
+    parallel = (bool(args.workers) or adaptive) and not lockstep and args.player1 != "human" and args.player2 != "human"
+    if args.paired:
+        from v3.models.match.batch_runner import GameConfig, run_paired
+        config = GameConfig(deck1, deck2, energy1_types, energy2_types, agent1=agent1_class, agent2=agent2_class)
+        config_b = None
+        if args.compare_player1:
+            config_b = GameConfig(deck1, deck2, energy1_types, energy2_types,
+                                  agent1=agent_classes[args.compare_player1], agent2=agent2_class)
+        print(f"Playing {args.simulations} tapes with the seats swapped...")
+        paired = run_paired(config, args.simulations, seed=args.seed, workers=args.workers or 1, config_b=config_b)
+        low, high = mean_interval(paired.scores_a)
+        print(f"\nPlayer 1 deck as {args.player1}: score {paired.score_a:.3f} "
+              f"(95% interval {low:.3f}-{high:.3f}) over {2 * paired.tapes} games")
+        if config_b is not None:
+            low, high = mean_interval(paired.scores_b)
+            print(f"Player 1 deck as {args.compare_player1}: score {paired.score_b:.3f} "
+                  f"(95% interval {low:.3f}-{high:.3f}) over {2 * paired.tapes} games")
+            low, high = paired.interval()
+            unpaired_low, unpaired_high = paired.unpaired_interval()
+            print(f"Difference: {paired.difference:+.3f} (paired 95% interval {low:+.3f} to {high:+.3f}; "
+                  f"independent games would give {unpaired_low:+.3f} to {unpaired_high:+.3f})")
+        return 0
     
-    for sim in range(args.simulations):
+    if lockstep:
+        from v3.models.match.exceptions import UnsupportedMatchupError
+        from v3.models.match.lockstep_kernel import simulate_matchup
+        print(f"Running {args.simulations} simulations on the lockstep kernel...")
+        try:
+            lockstep_result = simulate_matchup(deck1, deck2, energy1_types, energy2_types, args.simulations,
+                                               seed=args.seed)
+        except UnsupportedMatchupError as e:
+            # Normal games follow another policy, so they are not a stand-in for kernel results
+            print(f"Error: {e}")
+            print("Run without --lockstep to play these decks as normal games.")
+            return 1
+        results = lockstep_result.counts()
+    elif parallel:
+        from v3.models.match.batch_runner import (BatchRunner, GameConfig, merge_game_profiles, merge_results,
+                                                  write_game_records)
+        config = GameConfig(deck1, deck2, energy1_types, energy2_types,
+                            agent1=agent1_class, agent2=agent2_class, profile=profiler is not None,
+                            record=record_writer is not None)
+        runner = BatchRunner(config, workers=args.workers or 1, seed=args.seed)
+        print(f"Running {'up to ' if adaptive else ''}{args.simulations} simulations on {runner.workers} workers...")
+        if adaptive:
+            from v3.models.match.match_stats import SequentialStop
+            game_results = []
+            stop = SequentialStop(precision=args.precision, sprt_delta=args.sprt, min_games=args.min_games)
+            adaptive_result = runner.run_adaptive(args.simulations, stop, on_result=game_results.append)
+            if record_writer is not None:
+                for _ in write_game_records(game_results, record_writer):
+                    pass
+            results = adaptive_result.counts
+            if adaptive_result.stopped_by:
+                print(f"Stopped after {adaptive_result.games} games ({adaptive_result.stopped_by}), "
+                      f"{adaptive_result.games_saved} games saved")
+            else:
+                print(f"No early stop: all {adaptive_result.games} games played")
+            for key, (low, high) in adaptive_result.intervals().items():
+                print(f"  {key}: {100 * results[key] / adaptive_result.games:.1f}% "
+                      f"(95% interval {100 * low:.1f}-{100 * high:.1f}%)")
+        else:
+            game_results = runner.iter_results(args.simulations)
+            if record_writer is not None:
+                game_results = write_game_records(game_results, record_writer)
+            game_results = list(game_results)
+            results = merge_results(game_results)
+        if profiler is not None:
+            profiler.merge(merge_game_profiles(game_results))
+    
+    for sim in range(0 if lockstep or parallel else args.simulations):
         if args.simulations > 1:
             print(f"\n{'='*60}")
             print(f"Simulation {sim + 1}/{args.simulations}")
             print(f"{'='*60}\n")
         
         # Create fresh players for each simulation
-        # Use deepcopy to ensure each simulation has independent card instances
-        from copy import deepcopy
-        player1 = Player("Player 1", deepcopy(deck1), energy1_types, agent=agent1_class)
-        player2 = Player("Player 2", deepcopy(deck2), energy2_types, agent=agent2_class)
+        # Fresh card instances per simulation (card definitions are shared)
+        player1 = Player("Player 1", [card.instantiate() for card in deck1], energy1_types, agent=agent1_class)
+        player2 = Player("Player 2", [card.instantiate() for card in deck2], energy2_types, agent=agent2_class)
         
-        # Create battle engine
-        engine = BattleEngine(player1, player2, debug=args.debug)
+        # Create battle engine (game i of a seeded batch always gets the same seed,
+        # matching what --workers would give it)
+        seed = None
+        if args.seed is not None:
+            from v3.models.match.batch_runner import game_seed
+            seed = game_seed(args.seed, sim)
+        recorder = None
+        if record_writer is not None:
+            recorder = GameRecorder(record_writer, meta={"game": sim, "agents": [agent1_class.__name__,
+                                                                               agent2_class.__name__]})
+        engine = BattleEngine(player1, player2, debug=args.debug, seed=seed, events=recorder,
+                              matchups=MatchupTables.for_decks(deck1, deck2), profiler=profiler)
         
         # Run battle
         if args.simulations == 1 and (args.player1 == "human" or args.player2 == "human"):
@@ -678,15 +587,27 @@ Examples:
                 print(f"{'='*60}\n")
     
     # Print summary
-    if args.simulations > 1:
+    if args.simulations > 1 or lockstep or parallel:
         print(f"\n{'='*60}")
         print("Simulation Results:")
+        if lockstep:
+            print(f"(engine: {lockstep_result.engine} - greedy-policy win rates, not comparable with "
+                  f"normal RandomAgent games)")
         print(f"{'='*60}")
         print(f"Player 1 wins: {results['Player 1']}")
         print(f"Player 2 wins: {results['Player 2']}")
         print(f"Draws: {results['Draw']}")
         print(f"{'='*60}\n")
     
+    if record_writer is not None:
+        record_writer.close()
+        print(f"{record_writer.count} game records written to {args.record}")
+    
+    if profiler is not None:
+        profiler.to_json(args.profile)
+        print(profiler.report())
+        print(f"\nProfile written to {args.profile}")
+    
     return 0
 
 
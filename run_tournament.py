@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Round-robin tournament over every registered deck: a win-rate matrix with confidence intervals.
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from v3.decks.registry import build_registered_decks, registered_deck_names
+from v3.models.agents.ismcts_agent import ISMCTSAgent
+from v3.models.agents.random_agent import RandomAgent
+from v3.models.match.match_stats import SequentialStop
+from v3.models.match.tournament import Entrant, Tournament
+
+AGENTS = {"random": RandomAgent, "ismcts": ISMCTSAgent}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play every registered deck against every other deck",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 200 games per pairing on 8 processes
+  python3 run_tournament.py --games 200 --workers 8 --seed 1
+
+  # A subset of decks, saved as JSON
+  python3 run_tournament.py --decks basic_grass basic_fire generated_aggressive_fire --output matrix.json
+
+  # Up to 2000 games per pairing, each stopping once its win rates are known to ±3%
+  python3 run_tournament.py --games 2000 --precision 0.03 --workers 8
+        """
+    )
+    parser.add_argument("--decks", nargs="+", choices=registered_deck_names(), default=None,
+                        help="Decks to include (default: all registered decks)")
+    parser.add_argument("--games", type=int, default=100, help="Games per pairing (default: 100)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible matrix (default: random)")
+    parser.add_argument("--mirrors", action="store_true", help="Also play each deck against itself")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Games per scheduled task")
+    parser.add_argument("--schedule", choices=Tournament.SCHEDULES, default="uncertainty",
+                        help="uncertainty: widest confidence interval first (default); fixed: pairing order")
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="random",
+                        help="Agent on both seats (default: random; ismcts searches each decision)")
+    parser.add_argument("--precision", type=float, default=None,
+                        help="Stop a pairing once every outcome rate's 95%% interval is within ± this (e.g. 0.03)")
+    parser.add_argument("--sprt", type=float, default=None, metavar="DELTA",
+                        help="Stop a pairing once an SPRT of 50%%-DELTA vs 50%%+DELTA decisive wins decides")
+    parser.add_argument("--min-games", type=int, default=100,
+                        help="Games a pairing plays before it may stop early (default: 100)")
+    parser.add_argument("--output", metavar="PATH", default=None, help="Write the matrix as JSON to PATH")
+    args = parser.parse_args()
+
+    decks = build_registered_decks(args.decks)
+    entrants = [Entrant(name, deck, energy_types) for name, (deck, energy_types) in decks.items()]
+    if len(entrants) < 2 and not args.mirrors:
+        print("Need at least two decks")
+        return 1
+
+    stop = None
+    if args.precision is not None or args.sprt is not None:
+        stop = SequentialStop(precision=args.precision, sprt_delta=args.sprt, min_games=args.min_games)
+    tournament = Tournament(entrants, games_per_pairing=args.games, workers=args.workers, seed=args.seed,
+                            mirrors=args.mirrors, chunk_size=args.chunk_size, schedule=args.schedule,
+                            agent1=AGENTS[args.agent], agent2=AGENTS[args.agent], stop=stop)
+    total = len(tournament.pairs) * args.games
+    print(f"Playing {len(tournament.pairs)} pairings x {args.games} games on {tournament.workers} workers "
+          f"(seed {tournament.seed})...")
+
+    def progress(running: Tournament):
+        played = sum(pairing.games for pairing in running.results)
+        print(f"\r  {played}/{total} games", end="", flush=True)
+
+    result = tournament.run(progress=progress)
+    print("\n\nRow deck's win rate against column deck (draws count half), ± 95% interval half-width:\n")
+    print(result.format_table())
+    if stop is not None:
+        stopped = sum(1 for pairing in result.pairings.values() if pairing.stopped_by)
+        print(f"\n{stopped}/{len(result.pairings)} pairings stopped early: {result.total_games()} games played, "
+              f"{result.games_saved()} of {total} saved")
+
+    if args.output:
+        result.to_json(args.output)
+        print(f"\nMatrix written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,8 +18,8 @@ class MockBattleEngine:
     def __init__(self):
         self.logs = []
     
-    def log(self, message):
-        self.logs.append(message)
+    def log(self, message, *args):
+        self.logs.append(message % args if args else message)
     
     def _handle_knockout(self, pokemon, player):
         pass
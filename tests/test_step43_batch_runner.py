@@ -0,0 +1,46 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import BatchRunner, GameConfig, merge_results
+
+
+def _create_config():
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    return GameConfig(grass.get_deck(), fire.get_deck(),
+                      [Energy.Type.GRASS], [Energy.Type.FIRE])
+
+
+def test_batch_runner_summary():
+    """Test that a parallel batch tallies every game into the summary"""
+    runner = BatchRunner(_create_config(), workers=2, seed=1234, chunk_size=3)
+    results = runner.run(10)
+
+    assert set(results.keys()) == {"Player 1", "Player 2", "Draw"}
+    assert sum(results.values()) == 10
+
+    print("✓ Batch runner summary test passed")
+    return True
+
+
+def test_batch_runner_worker_count_independent():
+    """Test that per-game seeds give the same results for any worker count"""
+    config = _create_config()
+    serial = sorted(BatchRunner(config, workers=1, seed=99).iter_results(6), key=lambda r: r.game_index)
+    parallel = sorted(BatchRunner(config, workers=2, seed=99, chunk_size=2).iter_results(6),
+                      key=lambda r: r.game_index)
+
+    assert [r.game_index for r in parallel] == list(range(6))
+    assert [(r.seed, r.winner, r.turns) for r in serial] == [(r.seed, r.winner, r.turns) for r in parallel]
+    assert merge_results(serial) == merge_results(parallel)
+
+    print("✓ Batch runner worker count test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_batch_runner_summary() and test_batch_runner_worker_count_independent()
+    exit(0 if success else 1)
@@ -0,0 +1,60 @@
+import sys
+import random
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+
+
+def _create_seeded_engine(seed):
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    player1 = Player("Player 1", grass.get_deck(), [Energy.Type.GRASS])
+    player2 = Player("Player 2", fire.get_deck(), [Energy.Type.FIRE])
+    return BattleEngine(player1, player2, debug=False, seed=seed)
+
+
+def _play_seeded_game(seed, engine=None):
+    engine = engine or _create_seeded_engine(seed)
+    player1, player2 = engine.players
+    winner = engine.start_battle()
+    return (
+        engine.first_player_index,
+        winner.name if winner else None,
+        engine.turn,
+        player1.points,
+        player2.points,
+        [card.id for card in player1.discard_pile],
+        [card.id for card in player2.discard_pile],
+    )
+
+
+def test_same_seed_same_game():
+    """Test that two engines with the same seed play the identical game"""
+    for seed in (1, 2, 3):
+        assert _play_seeded_game(seed) == _play_seeded_game(seed)
+
+    print("✓ Same seed same game test passed")
+    return True
+
+
+def test_seeded_game_leaves_global_random_alone():
+    """Test that a seeded game does not consume the module-level random stream"""
+    engine = _create_seeded_engine(11)
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    _play_seeded_game(11, engine)
+    assert random.random() == expected
+
+    print("✓ Global random isolation test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_same_seed_same_game() and test_seeded_game_leaves_global_random_alone()
+    exit(0 if success else 1)
@@ -0,0 +1,37 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.models.cards.ability import Ability
+from v3.models.match.effects import EffectParser, HealEffect
+
+
+def test_ability_effects_compiled_once():
+    """Test that effect text is parsed once and shared between abilities"""
+    text = "Heal 20 damage from this Pokémon."
+    first = Ability("Heal", text, None, None)
+    second = Ability("Heal", text, None, None)
+
+    effects = first.effects
+    assert isinstance(effects, tuple)
+    assert len(effects) == 1 and isinstance(effects[0], HealEffect)
+    # Memoized on the ability and shared through the parser cache
+    assert first.effects is effects
+    assert second.effects is effects
+    assert EffectParser.compile(text) is effects
+
+    print("✓ Compiled ability effects test passed")
+    return True
+
+
+def test_empty_effect_text():
+    """Test that abilities without effect text compile to no effects"""
+    assert Ability("Nothing", None, None, None).effects == ()
+    assert EffectParser.compile("") == ()
+
+    print("✓ Empty effect text test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_ability_effects_compiled_once() and test_empty_effect_text()
+    exit(0 if success else 1)
@@ -0,0 +1,68 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+from v3.models.match.actions import (
+    Action, ActionType, AttackAction, EndTurnAction, PlayPokemonAction, decode_action, parse_action,
+)
+
+
+def _create_engine(seed=5):
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    player1 = Player("Player 1", grass.get_deck(), [Energy.Type.GRASS])
+    player2 = Player("Player 2", fire.get_deck(), [Energy.Type.FIRE])
+    engine = BattleEngine(player1, player2, debug=False, seed=seed)
+    engine._setup_game()
+    return engine
+
+
+def test_legal_actions_are_validated_objects():
+    """Test that get_legal_actions yields valid Action objects with end turn last"""
+    engine = _create_engine()
+    player = engine.players[engine.first_player_index]
+
+    actions = player.get_legal_actions(engine)
+    assert actions and all(isinstance(a, Action) for a in actions)
+    assert isinstance(actions[-1], EndTurnAction)
+    for action in actions[:-1]:
+        is_valid, error = action.validate(player, engine)
+        assert is_valid, error
+
+    # Attacks always come first
+    types = [a.action_type for a in actions]
+    attack_count = types.count(ActionType.ATTACK)
+    assert all(t == ActionType.ATTACK for t in types[:attack_count])
+
+    print("✓ Legal action objects test passed")
+    return True
+
+
+def test_action_encoding_round_trip():
+    """Test that every legal action survives encode/decode and string parsing"""
+    engine = _create_engine()
+    for player in engine.players:
+        for actions in (player._generate_turn_zero_actions(), player._generate_actions()):
+            codes = [action.encode(player) for action in actions]
+            for action, code in zip(actions, codes):
+                assert isinstance(code, int)
+                assert decode_action(code, player).to_string() == action.to_string()
+                assert parse_action(action.to_string(), player).to_string() == action.to_string()
+            # Distinct actions get distinct codes
+            assert len(set(codes)) == len(codes)
+
+    assert AttackAction(0).encode() != AttackAction(1).encode()
+    assert PlayPokemonAction("x", "active", hand_index=2).encode() != \
+        PlayPokemonAction("x", "bench", hand_index=2).encode()
+
+    print("✓ Action encoding round trip test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_legal_actions_are_validated_objects() and test_action_encoding_round_trip()
+    exit(0 if success else 1)
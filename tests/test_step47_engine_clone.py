@@ -0,0 +1,92 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+
+
+def _create_engine(seed):
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    player1 = Player("Player 1", grass.get_deck(), [Energy.Type.GRASS])
+    player2 = Player("Player 2", fire.get_deck(), [Energy.Type.FIRE])
+    engine = BattleEngine(player1, player2, debug=False, seed=seed)
+    engine._setup_game()
+    return engine
+
+
+def _play_out(engine):
+    while not engine._is_game_over():
+        engine._execute_turn()
+    winner = engine._determine_winner()
+    return (
+        winner.name if winner else None,
+        engine.turn,
+        [p.points for p in engine.players],
+        [[c.id for c in p.discard_pile] for p in engine.players],
+    )
+
+
+def _advance(engine, turns):
+    for _ in range(turns):
+        if engine._is_game_over():
+            break
+        engine._execute_turn()
+
+
+def test_clone_is_independent():
+    """Test that a clone plays the same game without touching the original"""
+    engine = _create_engine(21)
+    _advance(engine, 6)
+
+    seat = next(i for i, p in enumerate(engine.players) if p.active_pokemon)
+    clone = engine.clone()
+    assert clone.players[seat] is not engine.players[seat]
+    assert clone.players[seat].agent.player is clone.players[seat]
+    active = engine.players[seat].active_pokemon
+    assert clone.players[seat].active_pokemon is not active
+    assert clone.players[seat].active_pokemon.attacks is active.attacks  # Card data is shared
+
+    turn, damage = engine.turn, active.damage_taken
+    energies = dict(active.equipped_energies)
+    hand = [c.id for c in engine.players[seat].cards_in_hand]
+    clone_result = _play_out(clone)
+
+    assert engine.turn == turn
+    assert active.damage_taken == damage
+    assert active.equipped_energies == energies
+    assert [c.id for c in engine.players[seat].cards_in_hand] == hand
+
+    # Random streams were copied too, so the original plays out the same way
+    assert _play_out(engine) == clone_result
+
+    print("✓ Clone independence test passed")
+    return True
+
+
+def test_snapshot_restore():
+    """Test that restore rewinds the engine in place and the snapshot can be reused"""
+    engine = _create_engine(8)
+    _advance(engine, 4)
+    player1 = engine.players[0]
+
+    snapshot = engine.snapshot()
+    first = _play_out(engine)
+
+    engine.restore(snapshot)
+    assert engine.players[0] is player1 and player1.agent.player is player1
+    assert _play_out(engine) == first
+
+    engine.restore(snapshot)
+    assert _play_out(engine) == first
+
+    print("✓ Snapshot restore test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_clone_is_independent() and test_snapshot_restore()
+    exit(0 if success else 1)
@@ -0,0 +1,80 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+from v3.models.match.state_encoder import np, StateEncoder, STATE_SIZE
+import v2.game.ids.state as layout
+
+
+def _create_engine(seed):
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    player1 = Player("Player 1", grass.get_deck(), [Energy.Type.GRASS])
+    player2 = Player("Player 2", fire.get_deck(), [Energy.Type.FIRE])
+    engine = BattleEngine(player1, player2, debug=False, seed=seed)
+    engine._setup_game()
+    for _ in range(5):
+        if not engine._is_game_over():
+            engine._execute_turn()
+    return engine
+
+
+def test_encode_follows_layout():
+    """Test that the encoder writes v3 game values at the v2 layout indices"""
+    if np is None:
+        print("⚠ numpy not installed - skipping state encoder test")
+        return True
+
+    encoder = StateEncoder()
+    engine = _create_engine(3)
+    player = engine._get_current_player()
+    opponent = engine._get_opponent(player)
+    state = encoder.encode(engine, player)
+
+    assert state.shape == (STATE_SIZE,) and state.dtype == np.float32
+    active = player.active_pokemon
+    assert state[layout.pa_pokemon_id] == encoder.card_index[active.id]
+    assert state[layout.pa_pokemon_damage_taken] == active.damage_taken
+    assert state[layout.pa_pokemon_max_hp] == active.max_health()
+    assert state[layout.pa_pokemon_energy_grass] == active.equipped_energies["grass"]
+    if opponent.active_pokemon:
+        assert state[layout.oa_pokemon_id] == encoder.card_index[opponent.active_pokemon.id]
+    else:
+        assert state[layout.oa_pokemon_id] == 0
+    assert state[layout.p_hand_card_count] == len(player.cards_in_hand)
+    assert state[layout.o_deck_card_count] == len(opponent.deck)
+    assert state[layout.p_score] == player.points
+    assert state[layout.turn_number] == engine.turn
+
+    # Encoding again into the same buffer gives the same values
+    assert np.array_equal(encoder.encode(engine, player, out=state.copy()), state)
+
+    print("✓ State encoder layout test passed")
+    return True
+
+
+def test_encode_batch():
+    """Test that batch encoding matches encoding each engine on its own"""
+    if np is None:
+        print("⚠ numpy not installed - skipping state encoder test")
+        return True
+
+    encoder = StateEncoder()
+    engines = [_create_engine(seed) for seed in (1, 2, 3)]
+    batch = encoder.encode_batch(engines)
+
+    assert batch.shape == (3, STATE_SIZE) and batch.dtype == np.float32
+    for row, engine in zip(batch, engines):
+        assert np.array_equal(row, encoder.encode(engine))
+
+    print("✓ State encoder batch test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_encode_follows_layout() and test_encode_batch()
+    exit(0 if success else 1)
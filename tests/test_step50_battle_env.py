@@ -0,0 +1,83 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import GameConfig
+from v3.models.match.battle_env import BattleEnv, VectorEnv, np
+from v3.models.match.state_encoder import STATE_SIZE
+
+
+def _create_config():
+    grass = BasicGrassDeck()
+    fire = BasicFireDeck()
+    return GameConfig(grass.get_deck(), fire.get_deck(), [Energy.Type.GRASS], [Energy.Type.FIRE])
+
+
+def _first_legal(masks):
+    return [int(np.flatnonzero(mask)[-1]) for mask in masks]
+
+
+def test_battle_env_episode():
+    """Test that a BattleEnv plays a full game through reset/step"""
+    if np is None:
+        print("⚠ numpy not installed - skipping env test")
+        return True
+
+    env = BattleEnv(_create_config(), seed=4)
+    obs, info = env.reset()
+    assert obs.shape == (STATE_SIZE,)
+    assert env.engine._get_current_player() is env.learner
+
+    done = False
+    steps = 0
+    while not done:
+        mask = info["action_mask"]
+        assert mask.any()
+        obs, reward, terminated, truncated, info = env.step(int(np.flatnonzero(mask)[-1]))
+        done = terminated or truncated
+        steps += 1
+
+    assert reward in (-1.0, 0.0, 1.0)
+    assert not info["action_mask"].any()
+
+    # Same seed, same actions -> same first observation
+    first, _ = env.reset(seed=4)
+    again, _ = BattleEnv(_create_config(), seed=4).reset()
+    assert np.array_equal(first, again)
+
+    print("✓ Battle env episode test passed")
+    return True
+
+
+def test_vector_env_matches_subprocess():
+    """Test that in-process and subprocess vector envs return the same batches"""
+    if np is None:
+        print("⚠ numpy not installed - skipping env test")
+        return True
+
+    configs = [_create_config() for _ in range(3)]
+    local = VectorEnv(configs, seed=7)
+    with VectorEnv(configs, seed=7, subprocess=True) as remote:
+        obs_a, info_a = local.reset()
+        obs_b, info_b = remote.reset()
+        assert obs_a.shape == (3, STATE_SIZE)
+        assert np.array_equal(obs_a, obs_b)
+
+        for _ in range(20):
+            actions = _first_legal(info_a["action_mask"])
+            obs_a, rew_a, term_a, trunc_a, info_a = local.step(actions)
+            obs_b, rew_b, term_b, trunc_b, info_b = remote.step(actions)
+            assert np.array_equal(obs_a, obs_b)
+            assert np.array_equal(rew_a, rew_b)
+            assert np.array_equal(term_a | trunc_a, term_b | trunc_b)
+            assert np.array_equal(info_a["action_mask"], info_b["action_mask"])
+
+    print("✓ Vector env test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_battle_env_episode() and test_vector_env_matches_subprocess()
+    exit(0 if success else 1)
@@ -0,0 +1,113 @@
+import io
+import sys
+from contextlib import redirect_stdout
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+from v3.models.match.game_logger import NULL_LOGGER, ConsoleLogger, ListEventSink
+
+
+def _create_engine(seed, **kwargs):
+    player1 = Player("Player 1", BasicGrassDeck().get_deck(), [Energy.Type.GRASS])
+    player2 = Player("Player 2", BasicFireDeck().get_deck(), [Energy.Type.FIRE])
+    return BattleEngine(player1, player2, seed=seed, **kwargs)
+
+
+def _result(engine, winner):
+    return (winner.name if winner else None, engine.turn, [player.points for player in engine.players])
+
+
+def test_headless_game_is_silent():
+    """Test that a non-debug game writes nothing to stdout"""
+    for seed in (1, 2, 3):
+        engine = _create_engine(seed)
+        assert engine.logger is NULL_LOGGER
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            engine.start_battle()
+        assert output.getvalue() == ""
+
+    print("✓ Headless game silence test passed")
+    return True
+
+
+def test_log_messages_are_lazy():
+    """Test that log arguments are only formatted by a logger that writes them"""
+    class Counted:
+        formatted = 0
+
+        def __str__(self):
+            Counted.formatted += 1
+            return "counted"
+
+    engine = _create_engine(4)
+    engine.log("Value: %s", Counted())
+    assert Counted.formatted == 0
+
+    engine = _create_engine(4, logger=ConsoleLogger())
+    output = io.StringIO()
+    with redirect_stdout(output):
+        engine.log("Value: %s", Counted())
+        engine.log("100% literal")
+    assert Counted.formatted == 1
+    assert output.getvalue() == "[Turn 0] Value: counted\n[Turn 0] 100% literal\n"
+
+    print("✓ Lazy log message test passed")
+    return True
+
+
+def test_event_sink_records_game():
+    """Test that the event sink sees the game without changing it"""
+    for seed in (5, 6):
+        sink = ListEventSink()
+        engine = _create_engine(seed, events=sink)
+        winner = engine.start_battle()
+        plain = _create_engine(seed)
+        assert _result(engine, winner) == _result(plain, plain.start_battle())
+
+        names = [event for _, event, _ in sink.events]
+        assert names[0] == "game_start" and names[-1] == "game_end"
+        assert names.count("game_end") == 1
+        assert sink.of_type("game_end")[0]["winner"] == (winner.name if winner else None)
+        assert len(sink.of_type("turn_start")) == engine.turn
+        assert all("action" in data for data in sink.of_type("action"))
+
+    print("✓ Event sink test passed")
+    return True
+
+
+def test_clones_are_silent():
+    """Test that clones drop the logger and sink while restore keeps them"""
+    sink = ListEventSink()
+    engine = _create_engine(7, logger=ConsoleLogger(), events=sink)
+    with redirect_stdout(io.StringIO()):
+        engine.begin()
+    count = len(sink.events)
+
+    clone = engine.clone()
+    assert clone.logger is NULL_LOGGER and clone.events is None and not clone.debug
+    assert clone.players[0].agent.log == clone.log
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        while not clone._is_game_over():
+            clone.play_turn()
+        engine.restore(clone)
+    assert output.getvalue() == ""
+    assert len(sink.events) == count
+    assert isinstance(engine.logger, ConsoleLogger) and engine.events is sink
+    assert engine.players[0].agent.log == engine.log
+
+    print("✓ Silent clone test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_headless_game_is_silent() and test_log_messages_are_lazy()
+               and test_event_sink_records_game() and test_clones_are_silent())
+    exit(0 if success else 1)
@@ -0,0 +1,115 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.importers import json_card_importer
+from v3.importers.json_card_importer import JsonCardImporter, CACHE_DIR_ENV
+
+
+def _import(folder_path):
+    importer = JsonCardImporter()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        importer.import_from_json(folder_path)
+    return importer, "from cache" in output.getvalue()
+
+
+def _summary(importer):
+    return {card_id: (card.name, card.health, [(a.name, a.damage) for a in card.attacks])
+            for card_id, card in importer.pokemon.items()}, sorted(importer.items), sorted(importer.tools)
+
+
+def test_cache_round_trip():
+    """Test that a second import loads the cache and gives the same cards"""
+    work_dir = tempfile.mkdtemp()
+    old_env = os.environ.get(CACHE_DIR_ENV)
+    try:
+        assets = os.path.join(work_dir, "assets")
+        shutil.copytree(JsonCardImporter.default_folder(), assets)
+        os.environ[CACHE_DIR_ENV] = os.path.join(work_dir, "cache")
+
+        parsed, cached = _import(assets)
+        assert not cached
+        assert len(os.listdir(os.path.join(work_dir, "cache"))) == 1
+
+        loaded, cached = _import(assets)
+        assert cached
+        assert _summary(loaded) == _summary(parsed)
+        assert loaded.card_count() == parsed.card_count() > 0
+
+        # Changing a source file invalidates the cache and replaces the old file
+        json_file = os.path.join(assets, sorted(os.listdir(assets))[0])
+        with open(json_file, 'a', encoding='utf-8') as file:
+            file.write("\n")
+        _, cached = _import(assets)
+        assert not cached
+        assert len(os.listdir(os.path.join(work_dir, "cache"))) == 1
+
+        # A corrupt cache falls back to parsing
+        cache_file = os.path.join(work_dir, "cache", os.listdir(os.path.join(work_dir, "cache"))[0])
+        with open(cache_file, 'wb') as file:
+            file.write(b"not a pickle")
+        reparsed, cached = _import(assets)
+        assert not cached
+        assert _summary(reparsed) == _summary(parsed)
+    finally:
+        if old_env is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = old_env
+        shutil.rmtree(work_dir)
+
+    print("✓ Card cache round trip test passed")
+    return True
+
+
+def test_folders_share_a_cache_directory():
+    """Test that two asset folders using one cache directory keep each other's caches"""
+    work_dir = tempfile.mkdtemp()
+    old_env = os.environ.get(CACHE_DIR_ENV)
+    try:
+        folders = [os.path.join(work_dir, name) for name in ("assets", "more_assets")]
+        for folder in folders:
+            shutil.copytree(JsonCardImporter.default_folder(), folder)
+        os.environ[CACHE_DIR_ENV] = os.path.join(work_dir, "cache")
+
+        assert [_import(folder)[1] for folder in folders] == [False, False]
+        assert len(os.listdir(os.path.join(work_dir, "cache"))) == 2
+        assert [_import(folder)[1] for folder in folders] == [True, True]
+    finally:
+        if old_env is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = old_env
+        shutil.rmtree(work_dir)
+
+    print("✓ Shared cache directory test passed")
+    return True
+
+
+def test_shared_importer():
+    """Test that decks share one loaded importer per process"""
+    importer = JsonCardImporter.shared()
+    assert JsonCardImporter.shared() is importer
+    assert BasicGrassDeck().importer is importer
+    assert BasicFireDeck().importer is importer
+    assert JsonCardImporter.default_folder() in json_card_importer._shared_importers
+
+    # Deck cards are copies, so the shared cards stay untouched
+    deck = BasicGrassDeck().get_deck()
+    deck[0].damage_taken = 50
+    assert importer.pokemon[deck[0].id].damage_taken == 0
+
+    print("✓ Shared importer test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_cache_round_trip() and test_folders_share_a_cache_directory() and test_shared_importer()
+    exit(0 if success else 1)
@@ -0,0 +1,96 @@
+import copy
+import pickle
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from v3.models.cards.pokemon import Pokemon, PokemonDefinition
+
+
+def _shared_pokemon():
+    importer = JsonCardImporter.shared()
+    return next(card for card in importer.pokemon.values() if card.attacks)
+
+
+def test_instances_share_definition():
+    """Test that deck cards share one immutable definition and keep their own state"""
+    deck = BasicGrassDeck().get_deck()
+    by_id = {}
+    for card in deck:
+        by_id.setdefault(card.id, []).append(card)
+    copies = next(cards for cards in by_id.values() if len(cards) > 1)
+    assert copies[0] is not copies[1]
+    assert copies[0].definition is copies[1].definition
+
+    for card in deck:
+        assert not hasattr(card, '__dict__')
+
+    pokemon = next(card for card in deck if isinstance(card, Pokemon))
+    assert isinstance(pokemon.definition, PokemonDefinition)
+    try:
+        pokemon.definition.health = 999
+        assert False, "definitions should be immutable"
+    except AttributeError:
+        pass
+
+    # Game state is per instance
+    fresh = pokemon.instantiate()
+    pokemon.damage_taken = 30
+    pokemon.equipped_energies[Energy.Type.GRASS] += 1
+    assert fresh.damage_taken == 0
+    assert fresh.equipped_energies[Energy.Type.GRASS] == 0
+    assert fresh.card_position == Card.Position.DECK
+
+    print("✓ Shared definition test passed")
+    return True
+
+
+def test_static_fields_copy_on_write():
+    """Test that changing a static field on one card leaves its other copies alone"""
+    original = _shared_pokemon()
+    card = original.instantiate()
+    other = original.instantiate()
+
+    card.retreat_cost = 4
+    card.name = "Test ex"
+    assert card.retreat_cost == 4 and card.is_ex
+    assert Pokemon.PokemonType.EX in card.pokemon_types
+    assert card.definition is not original.definition
+    assert other.retreat_cost == original.retreat_cost and other.name == original.name
+    assert other.definition is original.definition
+
+    card.attacks = [original.attacks[0]]
+    assert len(card.attacks) == 1 and card.attacks[0] is original.attacks[0]
+
+    print("✓ Copy on write test passed")
+    return True
+
+
+def test_copies_and_pickles_keep_definition():
+    """Test that copies share the definition and pickles restore every field"""
+    card = _shared_pokemon().instantiate()
+    card.damage_taken = 20
+
+    deep = copy.deepcopy(card)
+    assert deep.definition is card.definition and deep.damage_taken == 20
+    clone = card.clone()
+    assert clone.definition is card.definition and clone.damage_taken == 20
+
+    loaded = pickle.loads(pickle.dumps(card))
+    assert loaded.damage_taken == 20
+    for name in PokemonDefinition._FIELDS:
+        if name not in ('attacks', 'abilities', 'ability'):
+            assert getattr(loaded.definition, name) == getattr(card.definition, name), name
+    assert [a.name for a in loaded.attacks] == [a.name for a in card.attacks]
+
+    print("✓ Copy and pickle test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_instances_share_definition() and test_static_fields_copy_on_write()
+               and test_copies_and_pickles_keep_definition())
+    exit(0 if success else 1)
@@ -0,0 +1,87 @@
+import pickle
+import random
+import sys
+sys.path.insert(0, '.')
+
+from v3.models.cards.attack import Attack
+from v3.models.cards.energy import Energy
+from v3.models.cards.energy_math import ENERGY_ORDER, EnergyCounter, pack, requirement, discard
+
+
+def _reference_can_afford(energies, cost):
+    """The dict-based check EnergyCounter replaces"""
+    if sum(energies.values()) < sum(cost.values()):
+        return False
+    return all(energies.get(energy_type, 0) >= amount
+               for energy_type, amount in cost.items() if energy_type != Energy.Type.NORMAL)
+
+
+def test_can_afford_matches_reference():
+    """Test packed affordability against the dict computation on random boards"""
+    rng = random.Random(12)
+    for _ in range(5000):
+        energies = {energy_type: rng.choice([0, 0, 0, 1, 2, 3]) for energy_type in ENERGY_ORDER}
+        cost = {energy_type: rng.choice([0, 0, 0, 0, 1, 2]) for energy_type in ENERGY_ORDER}
+        counter = EnergyCounter(energies)
+        assert counter.can_afford(requirement(cost)) == _reference_can_afford(energies, cost)
+
+    pokemon_energy = EnergyCounter({Energy.Type.GRASS: 1, Energy.Type.FIRE: 1})
+    assert pokemon_energy.can_afford(requirement(Energy.from_string_list(["Grass", "Colorless"])))
+    assert not pokemon_energy.can_afford(requirement(Energy.from_string_list(["Grass", "Grass"])))
+    assert not pokemon_energy.can_afford(requirement(Energy.from_string_list(["Colorless"] * 3)))
+
+    print("✓ Packed affordability test passed")
+    return True
+
+
+def test_counter_behaves_like_dict():
+    """Test that writes through the dict interface keep the packed form in sync"""
+    counter = EnergyCounter()
+    assert isinstance(counter, dict) and list(counter) == list(ENERGY_ORDER)
+    assert counter.total == 0 and counter.packed == 0
+
+    counter[Energy.Type.GRASS] += 2
+    counter[Energy.Type.NORMAL] = 1
+    counter.update({Energy.Type.FIRE: 3})
+    assert counter == {**dict.fromkeys(ENERGY_ORDER, 0), Energy.Type.GRASS: 2,
+                       Energy.Type.NORMAL: 1, Energy.Type.FIRE: 3}
+    assert counter.total == 6
+    assert counter.packed == pack(counter)
+
+    copied = counter.copy()
+    copied[Energy.Type.GRASS] = 0
+    assert counter[Energy.Type.GRASS] == 2 and copied.total == 4
+
+    loaded = pickle.loads(pickle.dumps(counter))
+    assert loaded == counter and loaded.packed == counter.packed and loaded.total == counter.total
+
+    # Retreat discards types in lane order
+    assert discard(counter, 3) == 3
+    assert counter[Energy.Type.GRASS] == 0 and counter[Energy.Type.FIRE] == 2
+    assert counter.total == 3 and counter.packed == pack(counter)
+
+    plain = {Energy.Type.WATER: 1, Energy.Type.METAL: 2}
+    assert discard(plain, 2) == 2 and plain == {Energy.Type.WATER: 0, Energy.Type.METAL: 1}
+
+    print("✓ Energy counter dict test passed")
+    return True
+
+
+def test_attack_requirement_follows_cost():
+    """Test that attacks precompute their requirement and refresh it when the cost changes"""
+    attack = Attack("Vine Whip", 40, Energy.from_string_list(["Grass", "Colorless"]))
+    assert attack.requirement.total == 2
+    assert attack.requirement.specific == pack({Energy.Type.GRASS: 1})
+
+    attack.cost = Energy.from_string_list(["Fire"]).cost
+    assert attack.requirement.total == 1
+    assert attack.requirement.specific == pack({Energy.Type.FIRE: 1})
+
+    print("✓ Attack requirement test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_can_afford_matches_reference() and test_counter_behaves_like_dict()
+               and test_attack_requirement_follows_cost())
+    exit(0 if success else 1)
@@ -0,0 +1,99 @@
+import random
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.models.agents.random_agent import RandomAgent
+from v3.models.cards.energy import Energy
+from v3.models.cards.energy_math import ENERGY_ORDER
+from v3.models.cards.pokemon import Pokemon
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.game_rules import GameRules
+from v3.models.match.matchup_tables import MatchupTables, attack_base_damage
+from v3.models.match.player import Player
+
+
+def _decks():
+    return BasicGrassDeck().get_deck(), BasicFireDeck().get_deck()
+
+
+def _engine(deck1, deck2, seed, matchups=None):
+    player1 = Player("Player 1", [card.instantiate() for card in deck1], [Energy.Type.GRASS], agent=RandomAgent)
+    player2 = Player("Player 2", [card.instantiate() for card in deck2], [Energy.Type.FIRE], agent=RandomAgent)
+    return BattleEngine(player1, player2, seed=seed, matchups=matchups)
+
+
+def test_tables_match_engine_rules():
+    """Test table damage and prize values against the engine's own calculation for every pair"""
+    deck1, deck2 = _decks()
+    tables = MatchupTables.from_decks(deck1, deck2)
+    engine = _engine(deck1, deck2, seed=1)
+    pokemon = [card for card in deck1 + deck2 if isinstance(card, Pokemon)]
+    assert len(tables.definitions) == len({card.definition for card in pokemon})
+
+    for attacker in pokemon:
+        base = tuple(attack_base_damage(attack) for attack in attacker.attacks)
+        assert tables.base_damage(attacker) == base
+        assert tables.max_damage(attacker) == max(base, default=0)
+        assert tables.prize_value(attacker) == GameRules.calculate_prize_value(attacker)
+        for defender in pokemon:
+            expected = tuple(engine._calculate_damage(attacker, defender, damage) for damage in base)
+            assert tables.damage(attacker, defender) == expected
+
+    print("✓ Matchup table values test passed")
+    return True
+
+
+def test_affordable_attacks_and_knockouts():
+    """Test the affordability memo and KO lookups on random energy and damage"""
+    deck1, deck2 = _decks()
+    tables = MatchupTables.for_decks(deck1, deck2)
+    assert MatchupTables.for_decks(deck1, deck2) is tables
+
+    rng = random.Random(5)
+    pokemon = [card.instantiate() for card in deck1 + deck2 if isinstance(card, Pokemon)]
+    for _ in range(500):
+        attacker, defender = rng.choice(pokemon), rng.choice(pokemon)
+        attacker.equipped_energies.clear()
+        for energy_type in ENERGY_ORDER:
+            attacker.equipped_energies[energy_type] = rng.choice([0, 0, 1, 2])
+        expected = tuple(i for i, attack in enumerate(attacker.attacks) if attacker._can_afford_attack(attack))
+        assert tables.affordable_attacks(attacker) == expected
+
+        defender.damage_taken = rng.choice([0, 10, 30, 50, 70])
+        for i in range(len(attacker.attacks)):
+            damage = tables.damage(attacker, defender)[i]
+            assert tables.knocks_out(attacker, i, defender) == (damage >= defender.current_health())
+
+    # A card changed mid-game gets its own entry
+    changed = pokemon[0].instantiate()
+    changed.name = changed.name + " ex"
+    assert tables.prize_value(changed) == 2
+    assert tables.prize_value(pokemon[0]) == GameRules.calculate_prize_value(pokemon[0])
+
+    print("✓ Affordability and KO lookup test passed")
+    return True
+
+
+def test_tables_do_not_change_games():
+    """Test that seeded games play out the same with and without tables"""
+    deck1, deck2 = _decks()
+    tables = MatchupTables.for_decks(deck1, deck2)
+    for seed in range(6):
+        plain = _engine(deck1, deck2, seed)
+        tabled = _engine(deck1, deck2, seed, matchups=tables)
+        assert tabled.player1.agent.matchups is tables
+        winner_plain, winner_tabled = plain.start_battle(), tabled.start_battle()
+        assert (winner_plain and winner_plain.name) == (winner_tabled and winner_tabled.name)
+        assert plain.turn == tabled.turn
+        assert [p.points for p in plain.players] == [p.points for p in tabled.players]
+
+    print("✓ Tables keep games unchanged test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_tables_match_engine_rules() and test_affordable_attacks_and_knockouts()
+               and test_tables_do_not_change_games())
+    exit(0 if success else 1)
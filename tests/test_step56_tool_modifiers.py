@@ -0,0 +1,66 @@
+import pickle
+import sys
+sys.path.insert(0, '.')
+
+from v3.models.cards.ability import Ability
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from v3.models.cards.pokemon import Pokemon
+from v3.models.cards.tool import NO_MODIFIER, Tool, ToolModifier
+
+
+def _tool(effect):
+    ability = Ability(name="Tool Effect", effect=effect, target=Ability.Target.PLAYER_ACTIVE,
+                      position=Card.Position.ACTIVE)
+    return Tool("tool-001", "Cape", Card.Type.TRAINER, Card.Subtype.TOOL, "A1", "Test", "Common", ability=ability)
+
+
+def _pokemon():
+    return Pokemon("p-001", "Bulbasaur", Energy.Type.GRASS, Card.Type.POKEMON, Card.Subtype.BASIC, 70,
+                   "A1", "Test", "Common", [], 1, Energy.Type.FIRE, None)
+
+
+def test_modifier_compiled_from_effect():
+    """Test that tool effects compile to a modifier once, when the card is built"""
+    assert _tool("hp_bonus(20)").modifier.hp_bonus == 20
+    assert _tool("The Pokemon this card is attached to gets +30 HP.").modifier.hp_bonus == 30
+    assert _tool("Retreat cost is 1 less.").modifier is NO_MODIFIER
+    assert ToolModifier.from_ability(None) is NO_MODIFIER
+
+    tool = _tool("hp_bonus(20)")
+    copy = tool.instantiate()
+    assert copy.modifier is tool.modifier
+    loaded = pickle.loads(pickle.dumps(tool))
+    assert loaded.modifier.hp_bonus == 20
+
+    print("✓ Tool modifier compile test passed")
+    return True
+
+
+def test_max_health_cache_follows_attach_and_detach():
+    """Test that max HP is cached and refreshed when a tool or the card data changes"""
+    pokemon = _pokemon()
+    assert pokemon.max_health() == 70
+
+    pokemon.poketool = _tool("hp_bonus(20)")
+    assert pokemon.max_health() == 90
+    pokemon.damage_taken = 30
+    assert pokemon.current_health() == 60
+
+    clone = pokemon.clone()
+    assert clone.max_health() == 90 and clone.poketool is not pokemon.poketool
+
+    pokemon.poketool = None
+    assert pokemon.max_health() == 70
+    assert clone.max_health() == 90
+
+    pokemon.health = 100
+    assert pokemon.max_health() == 100
+
+    print("✓ Max health cache test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_modifier_compiled_from_effect() and test_max_health_cache_follows_attach_and_detach()
+    exit(0 if success else 1)
@@ -0,0 +1,68 @@
+import json
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import GameConfig, build_engine, merge_game_profiles, play_game
+from v3.models.match.game_profiler import NULL_PROFILER, PhaseProfiler, merge_profiles
+
+
+def _config(**kwargs):
+    return GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                      [Energy.Type.GRASS], [Energy.Type.FIRE], **kwargs)
+
+
+def test_profiler_records_phases_and_counters():
+    """Test that a profiled game fills phase, action and counter totals without changing the game"""
+    config = _config()
+    profiler = PhaseProfiler()
+    profiled = build_engine(config, seed=3, profiler=profiler)
+    plain = build_engine(config, seed=3)
+    assert plain.profiler is NULL_PROFILER
+
+    winner_profiled, winner_plain = profiled.start_battle(), plain.start_battle()
+    assert (winner_profiled and winner_profiled.name) == (winner_plain and winner_plain.name)
+    assert profiled.turn == plain.turn
+
+    data = profiler.to_dict()
+    for name in ("phase.setup", "phase.draw", "phase.main", "phase.end",
+                 "main.legal_actions", "main.agent_decision"):
+        assert data["timers"][name]["calls"] > 0, name
+    assert any(name.startswith("action.") for name in data["timers"])
+
+    counters = data["counters"]
+    assert counters["games"] == 1 and counters["turns"] > 0
+    assert counters["actions.generated"] == counters["actions.valid"] + counters["actions.rejected"]
+    assert data["per_turn"]["actions.valid"] == counters["actions.valid"] / counters["turns"]
+
+    # Clones are never profiled
+    assert profiled.clone().profiler is NULL_PROFILER
+
+    print("✓ Profiler phases and counters test passed")
+    return True
+
+
+def test_profiles_merge_across_batch():
+    """Test that per-game profiles from a batch merge and round-trip through JSON"""
+    config = _config(profile=True)
+    results = [play_game(config, index, seed=100 + index) for index in range(3)]
+    assert all(result.profile for result in results)
+
+    merged = merge_game_profiles(results)
+    assert merged.counters["games"] == 3
+    assert merged.counters["turns"] == sum(result.profile["counters"]["turns"] for result in results)
+
+    loaded = merge_profiles([json.loads(merged.to_json())])
+    assert loaded.counters == merged.counters
+    assert loaded.calls == merged.calls
+    assert "phase.main" in merged.report()
+
+    print("✓ Profile merge test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_profiler_records_phases_and_counters() and test_profiles_merge_across_batch()
+    exit(0 if success else 1)
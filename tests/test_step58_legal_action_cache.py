@@ -0,0 +1,85 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.actions import ActionType
+from v3.models.match.batch_runner import GameConfig, build_engine
+from v3.models.match.legal_actions import _is_valid
+from v3.models.match.player import Player
+
+
+def _full_validation(player, engine):
+    """Every candidate from _generate_actions validated - what the cache must reproduce"""
+    attacks, others = [], []
+    for action in player._generate_actions():
+        if action.action_type == ActionType.END_TURN:
+            others.append(action)
+        elif _is_valid(action, player, engine):
+            (attacks if action.action_type == ActionType.ATTACK else others).append(action)
+    return [action.to_string() for action in attacks + others]
+
+
+def test_cache_matches_full_validation():
+    """Test cached legal actions against full validation at every decision of seeded games"""
+    cached_get_legal_actions = Player.get_legal_actions
+    checked = []
+
+    def checking(player, engine):
+        actions = cached_get_legal_actions(player, engine)
+        assert [action.to_string() for action in actions] == _full_validation(player, engine)
+        checked.append(len(actions))
+        return actions
+
+    Player.get_legal_actions = checking
+    try:
+        decks = [(BasicGrassDeck().get_deck(), [Energy.Type.GRASS]),
+                 (BasicFireDeck().get_deck(), [Energy.Type.FIRE]),
+                 (IntermediateGrassDeck().get_deck(), [Energy.Type.GRASS])]
+        for (deck1, energy1), (deck2, energy2) in [(decks[0], decks[1]), (decks[2], decks[1]), (decks[2], decks[0])]:
+            config = GameConfig(deck1, deck2, energy1, energy2)
+            for seed in range(8):
+                build_engine(config, seed).start_battle()
+    finally:
+        Player.get_legal_actions = cached_get_legal_actions
+    assert len(checked) > 100
+
+    print("✓ Legal action cache equivalence test passed")
+    return True
+
+
+def test_unchanged_families_are_reused():
+    """Test that repeated calls reuse actions and a mutation rebuilds the affected family"""
+    config = GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                        [Energy.Type.GRASS], [Energy.Type.FIRE])
+    engine = build_engine(config, seed=4)
+    engine.begin()
+    player = engine._get_current_player()
+
+    first = player.get_legal_actions(engine)
+    second = player.get_legal_actions(engine)
+    assert first is not second
+    assert [a for a in first if a.action_type != ActionType.END_TURN] == \
+           [a for a in second if a.action_type != ActionType.END_TURN]
+    for a, b in zip(first[:-1], second[:-1]):
+        assert a is b
+
+    # Drawing a card changes the hand, so hand-based families are rebuilt
+    if player.can_draw():
+        player.draw(1)
+        assert [a.to_string() for a in player.get_legal_actions(engine)] == _full_validation(player, engine)
+
+    # Clones start with their own cache
+    clone = engine.clone()
+    clone_player = clone.players[engine.players.index(player)]
+    assert clone_player._legal_actions is not player._legal_actions
+
+    print("✓ Legal action reuse test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_cache_matches_full_validation() and test_unchanged_families_are_reused()
+    exit(0 if success else 1)
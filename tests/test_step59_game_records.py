@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.actions import ActionType
+from v3.models.match.actions.action import unpack_action
+from v3.models.match.batch_runner import BatchRunner, GameConfig, build_engine, write_game_records
+from v3.models.match.game_record import GameRecord, GameRecorder, RecordWriter, iter_records
+
+
+def _config(**kwargs):
+    return GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                      [Energy.Type.GRASS], [Energy.Type.FIRE], **kwargs)
+
+
+def test_recorder_captures_game():
+    """Test that a recorded game holds its seed, decks, decisions and outcome"""
+    config = _config()
+    recorder = GameRecorder(meta={"game": 0})
+    engine = build_engine(config, seed=11, events=recorder)
+    winner = engine.start_battle()
+    record = recorder.record
+
+    assert record.seed == 11
+    assert record.decks == [[card.id for card in config.deck1], [card.id for card in config.deck2]]
+    assert record.energies == [[Energy.Type.GRASS], [Energy.Type.FIRE]]
+    assert record.first_player == engine.first_player_index
+    assert record.winner == (engine.players.index(winner) if winner else None)
+    assert record.turns == engine.turn
+    assert record.points == [player.points for player in engine.players]
+    assert record.meta == {"game": 0}
+
+    assert record.decisions and all(len(decision) == 3 for decision in record.decisions)
+    assert unpack_action(record.decisions[0][2])[0] == ActionType.PLAY_POKEMON  # Setup starts with an active
+    knockout_prizes = [0, 0]
+    for decision, kind, seat, card_id, amount in record.deltas:
+        assert 0 <= decision < len(record.decisions) and kind in ("damage", "knockout")
+        if kind == "knockout":
+            knockout_prizes[1 - seat] += amount
+    assert knockout_prizes == record.points
+
+    # Recording does not change the game
+    plain = build_engine(config, seed=11)
+    plain_winner = plain.start_battle()
+    assert (plain_winner and plain_winner.name) == (winner and winner.name)
+    assert plain.turn == engine.turn
+
+    print("✓ Game recorder test passed")
+    return True
+
+
+def test_records_round_trip_through_files():
+    """Test buffered writing and lazy reading, plain and gzip, for a parallel batch"""
+    config = _config(record=True)
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("games.ndjson", "games.ndjson.gz"):
+            path = os.path.join(directory, name)
+            with RecordWriter(path, buffer_size=4) as writer:
+                results = list(write_game_records(BatchRunner(config, workers=2, seed=5).iter_results(10), writer))
+            assert writer.count == 10
+
+            records = sorted(iter_records(path), key=lambda record: record.meta["game"])
+            assert [record.meta["game"] for record in records] == list(range(10))
+            by_index = {result.game_index: result for result in results}
+            for record in records:
+                result = by_index[record.meta["game"]]
+                assert record.seed == result.seed and record.turns == result.turns
+                assert GameRecord.from_json(result.record) == record
+
+            raw = next(iter_records(path, raw=True))
+            assert raw["v"] == 1 and "decisions" in raw
+
+    print("✓ Game record file round trip test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_recorder_captures_game() and test_records_round_trip_through_files()
+    exit(0 if success else 1)
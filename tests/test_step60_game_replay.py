@@ -0,0 +1,64 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import BatchRunner, GameConfig
+from v3.models.match.exceptions import ReplayError
+from v3.models.match.game_logger import ListEventSink
+from v3.models.match.game_record import GameRecord
+from v3.models.match.game_replay import GameReplay, replay_game
+
+
+def _records(deck1, energy1, deck2, energy2, games, seed):
+    config = GameConfig(deck1, deck2, energy1, energy2, record=True)
+    return [GameRecord.from_json(result.record)
+            for result in BatchRunner(config, workers=1, seed=seed).iter_results(games)]
+
+
+def test_replay_reproduces_games():
+    """Test that replays end exactly as recorded and repeat every damage and knockout"""
+    grass, fire = BasicGrassDeck().get_deck(), BasicFireDeck().get_deck()
+    intermediate = IntermediateGrassDeck().get_deck()
+    records = (_records(grass, [Energy.Type.GRASS], fire, [Energy.Type.FIRE], 15, seed=1)
+               + _records(intermediate, [Energy.Type.GRASS], grass, [Energy.Type.GRASS], 15, seed=2))
+
+    for record in records:
+        replay = GameReplay(record)
+        sink = ListEventSink()
+        replay.engine.events = sink
+        steps = list(replay.steps())
+        replay_deltas = [(event, data["owner_seat"], data["card_id"],
+                          data["amount"] if event == "damage" else data["prizes"])
+                         for _, event, data in sink.events if event in ("damage", "knockout")]
+        assert replay_deltas == [tuple(delta[1:]) for delta in record.deltas]
+        assert [step.index for step in steps] == sorted(step.index for step in steps)
+
+    for record in records:
+        engine = replay_game(record)  # Also checks winner, turns and points
+        assert engine.turn == record.turns
+
+    print("✓ Replay reproduction test passed")
+    return True
+
+
+def test_replay_rejects_diverging_records():
+    """Test that a record that does not fit the replayed game raises ReplayError"""
+    record = _records(BasicGrassDeck().get_deck(), [Energy.Type.GRASS],
+                      BasicFireDeck().get_deck(), [Energy.Type.FIRE], 1, seed=3)[0]
+    record.first_player = 1 - record.first_player
+    try:
+        replay_game(record)
+        assert False, "Expected ReplayError"
+    except ReplayError:
+        pass
+
+    print("✓ Replay divergence test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_replay_reproduces_games() and test_replay_rejects_diverging_records()
+    exit(0 if success else 1)
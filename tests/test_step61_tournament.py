@@ -0,0 +1,68 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.registry import build_registered_decks, registered_deck_names
+from v3.models.match.match_stats import wilson_interval
+from v3.models.match.tournament import Entrant, Tournament
+
+
+def test_wilson_interval():
+    """Test the Wilson interval against known values and its edge cases"""
+    low, high = wilson_interval(0, 10)
+    assert low == 0.0 and abs(high - 0.2775) < 1e-3
+    low, high = wilson_interval(50, 100)
+    assert abs(low - 0.4038) < 1e-3 and abs(high - 0.5962) < 1e-3
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    narrow, wide = wilson_interval(500, 1000), wilson_interval(5, 10)
+    assert narrow[1] - narrow[0] < wide[1] - wide[0]
+
+    print("✓ Wilson interval test passed")
+    return True
+
+
+def test_registry_builds_every_deck():
+    """Test that every registered deck builds as 20 cards with energy types"""
+    decks = build_registered_decks()
+    assert {"basic_grass", "intermediate_grass", "basic_fire"} <= set(decks)
+    assert any(name.startswith("generated_evolution") for name in decks)
+    assert list(decks) == [name for name in registered_deck_names() if name in decks]
+    for name, (deck, energy_types) in decks.items():
+        assert len(deck) == 20, name
+        assert energy_types, name
+
+    print("✓ Deck registry test passed")
+    return True
+
+
+def test_round_robin_matrix():
+    """Test that a tournament fills a consistent matrix independent of its schedule"""
+    decks = build_registered_decks(["basic_grass", "basic_fire", "intermediate_grass"])
+    entrants = [Entrant(name, deck, energy_types) for name, (deck, energy_types) in decks.items()]
+
+    uncertain = Tournament(entrants, games_per_pairing=8, workers=1, seed=4, chunk_size=2)
+    order = []
+    result = uncertain.run(progress=lambda t: order.append([p.games for p in t.results]))
+    # Every pairing gets its first chunk before any pairing gets a second one
+    assert order[len(uncertain.pairs) - 1] == [2] * len(uncertain.pairs)
+
+    assert result.total_games() == 3 * 8
+    matrix = result.matrix()
+    for r in range(3):
+        assert matrix[r][r] is None
+        for c in range(3):
+            if r != c:
+                assert abs(matrix[r][c] + matrix[c][r] - 1) < 1e-9
+                score, low, high = result.cell(r, c)
+                assert low <= score <= high
+
+    fixed = Tournament(entrants, games_per_pairing=8, workers=1, seed=4, chunk_size=3, schedule="fixed").run()
+    assert fixed.to_dict() == result.to_dict()
+    assert "basic_fire" in result.format_table()
+
+    print("✓ Round-robin tournament test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_wilson_interval() and test_registry_builds_every_deck() and test_round_robin_matrix()
+    exit(0 if success else 1)
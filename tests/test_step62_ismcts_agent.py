@@ -0,0 +1,114 @@
+import pickle
+import random
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.models.agents.agent import agent_name
+from v3.models.agents.ismcts_agent import ISMCTSAgent, _determinize, close_search_pools
+from v3.models.agents.random_agent import RandomAgent
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import BatchRunner, GameConfig
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.player import Player
+
+
+def _engine(agent1, agent2=RandomAgent, seed=11) -> BattleEngine:
+    """A game at the first main phase decision of agent1's seat"""
+    grass, fire = BasicGrassDeck().get_deck(), BasicFireDeck().get_deck()
+    engine = BattleEngine(Player("Player 1", [card.instantiate() for card in grass], [Energy.Type.GRASS], agent=agent1),
+                          Player("Player 2", [card.instantiate() for card in fire], [Energy.Type.FIRE], agent=agent2),
+                          seed=seed)
+    engine.begin()
+    while engine._get_current_player() is not engine.player1:
+        engine.play_turn()
+    return engine
+
+
+def _view(engine: BattleEngine):
+    return [([card.id for card in player.cards_in_hand], [card.id for card in player.deck], player.points)
+            for player in engine.players] + [engine.rng.getstate(), engine.turn]
+
+
+def test_determinization_resamples_hidden_cards():
+    """Test that a determinization reshuffles only what the searching seat cannot see"""
+    engine = _engine(RandomAgent)
+    sim = engine.clone()
+    _determinize(sim, 0, random.Random(3))
+    me, opponent = engine.players
+    sim_me, sim_opponent = sim.players
+
+    assert [card.id for card in sim_me.cards_in_hand] == [card.id for card in me.cards_in_hand]
+    assert sorted(card.id for card in sim_me.deck) == sorted(card.id for card in me.deck)
+    assert len(sim_opponent.cards_in_hand) == len(opponent.cards_in_hand)
+    hidden = sorted(card.id for card in opponent.cards_in_hand + opponent.deck)
+    assert sorted(card.id for card in sim_opponent.cards_in_hand + sim_opponent.deck) == hidden
+    assert all(card.card_position == card.Position.HAND for card in sim_opponent.cards_in_hand)
+    assert sim.rng.getstate() != engine.rng.getstate()
+
+    print("✓ Determinization test passed")
+    return True
+
+
+def test_search_leaves_game_untouched_and_repeats():
+    """Test that a decision does not change the live game and repeats under the same agent stream"""
+    engine = _engine(ISMCTSAgent.configured(iterations=12))
+    agent = engine.player1.agent
+    actions = engine.player1.get_legal_actions(engine)
+    before = _view(engine)
+    state = agent.rng.getstate()
+
+    chosen = agent.choose_action(actions)
+    assert chosen in actions
+    assert _view(engine) == before
+    stats, iterations = agent.last_search
+    assert iterations == 12 and sum(visits for visits, _ in stats.values()) == 12
+
+    agent.rng.setstate(state)
+    assert agent.choose_action(actions) is chosen
+    assert agent.last_search == (stats, iterations)
+
+    timed = ISMCTSAgent(engine.player1, iterations=None, time_limit=0.01)
+    timed.engine, timed.rng = engine, random.Random(1)
+    assert timed.choose_action(actions) in actions and timed.last_search[1] >= 1
+
+    print("✓ Search isolation test passed")
+    return True
+
+
+def test_process_pool_search():
+    """Test that a search split over a process pool uses the whole iteration budget"""
+    try:
+        engine = _engine(ISMCTSAgent.configured(iterations=8, workers=2))
+        agent = engine.player1.agent
+        actions = engine.player1.get_legal_actions(engine)
+        assert agent.choose_action(actions) in actions
+        stats, iterations = agent.last_search
+        assert iterations == 8 and sum(visits for visits, _ in stats.values()) == 8
+    finally:
+        close_search_pools()
+
+    print("✓ Process pool search test passed")
+    return True
+
+
+def test_beats_random_agent():
+    """Test that the search agent wins batch games against RandomAgent from the weaker seat"""
+    factory = ISMCTSAgent.configured(iterations=16)
+    assert agent_name(factory) == "ISMCTSAgent" and pickle.loads(pickle.dumps(factory)) is not None
+    config = GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                        [Energy.Type.GRASS], [Energy.Type.FIRE], agent1=factory, agent2=RandomAgent)
+    results = list(BatchRunner(config, workers=1, seed=5).iter_results(10))
+    wins = sum(1 for result in results if result.winner == "Player 1")
+    # RandomAgent wins about a third of these games as Player 1
+    assert wins >= 6, wins
+
+    print("✓ Search agent strength test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_determinization_resamples_hidden_cards() and test_search_leaves_game_untouched_and_repeats()
+               and test_process_pool_search() and test_beats_random_agent())
+    exit(0 if success else 1)
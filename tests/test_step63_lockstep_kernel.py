@@ -0,0 +1,115 @@
+import sys
+sys.path.insert(0, '.')
+
+import numpy as np
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.models.cards.ability import Ability
+from v3.models.cards.attack import Attack
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from v3.models.cards.pokemon import Pokemon
+from v3.models.match.exceptions import UnsupportedMatchupError
+from v3.models.match.game_rules import GameRules
+from v3.models.match.lockstep_kernel import (ENERGY_INDEX, KernelCards, LockstepBattle, _Side,
+                                             simulate_matchup)
+
+
+def _decks():
+    return BasicGrassDeck().get_deck(), BasicFireDeck().get_deck()
+
+
+def test_supported_cards_and_fallback():
+    """Test that the prebuilt decks compile and an unsupported card is refused unless a fallback is allowed"""
+    grass, fire = _decks()
+    cards = KernelCards(grass, fire)
+    assert cards.supported, cards.unsupported
+    bulbasaur, charmander = cards.index["a1-001"], cards.index["a1-230"]
+    assert cards.weakness[bulbasaur] == cards.element[charmander] == ENERGY_INDEX[Energy.Type.FIRE]
+    assert cards.evolve[bulbasaur, cards.index["a1-002"]] and not cards.evolve[bulbasaur, cards.index["a1-004"]]
+
+    discard = Attack("Hand Discard", 10, Energy.from_string_list(["Colorless"]),
+                     Ability("Hand Discard", "Discard 2 cards from your hand.", Ability.Target.PLAYER_ACTIVE,
+                             Card.Position.ACTIVE))
+    oddity = Pokemon("test-001", "Oddity", Energy.Type.GRASS, Card.Type.POKEMON, Card.Subtype.BASIC, 60,
+                     "Set", "Pack", "Common", [discard], 1, Energy.Type.FIRE, None)
+    odd_deck = grass[:-2] + [oddity, oddity]
+    assert KernelCards(odd_deck, fire).unsupported == [("test-001", "attack effect DiscardEffect")]
+    try:
+        simulate_matchup(odd_deck, fire, [Energy.Type.GRASS], [Energy.Type.FIRE], 4, seed=2)
+        assert False, "mixed a scalar fallback into a lockstep call"
+    except UnsupportedMatchupError as e:
+        assert e.unsupported == [("test-001", "attack effect DiscardEffect")]
+    result = simulate_matchup(odd_deck, fire, [Energy.Type.GRASS], [Energy.Type.FIRE], 4, seed=2, workers=1,
+                              allow_fallback=True)
+    assert result.engine == "scalar" and result.games == 4
+    assert result.unsupported == [("test-001", "attack effect DiscardEffect")]
+    assert sum(result.counts().values()) == 4
+
+    print("✓ Supported cards and fallback test passed")
+    return True
+
+
+def test_batch_results_repeat_under_a_seed():
+    """Test that a seeded batch repeats exactly and reports consistent outcomes"""
+    grass, fire = _decks()
+    result = simulate_matchup(grass, fire, [Energy.Type.GRASS], [Energy.Type.FIRE], 400, seed=9)
+    assert result.engine == "kernel" and result.games == 400
+    assert result == simulate_matchup(grass, fire, [Energy.Type.GRASS], [Energy.Type.FIRE], 400, seed=9)
+    assert result != simulate_matchup(grass, fire, [Energy.Type.GRASS], [Energy.Type.FIRE], 400, seed=10)
+
+    counts = result.counts()
+    assert sum(counts.values()) == 400 and counts["Player 1"] > 0 and counts["Player 2"] > 0
+    for winner, turns, points in zip(result.winners, result.turns, result.points):
+        assert 1 <= turns <= GameRules.MAX_TURNS
+        if winner is None:
+            assert turns == GameRules.MAX_TURNS and max(points) < GameRules.WINNING_POINTS
+        else:
+            assert points[1 - winner] < GameRules.WINNING_POINTS
+
+    print("✓ Seeded batch test passed")
+    return True
+
+
+def _side(battle: LockstepBattle, seat: int, games: int, active: str, bench: str = None) -> _Side:
+    """A side with an empty hand and deck and the given Pokemon in play"""
+    side = battle._new_side(seat, games)
+    side.hand[:] = 0
+    side.top[:] = side.deck_size
+    side.kind[:, 0] = battle.cards.index[active]
+    if bench:
+        side.kind[:, 1] = battle.cards.index[bench]
+    side.turns[:] = 1
+    return side
+
+
+def test_attack_weakness_and_knockout():
+    """Test the vectorized attack step: weakness bonus, knockouts, prizes and promotion"""
+    grass, fire = _decks()
+    battle = LockstepBattle(grass, fire, [Energy.Type.GRASS], [Energy.Type.FIRE])
+    battle.rng = np.random.default_rng(0)
+    fire_index = ENERGY_INDEX[Energy.Type.FIRE]
+
+    attacker = _side(battle, 1, 2, "a1-230")  # Charmander: Ember, 30 for one Fire
+    attacker.energy[:, 0, fire_index] = 1
+    defender = _side(battle, 0, 2, "a1-001", bench="a1-005")  # Bulbasaur (Fire weakness), Caterpie
+    defender.damage[1, 0] = 20  # 70 HP: 20 + 30 + weakness goes down
+
+    mover_won, other_won = battle._play_turn(attacker, defender, turn=1)
+    assert not mover_won.any() and not other_won.any()
+    assert defender.damage[0, 0] == 30 + GameRules.WEAKNESS_BONUS
+    assert defender.kind[1, 0] == battle.cards.index["a1-005"] and defender.kind[1, 1] == battle.cards.empty
+    assert defender.damage[1, 0] == 0 and attacker.points.tolist() == [0, 1]
+    # Ember discards the Fire Energy it was paid with
+    assert attacker.energy[:, 0, fire_index].tolist() == [0, 0]
+    assert attacker.turns[:, 0].tolist() == [2, 2]
+
+    print("✓ Attack, weakness and knockout test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_supported_cards_and_fallback() and test_batch_results_repeat_under_a_seed()
+               and test_attack_weakness_and_knockout())
+    exit(0 if success else 1)
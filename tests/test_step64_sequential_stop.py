@@ -0,0 +1,87 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.registry import build_registered_decks
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import BatchRunner, GameConfig
+from v3.models.match.match_stats import SequentialStop, sprt_llr
+from v3.models.match.tournament import Entrant, Tournament
+
+
+def test_stop_rules():
+    """Test the precision and SPRT decisions and the minimum game count"""
+    sprt = SequentialStop(sprt_delta=0.1, min_games=20)
+    lower, upper = sprt.sprt_bounds()
+    assert lower < 0 < upper
+    assert sprt.decision(18, 2, 0) == "sprt: Player 1 favored"
+    assert sprt.decision(2, 18, 0) == "sprt: Player 2 favored"
+    assert sprt.decision(10, 10, 5) is None  # Even so far: keep going
+    assert sprt.decision(9, 1, 0) is None  # Too few games
+    assert sprt_llr(10, 10, 0.4, 0.6) == 0.0
+
+    precise = SequentialStop(precision=0.05, min_games=20)
+    assert precise.decision(100, 100, 0) is None  # About ±7% on 200 games
+    assert precise.decision(500, 500, 0) == "precision"
+    assert precise.half_width(500, 500, 0) <= 0.05 < precise.half_width(100, 100, 0)
+
+    for bad in ({}, {"precision": 0.0}, {"sprt_delta": 0.5}):
+        try:
+            SequentialStop(**bad)
+            assert False, bad
+        except ValueError:
+            pass
+
+    print("✓ Stop rule test passed")
+    return True
+
+
+def test_adaptive_batch_stops_at_the_same_game():
+    """Test that an adaptive batch stops early at the same game for any worker count"""
+    config = GameConfig(BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                        [Energy.Type.GRASS], [Energy.Type.FIRE])
+    stop = SequentialStop(sprt_delta=0.15, min_games=20)
+    seen = []
+    serial = BatchRunner(config, workers=1, seed=4).run_adaptive(400, stop, check_every=10, on_result=seen.append)
+    assert serial.stopped_by is not None and serial.games < 400
+    assert serial.games_saved == 400 - serial.games and serial.games % 10 == 0
+    assert [result.game_index for result in seen] == list(range(serial.games))
+    assert sum(serial.counts.values()) == serial.games
+    low, high = serial.intervals()["Player 2"]
+    assert low <= serial.counts["Player 2"] / serial.games <= high
+
+    parallel = BatchRunner(config, workers=2, seed=4, chunk_size=7).run_adaptive(400, stop, check_every=10)
+    assert parallel == serial
+
+    unmet = BatchRunner(config, workers=1, seed=4).run_adaptive(30, SequentialStop(precision=0.01, min_games=10))
+    assert unmet.stopped_by is None and unmet.games == 30 and unmet.games_saved == 0
+
+    print("✓ Adaptive batch test passed")
+    return True
+
+
+def test_tournament_pairings_stop_early():
+    """Test that tournament pairings stop on their own rule and report the games saved"""
+    decks = build_registered_decks(["basic_grass", "basic_fire", "generated_basic_grass"])
+    entrants = [Entrant(name, deck, energy_types) for name, (deck, energy_types) in decks.items()]
+    stop = SequentialStop(sprt_delta=0.2, min_games=10)
+
+    result = Tournament(entrants, games_per_pairing=60, workers=1, seed=2, chunk_size=5, stop=stop).run()
+    stopped = [pairing for pairing in result.pairings.values() if pairing.stopped_by]
+    assert stopped and all(pairing.games < 60 and pairing.games % 5 == 0 for pairing in stopped)
+    assert result.games_saved() == 3 * 60 - result.total_games() > 0
+    assert result.to_dict()["games_saved"] == result.games_saved()
+
+    fixed = Tournament(entrants, games_per_pairing=60, workers=1, seed=2, chunk_size=5, stop=stop,
+                       schedule="fixed").run()
+    assert fixed.to_dict() == result.to_dict()
+
+    print("✓ Tournament early stop test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_stop_rules() and test_adaptive_batch_stops_at_the_same_game()
+               and test_tournament_pairings_stop_early())
+    exit(0 if success else 1)
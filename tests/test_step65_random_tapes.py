@@ -0,0 +1,106 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.basic_fire_deck import BasicFireDeck
+from v3.decks.basic_grass_deck import BasicGrassDeck
+from v3.decks.intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
+from v3.models.cards.energy import Energy
+from v3.models.match.batch_runner import GameConfig, build_engine, play_game, run_paired
+from v3.models.match.game_record import GameRecord
+from v3.models.match.game_replay import GameReplay
+from v3.models.match.random_tape import RandomTape
+
+
+def _config(deck1=None, **options) -> GameConfig:
+    return GameConfig(deck1 or BasicGrassDeck().get_deck(), BasicFireDeck().get_deck(),
+                      [Energy.Type.GRASS], [Energy.Type.FIRE], **options)
+
+
+def test_arms_share_the_tape():
+    """Test that two different games on one tape get the same first player, shuffles and rolls"""
+    tape = RandomTape(12)
+    grass = build_engine(_config(tapes=True), 12)
+    swapped = build_engine(_config(tapes=True).swapped(), 12)
+    assert grass.tape == swapped.tape == tape and grass.seed == 12
+
+    for engine in (grass, swapped):
+        assert engine.rng.random() == tape.coin_rng().random()
+        for seat, player in enumerate(engine.players):
+            assert player.rng.getstate() == tape.shuffle_rng(seat).getstate()
+            assert player.agent.rng.getstate() == tape.agent_rng(seat).getstate()
+            assert player.rng is not player.energy_zone.rng is not engine.rng
+        engine.begin()
+        assert engine.first_player_index == tape.first_player
+
+    # Equal-size decks are shuffled by the same permutations, seat by seat
+    order = list(range(20))
+    tape.shuffle_rng(0).shuffle(order)
+    deck = BasicGrassDeck().get_deck()
+    player = build_engine(_config(tapes=True), 12).players[0]
+    player.deck = [card.instantiate() for card in deck]
+    player._shuffle_deck()
+    assert [card.id for card in player.deck] == [deck[i].id for i in order]
+
+    # Without a tape the engine keeps its single stream
+    plain = build_engine(_config(), 12)
+    assert plain.tape is None and plain.players[0].rng is plain.rng is plain.players[0].energy_zone.rng
+
+    print("✓ Shared tape test passed")
+    return True
+
+
+def test_tape_games_clone_and_replay():
+    """Test that a tape game repeats through clone() and through its game record"""
+    engine = build_engine(_config(tapes=True), 5)
+    copy = engine.clone()
+    assert copy.players[0].rng is not engine.players[0].rng
+    assert copy.players[0].energy_zone.rng.getstate() == engine.players[0].energy_zone.rng.getstate()
+    winner = engine.start_battle()
+    copy_winner = copy.start_battle()
+    assert engine.players.index(winner) == copy.players.index(copy_winner) and engine.turn == copy.turn
+
+    result = play_game(_config(tapes=True, record=True), 0, 5)
+    record = GameRecord.from_json(result.record)
+    assert record.tape and record.seed == 5
+    assert play_game(_config(record=True), 0, 5).record != result.record
+    replayed = GameReplay(record).run()
+    assert replayed.turn == record.turns
+    assert [player.points for player in replayed.players] == record.points
+
+    print("✓ Tape clone and replay test passed")
+    return True
+
+
+def test_paired_comparison():
+    """Test that paired arms on shared tapes give a narrower difference interval"""
+    config_a = _config()
+    config_b = _config(IntermediateGrassDeck().get_deck())
+
+    same = run_paired(config_a, 20, seed=3, workers=1, config_b=_config())
+    assert same.difference == 0 and same.interval() == (0.0, 0.0) and same.games == 80
+    low, high = same.unpaired_interval()
+    assert low < 0 < high
+
+    paired = run_paired(config_a, 100, seed=3, workers=1, config_b=config_b)
+    assert all(score in (0, 0.25, 0.5, 0.75, 1) for score in paired.scores_a)
+    low, high = paired.interval()
+    unpaired_low, unpaired_high = paired.unpaired_interval()
+    assert low < paired.difference < high
+    assert high - low < unpaired_high - unpaired_low
+
+    parallel = run_paired(config_a, 100, seed=3, workers=2, chunk_size=9, config_b=config_b)
+    assert parallel == paired
+
+    single = run_paired(config_a, 10, seed=3, workers=1, swap_seats=False)
+    assert single.games == 10 and single.score_b is None
+    assert all(score in (0, 0.5, 1) for score in single.scores_a)
+    low, high = single.interval()
+    assert low <= single.score_a <= high
+
+    print("✓ Paired comparison test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_arms_share_the_tape() and test_tape_games_clone_and_replay() and test_paired_comparison()
+    exit(0 if success else 1)
@@ -0,0 +1,93 @@
+import sys
+sys.path.insert(0, '.')
+
+from v3.decks.deck_generators import create_evolution_deck
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from v3.models.cards.evolution_graph import EvolutionGraph
+from v3.models.cards.pokemon import Pokemon
+from v3.models.match.game_rules import GameRules
+from v3.models.match.player import Player
+
+
+def _in_play(card: Pokemon) -> Pokemon:
+    pokemon = card.instantiate()
+    pokemon.turns_in_play = 1
+    return pokemon
+
+
+def _pokemon(card_id: str, name: str, subtype: str, evolves_from: str = None) -> Pokemon:
+    return Pokemon(card_id, name, Energy.Type.GRASS, Card.Type.POKEMON, subtype, 60, "Set", "Pack", "Common",
+                   [], 1, Energy.Type.FIRE, evolves_from)
+
+
+def test_imported_lines():
+    """Test that imported Pokemon carry their evolution lines and exact Rare Candy ancestry"""
+    importer = JsonCardImporter.shared()
+    cards = importer.pokemon
+    bulbasaur, ivysaur, venusaur = cards["a1-001"], cards["a1-002"], cards["a1-004"]
+    assert ivysaur.evolves_from_ids == {"a1-001"} and bulbasaur.evolves_to_ids == {"a1-002"}
+    assert venusaur.evolves_from_ids == {"a1-002"} and venusaur.rare_candy_from_ids == {"a1-001"}
+    assert importer.evolution_graph.descendants("a1-001") == ["a1-002", "a1-004"]
+    # Charizard ex evolves from Charmeleon, which is not in the card pool
+    assert not cards["a2b-010"].evolves_from_ids and not cards["a2b-010"].rare_candy_from_ids
+    # Copies share the annotated definition
+    assert bulbasaur.instantiate().evolves_to_ids is bulbasaur.evolves_to_ids
+
+    assert GameRules.can_evolve(_in_play(bulbasaur), ivysaur)
+    assert not GameRules.can_evolve(_in_play(bulbasaur), venusaur)
+    assert GameRules.can_evolve(_in_play(bulbasaur), venusaur, allow_rare_candy=True)
+    assert not GameRules.can_evolve(_in_play(cards["a1-005"]), venusaur, allow_rare_candy=True)
+    assert not GameRules.can_evolve(_in_play(cards["a1-230"]), cards["a2b-010"], allow_rare_candy=True)
+    assert not GameRules.can_evolve(bulbasaur.instantiate(), ivysaur)  # Not in play for a turn yet
+
+    print("✓ Imported evolution lines test passed")
+    return True
+
+
+def test_graph_over_reprints_and_unindexed_cards():
+    """Test that same-named cards share lines by stage, and cards outside a pool fall back to names"""
+    pool = [_pokemon("x-1", "Seed", Card.Subtype.BASIC), _pokemon("x-2", "Seed", Card.Subtype.BASIC),
+            _pokemon("x-3", "Sprout", Card.Subtype.STAGE_1, "Seed"),
+            _pokemon("x-4", "Bloom", Card.Subtype.STAGE_2, "Sprout"),
+            _pokemon("x-5", "Sprout", Card.Subtype.STAGE_2, "Seed")]  # Same name, wrong stage
+    graph = EvolutionGraph(pool)
+    assert graph.parents["x-3"] == {"x-1", "x-2"} and graph.parents["x-5"] == frozenset()
+    assert graph.parents["x-4"] == {"x-3"} and graph.rare_candy_parents["x-4"] == {"x-1", "x-2"}
+    assert graph.can_evolve("x-2", "x-4", rare_candy=True) and not graph.can_evolve("x-2", "x-4")
+
+    seed, sprout = _in_play(pool[0]), pool[2]
+    assert GameRules.can_evolve(seed, sprout)  # By name, before the pool is annotated
+    assert not GameRules.can_evolve(seed, pool[3], allow_rare_candy=True)
+    graph.annotate()
+    assert pool[3].rare_candy_from_ids == {"x-1", "x-2"}
+    assert GameRules.can_evolve(_in_play(pool[0]), pool[3], allow_rare_candy=True)
+
+    print("✓ Reprint and fallback test passed")
+    return True
+
+
+def test_evolve_moves_and_evolution_deck():
+    """Test that Rare Candy evolve moves are generated and the evolution deck reaches Stage 2"""
+    importer = JsonCardImporter.shared()
+    cards = importer.pokemon
+    player = Player("Player 1", [cards["a1-001"].instantiate() for _ in range(20)], [Energy.Type.GRASS])
+    player.active_pokemon = _in_play(cards["a1-001"])
+    player.cards_in_hand = [cards["a1-004"].instantiate(), cards["a1-002"].instantiate()]
+    assert [action.evolution_card_id for action in player._generate_evolve_actions()] == ["a1-002"]
+    player.used_rare_candy_this_turn = True
+    assert [action.evolution_card_id for action in player._generate_evolve_actions()] == ["a1-004", "a1-002"]
+
+    deck = create_evolution_deck(importer, "Bulbasaur", 20)
+    names = {card.name for card in deck}
+    assert len(deck) == 20 and names == {"Bulbasaur", "Ivysaur", "Venusaur ex"}
+
+    print("✓ Evolve moves and evolution deck test passed")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_imported_lines() and test_graph_over_reprints_and_unindexed_cards()
+               and test_evolve_moves_and_evolution_deck())
+    exit(0 if success else 1)
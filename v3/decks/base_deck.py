@@ -4,7 +4,6 @@ Handles card loading using JsonCardImporter.
 """
 
 from typing import List, Dict, Any
-from copy import deepcopy
 from v3.importers.json_card_importer import JsonCardImporter
 from v3.models.cards.card import Card
 
@@ -13,16 +12,15 @@ class BaseDeck:
     """Base class for all deck configurations in v3"""
     
     def __init__(self):
-        """Initialize the deck with card importer"""
-        self.importer = JsonCardImporter()
-        self.importer.import_from_json()
+        """Initialize the deck with the shared card importer"""
+        self.importer = JsonCardImporter.shared()
         self._loaded_cards = {}  # Cache for loaded cards
     
     def get_card_by_id(self, card_id: str) -> Card:
-        """Get a card by its ID (returns a deep copy for deck building)"""
+        """Get a card by its ID (a fresh instance sharing the card's definition)"""
         # Check cache first
         if card_id in self._loaded_cards:
-            return deepcopy(self._loaded_cards[card_id])
+            return self._loaded_cards[card_id].instantiate()
         
         # Try to find in importer
         card = None
@@ -43,9 +41,9 @@ class BaseDeck:
         if card is None:
             raise ValueError(f"Card with ID '{card_id}' not found in card database")
         
-        # Cache the original (we'll deepcopy when returning)
+        # Cache the original (we'll instantiate when returning)
         self._loaded_cards[card_id] = card
-        return deepcopy(card)
+        return card.instantiate()
     
     def get_deck(self) -> List[Card]:
         """Override this method in subclasses to define deck contents"""
@@ -0,0 +1,270 @@
+"""
+Generated deck builders for v3 - decks assembled from whatever cards the importer loaded
+(as opposed to the fixed BaseDeck lists)
+"""
+
+from collections import Counter
+from typing import List
+
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+
+
+def create_basic_deck(importer: JsonCardImporter, energy_type: Energy.Type, deck_size: int = 20):
+    """Create a basic deck from available Pokemon cards (max 2 copies per card)
+    Note: energy_type is used for Energy Zone generation, not for filtering Pokemon"""
+    deck = []
+    
+    # Get all available Pokemon
+    available_pokemon = list(importer.pokemon.values())
+    
+    if not available_pokemon:
+        print("Error: No Pokemon cards found in JSON file!")
+        return None
+    
+    # Get all Basic Pokemon (don't filter by energy type - use all available)
+    basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
+    
+    if not basic_pokemon:
+        print("Error: No Basic Pokemon found!")
+        return None
+    
+    # Sort by energy type preference (prefer Pokemon matching the chosen energy type)
+    def sort_key(p):
+        if p.element == energy_type:
+            return 0  # Prefer matching energy type
+        return 1
+    
+    basic_pokemon.sort(key=sort_key)
+    
+    # Create deck with max 2 copies of each card
+    # Track how many of each card ID we've added
+    card_counts = Counter()
+    max_copies = 2
+    
+    # First pass: add up to 2 copies of each unique card
+    for pokemon in basic_pokemon:
+        card_id = pokemon.id
+        if card_counts[card_id] < max_copies:
+            copies_to_add = min(max_copies - card_counts[card_id], deck_size - len(deck))
+            for _ in range(copies_to_add):
+                deck.append(pokemon.instantiate())
+                card_counts[card_id] += 1
+                if len(deck) >= deck_size:
+                    break
+        if len(deck) >= deck_size:
+            break
+    
+    # If we still need more cards, add more copies (but still max 2 per card)
+    # Cycle through available cards
+    while len(deck) < deck_size:
+        added_any = False
+        for pokemon in basic_pokemon:
+            card_id = pokemon.id
+            if card_counts[card_id] < max_copies and len(deck) < deck_size:
+                deck.append(pokemon.instantiate())
+                card_counts[card_id] += 1
+                added_any = True
+                if len(deck) >= deck_size:
+                    break
+        if not added_any or len(deck) >= deck_size:
+            break
+    
+    # If still not enough cards, we need to allow more copies (but warn)
+    if len(deck) < deck_size:
+        print(f"Warning: Only {len(basic_pokemon)} unique Basic Pokemon available.")
+        print(f"Adding extra copies to reach {deck_size} cards (exceeding 2-copy limit).")
+        while len(deck) < deck_size:
+            for pokemon in basic_pokemon:
+                if len(deck) >= deck_size:
+                    break
+                deck.append(pokemon.instantiate())
+    
+    return deck[:deck_size]
+
+
+def create_evolution_deck(importer: JsonCardImporter, base_pokemon_name: str, deck_size: int = 20):
+    """Create a deck focused on an evolution chain (e.g., Bulbasaur -> Ivysaur -> Venusaur)"""
+    deck = []
+    available_pokemon = list(importer.pokemon.values())
+    
+    if not available_pokemon:
+        return None
+    
+    # Find the evolution chain
+    base = None
+    for pokemon in available_pokemon:
+        if pokemon.name == base_pokemon_name and pokemon.subtype == Card.Subtype.BASIC:
+            base = pokemon
+    
+    if not base:
+        print(f"Error: Base Pokemon '{base_pokemon_name}' not found!")
+        return None
+    
+    # Follow the evolution graph (see JsonCardImporter): a Stage 2 evolves from the
+    # Stage 1, so only the Stage 1's evolves_to_ids lead to it
+    stage1 = [importer.pokemon[card_id] for card_id in sorted(base.evolves_to_ids)]
+    stage2 = [importer.pokemon[card_id] for card_id in sorted(stage1[0].evolves_to_ids)] if stage1 else []
+    
+    # Build deck: 8-10 base, 4-6 stage1, 2-4 stage2, fill rest with base
+    card_counts = Counter()
+    max_copies = 2
+    
+    # Add base Pokemon (8-10 copies)
+    base_count = min(10, deck_size - 6)  # Leave room for evolutions
+    for _ in range(base_count):
+        if card_counts[base.id] < max_copies * 5:  # Allow more base Pokemon
+            deck.append(base.instantiate())
+            card_counts[base.id] += 1
+    
+    # Add Stage 1 (4-6 copies)
+    if stage1:
+        stage1_pokemon = stage1[0]
+        stage1_count = min(6, deck_size - len(deck) - 2)
+        for _ in range(stage1_count):
+            if card_counts[stage1_pokemon.id] < max_copies * 3:
+                deck.append(stage1_pokemon.instantiate())
+                card_counts[stage1_pokemon.id] += 1
+    
+    # Add Stage 2 (2-4 copies)
+    if stage2:
+        stage2_pokemon = stage2[0]
+        stage2_count = min(4, deck_size - len(deck))
+        for _ in range(stage2_count):
+            if card_counts[stage2_pokemon.id] < max_copies * 2:
+                deck.append(stage2_pokemon.instantiate())
+                card_counts[stage2_pokemon.id] += 1
+    
+    # Fill remaining with base Pokemon
+    while len(deck) < deck_size:
+        deck.append(base.instantiate())
+    
+    return deck[:deck_size]
+
+
+def create_mixed_type_deck(importer: JsonCardImporter, energy_types: list[Energy.Type], deck_size: int = 20):
+    """Create a deck with multiple energy types"""
+    deck = []
+    available_pokemon = list(importer.pokemon.values())
+    
+    if not available_pokemon:
+        return None
+    
+    # Get Basic Pokemon of any specified type
+    basic_pokemon = []
+    for energy_type in energy_types:
+        matching = [p for p in available_pokemon 
+                   if p.subtype == Card.Subtype.BASIC and p.element == energy_type]
+        basic_pokemon.extend(matching)
+    
+    if not basic_pokemon:
+        basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
+    
+    if not basic_pokemon:
+        return None
+    
+    # Create deck with max 2 copies per card
+    card_counts = Counter()
+    max_copies = 2
+    
+    # Distribute cards across types
+    cards_per_type = deck_size // len(energy_types) if energy_types else deck_size
+    
+    for energy_type in energy_types:
+        type_pokemon = [p for p in basic_pokemon if p.element == energy_type]
+        for pokemon in type_pokemon:
+            if len(deck) >= deck_size:
+                break
+            if card_counts[pokemon.id] < max_copies:
+                copies = min(max_copies - card_counts[pokemon.id], deck_size - len(deck))
+                for _ in range(copies):
+                    deck.append(pokemon.instantiate())
+                    card_counts[pokemon.id] += 1
+    
+    # Fill remaining slots
+    while len(deck) < deck_size:
+        added_any = False
+        for pokemon in basic_pokemon:
+            if len(deck) >= deck_size:
+                break
+            if card_counts[pokemon.id] < max_copies:
+                deck.append(pokemon.instantiate())
+                card_counts[pokemon.id] += 1
+                added_any = True
+        if not added_any:
+            break
+    
+    # Not enough different cards - allow extra copies, as create_basic_deck does
+    if len(deck) < deck_size:
+        print(f"Warning: Only {len(set(p.id for p in basic_pokemon))} unique Basic Pokemon available.")
+        print(f"Adding extra copies to reach {deck_size} cards (exceeding 2-copy limit).")
+        while len(deck) < deck_size:
+            for pokemon in basic_pokemon:
+                if len(deck) >= deck_size:
+                    break
+                deck.append(pokemon.instantiate())
+    
+    return deck[:deck_size]
+
+
+def create_aggressive_deck(importer: JsonCardImporter, energy_type: Energy.Type, deck_size: int = 20):
+    """Create an aggressive deck focused on high-damage Pokemon"""
+    deck = []
+    available_pokemon = list(importer.pokemon.values())
+    
+    if not available_pokemon:
+        return None
+    
+    # Filter for Basic Pokemon with attacks that do damage
+    basic_pokemon = [
+        p for p in available_pokemon 
+        if p.subtype == Card.Subtype.BASIC and p.element == energy_type
+    ]
+    
+    if not basic_pokemon:
+        basic_pokemon = [p for p in available_pokemon if p.subtype == Card.Subtype.BASIC]
+    
+    # Sort by attack damage (highest first)
+    def get_max_damage(pokemon):
+        if pokemon.attacks:
+            return max((a.damage for a in pokemon.attacks), default=0)
+        return 0
+    
+    basic_pokemon.sort(key=get_max_damage, reverse=True)
+    
+    # Create deck prioritizing high-damage Pokemon
+    card_counts = Counter()
+    max_copies = 2
+    
+    for pokemon in basic_pokemon:
+        if len(deck) >= deck_size:
+            break
+        if card_counts[pokemon.id] < max_copies:
+            copies = min(max_copies - card_counts[pokemon.id], deck_size - len(deck))
+            for _ in range(copies):
+                deck.append(pokemon.instantiate())
+                card_counts[pokemon.id] += 1
+    
+    # Fill remaining
+    while len(deck) < deck_size:
+        for pokemon in basic_pokemon:
+            if len(deck) >= deck_size:
+                break
+            deck.append(pokemon.instantiate())
+    
+    return deck[:deck_size]
+
+
+def infer_energy_types(deck: List[Card]) -> List[Energy.Type]:
+    """Energy zone types for a generated deck: its most common Pokemon element, plus Normal.
+
+    Ties go to the element that appears first in the deck, so the result is the same in
+    every process.
+    """
+    counts = Counter(card.element for card in deck
+                     if getattr(card, 'element', None) not in (None, Energy.Type.NORMAL))
+    if not counts:
+        return [Energy.Type.NORMAL]
+    energy_type = max(counts, key=counts.get)
+    return [energy_type, Energy.Type.NORMAL]
@@ -0,0 +1,73 @@
+"""
+Registry of every deck builder in v3: the BaseDeck lists plus the generated variants.
+Used by the tournament runner to play every deck against every other deck.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from .base_deck import BaseDeck
+from .basic_fire_deck import BasicFireDeck
+from .basic_grass_deck import BasicGrassDeck
+from .deck_generators import (
+    create_aggressive_deck, create_basic_deck, create_evolution_deck, create_mixed_type_deck, infer_energy_types,
+)
+from .intermediate_grass_deck import BasicGrassDeck as IntermediateGrassDeck
+
+# Fixed decklists, named as in play_game.py's DECK_MAP (other BaseDeck subclasses are
+# picked up by prebuilt_decks under their module name)
+PREBUILT_DECKS: Dict[str, type] = {
+    'basic_grass': BasicGrassDeck,
+    'intermediate_grass': IntermediateGrassDeck,
+    'basic_fire': BasicFireDeck,
+}
+
+# Generated variants (see deck_generators); each returns a deck or None
+GENERATED_DECKS: Dict[str, Callable[[JsonCardImporter], Optional[List[Card]]]] = {
+    'generated_basic_grass': lambda importer: create_basic_deck(importer, Energy.Type.GRASS),
+    'generated_basic_fire': lambda importer: create_basic_deck(importer, Energy.Type.FIRE),
+    'generated_evolution_bulbasaur': lambda importer: create_evolution_deck(importer, "Bulbasaur"),
+    'generated_mixed_grass': lambda importer: create_mixed_type_deck(importer, [Energy.Type.GRASS, Energy.Type.NORMAL]),
+    'generated_mixed_fire': lambda importer: create_mixed_type_deck(importer, [Energy.Type.FIRE, Energy.Type.NORMAL]),
+    'generated_aggressive_grass': lambda importer: create_aggressive_deck(importer, Energy.Type.GRASS),
+    'generated_aggressive_fire': lambda importer: create_aggressive_deck(importer, Energy.Type.FIRE),
+}
+
+
+def prebuilt_decks() -> Dict[str, type]:
+    """Every loaded BaseDeck subclass by name"""
+    decks = dict(PREBUILT_DECKS)
+    for deck_class in BaseDeck.__subclasses__():
+        if deck_class not in decks.values():
+            module = deck_class.__module__.rsplit('.', 1)[-1]
+            decks[module[:-5] if module.endswith('_deck') else module] = deck_class
+    return decks
+
+
+def build_deck(name: str, importer: Optional[JsonCardImporter] = None) -> Optional[Tuple[List[Card], List[str]]]:
+    """(deck, energy types) of a registered deck, or None if its builder found no cards"""
+    prebuilt = prebuilt_decks()
+    if name in prebuilt:
+        builder: BaseDeck = prebuilt[name]()
+        return builder.get_deck(), [getattr(Energy.Type, et.upper()) for et in builder.get_energy_types()]
+    if name in GENERATED_DECKS:
+        deck = GENERATED_DECKS[name](importer or JsonCardImporter.shared())
+        return (deck, infer_energy_types(deck)) if deck else None
+    raise ValueError(f"Unknown deck '{name}' (registered: {', '.join(registered_deck_names())})")
+
+
+def registered_deck_names() -> List[str]:
+    return list(prebuilt_decks()) + list(GENERATED_DECKS)
+
+
+def build_registered_decks(names: Optional[List[str]] = None,
+                           importer: Optional[JsonCardImporter] = None) -> Dict[str, Tuple[List[Card], List[str]]]:
+    """Build the named decks (default: all registered), skipping builders that return no deck"""
+    decks = {}
+    for name in names or registered_deck_names():
+        built = build_deck(name, importer)
+        if built is not None:
+            decks[name] = built
+    return decks
@@ -1,12 +1,25 @@
+import hashlib
 import json
 import os
+import pickle
 import sys
-from typing import Dict, List
+from typing import Dict, List, Optional
 from ..models.cards.energy import Energy
 from ..models.cards.attack import Attack
 from ..models.cards.ability import Ability
 from ..models.cards.card import Card
 from ..models.cards.pokemon import Pokemon
+from ..models.cards.evolution_graph import EvolutionGraph
+
+# Bump when the card classes change shape so stale caches are rebuilt
+CACHE_VERSION = 5
+# Set to a directory to keep the compiled card cache somewhere else
+CACHE_DIR_ENV = "PTCGP_CARD_CACHE_DIR"
+
+# Loaded importers by asset folder (see JsonCardImporter.shared)
+_shared_importers: Dict[str, 'JsonCardImporter'] = {}
+
+
 class JsonCardImporter:
     def __init__(self):
         # Card types
@@ -14,18 +27,47 @@ class JsonCardImporter:
         self.pokemon = {}
         self.supporters = {}
         self.tools = {}
+        self.evolution_graph: Optional[EvolutionGraph] = None
+
+    @classmethod
+    def shared(cls, folder_path: Optional[str] = None) -> 'JsonCardImporter':
+        """Process-wide importer for folder_path, loaded on first use.
+        
+        The cards are shared by every caller - copy a card before changing it.
+        """
+        folder_path = os.path.abspath(folder_path or cls.default_folder())
+        importer = _shared_importers.get(folder_path)
+        if importer is None:
+            importer = cls()
+            importer.import_from_json(folder_path)
+            _shared_importers[folder_path] = importer
+        return importer
 
-    def import_from_json(self):
-        """Import cards from all JSON files in a folder"""
-        # Get the directory of this file, then go to v3/assets
+    @staticmethod
+    def default_folder() -> str:
+        """The v3/assets folder"""
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        folder_path = os.path.join(current_dir, '..', 'assets')
-        folder_path = os.path.abspath(folder_path)
+        return os.path.abspath(os.path.join(current_dir, '..', 'assets'))
+
+    def import_from_json(self, folder_path: Optional[str] = None, use_cache: bool = True):
+        """Import cards from all JSON files in a folder (default v3/assets).
+        
+        The parsed cards are pickled to a cache keyed by the JSON files, so later
+        imports of unchanged files load with a single read instead of parsing.
+        """
+        folder_path = os.path.abspath(folder_path or self.default_folder())
+        json_files = sorted(f for f in os.listdir(folder_path) if f.endswith('.json'))
+
+        cache_path = self._cache_path(folder_path, json_files) if use_cache else None
+        if cache_path and self._load_cache(cache_path):
+            # Cached definitions already carry their evolution ids
+            self.evolution_graph = EvolutionGraph(self.pokemon.values())
+            print(f"✓ Loaded {self.card_count()} cards from cache")
+            return
 
         print(f"Loading cards from {folder_path}...")
         
         cards_data = []
-        json_files = [f for f in os.listdir(folder_path) if f.endswith('.json')]
         
         for json_file in json_files:
             file_path = os.path.join(folder_path, json_file)
@@ -73,14 +115,83 @@ class JsonCardImporter:
                 continue
         
         # Set evolution relationships after processing all cards
-        # (Will be implemented when evolution system is added)
-        # self._set_evolution_relationships()
+        self._set_evolution_relationships()
         
         print(f"Import complete!")
         print(f"Created {len(self.pokemon)} Pokemon")
         print(f"Created {len(self.supporters)} supporters")
         print(f"Created {len(self.tools)} tools")
         print(f"Created {len(self.items)} items")
+
+        if cache_path:
+            self._write_cache(cache_path)
+
+    def _set_evolution_relationships(self):
+        """Build the evolution graph of the imported Pokemon and write it into their definitions"""
+        self.evolution_graph = EvolutionGraph(self.pokemon.values())
+        self.evolution_graph.annotate()
+
+    def card_count(self) -> int:
+        return len(self.pokemon) + len(self.items) + len(self.supporters) + len(self.tools)
+
+    def find_card(self, card_id: str) -> Optional[Card]:
+        """The imported card with this id (Pokemon, item, supporter or tool), or None"""
+        for cards in (self.pokemon, self.items, self.supporters, self.tools):
+            card = cards.get(card_id)
+            if card is not None:
+                return card
+        return None
+
+    ########## Compiled Cache ##########
+
+    @staticmethod
+    def _cache_prefix(folder_path: str) -> str:
+        """File name prefix of every cache of folder_path (other folders may share the cache directory)"""
+        return f"cards-{hashlib.sha1(folder_path.encode('utf-8')).hexdigest()[:8]}-"
+
+    @classmethod
+    def _cache_path(cls, folder_path: str, json_files: List[str]) -> str:
+        """Cache file for the current JSON files (hash of their names, sizes and mtimes)"""
+        key = hashlib.sha1(f"{CACHE_VERSION}:{sys.version_info[:2]}:{folder_path}".encode("utf-8"))
+        for json_file in json_files:
+            stat = os.stat(os.path.join(folder_path, json_file))
+            key.update(f"|{json_file}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or os.path.join(folder_path, '..', '.cache')
+        return os.path.join(os.path.abspath(cache_dir), f"{cls._cache_prefix(folder_path)}{key.hexdigest()[:16]}.pickle")
+
+    def _load_cache(self, cache_path: str) -> bool:
+        """Fill the card dicts from cache_path; False if it is missing or unreadable"""
+        try:
+            with open(cache_path, 'rb') as file:
+                cards = pickle.load(file)
+            self.pokemon, self.items = cards["pokemon"], cards["items"]
+            self.supporters, self.tools = cards["supporters"], cards["tools"]
+        except Exception:
+            return False
+        return True
+
+    def _write_cache(self, cache_path: str):
+        """Save the parsed cards and drop this folder's caches of older file versions (best effort)"""
+        cards = {"pokemon": self.pokemon, "items": self.items,
+                 "supporters": self.supporters, "tools": self.tools}
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(cards, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            # The prefix is everything before the content hash (see _cache_path)
+            prefix = os.path.basename(cache_path).rsplit("-", 1)[0] + "-"
+            for name in os.listdir(cache_dir):
+                path = os.path.join(cache_dir, name)
+                if name.startswith(prefix) and name.endswith(".pickle") and path != cache_path:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass  # Pruned by another process writing the same folder's cache
+        except OSError as e:
+            print(f"⚠️ Could not write card cache: {e}")
     
     def parse_energy_cost(self, cost_list: List[str]) -> Dict[str, int]:
         """Convert JSON energy cost array to internal energy cost dict"""
@@ -10,6 +10,18 @@ class Agent:
     def __init__(self, player: str):
         self.player = player
         self.is_human = False
+        self.rng = random  # Replaced by a seeded stream when the battle engine binds the player
+        self.matchups = None  # MatchupTables shared by the battle engine, when it has them
+        self.engine = None  # The battle engine playing this agent (search agents clone it)
+
+    def log(self, message: str, *args):
+        """Debug output (%-style); the battle engine rebinds this to its logger"""
+        pass
 
     def get_action(self, state: Dict, valid_action_indices: List[int]) -> Optional[int]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+
+def agent_name(agent) -> str:
+    """Name of an agent class, or of the class behind a functools.partial factory"""
+    return getattr(agent, '__name__', None) or getattr(agent, 'func', type(agent)).__name__
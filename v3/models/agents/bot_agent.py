@@ -1,4 +1,3 @@
-import random
 from typing import List, Dict, Optional
 # import numpy as np  # Not needed for basic bot agent
 # from gymnasium import Env, spaces  # Not needed for basic bot agent
@@ -23,4 +22,4 @@ class RLAgent(Agent):
                        state["player_energy"], state["player_hand_energy"], 
                        state["turn"]], dtype=np.float32)
         action, _ = self.model.predict(obs)
-        return action if action in valid_action_indices else random.choice(valid_action_indices)
\ No newline at end of file
+        return action if action in valid_action_indices else self.rng.choice(valid_action_indices)
\ No newline at end of file
@@ -0,0 +1,263 @@
+import atexit
+import functools
+import math
+import multiprocessing
+import multiprocessing.pool
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from v3.models.agents.random_agent import RandomAgent
+from v3.models.match.actions import Action
+from v3.models.match.game_profiler import clock
+from v3.models.match.game_rules import GamePhase, GameRules
+
+"""Information-set Monte Carlo tree search over the searching player's own turn"""
+
+# Root statistics of one search: action key -> (visits, total value)
+SearchStats = Dict[str, Tuple[int, float]]
+
+
+class _Node:
+    """Tree node reached by playing `key` from its parent; value is from the searcher's view"""
+    __slots__ = ('children', 'visits', 'total', 'available')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.visits = 0
+        self.total = 0.0
+        self.available = 0  # Iterations in which this action was legal (ISMCTS availability)
+
+
+def _action_key(action: Action) -> str:
+    # Names the card and target rather than the hand index, so one key means the same
+    # move in every determinization
+    return action.to_string()
+
+
+def _determinize(engine, seat: int, rng: random.Random):
+    """Resample what the searching seat cannot see: the opponent's hand and both deck orders"""
+    me, opponent = engine.players[seat], engine.players[1 - seat]
+    rng.shuffle(me.deck)
+    hidden = opponent.cards_in_hand + opponent.deck
+    rng.shuffle(hidden)
+    count = len(opponent.cards_in_hand)
+    opponent.cards_in_hand, opponent.deck = hidden[:count], hidden[count:]
+    for card in opponent.cards_in_hand:
+        card.card_position = card.Position.HAND
+    for card in opponent.deck:
+        card.card_position = card.Position.DECK
+    # Future coin flips and energy rolls are unknown too
+    engine.rng.seed(rng.getrandbits(64))
+    if engine.tape is not None:
+        # Tape games roll shuffles and energies on per-seat streams (see random_tape)
+        for player in engine.players:
+            player.rng.seed(rng.getrandbits(64))
+            player.energy_zone.rng.seed(rng.getrandbits(64))
+
+
+def _board_hp(player) -> int:
+    pokemons = [player.active_pokemon] + player.bench_pokemons
+    return sum(pokemon.current_health() for pokemon in pokemons if pokemon is not None)
+
+
+def _evaluate(engine, seat: int) -> float:
+    """1 for a win, 0 for a loss, 0.5 for a draw; unfinished games score prizes and board HP"""
+    me, opponent = engine.players[seat], engine.players[1 - seat]
+    if engine._is_game_over():
+        winner = engine._determine_winner()
+        return 0.5 if winner is None else (1.0 if winner is me else 0.0)
+    mine, theirs = _board_hp(me), _board_hp(opponent)
+    board = (mine - theirs) / max(1, mine + theirs)
+    return 0.5 + 0.4 * (me.points - opponent.points) / GameRules.WINNING_POINTS + 0.1 * board
+
+
+def _play(engine, action: Action) -> bool:
+    try:
+        return engine.apply_action(action)
+    except Exception:
+        # As in BattleEngine._main_phase, an action that fails ends the turn
+        return engine._next_turn()
+
+
+def _use_rollout_agents(engine, rng: random.Random):
+    """Seat RandomAgents on both sides of engine (never a search agent or a human)"""
+    for player in engine.players:
+        player.agent = RandomAgent(player)
+        player.agent.rng = random.Random(rng.getrandbits(64))
+    engine._bind_agents()
+
+
+def _iterate(engine, seat: int, root: _Node, rng: random.Random, exploration: float,
+             rollout_turns: Optional[int]) -> float:
+    """One determinization: descend the tree through the searcher's turn, expand one
+    action, then play the game out with RandomAgent on both seats"""
+    sim = engine.clone()
+    _determinize(sim, seat, rng)
+    _use_rollout_agents(sim, rng)
+
+    node, path = root, []
+    turn = sim.turn
+    try:
+        over = False
+        while not over and sim.turn == turn:
+            actions: Dict[str, Action] = {}
+            for action in sim.players[seat].get_legal_actions(sim):
+                actions.setdefault(_action_key(action), action)
+            for key in actions:
+                child = node.children.get(key)
+                if child is not None:
+                    child.available += 1
+            untried = [key for key in actions if key not in node.children]
+            if untried:
+                key = rng.choice(untried)
+                child = node.children[key] = _Node()
+                child.available = 1
+            else:
+                log_available = {key: math.log(node.children[key].available) for key in actions}
+                key = max(actions, key=lambda k: node.children[k].total / node.children[k].visits
+                          + exploration * math.sqrt(log_available[k] / node.children[k].visits))
+                child = node.children[key]
+            path.append(child)
+            node = child
+            over = _play(sim, actions[key])
+            if untried:
+                break
+
+        turns = 0
+        while not sim._is_game_over() and (rollout_turns is None or turns < rollout_turns):
+            sim.play_turn()
+            turns += 1
+    except Exception:
+        pass  # As in start_battle, an engine error ends the game where it stands
+    value = _evaluate(sim, seat)
+
+    for visited in path:
+        visited.visits += 1
+        visited.total += value
+    return value
+
+
+def search(engine, seat: int, iterations: Optional[int] = None, time_limit: Optional[float] = None,
+           seed: Optional[int] = None, exploration: float = 0.7,
+           rollout_turns: Optional[int] = None) -> Tuple[SearchStats, int]:
+    """Run ISMCTS for the seat to move on a copy of engine until either budget runs out.
+
+    Returns the root statistics and the number of iterations played.
+    """
+    if iterations is None and time_limit is None:
+        iterations = ISMCTSAgent.DEFAULT_ITERATIONS
+    rng = random.Random(seed)
+    root = _Node()
+    deadline = clock() + time_limit if time_limit is not None else None
+    done = 0
+    while done == 0 or ((iterations is None or done < iterations)
+                        and (deadline is None or clock() < deadline)):
+        _iterate(engine, seat, root, rng, exploration, rollout_turns)
+        done += 1
+    return {key: (child.visits, child.total) for key, child in root.children.items()}, done
+
+
+def _search_task(args) -> Tuple[SearchStats, int]:
+    return search(*args)
+
+
+########## Shared Process Pools ##########
+
+# One pool per worker count, reused by every agent and game in this process
+_pools: Dict[int, multiprocessing.pool.Pool] = {}
+
+
+def search_pool(workers: int) -> multiprocessing.pool.Pool:
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = multiprocessing.Pool(processes=workers)
+    return pool
+
+
+def close_search_pools():
+    """Shut down the rollout pools (also done at interpreter exit)"""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.terminate()
+        pool.join()
+
+
+atexit.register(close_search_pools)
+
+
+class ISMCTSAgent(RandomAgent):
+    """Information-set MCTS agent for main phase decisions.
+
+    Every iteration samples a determinization - the opponent's hand and deck order and
+    the agent's own deck order reshuffled from the cards it cannot see, with fresh coin
+    flips and energy rolls - on a BattleEngine.clone() of the game (per-game state only,
+    card data is shared). The tree covers the agent's own actions for the rest of its
+    turn, with UCB1 over the actions available in that determinization; the game is then
+    played out by RandomAgent on both seats, cut off after rollout_turns turns and scored
+    on prizes and board HP when given. The most visited action is played.
+
+    Budgets are per decision: iterations, time_limit (seconds) or both, whichever runs
+    out first; iteration budgets keep seeded games reproducible. With workers > 1 each
+    decision runs independent searches in a shared process pool and adds up their root
+    statistics (root parallelisation); inside daemon processes such as BatchRunner
+    workers the search stays in-process. Setup, turn zero and knockout replacements use
+    the RandomAgent heuristics.
+
+    Players build agents from a factory, so pass ISMCTSAgent.configured(...) for other budgets.
+    """
+
+    DEFAULT_ITERATIONS = 32
+
+    def __init__(self, player, iterations: Optional[int] = DEFAULT_ITERATIONS, time_limit: Optional[float] = None,
+                 workers: int = 1, exploration: float = 0.7, rollout_turns: Optional[int] = 4):
+        super().__init__(player)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = max(1, workers)
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.last_search: Optional[Tuple[SearchStats, int]] = None  # Root stats and iterations of the last decision
+
+    @classmethod
+    def configured(cls, **options) -> Callable:
+        """Agent factory with other budgets, usable as Player(agent=...) and GameConfig.agent1/2"""
+        return functools.partial(cls, **options)
+
+    def choose_action(self, actions: List[Action]) -> Optional[Action]:
+        engine = self.engine
+        if (engine is None or len(actions) <= 1 or engine.phase != GamePhase.MAIN
+                or engine._get_current_player() is not self.player):
+            return super().choose_action(actions)
+
+        keys = [_action_key(action) for action in actions]
+        stats = self._search(engine, engine.players.index(self.player))
+        best = max(range(len(actions)), key=lambda i: (stats[0].get(keys[i], (0, 0.0))[0], -i))
+        self.log("DEBUG AGENT: %s searched %s iterations: %s", self.player.name, stats[1],
+                 {key: visits for key, (visits, _) in stats[0].items()})
+        return actions[best]
+
+    def _search(self, engine, seat: int) -> Tuple[SearchStats, int]:
+        workers = self.workers
+        if workers > 1 and multiprocessing.current_process().daemon:
+            workers = 1  # Daemon processes cannot start a pool
+        options = (self.exploration, self.rollout_turns)
+
+        if workers == 1:
+            stats = search(engine, seat, self.iterations, self.time_limit, self.rng.getrandbits(64), *options)
+        else:
+            # Picklable copy: rollout agents instead of this agent, which holds the live engine
+            base = engine.clone()
+            _use_rollout_agents(base, self.rng)
+            share = -(-self.iterations // workers) if self.iterations is not None else None
+            tasks = [(base, seat, share, self.time_limit, self.rng.getrandbits(64)) + options
+                     for _ in range(workers)]
+            merged: Dict[str, Tuple[int, float]] = {}
+            done = 0
+            for worker_stats, worker_done in search_pool(workers).map(_search_task, tasks):
+                done += worker_done
+                for key, (visits, total) in worker_stats.items():
+                    seen_visits, seen_total = merged.get(key, (0, 0.0))
+                    merged[key] = (seen_visits + visits, seen_total + total)
+            stats = (merged, done)
+        self.last_search = stats
+        return stats
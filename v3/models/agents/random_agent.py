@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-import random
 # from sb3_contrib import MaskablePPO  # Not needed for RandomAgent
 from v3.models.agents.agent import Agent
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from v3.models.match.actions import (
+    Action, AttackAction, AttachEnergyAction, EndTurnAction, EvolveAction, PlayItemAction,
+    PlayPokemonAction, PlaySupporterAction, RetreatAction, UseAbilityAction, parse_action,
+)
+from v3.models.match.matchup_tables import attack_base_damage
 
 if TYPE_CHECKING:
     from v3.models.cards.pokemon import Pokemon
@@ -25,7 +29,7 @@ class RandomAgent(Agent):
         # Get the actual action strings from the player
         # We need to access the player's available actions
         if not hasattr(self, 'player') or self.player is None:
-            return random.choice(valid_action_indices)
+            return self.rng.choice(valid_action_indices)
         
         # Get current valid actions from the battle engine context
         # Since we don't have direct access, we'll use weighted selection based on indices
@@ -33,7 +37,7 @@ class RandomAgent(Agent):
         weights = self._calculate_action_weights(valid_action_indices)
         
         # Weighted random selection
-        return random.choices(valid_action_indices, weights=weights, k=1)[0]
+        return self.rng.choices(valid_action_indices, weights=weights, k=1)[0]
     
     def _calculate_action_weights(self, action_indices: List[int]) -> List[float]:
         """Calculate weights for each action index based on heuristics"""
@@ -66,20 +70,33 @@ class RandomAgent(Agent):
         if not actions:
             return None
         
+        # Choices that are not game actions (e.g. "replace_active_0") are picked uniformly
+        parsed = [parse_action(a, self.player) for a in actions]
+        if any(action is None for action in parsed):
+            return self.rng.choice(actions)
+        
+        selected = self.choose_action(parsed)
+        return next(a for a, action in zip(actions, parsed) if action is selected)
+    
+    def choose_action(self, actions: List[Action]) -> Optional[Action]:
+        """Choose one of the legal Action objects using weighted heuristics"""
+        if not actions:
+            return None
+        
         # Check if bench is empty - this is CRITICAL and should be addressed before attacking
         bench_count = sum(1 for p in self.player.bench_pokemons if p is not None) if hasattr(self, 'player') and self.player else 0
-        bench_actions = [a for a in actions if a.startswith("play_pokemon_") and "_bench" in a]
+        bench_actions = [a for a in actions if isinstance(a, PlayPokemonAction) and a.position.startswith("bench")]
         
         # If bench is empty and we have Pokemon to play, prioritize that over attacking
         if bench_count == 0 and bench_actions:
             # Very high priority - survival is more important than attacking
-            selected = random.choice(bench_actions)
+            selected = self.rng.choice(bench_actions)
             if hasattr(self, 'player') and self.player:
-                print(f"DEBUG AGENT: {self.player.name} prioritizing bench setup (empty bench): {selected}")
+                self.log("DEBUG AGENT: %s prioritizing bench setup (empty bench): %s", self.player.name, selected)
             return selected
         
         # First, check if we can attack - if so, prioritize KO potential or highest damage
-        attack_actions = [a for a in actions if a.startswith("attack_")]
+        attack_actions = [a for a in actions if isinstance(a, AttackAction)]
         if attack_actions:
             # Prioritize attack that can KO or highest damage
             if hasattr(self, 'player') and self.player and self.player.active_pokemon:
@@ -87,13 +104,12 @@ class RandomAgent(Agent):
                 best_attack = None
                 best_score = -1
                 
-                for action_str in attack_actions:
-                    # Parse attack index from action string (format: "attack_0", "attack_1", etc.)
+                for attack_action in attack_actions:
                     try:
-                        attack_index = int(action_str.split("_")[1])
+                        attack_index = attack_action.attack_index
                         if attack_index < len(pokemon.attacks):
                             attack = pokemon.attacks[attack_index]
-                            damage = int(attack.damage) if attack.damage and str(attack.damage).isdigit() else 0
+                            damage = self._attack_damages(pokemon)[attack_index]
                             
                             # Score based on damage (prioritize higher damage)
                             # Also consider attack effects (healing, drawing, etc.)
@@ -109,25 +125,26 @@ class RandomAgent(Agent):
                             
                             if score > best_score:
                                 best_score = score
-                                best_attack = action_str
+                                best_attack = attack_action
                     except (ValueError, IndexError):
                         pass
                 
                 # Use best attack if found, otherwise random
-                selected = best_attack if best_attack else random.choice(attack_actions)
+                selected = best_attack if best_attack else self.rng.choice(attack_actions)
             else:
-                selected = random.choice(attack_actions)
+                selected = self.rng.choice(attack_actions)
             
             # Debug: log that we're attacking
             if hasattr(self, 'player') and self.player:
-                print(f"DEBUG AGENT: {self.player.name} choosing to attack: {selected} from {attack_actions}")
+                self.log("DEBUG AGENT: %s choosing to attack: %s from %s attack(s)",
+                         self.player.name, selected, len(attack_actions))
             return selected
         
         # Check if active Pokemon can attack
         can_attack = False
         if hasattr(self, 'player') and self.player and self.player.active_pokemon:
             active_pokemon = self.player.active_pokemon
-            can_attack = len(active_pokemon.get_possible_attacks()) > 0
+            can_attack = self._can_attack(active_pokemon)
         
         # Calculate weights based on action types
         weights = []
@@ -135,12 +152,12 @@ class RandomAgent(Agent):
             weight = 1.0  # Base weight
             
             # Prioritize attacks very highly - almost always attack if possible
-            if action.startswith("attack_"):
+            if isinstance(action, AttackAction):
                 weight = 50.0  # Much higher priority
             
             # Prioritize attaching energy to active Pokemon
             # If active can't attack, this becomes CRITICAL
-            elif action.startswith("attach_energy_active"):
+            elif isinstance(action, AttachEnergyAction) and action.pokemon_location == "active":
                 if not can_attack:
                     weight = 25.0  # Very high priority if active can't attack
                 else:
@@ -148,7 +165,7 @@ class RandomAgent(Agent):
             
             # Prioritize attaching energy to bench Pokemon (but less than active)
             # Only if active Pokemon can already attack
-            elif action.startswith("attach_energy_bench"):
+            elif isinstance(action, AttachEnergyAction):
                 if not can_attack:
                     weight = 0.5  # Very low priority if active needs energy
                 else:
@@ -156,7 +173,7 @@ class RandomAgent(Agent):
                     weight = self._calculate_bench_energy_weight(action)
             
             # Prioritize playing Pokemon to active if no active Pokemon
-            elif action.startswith("play_pokemon_") and "_active" in action:
+            elif isinstance(action, PlayPokemonAction) and action.position == "active":
                 # Check if player has no active Pokemon
                 if hasattr(self, 'player') and self.player and self.player.active_pokemon is None:
                     weight = 20.0  # Very high if no active Pokemon (especially during setup)
@@ -164,7 +181,7 @@ class RandomAgent(Agent):
                     weight = 3.0
             
             # Prioritize playing Pokemon to bench (but only if active is already set)
-            elif action.startswith("play_pokemon_") and "_bench" in action:
+            elif isinstance(action, PlayPokemonAction):
                 # During setup, only play to bench if active is already set
                 if hasattr(self, 'player') and self.player and self.player.active_pokemon is None:
                     weight = 0.1  # Very low if no active Pokemon (should set active first)
@@ -181,26 +198,26 @@ class RandomAgent(Agent):
                         weight = 1.0  # Low priority if bench is full
             
             # Prioritize evolution - smarter decisions
-            elif action.startswith("evolve_"):
+            elif isinstance(action, EvolveAction):
                 weight = self._calculate_evolution_weight(action)
             
             # Prioritize using abilities - especially beneficial ones
-            elif action.startswith("use_ability_"):
+            elif isinstance(action, UseAbilityAction):
                 weight = self._calculate_ability_weight(action)
             
             # Prioritize playing items/supporters - strategic usage
-            elif action.startswith("play_item_") or action.startswith("play_supporter_"):
+            elif isinstance(action, (PlayItemAction, PlaySupporterAction)):
                 weight = self._calculate_trainer_weight(action)
             
             # Retreat intelligence - strategic retreat decisions
-            elif action.startswith("retreat_"):
+            elif isinstance(action, RetreatAction):
                 weight = self._calculate_retreat_weight(action)
             
             # End turn is lowest priority - only if no other good options
-            elif action == "end_turn":
+            elif isinstance(action, EndTurnAction):
                 # Only end turn if we've done something useful this turn
                 # Check if we have attack actions available (they should be prioritized)
-                has_attack = any(a.startswith("attack_") for a in actions)
+                has_attack = any(isinstance(a, AttackAction) for a in actions)
                 if has_attack:
                     weight = 0.01  # Very low if attacks available
                 else:
@@ -209,25 +226,36 @@ class RandomAgent(Agent):
             weights.append(weight)
         
         # Weighted random selection
-        selected_action = random.choices(actions, weights=weights, k=1)[0]
+        selected_action = self.rng.choices(actions, weights=weights, k=1)[0]
         return selected_action
     
-    def _calculate_evolution_weight(self, action: str) -> float:
+    def _attack_damages(self, pokemon: 'Pokemon') -> Tuple[int, ...]:
+        """Printed damage of each attack (table lookup when the engine has matchup tables)"""
+        if self.matchups is not None:
+            return self.matchups.base_damage(pokemon)
+        return tuple(attack_base_damage(attack) for attack in pokemon.attacks)
+    
+    def _max_damage(self, pokemon: 'Pokemon') -> int:
+        if self.matchups is not None:
+            return self.matchups.max_damage(pokemon)
+        return max(self._attack_damages(pokemon), default=0)
+    
+    def _can_attack(self, pokemon: 'Pokemon') -> bool:
+        """True if pokemon's attached energy pays for at least one of its attacks"""
+        if self.matchups is not None:
+            return bool(self.matchups.affordable_attacks(pokemon))
+        return len(pokemon.get_possible_attacks()) > 0
+    
+    def _calculate_evolution_weight(self, action: EvolveAction) -> float:
         """Calculate weight for evolution action based on strategic value"""
         if not hasattr(self, 'player') or not self.player:
             return 5.0  # Default weight
         
-        # Parse evolution action: "evolve_{card_id}_{location}"
         try:
-            parts = action.replace("evolve_", "").split("_")
-            if len(parts) < 2:
-                return 5.0
-            
-            evolution_card_id = parts[0]
-            location = "_".join(parts[1:])
+            location = action.target_location
             
             # Find evolution card and target Pokemon
-            evolution_card = next((c for c in self.player.cards_in_hand if c.id == evolution_card_id), None)
+            evolution_card = Action._find_in_hand(self.player, action.evolution_card_id, action.hand_index)
             if not evolution_card or not isinstance(evolution_card, Pokemon):
                 return 5.0
             
@@ -263,8 +291,8 @@ class RandomAgent(Agent):
             
             # Prioritize if evolution has better attacks
             if evolution_card.attacks and target.attacks:
-                evolution_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in evolution_card.attacks)
-                target_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in target.attacks)
+                evolution_max_damage = self._max_damage(evolution_card)
+                target_max_damage = self._max_damage(target)
                 if evolution_max_damage > target_max_damage:
                     weight += 3.0
             
@@ -276,21 +304,16 @@ class RandomAgent(Agent):
         except Exception:
             return 5.0  # Default on error
     
-    def _calculate_ability_weight(self, action: str) -> float:
+    def _calculate_ability_weight(self, action: UseAbilityAction) -> float:
         """Calculate weight for ability usage based on strategic value"""
         if not hasattr(self, 'player') or not self.player:
             return 3.0  # Default weight
         
         weight = 3.0  # Base weight
         
-        # Parse ability action: "use_ability_{location}_{ability_index}"
         try:
-            parts = action.replace("use_ability_", "").split("_")
-            if len(parts) < 2:
-                return weight
-            
-            location = "_".join(parts[:-1])
-            ability_index = int(parts[-1])
+            location = action.pokemon_location
+            ability_index = action.ability_index
             
             # Get Pokemon
             pokemon = None
@@ -329,24 +352,23 @@ class RandomAgent(Agent):
         except Exception:
             return 3.0  # Default on error
     
-    def _calculate_trainer_weight(self, action: str) -> float:
+    def _calculate_trainer_weight(self, action: Action) -> float:
         """Calculate weight for trainer card usage based on strategic value"""
         if not hasattr(self, 'player') or not self.player:
             return 2.0  # Default weight
         
         weight = 2.0  # Base weight
         
-        # Parse trainer action: "play_item_{card_id}" or "play_supporter_{card_id}"
         try:
-            if action.startswith("play_item_"):
-                card_id = action.replace("play_item_", "")
-            elif action.startswith("play_supporter_"):
-                card_id = action.replace("play_supporter_", "")
+            if isinstance(action, PlayItemAction):
+                card_id = action.item_id
+            elif isinstance(action, PlaySupporterAction):
+                card_id = action.supporter_id
             else:
                 return weight
             
             # Find card in hand
-            card = next((c for c in self.player.cards_in_hand if c.id == card_id), None)
+            card = Action._find_in_hand(self.player, card_id, action.hand_index)
             if not card:
                 return weight
             
@@ -380,14 +402,14 @@ class RandomAgent(Agent):
                     weight += 2.0
             
             # Prioritize items over supporters (items are unlimited)
-            if action.startswith("play_item_"):
+            if isinstance(action, PlayItemAction):
                 weight += 0.5
             
             return weight
         except Exception:
             return 2.0  # Default on error
     
-    def _calculate_retreat_weight(self, action: str) -> float:
+    def _calculate_retreat_weight(self, action: RetreatAction) -> float:
         """Calculate weight for retreat action based on strategic value"""
         if not hasattr(self, 'player') or not self.player or not self.player.active_pokemon:
             return 1.0  # Default weight
@@ -405,11 +427,11 @@ class RandomAgent(Agent):
                 weight += 4.0  # Medium priority to retreat
             
             # Check if active Pokemon can't attack
-            if len(active.get_possible_attacks()) == 0:
+            if not self._can_attack(active):
                 # Check if bench Pokemon can attack
                 bench_can_attack = False
                 for bench_pokemon in self.player.bench_pokemons:
-                    if bench_pokemon and len(bench_pokemon.get_possible_attacks()) > 0:
+                    if bench_pokemon and self._can_attack(bench_pokemon):
                         bench_can_attack = True
                         break
                 
@@ -424,14 +446,14 @@ class RandomAgent(Agent):
             
             # Check if bench Pokemon have better attacks
             if active.attacks:
-                active_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in active.attacks)
+                active_max_damage = self._max_damage(active)
             else:
                 active_max_damage = 0
             
             bench_better_attack = False
             for bench_pokemon in self.player.bench_pokemons:
                 if bench_pokemon and bench_pokemon.attacks:
-                    bench_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in bench_pokemon.attacks)
+                    bench_max_damage = self._max_damage(bench_pokemon)
                     if bench_max_damage > active_max_damage:
                         # Check if bench Pokemon can afford the attack
                         for attack in bench_pokemon.attacks:
@@ -457,7 +479,7 @@ class RandomAgent(Agent):
         except Exception:
             return 1.0  # Default on error
     
-    def _calculate_bench_energy_weight(self, action: str) -> float:
+    def _calculate_bench_energy_weight(self, action: AttachEnergyAction) -> float:
         """Calculate weight for attaching energy to bench Pokemon"""
         if not hasattr(self, 'player') or not self.player:
             return 4.0  # Default weight
@@ -465,8 +487,8 @@ class RandomAgent(Agent):
         weight = 4.0  # Base weight
         
         try:
-            # Parse bench index from action: "attach_energy_bench_{index}"
-            parts = action.replace("attach_energy_bench_", "").split("_")
+            # Bench index from the target location: "bench_{index}"
+            parts = action.pokemon_location.replace("bench_", "").split("_")
             if not parts or not parts[0].isdigit():
                 return weight
             
@@ -495,11 +517,11 @@ class RandomAgent(Agent):
             # Prioritize if bench Pokemon has better attacks than active
             if self.player.active_pokemon and bench_pokemon.attacks:
                 if self.player.active_pokemon.attacks:
-                    active_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in self.player.active_pokemon.attacks)
+                    active_max_damage = self._max_damage(self.player.active_pokemon)
                 else:
                     active_max_damage = 0
                 
-                bench_max_damage = max((int(a.damage) if a.damage and str(a.damage).isdigit() else 0) for a in bench_pokemon.attacks)
+                bench_max_damage = self._max_damage(bench_pokemon)
                 if bench_max_damage > active_max_damage:
                     weight += 2.0  # Prioritize if bench has better attacks
             
@@ -26,4 +26,13 @@ class Ability:
         self.name: str = name
         self.effect: str = effect
         self.target: Ability.Target = target
-        self.position = position  # Will be Card.Position when used
\ No newline at end of file
+        self.position = position  # Will be Card.Position when used
+        self._effects = None  # Parsed lazily from effect text, see effects
+
+    @property
+    def effects(self) -> tuple:
+        """Executable effects for this ability's text, parsed once and reused"""
+        if self._effects is None:
+            from v3.models.match.effects.effect_parser import EffectParser
+            self._effects = EffectParser.compile(self.effect)
+        return self._effects
@@ -1,5 +1,6 @@
 from .ability import Ability
 from .energy import Energy
+from .energy_math import EnergyRequirement, requirement
 
 # These are the attacks that a pokemon can use
 class Attack:
@@ -9,4 +10,12 @@ class Attack:
         self.cost: dict[Energy.Type, int] = Energy(cost).cost if cost else Energy().cost
         self.damage: int = damage
 
+    @property
+    def cost(self) -> dict[Energy.Type, int]:
+        return self._cost
 
+    @cost.setter
+    def cost(self, cost):
+        self._cost = cost
+        # Packed form of the cost, checked by EnergyCounter.can_afford
+        self.requirement: EnergyRequirement = requirement(cost)
@@ -1,14 +1,94 @@
 # This is the superclass for all cards
-from typing import TYPE_CHECKING, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 if TYPE_CHECKING:
     from .ability import Ability
 
+
+def _slot_names(cls, base) -> Tuple[str, ...]:
+    """Every __slots__ entry of cls and its parents, up to and including base"""
+    names = []
+    for klass in reversed(cls.__mro__):
+        if issubclass(klass, base):
+            names.extend(klass.__dict__.get('__slots__', ()))
+    return tuple(names)
+
+
+def _rebuild_definition(cls, values: Tuple):
+    definition = object.__new__(cls)
+    for name, value in zip(cls._FIELDS, values):
+        object.__setattr__(definition, name, value)
+    return definition
+
+
+class CardDefinition:
+    """Immutable card data shared by every copy of a card (flyweight).
+
+    Copies and deep copies return the same object. Use replace() to get a changed
+    definition; setting a static attribute on a Card does this for that card only.
+    """
+    __slots__ = ('id', 'name', 'type', 'subtype', 'set', 'pack', 'rarity', 'image_url', 'ability')
+    _FIELDS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = _slot_names(cls, CardDefinition)
+
+    def __init__(self, id: str, name: str, type: str, subtype: str, set: str, pack: str, rarity: str,
+                 image_url: str = None, ability: Optional['Ability'] = None):
+        _set = object.__setattr__
+        _set(self, 'id', id)
+        _set(self, 'name', name)
+        _set(self, 'type', type)
+        _set(self, 'subtype', subtype)
+        _set(self, 'set', set)
+        _set(self, 'pack', pack)
+        _set(self, 'rarity', rarity)
+        _set(self, 'image_url', image_url)
+        _set(self, 'ability', ability)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable - use replace()")
+
+    def replace(self, **changes) -> 'CardDefinition':
+        """Copy of this definition with some fields changed"""
+        definition = _rebuild_definition(type(self), tuple(changes.get(name, getattr(self, name))
+                                                           for name in self._FIELDS))
+        definition._derive(changes)
+        return definition
+
+    def _derive(self, changes: Dict[str, Any]):
+        """Recompute fields that depend on changed ones (see PokemonDefinition)"""
+        pass
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_rebuild_definition, (type(self), tuple(getattr(self, name) for name in self._FIELDS)))
+
+
+CardDefinition._FIELDS = _slot_names(CardDefinition, CardDefinition)
+
+
+def definition_field(name: str) -> property:
+    """Card attribute read from the shared definition; assigning it copies the definition"""
+    def set(self, value):
+        self.definition = self.definition.replace(**{name: value})
+
+    # attrgetter reads through the definition without a Python-level call
+    return property(attrgetter('definition.' + name), set)
+
+
 class Card:
 
     class Type:
         POKEMON = "Pokemon"
         TRAINER = "Trainer"
-    
+
     class Subtype:
         BASIC = "Basic"
         STAGE_1 = "Stage 1"
@@ -20,25 +100,66 @@ class Card:
 
     class Position:
         DECK = "DECK"
-        HAND = "HAND" 
+        HAND = "HAND"
         BENCH = "BENCH"
         ACTIVE = "ACTIVE"
         DISCARD = "DISCARD"
 
+    # A card is its shared definition plus the per-game state in these slots
+    __slots__ = ('definition', 'card_position')
+    _STATE: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._STATE = _slot_names(cls, Card)
+
+    id = definition_field('id')
+    name = definition_field('name')
+    type = definition_field('type')
+    subtype = definition_field('subtype')
+    set = definition_field('set')
+    pack = definition_field('pack')
+    rarity = definition_field('rarity')
+    image_url = definition_field('image_url')
+    ability = definition_field('ability')
+
     def __init__(self, id: str, name: str, type: Type, subtype: Subtype, set: str, pack: str, rarity: str, image_url: str = None, ability: Optional['Ability'] = None):
-        self.id: str = id
-        self.name: str = name
-        self.type: Card.Type = type
-        self.subtype: Card.Subtype = subtype
-        self.set: str = set
-        self.pack: str = pack
-        self.rarity: str = rarity
-        self.image_url: str = image_url
-        self.ability: Ability = ability
-    
+        self.definition = CardDefinition(id, name, type, subtype, set, pack, rarity, image_url, ability)
+        self._reset_state()
+
+    @classmethod
+    def from_definition(cls, definition: CardDefinition) -> 'Card':
+        """New card of this class for definition, with a fresh game state"""
+        card = cls.__new__(cls)
+        card.definition = definition
+        card._reset_state()
+        return card
+
+    def _reset_state(self):
         # Lets say we add position to the card
         self.card_position: Card.Position = Card.Position.DECK  # Can be: DECK, HAND, BENCH, ACTIVE, DISCARD
-    
+
+    def instantiate(self) -> 'Card':
+        """Fresh copy of this card for a new deck (shares the definition, state starts over)"""
+        return self.from_definition(self.definition)
+
+    def clone(self, memo: Optional[Dict[int, 'Card']] = None) -> 'Card':
+        """Copy of this card's per-game state; the definition (attacks, abilities, text) is shared.
+
+        memo maps id(original) -> clone so a card reachable from several zones is copied once.
+        """
+        if memo is not None and id(self) in memo:
+            return memo[id(self)]
+        card = object.__new__(type(self))
+        for name in self._STATE:
+            setattr(card, name, getattr(self, name))
+        if memo is not None:
+            memo[id(self)] = card
+        return card
+
     def to_display_string(self) -> str:
         """Base card display representation. Subclasses should override this."""
-        return f"{self.name} ({self.subtype})"
\ No newline at end of file
+        return f"{self.name} ({self.subtype})"
+
+
+Card._STATE = _slot_names(Card, Card)
@@ -0,0 +1,171 @@
+"""Packed energy counts and precomputed attack costs.
+
+A Pokemon's attached energy is one integer with an 8-bit lane per energy type, so
+checking an attack cost is a total comparison plus one subtraction across all lanes.
+"""
+from typing import Dict, Mapping, Union
+
+from .energy import Energy
+
+# Lane order (also the iteration order of EnergyCounter); Fighting maps to Rock
+ENERGY_ORDER = (
+    Energy.Type.GRASS,
+    Energy.Type.FIRE,
+    Energy.Type.WATER,
+    Energy.Type.ELECTRIC,
+    Energy.Type.PSYCHIC,
+    Energy.Type.ROCK,
+    Energy.Type.DARK,
+    Energy.Type.METAL,
+    Energy.Type.NORMAL,
+)
+
+LANE_BITS = 8
+LANE_MASK = (1 << LANE_BITS) - 1
+MAX_COUNT = (1 << (LANE_BITS - 1)) - 1  # The top bit of each lane is the borrow guard
+SHIFTS: Dict[str, int] = {energy_type: i * LANE_BITS for i, energy_type in enumerate(ENERGY_ORDER)}
+GUARD = sum(1 << (shift + LANE_BITS - 1) for shift in SHIFTS.values())
+_ZEROS = dict.fromkeys(ENERGY_ORDER, 0)
+
+
+def pack(counts: Mapping[str, int]) -> int:
+    """Pack {energy type: count} into lanes (unknown types raise KeyError)"""
+    packed = 0
+    for energy_type, count in counts.items():
+        if count:
+            if not 0 <= count <= MAX_COUNT:
+                raise ValueError(f"Energy count out of range: {energy_type}={count}")
+            packed |= count << SHIFTS[energy_type]
+    return packed
+
+
+class EnergyRequirement:
+    """An attack cost: typed energy packed into lanes, plus the total count (Colorless included)"""
+    __slots__ = ('specific', 'total')
+
+    def __init__(self, specific: int, total: int):
+        self.specific = specific
+        self.total = total
+
+    def __repr__(self) -> str:
+        return f"EnergyRequirement({unpack(self.specific)}, total={self.total})"
+
+
+def requirement(cost: Union[Energy, Mapping[str, int], None]) -> EnergyRequirement:
+    """Precompute the requirement of an attack or retreat cost (Energy or cost dict)"""
+    if cost is None:
+        return EnergyRequirement(0, 0)
+    if isinstance(cost, Energy):
+        cost = cost.cost
+    specific = {energy_type: count for energy_type, count in cost.items() if energy_type != Energy.Type.NORMAL}
+    return EnergyRequirement(pack(specific), sum(cost.values()))
+
+
+def unpack(packed: int) -> Dict[str, int]:
+    return {energy_type: (packed >> shift) & LANE_MASK for energy_type, shift in SHIFTS.items()}
+
+
+class EnergyCounter(dict):
+    """Energy attached to a Pokemon: a {energy type: count} dict that also keeps its counts packed.
+
+    Every type in ENERGY_ORDER is always present (count 0 when none is attached).
+    Reads are plain dict reads; every write also updates the packed lanes and the total.
+    """
+    __slots__ = ('packed', 'total')
+
+    def __init__(self, counts: Mapping[str, int] = None):
+        super().__init__(_ZEROS)
+        self.packed = 0
+        self.total = 0
+        if counts:
+            self.update(counts)
+
+    def __setitem__(self, energy_type: str, count: int):
+        shift = SHIFTS[energy_type]
+        if not 0 <= count <= MAX_COUNT:
+            raise ValueError(f"Energy count out of range: {energy_type}={count}")
+        old = dict.__getitem__(self, energy_type)
+        dict.__setitem__(self, energy_type, count)
+        self.packed += (count - old) << shift
+        self.total += count - old
+
+    def __delitem__(self, energy_type: str):
+        self[energy_type] = 0
+
+    def update(self, *args, **kwargs):
+        for energy_type, count in dict(*args, **kwargs).items():
+            self[energy_type] = count
+
+    def setdefault(self, energy_type: str, default: int = 0) -> int:
+        return self[energy_type]
+
+    def pop(self, energy_type: str, *default) -> int:
+        count = self[energy_type]
+        self[energy_type] = 0
+        return count
+
+    def popitem(self):
+        raise KeyError("EnergyCounter always holds every energy type")
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return (EnergyCounter, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"EnergyCounter({dict.__repr__(self)})"
+
+    def copy(self) -> 'EnergyCounter':
+        counter = EnergyCounter.__new__(EnergyCounter)
+        dict.update(counter, self)
+        counter.packed = self.packed
+        counter.total = self.total
+        return counter
+
+    def clear(self):
+        dict.update(self, _ZEROS)
+        self.packed = 0
+        self.total = 0
+
+    def can_afford(self, cost: EnergyRequirement) -> bool:
+        """True if this energy pays cost (Colorless can be paid with any type)"""
+        return self.total >= cost.total and ((self.packed | GUARD) - cost.specific) & GUARD == GUARD
+
+    def discard(self, amount: int) -> int:
+        """Remove up to amount energy, taking types in lane order; returns how many were removed"""
+        discarded = 0
+        for energy_type in ENERGY_ORDER:
+            if discarded >= amount:
+                break
+            count = min(dict.__getitem__(self, energy_type), amount - discarded)
+            if count:
+                self[energy_type] -= count
+                discarded += count
+        return discarded
+
+
+def total(energies: Mapping[str, int]) -> int:
+    """Number of energy attached"""
+    if type(energies) is EnergyCounter:
+        return energies.total
+    return sum(energies.values())
+
+
+def can_afford(energies: Mapping[str, int], cost: EnergyRequirement) -> bool:
+    """can_afford for an EnergyCounter or a plain {energy type: count} dict"""
+    if type(energies) is EnergyCounter:
+        return energies.can_afford(cost)
+    return EnergyCounter(energies).can_afford(cost)
+
+
+def discard(energies: Mapping[str, int], amount: int) -> int:
+    """discard for an EnergyCounter or a plain dict (updated in place)"""
+    if type(energies) is EnergyCounter:
+        return energies.discard(amount)
+    counter = EnergyCounter(energies)
+    discarded = counter.discard(amount)
+    for energy_type in energies:
+        energies[energy_type] = counter[energy_type]
+    return discarded
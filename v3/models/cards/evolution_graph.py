@@ -0,0 +1,73 @@
+"""Evolution lines of a card pool as a DAG keyed by card id.
+
+Cards only name what they evolve from ("Ivysaur"), and several cards can share a name
+(reprints, promos), so every card named X counts as a parent of every card that evolves
+from X. The graph is built once per card pool (JsonCardImporter does it on import) and
+written into each PokemonDefinition as frozensets of ids:
+
+- evolves_from_ids: the cards this one can be placed on by a normal evolution
+- evolves_to_ids: the cards that evolve from this one
+- rare_candy_from_ids: for a Stage 2, the Basics two steps down its line (Rare Candy)
+
+so GameRules.can_evolve is a set lookup.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+from .card import Card
+
+_STAGE = {Card.Subtype.BASIC: 0, Card.Subtype.STAGE_1: 1, Card.Subtype.STAGE_2: 2}
+_NONE: FrozenSet[str] = frozenset()
+
+
+class EvolutionGraph:
+    """Parent and child ids of every Pokemon in a pool, with Rare Candy ancestry"""
+
+    def __init__(self, pokemon: Iterable):
+        pokemon = list(pokemon)
+        self.cards = {card.id: card for card in pokemon}
+        ids_by_name: Dict[str, List[str]] = {}
+        for card in pokemon:
+            ids_by_name.setdefault(card.name, []).append(card.id)
+
+        parents: Dict[str, Set[str]] = {}
+        children: Dict[str, Set[str]] = {card.id: set() for card in pokemon}
+        for card in pokemon:
+            stage = _STAGE.get(card.subtype)
+            if not card.evolves_from or stage is None or stage == 0:
+                continue
+            # An evolution goes on the stage right below it, never on a same-named card of another stage
+            found = {parent for parent in ids_by_name.get(card.evolves_from, ())
+                     if _STAGE.get(self.cards[parent].subtype) == stage - 1}
+            parents[card.id] = found
+            for parent in found:
+                children[parent].add(card.id)
+
+        self.parents: Dict[str, FrozenSet[str]] = {card_id: frozenset(ids) for card_id, ids in parents.items()}
+        self.children: Dict[str, FrozenSet[str]] = {card_id: frozenset(ids) for card_id, ids in children.items()}
+        self.rare_candy_parents: Dict[str, FrozenSet[str]] = {
+            card_id: frozenset(basic for parent in ids for basic in self.parents.get(parent, _NONE))
+            for card_id, ids in self.parents.items() if self.cards[card_id].subtype == Card.Subtype.STAGE_2
+        }
+
+    def can_evolve(self, target_id: str, evolution_id: str, rare_candy: bool = False) -> bool:
+        """Whether evolution_id may be placed on target_id (ignores turn restrictions)"""
+        if target_id in self.parents.get(evolution_id, _NONE):
+            return True
+        return rare_candy and target_id in self.rare_candy_parents.get(evolution_id, _NONE)
+
+    def descendants(self, card_id: str) -> List[str]:
+        """Every card further down card_id's lines, stage by stage"""
+        found: List[str] = []
+        layer = sorted(self.children.get(card_id, _NONE))
+        while layer:
+            found.extend(layer)
+            layer = sorted({child for parent in layer for child in self.children.get(parent, _NONE)} - set(found))
+        return found
+
+    def annotate(self):
+        """Write the graph into the cards' definitions (shared by every copy made from them later)"""
+        for card_id, card in self.cards.items():
+            card.definition = card.definition.replace(
+                evolves_from_ids=self.parents.get(card_id, _NONE),
+                evolves_to_ids=self.children.get(card_id, _NONE),
+                rare_candy_from_ids=self.rare_candy_parents.get(card_id, _NONE))
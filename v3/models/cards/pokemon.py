@@ -1,106 +1,134 @@
-from .card import Card
-from .tool import Tool
+from .card import Card, CardDefinition, definition_field
+from .tool import Tool, ToolModifier
 from .attack import Attack
 from .ability import Ability
 from .energy import Energy
-from typing import Dict, List, Optional, TYPE_CHECKING
+from .energy_math import EnergyCounter, can_afford
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
 if TYPE_CHECKING:
     from .attack import Attack
 
 
+class PokemonDefinition(CardDefinition):
+    """Static Pokemon data: stats, attacks, abilities, weakness and evolution line"""
+    __slots__ = ('element', 'health', 'attacks', 'abilities', 'retreat_cost', 'weakness', 'evolves_from',
+                 'evolves_from_ids', 'evolves_to_ids', 'rare_candy_from_ids', 'pokemon_types', 'is_ex')
+
+    def __init__(self, id: str, name: str, element: Energy.Type, type: Card.Type, subtype: Card.Subtype, health: int,
+                 set: str, pack: str, rarity: str, attacks: Sequence[Attack], retreat_cost: int, weakness: Energy.Type,
+                 evolves_from: str, image_url: str = None, abilities: Sequence[Ability] = ()):
+        abilities = tuple(abilities)
+        # Keep ability for backward compatibility (first ability)
+        super().__init__(id, name, type, subtype, set, pack, rarity, image_url, abilities[0] if abilities else None)
+        _set = object.__setattr__
+        _set(self, 'element', element)
+        _set(self, 'health', health)  # This is the original max health of the pokemon (base HP)
+        _set(self, 'attacks', tuple(attacks))
+        _set(self, 'abilities', abilities)
+        _set(self, 'retreat_cost', retreat_cost)
+        _set(self, 'weakness', weakness)
+        _set(self, 'evolves_from', evolves_from)
+        # Evolution tracking: card ids, filled in for a card pool by EvolutionGraph.annotate
+        _set(self, 'evolves_from_ids', frozenset())
+        _set(self, 'evolves_to_ids', frozenset())
+        _set(self, 'rare_candy_from_ids', frozenset())  # Basics a Stage 2 can go on with Rare Candy
+        self._derive({'name': name})
+
+    def _derive(self, changes):
+        _set = object.__setattr__
+        if 'attacks' in changes:
+            _set(self, 'attacks', tuple(self.attacks))
+        if 'abilities' in changes:
+            _set(self, 'abilities', tuple(self.abilities))
+            _set(self, 'ability', self.abilities[0] if self.abilities else None)
+        if 'name' in changes:
+            _set(self, 'is_ex', self.name.endswith(' ex'))
+            _set(self, 'pokemon_types', frozenset([Pokemon.PokemonType.EX] if self.is_ex else []))
+
+
 class Pokemon(Card):
 
     class PokemonType:
         EX = "ex"
         BEAST = "beast"
         ALOLAN = "alolan"
+
+    # Per-game state; everything else is read from the shared PokemonDefinition
+    __slots__ = ('status_effects', '_poketool', '_max_health', '_max_health_for', '_can_retreat_flag', 'damage_nerf', 'damage_taken', 'effect_status',
+                 'equipped_energies', 'placed_or_evolved_this_turn', 'used_ability_this_turn', 'turns_in_play',
+                 'attacked_this_turn')
+
+    element = definition_field('element')
+    health = definition_field('health')
+    _base_health = definition_field('health')  # Base HP for tool calculations
+    attacks = definition_field('attacks')
+    abilities = definition_field('abilities')
+    retreat_cost = definition_field('retreat_cost')
+    weakness = definition_field('weakness')
+    evolves_from = definition_field('evolves_from')
+    evolves_from_ids = definition_field('evolves_from_ids')
+    evolves_to_ids = definition_field('evolves_to_ids')
+    rare_candy_from_ids = definition_field('rare_candy_from_ids')
+    pokemon_types = definition_field('pokemon_types')
     
     def __init__(self, id: str, name: str, element: Energy.Type, type: Card.Type, subtype: Card.Subtype, health: int, set: str, pack: str, rarity: str, attacks: list[Attack], retreat_cost: int, weakness: Energy.Type, evolves_from: str, image_url: str = None, ability: Ability = None, abilities: Optional[List[Ability]] = None):
         # Handle abilities - support both single ability and list
-        if abilities is not None:
-            self.abilities: List[Ability] = abilities
-        elif ability is not None:
-            self.abilities: List[Ability] = [ability]
-        else:
-            self.abilities: List[Ability] = []
-        
-        # Keep ability for backward compatibility (first ability)
-        first_ability = self.abilities[0] if self.abilities else None
-        
-        # Call the parent Card constructor
-        super().__init__(id, name, type, subtype, set, pack, rarity, image_url, first_ability)
-
-        self.element: Energy.Type = element
-        self.health: int = health # This is the original max health of the pokemon (base HP)
-        self._base_health: int = health # Store base HP for tool calculations
-        self.attacks: list[Attack] = attacks
-        self.retreat_cost: int = retreat_cost
-        self.weakness: Energy.Type = weakness
-        self.evolves_from = evolves_from
-
-        import builtins
-        self.pokemon_types = builtins.set()
-        self.pokemon_types.add(Pokemon.PokemonType.EX) if name.endswith(' ex') else None
-
-
-        # STILL NEED TO FIGURE OUT THESE VALUES
-        # Evolution tracking
-        self.evolves_from_ids = []
-        self.evolves_to_ids = []
+        if abilities is None:
+            abilities = [ability] if ability is not None else []
+        self.definition = PokemonDefinition(id, name, element, type, subtype, health, set, pack, rarity, attacks,
+                                            retreat_cost, weakness, evolves_from, image_url, abilities)
+        self._reset_state()
 
+    def _reset_state(self):
+        super()._reset_state()
         # Status effects
         self.status_effects: List = []  # List of StatusEffect objects
         
         # Game variables
-        self.poketool: Tool = None
+        self._max_health = 0
+        self.poketool: Tool = None  # Also resets the cached max HP
         self._can_retreat_flag = True  # Internal flag for retreat permission
         self.damage_nerf = 0
         self.damage_taken = 0
         self.effect_status = []
-        self.equipped_energies: Dict[Energy.Type, int] = {
-            Energy.Type.GRASS: 0,
-            Energy.Type.FIRE: 0,
-            Energy.Type.WATER: 0,
-            Energy.Type.ELECTRIC: 0,
-            Energy.Type.PSYCHIC: 0,
-            Energy.Type.ROCK: 0,  # Fighting maps to Rock
-            Energy.Type.DARK: 0,
-            Energy.Type.METAL: 0,
-            Energy.Type.NORMAL: 0,
-        }
+        self.equipped_energies: EnergyCounter = EnergyCounter()  # Dict-like counts of every energy type
         self.placed_or_evolved_this_turn: bool = False  # Changed from 1 to False
         self.used_ability_this_turn = False
         self.turns_in_play: int = 0  # Increment at end of each turn
         self.attacked_this_turn: bool = False  # Reset at end of turn
     
+    def clone(self, memo: Optional[Dict[int, Card]] = None) -> 'Pokemon':
+        """Copy of this Pokemon's game state (damage, energies, statuses, tool, flags)"""
+        if memo is not None and id(self) in memo:
+            return memo[id(self)]
+        pokemon = super().clone(memo)
+        pokemon.equipped_energies = self.equipped_energies.copy()
+        pokemon.status_effects = list(self.status_effects)  # Status objects hold no state
+        pokemon.effect_status = list(self.effect_status)
+        if self.poketool is not None:
+            pokemon.poketool = self.poketool.clone(memo)
+        return pokemon
+    
     def current_health(self) -> int:
         """Get current health (max HP - damage taken)"""
         return self.max_health() - self.damage_taken
     
     def max_health(self) -> int:
-        """Get maximum health including tool bonuses"""
-        max_hp = self._base_health
-        
-        # Apply tool HP bonuses
-        if self.poketool and self.poketool.ability:
-            effect = self.poketool.ability.effect
-            if effect:
-                # Check for HP bonus effects (e.g., "hp_bonus(20)" or "+20 HP")
-                import re
-                effect_lower = effect.lower()
-                # Look for hp_bonus pattern
-                hp_bonus_match = re.search(r'hp_bonus\((\d+)\)', effect_lower)
-                if hp_bonus_match:
-                    bonus = int(hp_bonus_match.group(1))
-                    max_hp += bonus
-                # Also check for "+X HP" pattern (more flexible, handles period at end)
-                else:
-                    plus_hp_match = re.search(r'\+(\d+)\s*hp\.?', effect_lower)
-                    if plus_hp_match:
-                        bonus = int(plus_hp_match.group(1))
-                        max_hp += bonus
-        
-        return max_hp
+        """Get maximum health including tool bonuses (cached until the tool or card data changes)"""
+        if self._max_health_for is not self.definition:
+            self._max_health = self._base_health + ToolModifier.of(self._poketool).hp_bonus
+            self._max_health_for = self.definition
+        return self._max_health
+    
+    @property
+    def poketool(self) -> Optional[Tool]:
+        return self._poketool
+    
+    @poketool.setter
+    def poketool(self, tool: Optional[Tool]):
+        # Attaching or removing a tool invalidates the cached max HP
+        self._poketool = tool
+        self._max_health_for = None
     
     def to_display_string(self) -> str:
         """Generate a detailed string representation of the Pokemon for display."""
@@ -153,7 +181,7 @@ class Pokemon(Card):
     @property
     def is_ex(self) -> bool:
         """Check if Pokemon is EX variant"""
-        return self.name.endswith(' ex')
+        return self.definition.is_ex
     
     def get_possible_attacks(self) -> List['Attack']:
         """Return attacks that can be used (energy cost met)"""
@@ -174,38 +202,7 @@ class Pokemon(Card):
         - Specific types (Grass, Fire, etc.) must be that specific type
         - We need enough total energy to satisfy all requirements
         """
-        # Attack.cost is an Energy object, so we need to access its cost dict
-        attack_cost = attack.cost.cost if hasattr(attack.cost, 'cost') else attack.cost
-        available_energy = self.equipped_energies.copy()
-        
-        # Calculate total energy needed and specific type requirements
-        total_required = 0
-        specific_requirements = {}  # Type -> amount needed
-        
-        for energy_type, required_amount in attack_cost.items():
-            if required_amount == 0:
-                continue
-            
-            total_required += required_amount
-            
-            # Colorless can be satisfied by any energy, so don't add to specific requirements
-            if energy_type != Energy.Type.NORMAL:
-                specific_requirements[energy_type] = specific_requirements.get(energy_type, 0) + required_amount
-        
-        # Check if we have enough total energy
-        total_available = sum(available_energy.values())
-        if total_available < total_required:
-            return False
-        
-        # Check if we have enough of each specific type required
-        # For specific types, we need that exact type (can't use Colorless substitution)
-        for energy_type, required_amount in specific_requirements.items():
-            specific_available = available_energy.get(energy_type, 0)
-            if specific_available < required_amount:
-                return False
-        
-        # All requirements met
-        return True
+        return can_afford(self.equipped_energies, attack.requirement)
     
     def get_usable_abilities(self) -> List[Ability]:
         """Get abilities that can be used this turn"""
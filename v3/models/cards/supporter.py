@@ -3,6 +3,8 @@ from .card import Card
 from .ability import Ability
 
 class Supporter(Card):
+    __slots__ = ()
+
     def __init__(self, id: str, name: str, type: Card.Type, subtype: Card.Subtype, set: str, pack: str, rarity: str, image_url: str = None, ability: Ability = None):
         # Call the parent Card constructor
         super().__init__(id, name, type, subtype, set, pack, rarity, image_url, ability)
@@ -1,16 +1,79 @@
 # This is the tool card class; for example, the Cape, Poison Barb, etc.
-from .card import Card
+import re
+from typing import Optional
+
+from .card import Card, CardDefinition, definition_field
 from .ability import Ability
 
+_HP_BONUS = re.compile(r'hp_bonus\((\d+)\)')
+_PLUS_HP = re.compile(r'\+(\d+)\s*hp\.?')
+
+
+class ToolModifier:
+    """Stat changes a tool gives the Pokemon holding it, compiled once from the effect text"""
+    __slots__ = ('hp_bonus',)
+
+    def __init__(self, hp_bonus: int = 0):
+        self.hp_bonus = hp_bonus
+
+    @classmethod
+    def from_ability(cls, ability: Optional[Ability]) -> 'ToolModifier':
+        """Parse "hp_bonus(20)" or "+20 HP" style effect text (no recognised effect -> NO_MODIFIER)"""
+        effect = ability.effect if ability else None
+        if not effect:
+            return NO_MODIFIER
+        effect_lower = effect.lower()
+        match = _HP_BONUS.search(effect_lower) or _PLUS_HP.search(effect_lower)
+        if match is None:
+            return NO_MODIFIER
+        return cls(hp_bonus=int(match.group(1)))
+
+    @classmethod
+    def of(cls, tool) -> 'ToolModifier':
+        """Modifier of an attached tool (compiled from its ability if it is not a Tool card)"""
+        if tool is None:
+            return NO_MODIFIER
+        modifier = getattr(tool, 'modifier', None)
+        if isinstance(modifier, ToolModifier):
+            return modifier
+        return cls.from_ability(getattr(tool, 'ability', None))
+
+    def __reduce__(self):
+        return (ToolModifier, (self.hp_bonus,))
+
+    def __repr__(self) -> str:
+        return f"ToolModifier(hp_bonus={self.hp_bonus})"
+
+
+NO_MODIFIER = ToolModifier()
+
+
+class ToolDefinition(CardDefinition):
+    """Static tool data plus its compiled modifier"""
+    __slots__ = ('modifier',)
+
+    def __init__(self, id: str, name: str, type: Card.Type, subtype: Card.Subtype, set: str, pack: str, rarity: str,
+                 image_url: str = None, ability: Ability = None):
+        super().__init__(id, name, type, subtype, set, pack, rarity, image_url, ability)
+        self._derive({'ability': ability})
+
+    def _derive(self, changes):
+        if 'ability' in changes:
+            object.__setattr__(self, 'modifier', ToolModifier.from_ability(self.ability))
+
+
 class Tool(Card):
+    __slots__ = ()
+
+    modifier = definition_field('modifier')
+
     def __init__(self, id: str, name: str, type: Card.Type, subtype: Card.Subtype, set: str, pack: str, rarity: str, image_url: str = None, ability: Ability = None):
-        # Call the parent Card constructor
-        super().__init__(id, name, type, subtype, set, pack, rarity, image_url, ability)
-    
+        self.definition = ToolDefinition(id, name, type, subtype, set, pack, rarity, image_url, ability)
+        self._reset_state()
+
     def to_display_string(self) -> str:
         """Generate a string representation of the Tool for display."""
         display = f"{self.name} (Tool)"
         if self.ability:
             display += f"\nEffect: {self.ability.effect}"
         return display
-        
\ No newline at end of file
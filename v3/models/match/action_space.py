@@ -0,0 +1,177 @@
+import hashlib
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for masks
+    np = None
+
+from v2.game.ids.action_id_generation import ActionIdGenerator
+from v3.models.cards.card import Card
+from v3.models.match.actions import Action, ActionType
+
+if TYPE_CHECKING:
+    from v3.models.match.battle_engine import BattleEngine
+    from v3.models.match.player import Player
+
+"""Fixed, versioned action id space generated from the card database (v2 ACTION_IDS naming)"""
+
+# Board spots: 0 = active, 1-3 = bench slots
+SPOTS = ["pactive", "pbench1", "pbench2", "pbench3"]
+POSITIONS = ["pActive", "pBench1", "pBench2", "pBench3"]
+
+_camel = ActionIdGenerator._to_camel_case
+
+
+def location_to_spot(location: str, player: Optional['Player'] = None) -> int:
+    """Board spot of an action location ("active", "bench_{i}", or "bench" = first empty slot)"""
+    if location == "active":
+        return 0
+    if location.startswith("bench_"):
+        return int(location.split("_")[1]) + 1
+    if location == "bench" and player is not None:
+        for i, pokemon in enumerate(player.bench_pokemons):
+            if pokemon is None:
+                return i + 1
+    raise ValueError(f"Cannot map location to a spot: {location}")
+
+
+class ActionSpace:
+    """Every action a player can take, numbered 0..size-1.
+
+    Ids are generated from the card database in sorted card order, so the same cards
+    always give the same numbering; version changes whenever the id list does.
+    """
+
+    def __init__(self, cards: Iterable[Card]):
+        self.names: List[str] = []
+        self.keys: List[Tuple] = []
+        self._ids: Dict[Tuple, int] = {}
+        self._names = set()
+
+        self._add(("end_turn",), "end_turn")
+        for spot, name in enumerate(SPOTS):
+            self._add(("attach_energy", spot), f"{name}_attach_energy")
+
+        for card in sorted(cards, key=lambda c: c.id):
+            if card.type == Card.Type.POKEMON:
+                self._add_pokemon(card)
+            elif card.subtype == Card.Subtype.ITEM:
+                self._add(("item", card.id), f"{card.id}_play_item_{_camel(card.name)}")
+            elif card.subtype == Card.Subtype.SUPPORTER:
+                self._add(("supporter", card.id), f"{card.id}_play_supporter_{_camel(card.name)}")
+            elif card.subtype == Card.Subtype.TOOL:
+                for spot, name in enumerate(SPOTS):
+                    self._add(("tool", card.id, spot), f"{card.id}_attach_tool_{name}_{_camel(card.name)}")
+
+        self.version = hashlib.sha1("\n".join(self.names).encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def from_card_db(cls) -> 'ActionSpace':
+        """Action space over every card in the v3 assets"""
+        from v3.importers.json_card_importer import JsonCardImporter
+        importer = JsonCardImporter.shared()
+        return cls([*importer.pokemon.values(), *importer.items.values(),
+                    *importer.supporters.values(), *importer.tools.values()])
+
+    def _add(self, key: Tuple, name: str):
+        # Some cards repeat a move name; keep ids readable and unique
+        base, n = name, 1
+        while name in self._names:
+            n += 1
+            name = f"{base}_{n}"
+        self._names.add(name)
+        self._ids[key] = len(self.names)
+        self.keys.append(key)
+        self.names.append(name)
+
+    def _add_pokemon(self, card):
+        pokemon_name = _camel(card.name)
+        if card.subtype == Card.Subtype.BASIC:
+            for spot, name in enumerate(SPOTS):
+                self._add(("play", card.id, spot), f"{card.id}_play_{name}_{pokemon_name}")
+        elif card.evolves_from:
+            for spot, name in enumerate(SPOTS):
+                self._add(("evolve", card.id, spot),
+                          f"{card.id}_evolve_{name}_{_camel(card.evolves_from)}_{pokemon_name}")
+        for i, ability in enumerate(card.abilities):
+            for spot, position in enumerate(POSITIONS):
+                self._add(("ability", card.id, i, spot),
+                          f"{card.id}_ability_{pokemon_name}_{_camel(ability.name)}_{position}")
+        for i, attack in enumerate(card.attacks):
+            self._add(("attack", card.id, i), f"{card.id}_attack_{pokemon_name}_{_camel(attack.name)}_pActive_oActive")
+        for spot in range(1, len(SPOTS)):
+            self._add(("retreat", card.id, spot), f"{card.id}_retreat_{SPOTS[spot]}_{pokemon_name}")
+
+    @property
+    def size(self) -> int:
+        return len(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def name(self, action_id: int) -> str:
+        return self.names[action_id]
+
+    def action_id(self, action: Action, player: 'Player') -> Optional[int]:
+        """Id of an Action for player's current board, or None if its card is not in the space"""
+        return self._ids.get(self._key(action, player))
+
+    def _key(self, action: Action, player: 'Player') -> Tuple:
+        action_type = action.action_type
+        if action_type == ActionType.END_TURN:
+            return ("end_turn",)
+        if action_type == ActionType.ATTACH_ENERGY:
+            return ("attach_energy", location_to_spot(action.pokemon_location))
+        if action_type == ActionType.PLAY_POKEMON:
+            return ("play", action.card_id, location_to_spot(action.position, player))
+        if action_type == ActionType.EVOLVE:
+            return ("evolve", action.evolution_card_id, location_to_spot(action.target_location))
+        if action_type == ActionType.ATTACK:
+            return ("attack", player.active_pokemon.id, action.attack_index)
+        if action_type == ActionType.RETREAT:
+            return ("retreat", player.active_pokemon.id, action.bench_index + 1)
+        if action_type == ActionType.USE_ABILITY:
+            spot = location_to_spot(action.pokemon_location)
+            pokemon = player.active_pokemon if spot == 0 else player.bench_pokemons[spot - 1]
+            return ("ability", pokemon.id, action.ability_index, spot)
+        if action_type == ActionType.PLAY_ITEM:
+            return ("item", action.item_id)
+        if action_type == ActionType.PLAY_SUPPORTER:
+            return ("supporter", action.supporter_id)
+        if action_type == ActionType.ATTACH_TOOL:
+            return ("tool", action.tool_id, location_to_spot(action.pokemon_location))
+        raise ValueError(f"No action id for {action_type}")
+
+    def legal_actions(self, engine: 'BattleEngine', player: 'Player') -> Dict[int, Action]:
+        """Legal actions of player keyed by action id (copies of the same card share an id)"""
+        actions: Dict[int, Action] = {}
+        for action in player.get_legal_actions(engine):
+            action_id = self.action_id(action, player)
+            if action_id is not None:
+                actions.setdefault(action_id, action)
+        return actions
+
+    def legal_action_mask(self, engine: 'BattleEngine', player: 'Player',
+                          out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """Boolean mask of shape (size,) that is True for every legal action id"""
+        if np is None:
+            raise ImportError("legal_action_mask requires numpy")
+        if out is None:
+            out = np.zeros(self.size, dtype=bool)
+        else:
+            out.fill(False)
+        ids = list(self.legal_actions(engine, player))
+        out[ids] = True
+        return out
+
+
+_default_action_space: Optional[ActionSpace] = None
+
+
+def default_action_space() -> ActionSpace:
+    """Shared action space over the full v3 card database (built on first use)"""
+    global _default_action_space
+    if _default_action_space is None:
+        _default_action_space = ActionSpace.from_card_db()
+    return _default_action_space
@@ -10,6 +10,7 @@ from .play_item import PlayItemAction
 from .play_supporter import PlaySupporterAction
 from .attach_tool import AttachToolAction
 from .use_ability import UseAbilityAction
+from .action_codec import parse_action, decode_action
 
-__all__ = ['Action', 'ActionType', 'EndTurnAction', 'PlayPokemonAction', 'AttachEnergyAction', 'AttackAction', 'EvolveAction', 'RetreatAction', 'DiscardAction', 'PlayItemAction', 'PlaySupporterAction', 'AttachToolAction', 'UseAbilityAction']
+__all__ = ['Action', 'ActionType', 'EndTurnAction', 'PlayPokemonAction', 'AttachEnergyAction', 'AttackAction', 'EvolveAction', 'RetreatAction', 'DiscardAction', 'PlayItemAction', 'PlaySupporterAction', 'AttachToolAction', 'UseAbilityAction', 'parse_action', 'decode_action']
 
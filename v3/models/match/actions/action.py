@@ -20,6 +20,53 @@ class ActionType(Enum):
     SWITCH = "switch"
     END_TURN = "end_turn"
 
+# Compact integer encoding of an action:
+#   bits 0-3  action type (ActionType declaration order)
+#   bits 4-6  board slot (see SLOT_*)
+#   bits 7+   index - attack/ability index, retreat bench slot, or the hand
+#             position of the card being played
+TYPE_BITS = 4
+SLOT_BITS = 3
+TYPE_CODES = {action_type: code for code, action_type in enumerate(ActionType)}
+TYPES_BY_CODE = {code: action_type for action_type, code in TYPE_CODES.items()}
+
+SLOT_NONE = 0
+SLOT_ACTIVE = 1
+SLOT_BENCH_0 = 2  # Bench slots 0-2 are SLOT_BENCH_0 + index
+SLOT_BENCH_ANY = 5  # First free bench slot ("bench" position when playing a Pokemon)
+
+def location_to_slot(location: Optional[str]) -> int:
+    """Map an "active" / "bench" / "bench_{i}" location string to its slot code"""
+    if location is None:
+        return SLOT_NONE
+    if location == "active":
+        return SLOT_ACTIVE
+    if location == "bench":
+        return SLOT_BENCH_ANY
+    if location.startswith("bench_"):
+        return SLOT_BENCH_0 + int(location[6:])
+    raise ValueError(f"Invalid location: {location}")
+
+def slot_to_location(slot: int) -> Optional[str]:
+    """Inverse of location_to_slot"""
+    if slot == SLOT_NONE:
+        return None
+    if slot == SLOT_ACTIVE:
+        return "active"
+    if slot == SLOT_BENCH_ANY:
+        return "bench"
+    return f"bench_{slot - SLOT_BENCH_0}"
+
+def pack_action(action_type: ActionType, slot: int = SLOT_NONE, index: int = 0) -> int:
+    """Pack an action into its integer code"""
+    return TYPE_CODES[action_type] | (slot << TYPE_BITS) | (index << (TYPE_BITS + SLOT_BITS))
+
+def unpack_action(code: int) -> tuple[ActionType, int, int]:
+    """Unpack an integer code into (action_type, slot, index)"""
+    action_type = TYPES_BY_CODE[code & ((1 << TYPE_BITS) - 1)]
+    slot = (code >> TYPE_BITS) & ((1 << SLOT_BITS) - 1)
+    return action_type, slot, code >> (TYPE_BITS + SLOT_BITS)
+
 @dataclass
 class Action(ABC):
     """Base class for all game actions"""
@@ -43,9 +90,39 @@ class Action(ABC):
         """Convert action to string representation for agents"""
         pass
     
+    def __str__(self) -> str:
+        return self.to_string()
+    
     @classmethod
     @abstractmethod
     def from_string(cls, action_str: str, player: 'Player') -> 'Action':
         """Create action from string representation"""
         pass
+    
+    def encode(self, player: Optional['Player'] = None) -> int:
+        """Compact integer encoding of this action (see pack_action)"""
+        raise NotImplementedError(f"{type(self).__name__} has no integer encoding")
+    
+    @staticmethod
+    def _find_in_hand(player: 'Player', card_id: str, hand_index: Optional[int] = None):
+        """Find a card in hand by id, trying the known hand position first"""
+        hand = player.cards_in_hand
+        if hand_index is not None and hand_index < len(hand) and hand[hand_index].id == card_id:
+            return hand[hand_index]
+        return next((c for c in hand if c.id == card_id), None)
+    
+    @staticmethod
+    def _hand_index(player: Optional['Player'], card_id: str, hand_index: Optional[int]) -> int:
+        """Hand position of a card for encoding (uses the hint when it is still correct)"""
+        if player is None:
+            if hand_index is None:
+                raise ValueError(f"Need the player to encode card {card_id}")
+            return hand_index
+        hand = player.cards_in_hand
+        if hand_index is not None and hand_index < len(hand) and hand[hand_index].id == card_id:
+            return hand_index
+        for i, card in enumerate(hand):
+            if card.id == card_id:
+                return i
+        raise ValueError(f"Card {card_id} not in hand")
 
@@ -0,0 +1,72 @@
+"""Conversions between Action objects and their string / integer forms"""
+from typing import Optional, TYPE_CHECKING
+from .action import Action, ActionType, slot_to_location, unpack_action
+from .end_turn import EndTurnAction
+from .play_pokemon import PlayPokemonAction
+from .attach_energy import AttachEnergyAction
+from .attack import AttackAction
+from .evolve import EvolveAction
+from .retreat import RetreatAction
+from .play_item import PlayItemAction
+from .play_supporter import PlaySupporterAction
+from .attach_tool import AttachToolAction
+from .use_ability import UseAbilityAction
+
+if TYPE_CHECKING:
+    from v3.models.match.player import Player
+
+# Checked in order - the first matching prefix wins
+_STRING_PREFIXES = [
+    ("attack_", AttackAction),
+    ("play_pokemon_", PlayPokemonAction),
+    ("attach_energy_", AttachEnergyAction),
+    ("evolve_", EvolveAction),
+    ("retreat_", RetreatAction),
+    ("play_item_", PlayItemAction),
+    ("play_supporter_", PlaySupporterAction),
+    ("attach_tool_", AttachToolAction),
+    ("use_ability_", UseAbilityAction),
+]
+
+
+def parse_action(action_str: str, player: 'Player') -> Optional[Action]:
+    """Parse an action string (agent / human form) into an Action, or None if unknown"""
+    if action_str == "end_turn":
+        return EndTurnAction()
+    for prefix, action_class in _STRING_PREFIXES:
+        if action_str.startswith(prefix):
+            return action_class.from_string(action_str, player)
+    return None
+
+
+def decode_action(code: int, player: 'Player') -> Action:
+    """Rebuild an Action from its integer code against the player's current hand"""
+    action_type, slot, index = unpack_action(code)
+    location = slot_to_location(slot)
+
+    if action_type == ActionType.END_TURN:
+        return EndTurnAction()
+    if action_type == ActionType.ATTACK:
+        return AttackAction(index)
+    if action_type == ActionType.RETREAT:
+        return RetreatAction(index)
+    if action_type == ActionType.ATTACH_ENERGY:
+        return AttachEnergyAction(location)
+    if action_type == ActionType.USE_ABILITY:
+        return UseAbilityAction(location, index)
+
+    # Remaining actions play a card - index is its hand position
+    if index >= len(player.cards_in_hand):
+        raise ValueError(f"Hand index {index} out of range for action code {code}")
+    card_id = player.cards_in_hand[index].id
+    if action_type == ActionType.PLAY_POKEMON:
+        return PlayPokemonAction(card_id, location, hand_index=index)
+    if action_type == ActionType.EVOLVE:
+        return EvolveAction(card_id, location, hand_index=index)
+    if action_type == ActionType.PLAY_ITEM:
+        return PlayItemAction(card_id, hand_index=index)
+    if action_type == ActionType.PLAY_SUPPORTER:
+        return PlaySupporterAction(card_id, hand_index=index)
+    if action_type == ActionType.ATTACH_TOOL:
+        return AttachToolAction(card_id, location, hand_index=index)
+    raise ValueError(f"Cannot decode action code {code} ({action_type})")
@@ -1,5 +1,5 @@
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action, location_to_slot
 from v3.models.cards.pokemon import Pokemon
 
 class AttachEnergyAction(Action):
@@ -46,56 +46,59 @@ class AttachEnergyAction(Action):
     def execute(self, player, battle_engine) -> None:
         """Execute energy attachment"""
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: AttachEnergyAction.execute() called for location: {self.pokemon_location}")
+            battle_engine.log("DEBUG: AttachEnergyAction.execute() called for location: %s", self.pokemon_location)
         
         pokemon = self._get_pokemon(player)
         if not pokemon:
             raise ValueError(f"No Pokemon at location: {self.pokemon_location}")
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Found Pokemon: {pokemon.name} at {self.pokemon_location}")
+            battle_engine.log("DEBUG: Found Pokemon: %s at %s", pokemon.name, self.pokemon_location)
         
         # Check if already attached energy this turn
         if player.attached_energy_this_turn:
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Already attached energy this turn - raising error")
+                battle_engine.log("DEBUG: Already attached energy this turn - raising error")
             raise ValueError("Already attached energy this turn (limit: 1 per turn)")
         
         # Get energy from Energy Zone
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Energy zone has energy: {player.energy_zone.has_energy()}")
-            battle_engine.log(f"DEBUG: Current energy: {player.energy_zone.current_energy}")
+            battle_engine.log("DEBUG: Energy zone has energy: %s", player.energy_zone.has_energy())
+            battle_engine.log("DEBUG: Current energy: %s", player.energy_zone.current_energy)
         
         energy_type = player.energy_zone.consume_current()
         if not energy_type:
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: No energy available after consume - raising error")
+                battle_engine.log("DEBUG: No energy available after consume - raising error")
             raise ValueError("No energy available")
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Consumed energy type: {energy_type}")
-            battle_engine.log(f"DEBUG: Pokemon energy before: {pokemon.equipped_energies}")
+            battle_engine.log("DEBUG: Consumed energy type: %s", energy_type)
+            battle_engine.log("DEBUG: Pokemon energy before: %s", pokemon.equipped_energies)
         
         # Attach to Pokemon
         pokemon.equipped_energies[energy_type] += 1
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Pokemon energy after: {pokemon.equipped_energies}")
+            battle_engine.log("DEBUG: Pokemon energy after: %s", pokemon.equipped_energies)
         
         # Mark that energy was attached this turn
         player.attached_energy_this_turn = True
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Set attached_energy_this_turn = True")
+            battle_engine.log("DEBUG: Set attached_energy_this_turn = True")
         
-        battle_engine.log(f"{player.name} attached {energy_type} energy to {pokemon.name}")
+        battle_engine.log("%s attached %s energy to %s", player.name, energy_type, pokemon.name)
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: AttachEnergyAction.execute() completed successfully")
+            battle_engine.log("DEBUG: AttachEnergyAction.execute() completed successfully")
     
     def to_string(self) -> str:
         return f"attach_energy_{self.pokemon_location}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.ATTACH_ENERGY, location_to_slot(self.pokemon_location))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'AttachEnergyAction':
         if not action_str.startswith("attach_energy_"):
@@ -1,6 +1,6 @@
 """Attach Tool action - attach a Tool trainer card to a Pokemon"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action, location_to_slot
 from v3.models.cards.tool import Tool
 from v3.models.cards.pokemon import Pokemon
 from v3.models.cards.card import Card
@@ -8,14 +8,15 @@ from v3.models.cards.card import Card
 class AttachToolAction(Action):
     """Action to attach a Tool card to a Pokemon"""
     
-    def __init__(self, tool_id: str, pokemon_location: str):
+    def __init__(self, tool_id: str, pokemon_location: str, hand_index: Optional[int] = None):
         super().__init__(ActionType.ATTACH_TOOL)
         self.tool_id = tool_id
         self.pokemon_location = pokemon_location  # "active" or "bench_{index}"
+        self.hand_index = hand_index  # Hand position of the tool when generated
     
     def validate(self, player, battle_engine) -> tuple[bool, Optional[str]]:
         """Validate if tool can be attached"""
-        tool = next((c for c in player.cards_in_hand if c.id == self.tool_id), None)
+        tool = self._find_in_hand(player, self.tool_id, self.hand_index)
         if not tool:
             return False, f"Tool {self.tool_id} not in hand"
         
@@ -50,7 +51,7 @@ class AttachToolAction(Action):
     
     def execute(self, player, battle_engine) -> None:
         """Execute attaching tool"""
-        tool = next((c for c in player.cards_in_hand if c.id == self.tool_id), None)
+        tool = self._find_in_hand(player, self.tool_id, self.hand_index)
         target = self._get_target_pokemon(player)
         
         if not tool or not isinstance(tool, Tool):
@@ -63,7 +64,7 @@ class AttachToolAction(Action):
             old_tool = target.poketool
             target.poketool = None
             player.discard_card(old_tool)
-            battle_engine.log(f"{player.name} discarded {old_tool.name} from {target.name}")
+            battle_engine.log("%s discarded %s from %s", player.name, old_tool.name, target.name)
         
         # Remove from hand
         player.cards_in_hand.remove(tool)
@@ -77,14 +78,18 @@ class AttachToolAction(Action):
         if tool.ability and tool.ability.effect:
             effect_msg = f" ({tool.ability.effect})"
         
-        battle_engine.log(f"{player.name} attached {tool.name} to {target.name}{effect_msg}")
+        battle_engine.log("%s attached %s to %s%s", player.name, tool.name, target.name, effect_msg)
         
-        # Apply tool effects immediately (e.g., HP bonuses)
-        # The max_health() method will automatically account for tool bonuses
+        # Tool effects apply immediately: HP bonuses come from the tool's compiled
+        # modifier, and attaching resets the cached max_health()
     
     def to_string(self) -> str:
         return f"attach_tool_{self.tool_id}_{self.pokemon_location}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.ATTACH_TOOL, location_to_slot(self.pokemon_location),
+                           self._hand_index(player, self.tool_id, self.hand_index))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'AttachToolAction':
         if not action_str.startswith("attach_tool_"):
@@ -1,5 +1,6 @@
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action
+from v3.models.cards import energy_math
 
 class AttackAction(Action):
     """Action to attack with active Pokemon"""
@@ -24,7 +25,7 @@ class AttackAction(Action):
             return False, f"Invalid attack index: {self.attack_index}"
         
         attack = player.active_pokemon.attacks[self.attack_index]
-        if not player.active_pokemon._can_afford_attack(attack):
+        if not energy_math.can_afford(player.active_pokemon.equipped_energies, attack.requirement):
             return False, "Cannot afford attack energy cost"
         
         # Check if opponent has an active Pokemon to attack
@@ -50,6 +51,9 @@ class AttackAction(Action):
     def to_string(self) -> str:
         return f"attack_{self.attack_index}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.ATTACK, index=self.attack_index)
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'AttackAction':
         if not action_str.startswith("attack_"):
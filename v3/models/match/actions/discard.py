@@ -21,7 +21,7 @@ class DiscardAction(Action):
         if self.card_index < len(player.cards_in_hand):
             card = player.cards_in_hand.pop(self.card_index)
             player.discard_card(card)
-            battle_engine.log(f"{player.name} discarded {card.name}")
+            battle_engine.log("%s discarded %s", player.name, card.name)
     
     def to_string(self) -> str:
         return f"discard_{self.card_index}"
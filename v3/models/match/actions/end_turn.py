@@ -1,5 +1,5 @@
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action
 
 class EndTurnAction(Action):
     """Action to end the current turn"""
@@ -13,11 +13,14 @@ class EndTurnAction(Action):
     
     def execute(self, player, battle_engine) -> None:
         """End turn - actual cleanup happens in battle engine"""
-        battle_engine.log(f"{player.name} ends their turn")
+        battle_engine.log("%s ends their turn", player.name)
     
     def to_string(self) -> str:
         return "end_turn"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.END_TURN)
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'EndTurnAction':
         if action_str != "end_turn":
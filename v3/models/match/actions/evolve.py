@@ -1,6 +1,6 @@
 """Evolve action - evolve a Pokemon"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action, location_to_slot
 from v3.models.cards.pokemon import Pokemon
 from v3.models.cards.card import Card
 from v3.models.match.game_rules import GameRules
@@ -8,15 +8,16 @@ from v3.models.match.game_rules import GameRules
 class EvolveAction(Action):
     """Action to evolve a Pokemon"""
     
-    def __init__(self, evolution_card_id: str, target_location: str):
+    def __init__(self, evolution_card_id: str, target_location: str, hand_index: Optional[int] = None):
         super().__init__(ActionType.EVOLVE)
         self.evolution_card_id = evolution_card_id
         self.target_location = target_location  # "active" or "bench_{index}"
+        self.hand_index = hand_index  # Hand position of the evolution card when generated
     
     def validate(self, player, battle_engine) -> tuple[bool, Optional[str]]:
         """Validate if evolution can be performed"""
         # Find evolution card in hand
-        evolution_card = next((c for c in player.cards_in_hand if c.id == self.evolution_card_id), None)
+        evolution_card = self._find_in_hand(player, self.evolution_card_id, self.hand_index)
         if not evolution_card:
             return False, f"Evolution card {self.evolution_card_id} not in hand"
         
@@ -60,7 +61,7 @@ class EvolveAction(Action):
     
     def execute(self, player, battle_engine) -> None:
         """Execute evolution"""
-        evolution_card = next((c for c in player.cards_in_hand if c.id == self.evolution_card_id), None)
+        evolution_card = self._find_in_hand(player, self.evolution_card_id, self.hand_index)
         target = self._get_target_pokemon(player)
         
         if not evolution_card or not target:
@@ -91,11 +92,15 @@ class EvolveAction(Action):
         target.card_position = Card.Position.DISCARD
         player.discard_card(target)
         
-        battle_engine.log(f"{player.name} evolved {target.name} into {evolution_card.name}")
+        battle_engine.log("%s evolved %s into %s", player.name, target.name, evolution_card.name)
     
     def to_string(self) -> str:
         return f"evolve_{self.evolution_card_id}_{self.target_location}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.EVOLVE, location_to_slot(self.target_location),
+                           self._hand_index(player, self.evolution_card_id, self.hand_index))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'EvolveAction':
         if not action_str.startswith("evolve_"):
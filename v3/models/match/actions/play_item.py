@@ -1,19 +1,20 @@
 """Play Item action - play an Item trainer card"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action
 from v3.models.cards.item import Item
-from v3.models.match.effects import EffectParser
+from v3.models.match.effects.effect import execute_effect
 
 class PlayItemAction(Action):
     """Action to play an Item card"""
     
-    def __init__(self, item_id: str):
+    def __init__(self, item_id: str, hand_index: Optional[int] = None):
         super().__init__(ActionType.PLAY_ITEM)
         self.item_id = item_id
+        self.hand_index = hand_index  # Hand position of the item when generated
     
     def validate(self, player, battle_engine) -> tuple[bool, Optional[str]]:
         """Validate if item can be played"""
-        item = next((c for c in player.cards_in_hand if c.id == self.item_id), None)
+        item = self._find_in_hand(player, self.item_id, self.hand_index)
         if not item:
             return False, f"Item {self.item_id} not in hand"
         
@@ -28,71 +29,74 @@ class PlayItemAction(Action):
     def execute(self, player, battle_engine) -> None:
         """Execute playing item"""
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: PlayItemAction.execute() called for item_id: {self.item_id}")
+            battle_engine.log("DEBUG: PlayItemAction.execute() called for item_id: %s", self.item_id)
         
-        item = next((c for c in player.cards_in_hand if c.id == self.item_id), None)
+        item = self._find_in_hand(player, self.item_id, self.hand_index)
         if not item or not isinstance(item, Item):
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Item {self.item_id} not found in hand. Hand has {len(player.cards_in_hand)} cards")
+                battle_engine.log("DEBUG: Item %s not found in hand. Hand has %s cards", self.item_id, len(player.cards_in_hand))
             raise ValueError(f"Item {self.item_id} not found")
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Found item: {item.name} (id: {item.id})")
-            battle_engine.log(f"DEBUG: Item has ability: {item.ability is not None}")
+            battle_engine.log("DEBUG: Found item: %s (id: %s)", item.name, item.id)
+            battle_engine.log("DEBUG: Item has ability: %s", item.ability is not None)
             if item.ability:
-                battle_engine.log(f"DEBUG: Ability name: {item.ability.name if hasattr(item.ability, 'name') else 'N/A'}")
-                battle_engine.log(f"DEBUG: Ability effect: {item.ability.effect if hasattr(item.ability, 'effect') else 'N/A'}")
+                battle_engine.log("DEBUG: Ability name: %s", item.ability.name if hasattr(item.ability, 'name') else 'N/A')
+                battle_engine.log("DEBUG: Ability effect: %s", item.ability.effect if hasattr(item.ability, 'effect') else 'N/A')
         
         # Remove from hand
         player.cards_in_hand.remove(item)
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Removed {item.name} from hand. Hand size now: {len(player.cards_in_hand)}")
+            battle_engine.log("DEBUG: Removed %s from hand. Hand size now: %s", item.name, len(player.cards_in_hand))
         
         # Execute item effect
         if item.ability and item.ability.effect:
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Parsing item effect: '{item.ability.effect}'")
-            effects = EffectParser.parse_multiple(item.ability.effect)
+                battle_engine.log("DEBUG: Using compiled item effect: '%s'", item.ability.effect)
+            effects = item.ability.effects
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Parsed {len(effects)} effect(s) from item")
+                battle_engine.log("DEBUG: Parsed %s effect(s) from item", len(effects))
                 for i, effect in enumerate(effects):
-                    battle_engine.log(f"DEBUG: Effect {i+1}: {type(effect).__name__} - {effect}")
+                    battle_engine.log("DEBUG: Effect %s: %s - %s", i+1, type(effect).__name__, effect)
             
             for i, effect in enumerate(effects):
                 try:
                     if battle_engine.debug:
-                        battle_engine.log(f"DEBUG: Executing effect {i+1}/{len(effects)}: {type(effect).__name__}")
+                        battle_engine.log("DEBUG: Executing effect %s/%s: %s", i+1, len(effects), type(effect).__name__)
                         if hasattr(effect, 'card_type'):
-                            battle_engine.log(f"DEBUG: SearchEffect card_type: {effect.card_type}, amount: {effect.amount}")
-                    effect.execute(player, battle_engine)
+                            battle_engine.log("DEBUG: SearchEffect card_type: %s, amount: %s", effect.card_type, effect.amount)
+                    execute_effect(effect, player, battle_engine)
                     if battle_engine.debug:
-                        battle_engine.log(f"DEBUG: Effect {i+1} executed successfully")
+                        battle_engine.log("DEBUG: Effect %s executed successfully", i+1)
                 except Exception as e:
-                    battle_engine.log(f"Error executing item effect: {e}")
+                    battle_engine.log("Error executing item effect: %s", e)
                     import traceback
                     if battle_engine.debug:
                         traceback.print_exc()
         else:
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Item {item.name} has no ability or effect")
+                battle_engine.log("DEBUG: Item %s has no ability or effect", item.name)
                 if not item.ability:
-                    battle_engine.log(f"DEBUG: Item.ability is None")
+                    battle_engine.log("DEBUG: Item.ability is None")
                 elif not item.ability.effect:
-                    battle_engine.log(f"DEBUG: Item.ability.effect is None or empty")
+                    battle_engine.log("DEBUG: Item.ability.effect is None or empty")
         
         # Discard item
         player.discard_card(item)
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: Discarded {item.name}. Discard pile size: {len(player.discard_pile)}")
+            battle_engine.log("DEBUG: Discarded %s. Discard pile size: %s", item.name, len(player.discard_pile))
         
-        battle_engine.log(f"{player.name} played {item.name}")
+        battle_engine.log("%s played %s", player.name, item.name)
         
         if battle_engine.debug:
-            battle_engine.log(f"DEBUG: PlayItemAction.execute() completed. Hand size: {len(player.cards_in_hand)}")
+            battle_engine.log("DEBUG: PlayItemAction.execute() completed. Hand size: %s", len(player.cards_in_hand))
     
     def to_string(self) -> str:
         return f"play_item_{self.item_id}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.PLAY_ITEM, index=self._hand_index(player, self.item_id, self.hand_index))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'PlayItemAction':
         if not action_str.startswith("play_item_"):
@@ -1,5 +1,5 @@
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action, location_to_slot
 from v3.models.cards.pokemon import Pokemon
 from v3.models.cards.card import Card
 from v3.models.match.game_rules import GamePhase
@@ -7,10 +7,11 @@ from v3.models.match.game_rules import GamePhase
 class PlayPokemonAction(Action):
     """Action to play a Pokemon card from hand"""
     
-    def __init__(self, card_id: str, position: str):
+    def __init__(self, card_id: str, position: str, hand_index: Optional[int] = None):
         super().__init__(ActionType.PLAY_POKEMON)
         self.card_id = card_id
         self.position = position  # "active" or "bench_{index}"
+        self.hand_index = hand_index  # Hand position of the card when the action was generated
     
     def validate(self, player, battle_engine) -> tuple[bool, Optional[str]]:
         """Validate if Pokemon can be played"""
@@ -20,7 +21,7 @@ class PlayPokemonAction(Action):
             return False, "Already played a Pokemon this turn (limit: 1 per turn)"
         
         # Find card in hand
-        card = next((c for c in player.cards_in_hand if c.id == self.card_id), None)
+        card = self._find_in_hand(player, self.card_id, self.hand_index)
         if not card:
             return False, f"Card {self.card_id} not in hand"
         
@@ -63,7 +64,7 @@ class PlayPokemonAction(Action):
             raise ValueError("Already played a Pokemon this turn (limit: 1 per turn)")
         
         # Find card
-        card = next((c for c in player.cards_in_hand if c.id == self.card_id), None)
+        card = self._find_in_hand(player, self.card_id, self.hand_index)
         if not card or not isinstance(card, Pokemon):
             raise ValueError(f"Card {self.card_id} not found or not Pokemon")
         
@@ -96,11 +97,15 @@ class PlayPokemonAction(Action):
         if battle_engine.phase != GamePhase.SETUP:
             player.played_pokemon_this_turn = True
         
-        battle_engine.log(f"{player.name} played {card.name} to {self.position}")
+        battle_engine.log("%s played %s to %s", player.name, card.name, self.position)
     
     def to_string(self) -> str:
         return f"play_pokemon_{self.card_id}_{self.position}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.PLAY_POKEMON, location_to_slot(self.position),
+                           self._hand_index(player, self.card_id, self.hand_index))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'PlayPokemonAction':
         # Format: "play_pokemon_{card_id}_{position}"
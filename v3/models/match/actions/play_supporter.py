@@ -1,19 +1,20 @@
 """Play Supporter action - play a Supporter trainer card"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action
 from v3.models.cards.supporter import Supporter
-from v3.models.match.effects import EffectParser
+from v3.models.match.effects.effect import execute_effect
 
 class PlaySupporterAction(Action):
     """Action to play a Supporter card"""
     
-    def __init__(self, supporter_id: str):
+    def __init__(self, supporter_id: str, hand_index: Optional[int] = None):
         super().__init__(ActionType.PLAY_SUPPORTER)
         self.supporter_id = supporter_id
+        self.hand_index = hand_index  # Hand position of the supporter when generated
     
     def validate(self, player, battle_engine) -> tuple[bool, Optional[str]]:
         """Validate if supporter can be played"""
-        supporter = next((c for c in player.cards_in_hand if c.id == self.supporter_id), None)
+        supporter = self._find_in_hand(player, self.supporter_id, self.hand_index)
         if not supporter:
             return False, f"Supporter {self.supporter_id} not in hand"
         
@@ -30,7 +31,7 @@ class PlaySupporterAction(Action):
     
     def execute(self, player, battle_engine) -> None:
         """Execute playing supporter"""
-        supporter = next((c for c in player.cards_in_hand if c.id == self.supporter_id), None)
+        supporter = self._find_in_hand(player, self.supporter_id, self.hand_index)
         if not supporter or not isinstance(supporter, Supporter):
             raise ValueError(f"Supporter {self.supporter_id} not found")
         
@@ -44,12 +45,12 @@ class PlaySupporterAction(Action):
         
         # Execute supporter effect
         if supporter.ability and supporter.ability.effect:
-            effects = EffectParser.parse_multiple(supporter.ability.effect)
+            effects = supporter.ability.effects
             for effect in effects:
                 try:
-                    effect.execute(player, battle_engine)
+                    execute_effect(effect, player, battle_engine)
                 except Exception as e:
-                    battle_engine.log(f"Error executing supporter effect: {e}")
+                    battle_engine.log("Error executing supporter effect: %s", e)
                     import traceback
                     if battle_engine.debug:
                         traceback.print_exc()
@@ -57,11 +58,15 @@ class PlaySupporterAction(Action):
         # Discard supporter
         player.discard_card(supporter)
         
-        battle_engine.log(f"{player.name} played {supporter.name}")
+        battle_engine.log("%s played %s", player.name, supporter.name)
     
     def to_string(self) -> str:
         return f"play_supporter_{self.supporter_id}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.PLAY_SUPPORTER,
+                           index=self._hand_index(player, self.supporter_id, self.hand_index))
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'PlaySupporterAction':
         if not action_str.startswith("play_supporter_"):
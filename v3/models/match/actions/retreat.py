@@ -1,8 +1,9 @@
 """Retreat action - retreat active Pokemon to bench"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action
 from v3.models.cards.pokemon import Pokemon
 from v3.models.cards.card import Card
+from v3.models.cards import energy_math
 
 class RetreatAction(Action):
     """Action to retreat active Pokemon to bench"""
@@ -21,7 +22,7 @@ class RetreatAction(Action):
         
         # Check retreat cost
         retreat_cost = player.active_pokemon.retreat_cost
-        total_energy = sum(player.active_pokemon.equipped_energies.values())
+        total_energy = energy_math.total(player.active_pokemon.equipped_energies)
         if total_energy < retreat_cost:
             return False, f"Not enough energy to retreat (need {retreat_cost}, have {total_energy})"
         
@@ -43,18 +44,8 @@ class RetreatAction(Action):
         """Execute retreat"""
         active = player.active_pokemon
         
-        # Discard energy equal to retreat cost
-        energy_to_discard = active.retreat_cost
-        discarded = 0
-        
-        # Discard energy (any type)
-        for energy_type in list(active.equipped_energies.keys()):
-            if discarded >= energy_to_discard:
-                break
-            if active.equipped_energies[energy_type] > 0:
-                discard_amount = min(active.equipped_energies[energy_type], energy_to_discard - discarded)
-                active.equipped_energies[energy_type] -= discard_amount
-                discarded += discard_amount
+        # Discard energy (any type) equal to retreat cost
+        energy_math.discard(active.equipped_energies, active.retreat_cost)
         
         # Move to bench
         player.bench_pokemons[self.bench_index] = active
@@ -74,11 +65,14 @@ class RetreatAction(Action):
         else:
             player.active_pokemon = None
         
-        battle_engine.log(f"{player.name} retreated {active.name} to bench")
+        battle_engine.log("%s retreated %s to bench", player.name, active.name)
     
     def to_string(self) -> str:
         return f"retreat_{self.bench_index}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.RETREAT, index=self.bench_index)
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'RetreatAction':
         if not action_str.startswith("retreat_"):
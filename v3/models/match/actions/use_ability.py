@@ -1,8 +1,8 @@
 """Use Ability action - use a Pokemon ability"""
 from typing import Optional
-from .action import Action, ActionType
+from .action import Action, ActionType, pack_action, location_to_slot
 from v3.models.cards.pokemon import Pokemon
-from v3.models.match.effects import EffectParser
+from v3.models.match.effects.effect import execute_effect
 
 class UseAbilityAction(Action):
     """Action to use a Pokemon ability"""
@@ -56,34 +56,26 @@ class UseAbilityAction(Action):
         pokemon.used_ability_this_turn = True
         
         # Execute ability effect
+        # (ability.effects is parsed once per effect text - passive "as long as"
+        # text falls through to the same multi-effect parse the old path used)
         if ability.effect:
-            # Try ability-specific parsing first
-            effect = EffectParser.parse_ability_effect(ability.effect)
-            if effect:
+            for effect in ability.effects:
                 try:
-                    effect.execute(player, battle_engine, pokemon)
+                    execute_effect(effect, player, battle_engine, pokemon)
                 except Exception as e:
-                    battle_engine.log(f"Error executing ability effect: {e}")
+                    battle_engine.log("Error executing ability effect: %s", e)
                     import traceback
                     if battle_engine.debug:
                         traceback.print_exc()
-            else:
-                # Fall back to standard parsing
-                effects = EffectParser.parse_multiple(ability.effect)
-                for effect in effects:
-                    try:
-                        effect.execute(player, battle_engine, pokemon)
-                    except Exception as e:
-                        battle_engine.log(f"Error executing ability effect: {e}")
-                        import traceback
-                        if battle_engine.debug:
-                            traceback.print_exc()
         
-        battle_engine.log(f"{player.name} used {ability.name} from {pokemon.name}")
+        battle_engine.log("%s used %s from %s", player.name, ability.name, pokemon.name)
     
     def to_string(self) -> str:
         return f"use_ability_{self.pokemon_location}_{self.ability_index}"
     
+    def encode(self, player=None) -> int:
+        return pack_action(ActionType.USE_ABILITY, location_to_slot(self.pokemon_location), self.ability_index)
+    
     @classmethod
     def from_string(cls, action_str: str, player) -> 'UseAbilityAction':
         if not action_str.startswith("use_ability_"):
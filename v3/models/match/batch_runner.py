@@ -0,0 +1,316 @@
+import math
+import os
+import random
+import multiprocessing
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.game_profiler import PhaseProfiler, merge_profiles
+from v3.models.match.game_record import GameRecorder, RecordWriter
+from v3.models.match.match_stats import SequentialStop, mean_interval, wilson_interval
+from v3.models.match.matchup_tables import MatchupTables
+from v3.models.match.player import Player
+from v3.models.match.random_tape import RandomTape
+from v3.models.agents.agent import agent_name
+from v3.models.agents.random_agent import RandomAgent
+
+"""Batch simulation runner - spreads independent games across a process pool"""
+
+RESULT_KEYS = ("Player 1", "Player 2", "Draw")
+
+
+@dataclass
+class GameConfig:
+    """Everything a worker needs to rebuild a game from scratch (must be picklable)"""
+    deck1: List
+    deck2: List
+    energy1_types: List[str]
+    energy2_types: List[str]
+    agent1: Type = RandomAgent
+    agent2: Type = RandomAgent
+    player1_name: str = "Player 1"
+    player2_name: str = "Player 2"
+    matchup_tables: bool = True  # Precompute damage/prize tables for the two decks
+    profile: bool = False  # Time each game with a PhaseProfiler (see GameResult.profile)
+    record: bool = False  # Keep a GameRecord of each game (see GameResult.record)
+    tapes: bool = False  # Play each game on RandomTape(seed) instead of a single stream (see random_tape)
+
+    def swapped(self) -> 'GameConfig':
+        """The same game with the decks, energies and agents trading seats (names stay with the seats)"""
+        return replace(self, deck1=self.deck2, deck2=self.deck1, energy1_types=self.energy2_types,
+                       energy2_types=self.energy1_types, agent1=self.agent2, agent2=self.agent1)
+
+
+@dataclass
+class GameResult:
+    """Outcome of a single simulated game"""
+    game_index: int
+    seed: int
+    winner: str  # "Player 1", "Player 2" or "Draw"
+    turns: int
+    profile: Optional[Dict] = None  # PhaseProfiler.to_dict() when GameConfig.profile is set
+    record: Optional[str] = None  # GameRecord NDJSON line when GameConfig.record is set
+
+
+@dataclass
+class AdaptiveResult:
+    """Tally of a batch that may have stopped early (see BatchRunner.run_adaptive)"""
+    counts: Dict[str, int]
+    games: int
+    max_games: int
+    stopped_by: Optional[str] = None  # SequentialStop.decision reason, None if the budget ran out
+
+    @property
+    def games_saved(self) -> int:
+        return self.max_games - self.games
+
+    def intervals(self, z: float = None) -> Dict[str, Tuple[float, float]]:
+        """Wilson interval of each outcome rate"""
+        z = z if z is not None else SequentialStop.z
+        return {key: wilson_interval(self.counts[key], self.games, z) for key in RESULT_KEYS}
+
+
+def game_seed(base_seed: int, game_index: int) -> int:
+    """Derive the seed of one game from the batch seed (stable across worker counts)"""
+    return (base_seed * 1_000_003 + game_index) & 0xFFFFFFFF
+
+
+def build_engine(config: GameConfig, seed: Optional[int], events=None, profiler=None) -> BattleEngine:
+    """Fresh engine for one game of config, with its own card instances (events/profiler are optional)"""
+    player1 = Player(config.player1_name, [card.instantiate() for card in config.deck1], config.energy1_types, agent=config.agent1)
+    player2 = Player(config.player2_name, [card.instantiate() for card in config.deck2], config.energy2_types, agent=config.agent2)
+    matchups = MatchupTables.for_decks(config.deck1, config.deck2) if config.matchup_tables else None
+    tape = RandomTape(seed) if config.tapes and seed is not None else None
+    return BattleEngine(player1, player2, debug=False, seed=seed, matchups=matchups, events=events,
+                        profiler=profiler, tape=tape)
+
+
+def play_game(config: GameConfig, game_index: int, seed: int) -> GameResult:
+    """Play one game with fresh card instances and return its result"""
+    profiler = PhaseProfiler() if config.profile else None
+    recorder = None
+    if config.record:
+        recorder = GameRecorder(meta={"game": game_index, "agents": [agent_name(config.agent1), agent_name(config.agent2)]})
+    engine = build_engine(config, seed, events=recorder, profiler=profiler)
+    player1, player2 = engine.players
+    winner = engine.start_battle()
+
+    # Results are keyed by seat, not by display name
+    if winner is None:
+        winner_name = "Draw"
+    else:
+        winner_name = "Player 1" if winner is player1 else "Player 2"
+    # Records are serialized here so worker processes do the JSON work, not the parent
+    record = recorder.record.to_json() if recorder is not None and recorder.record is not None else None
+    return GameResult(game_index=game_index, seed=seed, winner=winner_name, turns=engine.turn,
+                      profile=profiler.to_dict() if profiler else None, record=record)
+
+
+########## Worker Process ##########
+
+# Set once per worker by the pool initializer so decks are pickled once per
+# process instead of once per task
+_worker_config: Optional[GameConfig] = None
+
+
+def _init_worker(config: GameConfig):
+    global _worker_config
+    _worker_config = config
+
+
+def _run_chunk(task: Tuple[int, int, int]) -> List[GameResult]:
+    """Play games [start, start + count) of the batch in this worker"""
+    start, count, base_seed = task
+    return [
+        play_game(_worker_config, index, game_seed(base_seed, index))
+        for index in range(start, start + count)
+    ]
+
+
+class BatchRunner:
+    """Runs many independent games, optionally across several processes.
+
+    Each game gets its own seed derived from the batch seed and the game index,
+    so a batch produces the same per-game results whatever the worker count.
+    """
+
+    def __init__(self, config: GameConfig, workers: Optional[int] = None,
+                 seed: Optional[int] = None, chunk_size: Optional[int] = None):
+        self.config = config
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.chunk_size = chunk_size
+
+    def _chunks(self, simulations: int) -> List[Tuple[int, int, int]]:
+        """Split the batch into tasks small enough to keep every worker busy"""
+        chunk_size = self.chunk_size
+        if not chunk_size:
+            # ~8 tasks per worker balances load without drowning in IPC
+            chunk_size = max(1, min(256, simulations // (self.workers * 8)))
+        return [
+            (start, min(chunk_size, simulations - start), self.seed)
+            for start in range(0, simulations, chunk_size)
+        ]
+
+    def iter_results(self, simulations: int) -> Iterator[GameResult]:
+        """Yield game results as they complete (order is not guaranteed)"""
+        if simulations <= 0:
+            return
+
+        tasks = self._chunks(simulations)
+        if self.workers == 1 or len(tasks) == 1:
+            for index in range(simulations):
+                yield play_game(self.config, index, game_seed(self.seed, index))
+            return
+
+        with multiprocessing.Pool(processes=min(self.workers, len(tasks)),
+                                  initializer=_init_worker,
+                                  initargs=(self.config,)) as pool:
+            for chunk in pool.imap_unordered(_run_chunk, tasks):
+                yield from chunk
+
+    def run(self, simulations: int) -> Dict[str, int]:
+        """Run the whole batch and return the Player 1 / Player 2 / Draw tally"""
+        return merge_results(self.iter_results(simulations))
+
+    def run_adaptive(self, max_games: int, stop: SequentialStop, check_every: int = 50,
+                     on_result: Optional[Callable[[GameResult], None]] = None) -> AdaptiveResult:
+        """Play up to max_games games, stopping as soon as the stop rule is met.
+
+        The rule is checked every check_every games on the games counted so far, and games
+        are counted in game index order (results that arrive early wait for the ones before
+        them), so where a seeded batch stops does not depend on the worker count. Games
+        finished past the stopping point are dropped. on_result sees every counted game.
+        """
+        counts = dict.fromkeys(RESULT_KEYS, 0)
+        pending: Dict[int, GameResult] = {}
+        played = 0
+        stopped_by = None
+        results = self.iter_results(max_games)
+        try:
+            for result in results:
+                pending[result.game_index] = result
+                while played in pending and stopped_by is None:
+                    result = pending.pop(played)
+                    counts[result.winner] += 1
+                    played += 1
+                    if on_result is not None:
+                        on_result(result)
+                    if played % check_every == 0:
+                        stopped_by = stop.decision(*(counts[key] for key in RESULT_KEYS))
+                if stopped_by is not None:
+                    break
+        finally:
+            results.close()  # Shuts the pool down when stopping early
+        return AdaptiveResult(counts, played, max_games, stopped_by)
+
+
+@dataclass
+class PairedResult:
+    """Per-tape scores of Player 1's deck for one or two arms played on the same tapes (see run_paired).
+
+    A score is 1 for a win, 0.5 for a draw and 0 for a loss, averaged over the two games of
+    a tape when the seats were swapped.
+    """
+    scores_a: List[float]
+    scores_b: Optional[List[float]] = None
+    swap_seats: bool = True
+
+    @property
+    def tapes(self) -> int:
+        return len(self.scores_a)
+
+    @property
+    def games(self) -> int:
+        """Games played over all arms and seatings"""
+        arms = 1 if self.scores_b is None else 2
+        return self.tapes * arms * (2 if self.swap_seats else 1)
+
+    @property
+    def score_a(self) -> float:
+        return sum(self.scores_a) / max(1, self.tapes)
+
+    @property
+    def score_b(self) -> Optional[float]:
+        return None if self.scores_b is None else sum(self.scores_b) / max(1, self.tapes)
+
+    @property
+    def differences(self) -> List[float]:
+        """Per-tape score of arm A minus arm B"""
+        return [a - b for a, b in zip(self.scores_a, self.scores_b)]
+
+    @property
+    def difference(self) -> float:
+        return self.score_a - self.score_b
+
+    def interval(self, z: float = None) -> Tuple[float, float]:
+        """Interval of the score difference from the paired per-tape differences
+        (of arm A's score when there is no arm B)"""
+        z = z if z is not None else SequentialStop.z
+        return mean_interval(self.scores_a if self.scores_b is None else self.differences, z)
+
+    def unpaired_interval(self, z: float = None) -> Tuple[float, float]:
+        """Interval of the score difference treating the arms as independent samples - what
+        the same number of games without shared tapes would give (for comparison)"""
+        z = z if z is not None else SequentialStop.z
+        low_a, high_a = mean_interval(self.scores_a, z)
+        low_b, high_b = mean_interval(self.scores_b, z)
+        margin = math.hypot(high_a - low_a, high_b - low_b) / 2
+        return self.difference - margin, self.difference + margin
+
+
+def _tape_scores(config: GameConfig, tapes: int, seed: int, workers: Optional[int],
+                 chunk_size: Optional[int], swap_seats: bool) -> List[float]:
+    """Player 1's deck score per tape, over both seatings when swap_seats is set"""
+    seatings = [(replace(config, tapes=True), "Player 1")]
+    if swap_seats:
+        seatings.append((replace(config.swapped(), tapes=True), "Player 2"))
+    scores = [0.0] * tapes
+    for seating, seat in seatings:
+        for result in BatchRunner(seating, workers=workers, seed=seed, chunk_size=chunk_size).iter_results(tapes):
+            score = 0.5 if result.winner == "Draw" else float(result.winner == seat)
+            scores[result.game_index] += score / len(seatings)
+    return scores
+
+
+def run_paired(config_a: GameConfig, tapes: int, seed: Optional[int] = None, workers: Optional[int] = None,
+               config_b: Optional[GameConfig] = None, swap_seats: bool = True,
+               chunk_size: Optional[int] = None) -> PairedResult:
+    """Play every arm on the same randomness tapes and score Player 1's deck per tape.
+
+    Tape i is RandomTape(game_seed(seed, i)) for every arm and seating: the same shuffles,
+    energy rolls, coin flips and first player seat by seat. With swap_seats each tape is
+    played twice, the second time with the decks and agents trading seats, so both sides
+    get each tape's draws and the first turn once. With config_b (e.g. another deck or
+    agent for Player 1 against the same opponent) the per-tape score differences cancel
+    most of the luck both arms share, so the difference needs far fewer games for the same
+    interval than independent batches (compare interval with unpaired_interval).
+    """
+    seed = seed if seed is not None else random.randrange(2 ** 32)
+    scores_a = _tape_scores(config_a, tapes, seed, workers, chunk_size, swap_seats)
+    scores_b = None
+    if config_b is not None:
+        scores_b = _tape_scores(config_b, tapes, seed, workers, chunk_size, swap_seats)
+    return PairedResult(scores_a, scores_b, swap_seats)
+
+
+def merge_results(results) -> Dict[str, int]:
+    """Tally an iterable of GameResult into the Player 1 / Player 2 / Draw summary"""
+    summary = {key: 0 for key in RESULT_KEYS}
+    for result in results:
+        summary[result.winner] += 1
+    return summary
+
+
+def merge_game_profiles(results) -> PhaseProfiler:
+    """Combine the per-game profiles of an iterable of GameResult (games run with GameConfig.profile)"""
+    return merge_profiles(result.profile for result in results)
+
+
+def write_game_records(results, writer: RecordWriter) -> Iterator[GameResult]:
+    """Pass results through unchanged while writing their records (games run with GameConfig.record)"""
+    for result in results:
+        if result.record is not None:
+            writer.write_line(result.record)
+        yield result
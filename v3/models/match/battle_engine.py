@@ -1,3 +1,4 @@
+import copy
 import random
 import sys
 import os
@@ -11,14 +12,57 @@ from v3.models.cards.card import Card
 from v3.models.cards.energy import Energy
 from v3.models.cards.attack import Attack
 from v3.models.match.game_rules import GameRules, GamePhase
+from v3.models.match.actions import Action, ActionType, parse_action
+from v3.models.match.exceptions import InvalidActionError, StateError
+from v3.models.match.game_logger import NULL_LOGGER, NullLogger, EventSink, default_logger
+from v3.models.match.game_profiler import NULL_PROFILER, NullProfiler, clock
+from v3.models.match.effects.effect import execute_effect
+from v3.models.match.matchup_tables import MatchupTables
+from v3.models.match.random_tape import RandomTape
 
 """Core battle engine - simplified and modular"""
+
+
+def _copy_rng(rng: random.Random) -> random.Random:
+    copy = random.Random()
+    copy.setstate(rng.getstate())
+    return copy
+
+
 class BattleEngine:
-    def __init__(self, player1: Player, player2: Player, debug: bool = False):
+    MAX_MAIN_PHASE_ACTIONS = 50  # Prevent infinite loops
+    
+    def __init__(self, player1: Player, player2: Player, debug: bool = False, seed: Optional[int] = None,
+                 action_space=None, logger: Optional[NullLogger] = None, events: Optional[EventSink] = None,
+                 matchups: Optional[MatchupTables] = None, profiler: Optional[NullProfiler] = None,
+                 tape: Optional[RandomTape] = None):
         self.players = [player1, player2]
         self.player1 = player1
         self.player2 = player2
         self.debug = debug
+        # Messages are only formatted when the logger writes them (see game_logger)
+        self.logger = logger or default_logger(debug)
+        self.events = events
+        # Opt-in phase/action timers (see game_profiler); NULL_PROFILER records nothing
+        self.profiler = profiler or NULL_PROFILER
+        # Optional damage/prize tables for the two decks, read by the agents' previews (see matchup_tables)
+        self.matchups = matchups
+
+        # Every random decision in the game (coin tosses, shuffles, energy rolls,
+        # effects, statuses) draws from this one stream so a seed replays a game exactly.
+        # With a tape, each purpose and seat draws from its own stream instead (see random_tape)
+        self.tape = tape
+        self.seed = tape.seed if tape is not None else seed
+        self.rng = tape.coin_rng() if tape is not None else random.Random(seed)
+        for seat, player in enumerate(self.players):
+            if tape is not None:
+                player.set_rng(tape.shuffle_rng(seat), agent_rng=tape.agent_rng(seat),
+                               energy_rng=tape.energy_rng(seat))
+            else:
+                # Agents get a child stream so their choices never shift the game stream
+                player.set_rng(self.rng, agent_rng=random.Random(self.rng.getrandbits(64)))
+            # Energies rolled when the Player was built came from another stream
+            player.energy_zone.reset()
 
         self.current_player_index = 0
         self.turn = 0
@@ -26,6 +70,9 @@ class BattleEngine:
         self.first_player_first_turn = False  # Track if first player is on their first turn (no energy attachment)
         self.first_player_index = None  # Track which player goes first
         self.last_action_taken = None  # Track last action taken for debug display
+        self.main_phase_actions = 0  # Actions taken in the current main phase (step API)
+        self._action_space = action_space
+        self._bind_agents()
     
     def start_battle(self) -> Optional[Player]:
         """Main battle execution"""
@@ -41,9 +88,11 @@ class BattleEngine:
             
             while not self._is_game_over():
                 self._execute_turn()
+            self._emit_game_end()
             return self._determine_winner()
         except Exception as e:
-            self.log(f"Battle error: {e}")
+            self.log("Battle error: %s", e)
+            self._emit_game_end(error=f"{type(e).__name__}: {e}")
             import traceback
             if self.debug:
                 traceback.print_exc()
@@ -52,18 +101,106 @@ class BattleEngine:
 
 
     
-    def log(self, message: str):
-        """Log a message. Future enhancement: Make logging agent-aware (human vs AI)"""
-        if self.debug:
-            print(f"[Turn {self.turn}] {message}")
+    def clone(self) -> 'BattleEngine':
+        """Independent copy of the current game for search / lookahead.
+        
+        Only per-game state is copied (zones, damage, energies, statuses, flags and the
+        random streams); card data such as attacks, abilities and compiled effects is
+        shared with the original. Playing the clone never affects this engine.
+        Clones are silent: they log nothing, render no boards, emit no events and are not profiled.
+        """
+        engine = copy.copy(self)
+        engine.debug = False
+        engine.logger = NULL_LOGGER
+        engine.events = None
+        engine.profiler = NULL_PROFILER
+        engine.rng = _copy_rng(self.rng)
+        memo = {}
+        engine.players = [player.clone(engine.rng, memo) for player in self.players]
+        if self.tape is not None:
+            # Keep the per-seat tape streams apart rather than folding them into engine.rng
+            for player, clone in zip(self.players, engine.players):
+                clone.rng = _copy_rng(player.rng)
+                clone.energy_zone.rng = _copy_rng(player.energy_zone.rng)
+        engine.player1, engine.player2 = engine.players
+        engine._bind_agents()
+        return engine
+    
+    def snapshot(self) -> 'BattleEngine':
+        """Capture the current game state so it can be restored later"""
+        return self.clone()
+    
+    def restore(self, snapshot: 'BattleEngine'):
+        """Rewind this engine to a snapshot in place (the snapshot stays reusable).
+        
+        Player and agent objects keep their identity, so outside references stay valid.
+        """
+        state = snapshot.clone()
+        for player, saved in zip(self.players, state.players):
+            agent = player.agent
+            player.__dict__.update(saved.__dict__)
+            if agent is not None and saved.agent is not None:
+                agent.__dict__.update(saved.agent.__dict__)
+                agent.player = player
+            player.agent = agent
+        engine_state = dict(state.__dict__)
+        for name in ('players', 'player1', 'player2', 'debug', 'logger', 'events', 'profiler'):
+            engine_state.pop(name)
+        self.__dict__.update(engine_state)
+        self._bind_agents()
+    
+    def log(self, message: str, *args):
+        """Log a %-style message, e.g. log("%s drew %s", player.name, card.name).
+        
+        Formatting is deferred to the logger, so with the null logger (debug=False)
+        a call costs no string work.
+        """
+        if self.logger.enabled:
+            self.logger.log(self.turn, message, *args)
+    
+    def emit(self, event: str, **data):
+        """Send a structured event to the attached sink, if any"""
+        if self.events is not None:
+            self.events.emit(self.turn, event, data)
         
     #### PRIVATE METHODS ####
 
+    def _bind_agents(self):
+        """Give agents this engine, route their debug output through its logger and share its matchup tables"""
+        for player in self.players:
+            if player.agent is not None:
+                player.agent.engine = self
+                player.agent.log = self.log
+                player.agent.matchups = self.matchups
+    
+    def _emit_action(self, player: Player, action: Action):
+        """Report a chosen action with the player's seat and its integer code (see action_codec)"""
+        self.emit("action", player=player.name, seat=self.players.index(player),
+                  action=action.to_string(), code=action.encode(player))
+
+    def _emit_game_end(self, error: Optional[str] = None):
+        """Report the result; a game stopped by an error has no winner (start_battle returns None)"""
+        if self.events is not None:
+            winner = self._determine_winner() if error is None else None
+            self.emit("game_end", winner=winner.name if winner else None,
+                      winner_seat=self.players.index(winner) if winner else None,
+                      points=[player.points for player in self.players], error=error)
+
     def _setup_game(self):
         """Setup initial game state"""
         self.log("Setting up battle...")
+        profiler = self.profiler
+        if profiler.enabled:
+            start = clock()
+            profiler.count("games")
 
         self._determine_first_player()
+        if self.events is not None:
+            self.emit("game_start", first_player=self.players[self.first_player_index].name,
+                      players=[player.name for player in self.players], seed=self.seed, tape=self.tape is not None,
+                      first_seat=self.first_player_index,
+                      decks=[[card.id for card in player.deck] for player in self.players],
+                      energies=[list(player.chosen_energies) for player in self.players])
         
         # Setup both players
         for player in self.players:
@@ -75,13 +212,16 @@ class BattleEngine:
             opponent = self._get_opponent(current)
             self._turn_zero(current, opponent)
             self._switch_players()
+        
+        if profiler.enabled:
+            profiler.add_time("phase.setup", clock() - start)
     
     def _determine_first_player(self):
         """Determine which player goes first (coin toss)"""
         # Coin toss: randomly determine first player
-        self.first_player_index = random.randint(0, 1)
+        self.first_player_index = self.tape.first_player if self.tape is not None else self.rng.randint(0, 1)
         self.current_player_index = self.first_player_index
-        self.log(f"Coin toss: {self.players[self.first_player_index].name} goes first!")
+        self.log("Coin toss: %s goes first!", self.players[self.first_player_index].name)
     
     def _setup_player(self, player: Player):
         """Setup individual player by drawing initial hand and adding energies to energy zone"""
@@ -104,20 +244,15 @@ class BattleEngine:
 
     def _turn_zero(self, player: Player, opponent: Player):
         """Execute turn zero for a player - must play at least 1 basic Pokemon to active"""
-        self.log(f"=== Setup Phase - {player.name} ===")
-        player_state = self._get_player_state(player, opponent)
-        self.log(f"{player_state}")
+        self.log("=== Setup Phase - %s ===", player.name)
+        if self.logger.enabled:
+            self.log("%s", self._get_player_state(player, opponent))
+        
+        is_human = hasattr(player.agent, 'is_human') and player.agent.is_human
         
         # Display board for human players or in debug mode
-        if self.debug or (hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human):
-            board_view = self.generate_board_view(player, opponent)
-            
-            # Clear screen for human players (but not in debug mode)
-            if hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human and not self.debug:
-                import os
-                os.system('clear' if os.name != 'nt' else 'cls')
-            
-            print("\n" + board_view + "\n")
+        if self.debug or is_human:
+            self._show_board(player)
         
         # Player must play at least 1 basic Pokemon to active
         # Keep looping until they have an active Pokemon
@@ -125,152 +260,63 @@ class BattleEngine:
         action_count = 0
         
         while player.active_pokemon is None and action_count < max_actions:
-            # Get Actions
-            actions = player._get_turn_zero_actions()
-            
             # Only allow active actions - filter out bench and end_turn
-            active_actions = [a for a in actions if "_active" in a]
-            if not active_actions:
+            actions = [a for a in player._generate_turn_zero_actions()
+                       if a.action_type == ActionType.PLAY_POKEMON and a.position == "active"]
+            if not actions:
                 # No valid actions - this shouldn't happen if deck has basic Pokemon
-                self.log(f"ERROR: {player.name} has no basic Pokemon to play to active!")
+                self.log("ERROR: %s has no basic Pokemon to play to active!", player.name)
                 break
             
-            actions = active_actions  # Only allow active actions
-
             # Display board again with filtered actions for human players
-            if hasattr(player.agent, 'is_human') and player.agent.is_human:
-                board_view = self.generate_board_view(player, opponent)
-                # Clear screen for human players (but not in debug mode)
-                if not self.debug:
-                    import os
-                    os.system('clear' if os.name != 'nt' else 'cls')
-                print("\n" + board_view + "\n")
-            
-            # Play Action - handle different agent interfaces
-            action_str = None
-            if hasattr(player.agent, 'play_action'):
-                # HumanAgent interface - pass the filtered actions
-                action_str = player.agent.play_action(actions)
-            elif hasattr(player.agent, 'get_action'):
-                # RandomAgent interface - convert to string
-                action_indices = list(range(len(actions)))
-                action_index = player.agent.get_action({}, action_indices)
-                if action_index is not None and 0 <= action_index < len(actions):
-                    action_str = actions[action_index]
-                else:
-                    # Force play to active if available
-                    active_actions = [a for a in actions if "_active" in a]
-                    if active_actions:
-                        action_str = active_actions[0]
-                    else:
-                        action_str = actions[0] if actions else "end_turn"
-            else:
-                # Default: play first available action
-                active_actions = [a for a in actions if "_active" in a]
-                action_str = active_actions[0] if active_actions else (actions[0] if actions else "end_turn")
+            if is_human:
+                self._show_board(player)
             
-            # Handle None return from agent
-            if action_str is None:
-                action_str = "end_turn"
+            # Force play to active if the agent gives no usable answer
+            action = self._choose_action(player, actions)
+            if action is None or action.action_type == ActionType.END_TURN:
+                action = actions[0]
             
             # Execute the action
-            self.log(f"{player.name} chose action: {action_str}")
-            if action_str != "end_turn":
-                self._execute_action(action_str, player)
-                action_count += 1
-            else:
-                break
+            self.log("%s chose action: %s", player.name, action)
+            if self.events is not None:
+                self._emit_action(player, action)
+            action.execute(player, self)
+            action_count += 1
         
         # Now allow playing more Pokemon to bench (optional)
         action_count = 0
         while action_count < max_actions:
-            actions = player._get_turn_zero_actions()
-            
             # Only allow bench actions and end_turn now
-            bench_actions = [a for a in actions if "_bench" in a]
+            actions = player._generate_turn_zero_actions()
+            bench_actions = [a for a in actions
+                             if a.action_type == ActionType.PLAY_POKEMON and a.position == "bench"
+                             and a.validate(player, self)[0]]
             if not bench_actions:
-                # No more bench actions available
-                break
-            
-            # Add end_turn option
-            if "end_turn" not in actions:
-                actions.append("end_turn")
-            
-            # Limit bench actions to available slots only
-            valid_bench_actions = []
-            for bench_action_str in bench_actions:
-                # Validate that the bench slot is actually empty
-                try:
-                    from v3.models.match.actions.play_pokemon import PlayPokemonAction
-                    action_obj = PlayPokemonAction.from_string(bench_action_str, player)
-                    is_valid, error = action_obj.validate(player, self)
-                    if is_valid:
-                        valid_bench_actions.append(bench_action_str)
-                except:
-                    pass
-            
-            if not valid_bench_actions:
-                # No valid bench actions
+                # No more valid bench actions available
                 break
-            
-            # Add end_turn to valid actions
-            valid_actions = valid_bench_actions + ["end_turn"]
+            valid_actions = bench_actions + [actions[-1]]  # end_turn is always last
             
             # Display board again with filtered actions for human players
-            if hasattr(player.agent, 'is_human') and player.agent.is_human:
-                board_view = self.generate_board_view(player, opponent)
-                # Clear screen for human players (but not in debug mode)
-                if not self.debug:
-                    import os
-                    os.system('clear' if os.name != 'nt' else 'cls')
-                print("\n" + board_view + "\n")
+            if is_human:
+                self._show_board(player)
             
-            # Get action from agent
-            action_str = None
-            if hasattr(player.agent, 'play_action'):
-                action_str = player.agent.play_action(valid_actions)
-            elif hasattr(player.agent, 'get_action'):
-                action_indices = list(range(len(valid_actions)))
-                action_index = player.agent.get_action({}, action_indices)
-                if action_index is not None and 0 <= action_index < len(valid_actions):
-                    action_str = valid_actions[action_index]
-                else:
-                    action_str = "end_turn"
-            else:
-                action_str = "end_turn"
-            
-            # Handle None return from agent
-            if action_str is None:
-                action_str = "end_turn"
-            
-            if action_str == "end_turn":
+            action = self._choose_action(player, valid_actions)
+            if action is None or action.action_type == ActionType.END_TURN:
                 break
             
-            self.log(f"{player.name} chose action: {action_str}")
-            # Validate before executing
-            action_obj = None
-            try:
-                from v3.models.match.actions.play_pokemon import PlayPokemonAction
-                action_obj = PlayPokemonAction.from_string(action_str, player)
-                is_valid, error = action_obj.validate(player, self)
-                if is_valid:
-                    self._execute_action(action_str, player)
-                    action_count += 1
-                else:
-                    # Invalid action - end turn
-                    if self.debug:
-                        self.log(f"DEBUG: Invalid bench action: {error}")
-                    break
-            except Exception as e:
-                if self.debug:
-                    self.log(f"DEBUG: Error validating bench action: {e}")
-                break
+            self.log("%s chose action: %s", player.name, action)
+            if self.events is not None:
+                self._emit_action(player, action)
+            action.execute(player, self)
+            action_count += 1
         
+
         # Ensure active Pokemon is set
         if player.active_pokemon is None:
-            self.log(f"ERROR: {player.name} did not set an active Pokemon during setup!")
+            self.log("ERROR: %s did not set an active Pokemon during setup!", player.name)
         
-        self.log(f"{player.name} finished setup phase")
+        self.log("%s finished setup phase", player.name)
 
     def _get_player_state(self, player: Player, opponent: Player) -> str:
         """Get the state for a player as a string representation of the board"""
@@ -1066,50 +1112,37 @@ class BattleEngine:
     
     def _parse_action(self, action_str: str, player: Player):
         """Parse action string into Action object (for validation)"""
-        from v3.models.match.actions.end_turn import EndTurnAction
-        from v3.models.match.actions.play_pokemon import PlayPokemonAction
-        from v3.models.match.actions.attach_energy import AttachEnergyAction
-        from v3.models.match.actions.evolve import EvolveAction
-        
         try:
-            # Convert string to Action object
-            if action_str == "end_turn":
-                return EndTurnAction()
-            elif action_str.startswith("attack_"):
-                from v3.models.match.actions.attack import AttackAction
-                return AttackAction.from_string(action_str, player)
-            elif action_str.startswith("play_pokemon_"):
-                return PlayPokemonAction.from_string(action_str, player)
-            elif action_str.startswith("attach_energy_"):
-                return AttachEnergyAction.from_string(action_str, player)
-            elif action_str.startswith("evolve_"):
-                return EvolveAction.from_string(action_str, player)
-            elif action_str.startswith("retreat_"):
-                from v3.models.match.actions.retreat import RetreatAction
-                return RetreatAction.from_string(action_str, player)
-            elif action_str.startswith("play_item_"):
-                from v3.models.match.actions.play_item import PlayItemAction
-                return PlayItemAction.from_string(action_str, player)
-            elif action_str.startswith("play_supporter_"):
-                from v3.models.match.actions.play_supporter import PlaySupporterAction
-                return PlaySupporterAction.from_string(action_str, player)
-            elif action_str.startswith("attach_tool_"):
-                from v3.models.match.actions.attach_tool import AttachToolAction
-                return AttachToolAction.from_string(action_str, player)
-            elif action_str.startswith("use_ability_"):
-                from v3.models.match.actions.use_ability import UseAbilityAction
-                return UseAbilityAction.from_string(action_str, player)
-            else:
-                return None
+            return parse_action(action_str, player)
         except Exception as e:
             if self.debug:
-                self.log(f"DEBUG: Exception parsing action {action_str}: {e}")
+                self.log("DEBUG: Exception parsing action %s: %s", action_str, e)
             return None
     
+    def _choose_action(self, player: Player, actions: List[Action]) -> Optional[Action]:
+        """Ask the player's agent to pick one of the given Action objects"""
+        agent = player.agent
+        if hasattr(agent, 'choose_action'):
+            return agent.choose_action(actions)
+        if hasattr(agent, 'play_action'):
+            # HumanAgent interface - works on action strings
+            action_strs = [action.to_string() for action in actions]
+            action_str = agent.play_action(action_strs)
+            if action_str in action_strs:
+                return actions[action_strs.index(action_str)]
+            return None
+        if hasattr(agent, 'get_action'):
+            # Legacy interface - picks an index
+            action_index = agent.get_action({}, list(range(len(actions))))
+            if action_index is not None and 0 <= action_index < len(actions):
+                return actions[action_index]
+        return None
+    
+
     def _execute_action(self, action_str: str, player: Player) -> bool:
         """Execute an action from string representation"""
         if self.debug:
-            self.log(f"DEBUG: _execute_action() called with: {action_str}")
+            self.log("DEBUG: _execute_action() called with: %s", action_str)
         
         action = None
         try:
@@ -1117,29 +1150,29 @@ class BattleEngine:
             action = self._parse_action(action_str, player)
             if action is None:
                 if self.debug:
-                    self.log(f"DEBUG: _parse_action returned None for: {action_str}")
-                self.log(f"Unknown action: {action_str}")
+                    self.log("DEBUG: _parse_action returned None for: %s", action_str)
+                self.log("Unknown action: %s", action_str)
                 return False
             
             if self.debug:
-                self.log(f"DEBUG: Parsed action: {type(action).__name__}")
+                self.log("DEBUG: Parsed action: %s", type(action).__name__)
             
             # Validate
             is_valid, error = action.validate(player, self)
             if not is_valid:
                 if self.debug:
-                    self.log(f"DEBUG: Action validation failed: {error}")
-                self.log(f"Invalid action: {error}")
+                    self.log("DEBUG: Action validation failed: %s", error)
+                self.log("Invalid action: %s", error)
                 return False
             
             if self.debug:
-                self.log(f"DEBUG: Action validation passed, executing...")
+                self.log("DEBUG: Action validation passed, executing...")
             
             # Execute
             action.execute(player, self)
             
             if self.debug:
-                self.log(f"DEBUG: Action execution completed successfully")
+                self.log("DEBUG: Action execution completed successfully")
             
             # Track last action for debug display
             if self.debug:
@@ -1151,7 +1184,7 @@ class BattleEngine:
             return True
             
         except Exception as e:
-            self.log(f"Error executing action {action_str}: {e}")
+            self.log("Error executing action %s: %s", action_str, e)
             import traceback
             if self.debug:
                 traceback.print_exc()
@@ -1166,6 +1199,16 @@ class BattleEngine:
 
     def _execute_turn(self):
         """Execute a complete turn"""
+        if not self._begin_turn():
+            return
+        
+        # Main Phase
+        self._main_phase(self._get_current_player())
+        
+        self._finish_turn()
+    
+    def _begin_turn(self) -> bool:
+        """Start the next turn up to its main phase; False if the game ended first"""
         self.turn += 1
         current = self._get_current_player()
         
@@ -1173,45 +1216,143 @@ class BattleEngine:
         is_first_player_first_turn = (self.turn == 1 and self.current_player_index == self.first_player_index)
         if is_first_player_first_turn:
             self.first_player_first_turn = True
-            self.log(f"=== Turn {self.turn} - {current.name} (First Turn - No Energy Attachment) ===")
+            self.log("=== Turn %s - %s (First Turn - No Energy Attachment) ===", self.turn, current.name)
         else:
             self.first_player_first_turn = False
-            self.log(f"=== Turn {self.turn} - {current.name} ===")
+            self.log("=== Turn %s - %s ===", self.turn, current.name)
+        
+        if self.events is not None:
+            self.emit("turn_start", player=current.name)
         
         # Check turn limit before starting turn
         if self.turn > GameRules.MAX_TURNS:
-            self.log(f"Maximum turn limit ({GameRules.MAX_TURNS}) exceeded - ending game")
-            return
+            self.log("Maximum turn limit (%s) exceeded - ending game", GameRules.MAX_TURNS)
+            return False
         
         # Draw Phase (first player draws on their first turn)
         self.phase = GamePhase.DRAW
-        self._draw_phase(current)
+        profiler = self.profiler
+        if profiler.enabled:
+            profiler.count("turns")
+            start = clock()
+            self._draw_phase(current)
+            profiler.add_time("phase.draw", clock() - start)
+        else:
+            self._draw_phase(current)
         
         # Check if game ended (deck-out, turn limit, etc.)
         if self._is_game_over():
-            return
+            return False
         
-        # Main Phase
         self.phase = GamePhase.MAIN
-        self._main_phase(current)
-        
+        self.main_phase_actions = 0
+        return True
+    
+    def _finish_turn(self):
+        """Run the end phase of the current turn once its main phase is over"""
         # Check if game ended (after main phase actions)
         if self._is_game_over():
             return
         
         # End Phase
         self.phase = GamePhase.END
-        self._end_turn()
+        if self.profiler.enabled:
+            start = clock()
+            self._end_turn()
+            self.profiler.add_time("phase.end", clock() - start)
+        else:
+            self._end_turn()
         
         # Final check after end phase
         if self._is_game_over():
             return
 
-    def _create_empty_state(self) -> List[float]:
-        """Create an empty state array initialized with zeros"""
-        # STATE_SIZE not defined - return empty list for now
-        # This is for future AI state representation
-        return []
+########################################################
+#            Step API (fixed action ids)               #
+########################################################
+
+    @property
+    def action_space(self):
+        """Fixed action id space used by legal_action_mask and step"""
+        if self._action_space is None:
+            from v3.models.match.action_space import default_action_space
+            self._action_space = default_action_space()
+        return self._action_space
+    
+    def begin(self):
+        """Run setup and advance to the first main phase decision, for use with step()"""
+        self._setup_game()
+        self._begin_turn()
+    
+    def legal_action_mask(self, player: Optional[Player] = None):
+        """Boolean numpy mask over action_space of the actions player can take now"""
+        return self.action_space.legal_action_mask(self, player or self._get_current_player())
+    
+    def step(self, action_id: int) -> bool:
+        """Play one main phase action of the player to move; returns True once the game is over.
+        
+        Ending the turn, attacking or reaching the per-turn action limit runs the end phase
+        and the next player's draw phase, so the engine always waits on a main phase decision.
+        """
+        if self._is_game_over():
+            raise StateError("Game is over")
+        if self.phase != GamePhase.MAIN:
+            raise StateError(f"step() needs a main phase decision (phase is {self.phase})")
+        
+        player = self._get_current_player()
+        action = self.action_space.legal_actions(self, player).get(action_id)
+        if action is None:
+            name = self.action_space.name(action_id) if 0 <= action_id < self.action_space.size else str(action_id)
+            raise InvalidActionError(name, "not a legal action")
+        return self.apply_action(action)
+    
+    def apply_action(self, action: Action) -> bool:
+        """step() for an Action object already known to be legal - no lookup and no checks.
+        
+        Used by search agents that generate their own legal actions on a clone.
+        """
+        player = self._get_current_player()
+        if action.action_type != ActionType.END_TURN:
+            if self.events is not None:
+                self._emit_action(player, action)
+            self._execute_chosen(action, player)
+            self.main_phase_actions += 1
+            if action.action_type != ActionType.ATTACK and self.main_phase_actions < self.MAX_MAIN_PHASE_ACTIONS:
+                return self._check_game_over()
+        
+        # The turn is over - run it out and start the next one
+        return self._next_turn()
+    
+    def play_turn(self) -> bool:
+        """Let the current player's agent play the rest of its turn; returns True once the game is over"""
+        if self._is_game_over():
+            raise StateError("Game is over")
+        self._main_phase(self._get_current_player())
+        return self._next_turn()
+    
+    def _next_turn(self) -> bool:
+        """End the current main phase and advance to the next player's main phase"""
+        self._finish_turn()
+        if not self._is_game_over():
+            self._begin_turn()
+        return self._check_game_over()
+    
+    def _check_game_over(self) -> bool:
+        """_is_game_over() for the step API, reporting the end of the game once"""
+        if not self._is_game_over():
+            return False
+        self._emit_game_end()
+        return True
+
+    def _create_empty_state(self):
+        """Create an empty state array initialized with zeros (STATE_SIZE float32 values)"""
+        from v3.models.match.state_encoder import default_encoder
+        return default_encoder().empty()
+    
+    def _get_ai_state(self, player: Player, opponent: Player):
+        """Flat float32 state array from player's point of view (see StateEncoder)"""
+        from v3.models.match.state_encoder import default_encoder
+        return default_encoder().encode(self, player)
     
     # This is a function that gets the state for the human player or for the AI
     def _get_state(self, player: Player, opponent: Player) -> Dict[str, Any]:
@@ -1242,259 +1383,136 @@ class BattleEngine:
     
     def _draw_phase(self, player: Player):
         """Draw phase: draw 1 card"""
-        self.log(f"{player.name} draws a card")
+        self.log("%s draws a card", player.name)
         
         # Check if can draw (only requires deck to have cards - no hand size limit)
         # Note: Running out of cards is NOT a win condition - game continues until all prize points are gotten
         if not player.can_draw():
-            self.log(f"{player.name} cannot draw - deck is empty (game continues)")
+            self.log("%s cannot draw - deck is empty (game continues)", player.name)
             # Don't try to draw if we can't, but game continues
             return
         
         # Draw card
         try:
             player.draw(1)
-            self.log(f"{player.name} drew a card. Hand size: {len(player.cards_in_hand)}, Deck: {len(player.deck)}")
+            self.log("%s drew a card. Hand size: %s, Deck: %s", player.name, len(player.cards_in_hand), len(player.deck))
             
             # Note: If deck becomes empty, game continues - deck-out is NOT a win condition
             if len(player.deck) == 0:
-                self.log(f"{player.name} drew their last card - deck is now empty (game continues)")
+                self.log("%s drew their last card - deck is now empty (game continues)", player.name)
         except ValueError as e:
-            self.log(f"ERROR: Cannot draw - {e}")
+            self.log("ERROR: Cannot draw - %s", e)
             # If deck is empty, game continues - not a win condition
             if len(player.deck) == 0:
-                self.log(f"{player.name} has no cards in deck - game continues")
+                self.log("%s has no cards in deck - game continues", player.name)
             return
         
         # No hand size limit - players can have any number of cards in hand
     
     def _main_phase(self, player: Player):
         """Main phase: player can perform actions"""
-        self.log(f"{player.name} enters main phase")
+        self.log("%s enters main phase", player.name)
         
         # First player's first turn: cannot attach energy
         if self.first_player_first_turn:
-            self.log(f"{player.name} is on their first turn - energy attachment is not allowed")
+            self.log("%s is on their first turn - energy attachment is not allowed", player.name)
         
-        max_actions = 50  # Prevent infinite loops
         action_count = 0
-        consecutive_invalid = 0  # Track consecutive invalid actions
+        is_human = hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human
+        profiler = self.profiler
+        if profiler.enabled:
+            phase_start = clock()
         
-        while action_count < max_actions:
-            if self.debug:
-                self.log(f"DEBUG: === Main phase loop iteration {action_count + 1} ===")
-            
-            # Get available actions
-            actions = player._get_actions()
+        while action_count < self.MAX_MAIN_PHASE_ACTIONS:
             if self.debug:
-                self.log(f"DEBUG: Got {len(actions)} actions from player._get_actions()")
+                self.log("DEBUG: === Main phase loop iteration %s ===", action_count + 1)
             
-            # Filter out energy attachment on first player's first turn
-            if self.first_player_first_turn:
-                actions = [a for a in actions if not a.startswith("attach_energy_")]
-                if self.debug:
-                    self.log(f"DEBUG: Filtered out energy attachment actions (first player's first turn). Remaining: {len(actions)}")
-            
-            if not actions:
-                if self.debug:
-                    self.log(f"DEBUG: No actions available, breaking loop")
-                break
-            
-            # Filter out invalid actions before presenting to agent
-            valid_actions = []
-            attack_actions = []  # Prioritize attack actions
-            
-            for action_str in actions:
-                if action_str == "end_turn":
-                    valid_actions.append(action_str)
-                    continue
-                
-                # Quick validation check
-                try:
-                    action = self._parse_action(action_str, player)
-                    if action is not None:
-                        is_valid, error = action.validate(player, self)
-                        if is_valid:
-                            if action_str.startswith("attack_"):
-                                attack_actions.append(action_str)
-                                if self.debug:
-                                    self.log(f"DEBUG: Attack action {action_str} PASSED validation")
-                            else:
-                                valid_actions.append(action_str)
-                        elif action_str.startswith("attack_"):
-                            if self.debug:
-                                self.log(f"DEBUG: Attack action {action_str} validation FAILED: {error}")
-                except Exception as e:
-                    if action_str.startswith("attack_"):
-                        if self.debug:
-                            self.log(f"DEBUG: Exception validating attack action {action_str}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    pass  # Skip invalid actions
-            
-            # Prioritize attack actions - put them first
-            valid_actions = attack_actions + valid_actions
-            
-            # Debug: log available actions if debug mode
+            # Already validated, attacks first and end turn last
+            if profiler.enabled:
+                start = clock()
+                valid_actions = player.get_legal_actions(self)
+                profiler.add_time("main.legal_actions", clock() - start)
+            else:
+                valid_actions = player.get_legal_actions(self)
             if self.debug:
-                attack_actions_in_original = [a for a in actions if a.startswith("attack_")]
-                if attack_actions_in_original:
-                    self.log(f"DEBUG: {len(attack_actions_in_original)} attack actions in original list: {attack_actions_in_original}")
-                if attack_actions:
-                    self.log(f"DEBUG: {len(attack_actions)} attack actions passed validation: {attack_actions}")
-                elif attack_actions_in_original and not attack_actions:
-                    # Attack actions were generated but failed validation
-                    self.log(f"DEBUG: WARNING - {len(attack_actions_in_original)} attack actions generated but NONE passed validation!")
-                    for action_str in attack_actions_in_original:
-                        try:
-                            action = self._parse_action(action_str, player)
-                            if action is not None:
-                                is_valid, error = action.validate(player, self)
-                                self.log(f"DEBUG:   {action_str} validation: is_valid={is_valid}, error={error}")
-                        except Exception as e:
-                            self.log(f"DEBUG:   {action_str} exception: {e}")
-                elif player.active_pokemon:
-                    # Check why no attacks available
-                    possible = player.active_pokemon.get_possible_attacks()
-                    self.log(f"DEBUG: Active Pokemon {player.active_pokemon.name} has {len(possible)} possible attacks, energies")
-                    # Check what attack actions should be generated
-                    attack_actions_should_be = player._get_attack_actions()
-                    if attack_actions_should_be:
-                        self.log(f"DEBUG: _get_attack_actions() returned: {attack_actions_should_be}")
-                    else:
-                        self.log(f"DEBUG: _get_attack_actions() returned empty list")
+                attack_strs = [a.to_string() for a in valid_actions if a.action_type == ActionType.ATTACK]
+                self.log("DEBUG: %s legal actions (%s attacks: %s)", len(valid_actions), len(attack_strs), attack_strs)
             
             # If no valid actions (except end_turn), end turn
-            if not valid_actions or (len(valid_actions) == 1 and valid_actions[0] == "end_turn"):
+            if len(valid_actions) <= 1:
                 break
             
             # Display board view AFTER validation (so it shows the same actions the agent will receive)
-            if self.debug or (hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human):
-                opponent = self._get_opponent(player)
-                board_view = self.generate_board_view(player, opponent, actions=valid_actions)
-                
-                # Clear screen for human players (but not in debug mode)
-                if hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human and not self.debug:
-                    import os
-                    os.system('clear' if os.name != 'nt' else 'cls')
-                
-                print("\n" + board_view + "\n")
+            if self.debug or is_human:
+                self._show_board(player, [action.to_string() for action in valid_actions])
             
             # Get action from agent (only from valid actions)
-            if hasattr(player.agent, 'play_action'):
-                # HumanAgent or improved RandomAgent interface
-                if self.debug and attack_actions:
-                    self.log(f"DEBUG: Presenting {len(valid_actions)} valid actions to agent (including {len(attack_actions)} attacks)")
-                action_str = player.agent.play_action(valid_actions)
-                if self.debug and action_str and action_str.startswith("attack_"):
-                    self.log(f"DEBUG: Agent chose attack action: {action_str}")
-            elif hasattr(player.agent, 'get_action'):
-                # Legacy RandomAgent interface - convert to string
-                action_indices = list(range(len(valid_actions)))
-                action_index = player.agent.get_action({}, action_indices)
-                if action_index is not None and 0 <= action_index < len(valid_actions):
-                    action_str = valid_actions[action_index]
-                else:
-                    action_str = "end_turn"
+            if profiler.enabled:
+                start = clock()
+                action = self._choose_action(player, valid_actions)
+                profiler.add_time("main.agent_decision", clock() - start)
             else:
-                # Default: end turn
-                action_str = "end_turn"
+                action = self._choose_action(player, valid_actions)
             
-            # Check for attack or end turn
-            if action_str == "end_turn" or action_str is None:
+            # Check for end turn
+            if action is None or action.action_type == ActionType.END_TURN:
                 break
             
-            if action_str.startswith("attack_"):
-                # Handle attack
-                from v3.models.match.actions.attack import AttackAction
-                attack_action = AttackAction.from_string(action_str, player)
-                is_valid, error = attack_action.validate(player, self)
-                if is_valid:
-                    attack_action.execute(player, self)
-                    
-                    # Track last action for debug display
-                    if self.debug:
-                        self.last_action_taken = action_str
-                    
-                    # Display board after attack in debug mode OR for human players
-                    # Note: We don't show actions here since we'll show them at the start of the next loop iteration
-                    if self.debug or (hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human):
-                        opponent = self._get_opponent(player)
-                        # Don't show actions here - they'll be shown at the start of the next loop iteration with validation
-                        board_view = self.generate_board_view(player, opponent, actions=[])
-                        
-                        # Clear screen for human players (but not in debug mode)
-                        if hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human and not self.debug:
-                            import os
-                            os.system('clear' if os.name != 'nt' else 'cls')
-                        
-                        print("\n" + board_view + "\n")
-                
-                break  # Attack ends main phase
-            
-            # Execute action
+            action_str = action.to_string() if self.debug or is_human else None
             if self.debug:
-                self.log(f"DEBUG: About to execute action: {action_str}")
-            success = self._execute_action(action_str, player)
-            
-            if self.debug:
-                self.log(f"DEBUG: Action execution result: success={success}")
-            
-            if not success:
-                consecutive_invalid += 1
-                if self.debug:
-                    self.log(f"DEBUG: Invalid action count: {consecutive_invalid}")
-                if consecutive_invalid >= 3:
-                    # Too many invalid actions, end turn
-                    self.log(f"{player.name} had too many invalid actions, ending turn")
-                    break
-            else:
-                consecutive_invalid = 0
-                action_count += 1
-                
-                if self.debug:
-                    self.log(f"DEBUG: Action executed successfully. Action count: {action_count}, Max: {max_actions}")
-                
-                # Track last action for debug display
-                if self.debug:
-                    self.last_action_taken = action_str
-                
-                # Check what actions are available after this action (for next iteration)
-                if self.debug:
-                    next_actions = player._get_actions() if hasattr(player, '_get_actions') else []
-                    if self.first_player_first_turn:
-                        next_actions = [a for a in next_actions if not a.startswith("attach_energy_")]
-                    self.log(f"DEBUG: Available actions after execution: {len(next_actions)} actions")
-                    if len(next_actions) <= 5:
-                        self.log(f"DEBUG: Actions list: {next_actions}")
-                    else:
-                        self.log(f"DEBUG: First 5 actions: {next_actions[:5]}")
-                
-                # Display board after action in debug mode OR for human players
-                # Note: We don't show actions here since we'll show them at the start of the next loop iteration
-                # This is just to show the updated game state
-                if self.debug or (hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human):
-                    opponent = self._get_opponent(player)
-                    # Don't show actions here - they'll be shown at the start of the next loop iteration with validation
-                    board_view = self.generate_board_view(player, opponent, actions=[])
-                    
-                    # Clear screen for human players (but not in debug mode)
-                    if hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human and not self.debug:
-                        import os
-                        os.system('clear' if os.name != 'nt' else 'cls')
-                    
-                    print("\n" + board_view + "\n")
+                self.log("DEBUG: About to execute action: %s", action_str)
             
-            # If action failed and we've tried a few times, end turn
-            if not success and consecutive_invalid >= 2:
+            if self.events is not None:
+                self._emit_action(player, action)
+            try:
+                self._execute_chosen(action, player)
+            except Exception as e:
+                self.log("Error executing action %s: %s", action, e)
                 if self.debug:
-                    self.log(f"DEBUG: Breaking due to consecutive invalid actions: {consecutive_invalid}")
+                    import traceback
+                    traceback.print_exc()
                 break
+            action_count += 1
             
-            # Check if we should continue the loop
+            # Track last action for debug display
             if self.debug:
-                self.log(f"DEBUG: Loop check - action_count: {action_count}, max_actions: {max_actions}, will continue: {action_count < max_actions}")
+                self.last_action_taken = action_str
+            
+            # Display board after action in debug mode OR for human players
+            # Note: We don't show actions here since we'll show them at the start of the next loop iteration
+            if self.debug or is_human:
+                self._show_board(player, [])
+            
+            if action.action_type == ActionType.ATTACK:
+                break  # Attack ends main phase
+        
+        if profiler.enabled:
+            profiler.add_time("phase.main", clock() - phase_start)
     
+    def _execute_chosen(self, action: Action, player: Player):
+        """Execute a legal action, timed per action type when profiling"""
+        if self.profiler.enabled:
+            start = clock()
+            try:
+                action.execute(player, self)
+            finally:
+                self.profiler.add_time("action." + action.action_type.value, clock() - start)
+        else:
+            action.execute(player, self)
+    
+    def _show_board(self, player: Player, actions: Optional[List[str]] = None):
+        """Print the board for debug mode or a human player"""
+        opponent = self._get_opponent(player)
+        board_view = self.generate_board_view(player, opponent, actions=actions)
+        
+        # Clear screen for human players (but not in debug mode)
+        if hasattr(player, 'agent') and hasattr(player.agent, 'is_human') and player.agent.is_human and not self.debug:
+            import os
+            os.system('clear' if os.name != 'nt' else 'cls')
+        
+        print("\n" + board_view + "\n")
+    
+
     def _get_player_action(self, player: Player, has_attacked: bool) -> Optional[str]:
         """Get and execute player action"""
         # This is handled by _main_phase() which calls the agent
@@ -1553,14 +1571,14 @@ class BattleEngine:
         # - PlaySupporterAction
         # - AttachToolAction
         # Use _execute_action() with appropriate action string instead
-        self.log(f"Warning: _play_card called directly - use action system instead")
+        self.log("Warning: _play_card called directly - use action system instead")
     
     def _evolve_pokemon(self, evolution: Pokemon, player: Player):
         """Handle Pokemon evolution (legacy method - use EvolveAction instead)"""
         # This method is kept for backward compatibility
         # Actual evolution is handled by EvolveAction
         # Use _execute_action() with "evolve_{evolution_id}_{location}" instead
-        self.log(f"Warning: _evolve_pokemon called directly - use EvolveAction instead")
+        self.log("Warning: _evolve_pokemon called directly - use EvolveAction instead")
     
     def _execute_attack(self, attacker: Pokemon, attack: Attack, player: Player, opponent: Player):
         """Execute an attack"""
@@ -1583,22 +1601,21 @@ class BattleEngine:
         # Some attacks have coin flips that determine if they do anything
         coin_flip_cancelled = False
         if attack.ability and attack.ability.effect:
-            from v3.models.match.effects import EffectParser
             from v3.models.match.effects.coin_flip_effect import CoinFlipEffect
-            effects = EffectParser.parse_multiple(attack.ability.effect)
+            effects = attack.ability.effects
             for effect in effects:
                 if isinstance(effect, CoinFlipEffect) and effect.effect_type == "conditional_damage":
                     # This attack requires a coin flip - if tails, does nothing
-                    result = effect.execute(player, self, attacker)
+                    result = execute_effect(effect, player, self, attacker)
                     if result is False:
                         coin_flip_cancelled = True
-                        self.log(f"{attack.name} failed - attack does nothing")
+                        self.log("%s failed - attack does nothing", attack.name)
                         attacker.attacked_this_turn = True
                         return
         
         # Display attack with damage
         damage = attack.damage if attack.damage else 0
-        self.log(f"{attacker.name} uses {attack.name} - {damage} dmg!")
+        self.log("%s uses %s - %s dmg!", attacker.name, attack.name, damage)
         
         # Calculate damage
         base_damage = int(attack.damage) if isinstance(attack.damage, int) else (int(attack.damage) if str(attack.damage).isdigit() else 0)
@@ -1611,17 +1628,16 @@ class BattleEngine:
         
         # Execute attack effects (if any) - but skip coin flip effects we already handled
         if attack.ability and attack.ability.effect:
-            from v3.models.match.effects import EffectParser
             from v3.models.match.effects.coin_flip_effect import CoinFlipEffect
-            effects = EffectParser.parse_multiple(attack.ability.effect)
+            effects = attack.ability.effects
             for effect in effects:
                 # Skip coin flip effects we already handled
                 if isinstance(effect, CoinFlipEffect) and effect.effect_type == "conditional_damage":
                     continue
                 try:
-                    effect.execute(player, self, attacker)
+                    execute_effect(effect, player, self, attacker)
                 except Exception as e:
-                    self.log(f"Error executing attack effect: {e}")
+                    self.log("Error executing attack effect: %s", e)
                     import traceback
                     if self.debug:
                         traceback.print_exc()
@@ -1641,7 +1657,7 @@ class BattleEngine:
         # Rule: If an attack does no damage, no weakness addition is applied
         if base_damage > 0 and defender.weakness and attacker.element == defender.weakness:
             damage += GameRules.WEAKNESS_BONUS
-            self.log(f"Weakness! +{GameRules.WEAKNESS_BONUS} damage (total: {damage})")
+            self.log("Weakness! +%s damage (total: %s)", GameRules.WEAKNESS_BONUS, damage)
         
         # Apply damage modifiers
         damage = max(0, damage - attacker.damage_nerf)
@@ -1652,10 +1668,14 @@ class BattleEngine:
         """Apply damage to Pokemon, return True if knocked out"""
         pokemon.damage_taken += damage
         max_hp = pokemon.max_health()
+        if self.events is not None:
+            owner = self._get_player_with_pokemon(pokemon)
+            self.emit("damage", pokemon=pokemon.name, card_id=pokemon.id, amount=damage,
+                      owner_seat=self.players.index(owner) if owner else None)
         
         # Display damage - cap damage_taken at max_hp for display (can't exceed max)
         display_damage = min(pokemon.damage_taken, max_hp)
-        self.log(f"{pokemon.name} takes {damage} damage ({display_damage}/{max_hp} HP)")
+        self.log("%s takes %s damage (%s/%s HP)", pokemon.name, damage, display_damage, max_hp)
         
         # Check knockout (use max_health() which includes tool bonuses)
         if pokemon.damage_taken >= max_hp:
@@ -1664,10 +1684,13 @@ class BattleEngine:
     
     def _handle_knockout(self, knocked_out: Pokemon, owner: Player, attacker: Player):
         """Handle Pokemon knockout"""
-        self.log(f"{knocked_out.name} was knocked out!")
+        self.log("%s was knocked out!", knocked_out.name)
         
         # Calculate prize value
         prize_value = GameRules.calculate_prize_value(knocked_out)
+        if self.events is not None:
+            self.emit("knockout", pokemon=knocked_out.name, owner=owner.name, attacker=attacker.name,
+                      card_id=knocked_out.id, owner_seat=self.players.index(owner), prizes=prize_value)
         
         # Award prizes
         self._award_prizes(attacker, prize_value)
@@ -1689,12 +1712,12 @@ class BattleEngine:
                     owner.discard_card(knocked_out)
                     break
         
-        self.log(f"{attacker.name} takes {prize_value} prize(s)! Total: {attacker.points}")
+        self.log("%s takes %s prize(s)! Total: %s", attacker.name, prize_value, attacker.points)
     
     def _award_prizes(self, player: Player, amount: int):
         """Award prize points to player"""
         player.points += amount
-        self.log(f"{player.name} now has {player.points} points")
+        self.log("%s now has %s points", player.name, player.points)
     
     def _force_active_replacement(self, player: Player):
         """Force player to replace KO'd active Pokemon - let player choose which bench Pokemon"""
@@ -1702,10 +1725,10 @@ class BattleEngine:
         benched_pokemon = [p for p in player.bench_pokemons if p is not None]
         
         if self.debug:
-            self.log(f"DEBUG: Checking bench for {player.name}: {[p.name if p else None for p in player.bench_pokemons]}")
+            self.log("DEBUG: Checking bench for %s: %s", player.name, [p.name if p else None for p in player.bench_pokemons])
         
         if not benched_pokemon:
-            self.log(f"{player.name} has no benched Pokemon - GAME OVER")
+            self.log("%s has no benched Pokemon - GAME OVER", player.name)
             return  # Game will end in _is_game_over()
         
         # Generate actions for choosing which bench Pokemon to bring to active
@@ -1715,7 +1738,7 @@ class BattleEngine:
                 replacement_actions.append(f"replace_active_{i}")
         
         if not replacement_actions:
-            self.log(f"{player.name} has no benched Pokemon - GAME OVER")
+            self.log("%s has no benched Pokemon - GAME OVER", player.name)
             return
         
         # Get action from agent
@@ -1757,31 +1780,32 @@ class BattleEngine:
             try:
                 bench_idx = int(action_str.split("_")[-1])
                 if 0 <= bench_idx < len(player.bench_pokemons) and player.bench_pokemons[bench_idx]:
-                    bench_pokemon = player.bench_pokemons[bench_idx]
                     # Move to active
-                    player.active_pokemon = bench_pokemon
-                    player.bench_pokemons[bench_idx] = None
-                    bench_pokemon.card_position = Card.Position.ACTIVE
-                    self.log(f"{player.name} replaces active with {bench_pokemon.name}")
+                    self._promote_bench_pokemon(player, bench_idx)
                 else:
                     # Fallback: choose first available
                     for i, bench_pokemon in enumerate(player.bench_pokemons):
                         if bench_pokemon:
-                            player.active_pokemon = bench_pokemon
-                            player.bench_pokemons[i] = None
-                            bench_pokemon.card_position = Card.Position.ACTIVE
-                            self.log(f"{player.name} replaces active with {bench_pokemon.name}")
+                            self._promote_bench_pokemon(player, i)
                             break
             except (ValueError, IndexError):
                 # Fallback: choose first available
                 for i, bench_pokemon in enumerate(player.bench_pokemons):
                     if bench_pokemon:
-                        player.active_pokemon = bench_pokemon
-                        player.bench_pokemons[i] = None
-                        bench_pokemon.card_position = Card.Position.ACTIVE
-                        self.log(f"{player.name} replaces active with {bench_pokemon.name}")
+                        self._promote_bench_pokemon(player, i)
                         break
     
+    def _promote_bench_pokemon(self, player: Player, bench_idx: int):
+        """Move a benched Pokemon into the empty active spot"""
+        bench_pokemon = player.bench_pokemons[bench_idx]
+        if self.events is not None:
+            self.emit("replace_active", player=player.name, seat=self.players.index(player),
+                      bench_index=bench_idx, pokemon=bench_pokemon.name)
+        player.active_pokemon = bench_pokemon
+        player.bench_pokemons[bench_idx] = None
+        bench_pokemon.card_position = Card.Position.ACTIVE
+        self.log("%s replaces active with %s", player.name, bench_pokemon.name)
+    
     def _process_status_effects(self, player: Player):
         """Handle status effects at turn start"""
         # Status effects are now handled in _apply_status_effects() during _end_turn()
@@ -1829,10 +1853,7 @@ class BattleEngine:
         # Generate energy for next turn
         current.energy_zone.generate_energy()
         
-        self.log(f"{current.name}'s turn ends")
-        
-        # Switch players
-        self._switch_players()
+        self.log("%s's turn ends", current.name)
         
         # Generate energy for new current player
         new_current = self._get_current_player()
@@ -1846,7 +1867,7 @@ class BattleEngine:
         
         # Check maximum turn limit
         if self.turn >= GameRules.MAX_TURNS:
-            self.log(f"Maximum turn limit reached ({GameRules.MAX_TURNS} turns) - Game ends in a draw")
+            self.log("Maximum turn limit reached (%s turns) - Game ends in a draw", GameRules.MAX_TURNS)
             return True
         
         for player in self.players:
@@ -1898,7 +1919,7 @@ class BattleEngine:
         """Determine game winner"""
         # Check maximum turn limit - if reached, it's a draw
         if self.turn >= GameRules.MAX_TURNS:
-            self.log(f"Game reached maximum turn limit ({GameRules.MAX_TURNS} turns) - Draw!")
+            self.log("Game reached maximum turn limit (%s turns) - Draw!", GameRules.MAX_TURNS)
             return None  # Draw
         
         for player in self.players:
@@ -0,0 +1,224 @@
+import multiprocessing
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is required for observations
+    np = None
+
+try:
+    import gymnasium as gym
+    from gymnasium import spaces
+except ImportError:  # gymnasium is optional - the env works the same without it
+    gym = None
+    spaces = None
+
+from v3.models.match.batch_runner import GameConfig, build_engine, game_seed
+from v3.models.match.action_space import ActionSpace, default_action_space
+from v3.models.match.state_encoder import StateEncoder, STATE_SIZE, default_encoder
+from v3.models.match.game_rules import GameRules
+
+"""Stepping environments around BattleEngine for training learned agents"""
+
+_EnvBase = gym.Env if gym is not None else object
+
+
+class BattleEnv(_EnvBase):
+    """Single-learner environment: the engine pauses at each main phase decision of the learner.
+
+    The other seat is played by its configured agent, and setup / knockout replacement
+    decisions are left to the agents as in a normal game. Observations are StateEncoder
+    arrays from the learner's view; info["action_mask"] marks the legal action ids.
+    Rewards are +1 for a win, -1 for a loss and 0 otherwise; reaching the turn limit
+    is reported as truncated.
+    """
+
+    def __init__(self, config: GameConfig, learner_seat: int = 0, seed: Optional[int] = None,
+                 encoder: Optional[StateEncoder] = None, actions: Optional[ActionSpace] = None):
+        if np is None:
+            raise ImportError("BattleEnv requires numpy")
+        self.config = config
+        self.learner_seat = learner_seat
+        self.seed = seed
+        self.encoder = encoder or default_encoder()
+        self.actions = actions or default_action_space()
+        self.engine = None
+        self.episode = 0
+
+        if spaces is not None:
+            self.observation_space = spaces.Box(low=0.0, high=np.inf, shape=(STATE_SIZE,), dtype=np.float32)
+            self.action_space = spaces.Discrete(self.actions.size)
+
+    @property
+    def learner(self):
+        return self.engine.players[self.learner_seat]
+
+    def reset(self, seed: Optional[int] = None, options: Optional[Dict] = None) -> Tuple['np.ndarray', Dict[str, Any]]:
+        """Start a new game and play until the learner's first decision"""
+        if seed is not None:
+            self.seed = seed
+            self.episode = 0
+        episode_seed = game_seed(self.seed, self.episode) if self.seed is not None else None
+        self.episode += 1
+
+        self.engine = build_engine(self.config, episode_seed)
+        self.engine._action_space = self.actions
+        self.engine.begin()
+        self._play_opponent()
+        return self.observe(), self._info()
+
+    def step(self, action_id: int) -> Tuple['np.ndarray', float, bool, bool, Dict[str, Any]]:
+        """Play one learner action, then the opponent until the learner must decide again"""
+        self.engine.step(int(action_id))
+        self._play_opponent()
+
+        terminated = truncated = False
+        reward = 0.0
+        if self.engine._is_game_over():
+            winner = self.engine._determine_winner()
+            if winner is None:
+                truncated = self.engine.turn >= GameRules.MAX_TURNS
+                terminated = not truncated
+            else:
+                terminated = True
+                reward = 1.0 if winner is self.learner else -1.0
+        return self.observe(), reward, terminated, truncated, self._info()
+
+    def observe(self, out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """Current observation from the learner's point of view"""
+        return self.encoder.encode(self.engine, self.learner, out=out)
+
+    def action_mask(self, out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """Legal action ids of the learner (all False once the game is over)"""
+        if self.engine._is_game_over():
+            if out is None:
+                return np.zeros(self.actions.size, dtype=bool)
+            out.fill(False)
+            return out
+        return self.actions.legal_action_mask(self.engine, self.learner, out=out)
+
+    def _play_opponent(self):
+        while not self.engine._is_game_over() and self.engine._get_current_player() is not self.learner:
+            self.engine.play_turn()
+
+    def _info(self) -> Dict[str, Any]:
+        return {"action_mask": self.action_mask(), "turn": self.engine.turn}
+
+
+########## Vectorized Environments ##########
+
+def _env_worker(conn, config: GameConfig, learner_seat: int, seed: Optional[int]):
+    """Subprocess loop serving one BattleEnv over a pipe"""
+    env = BattleEnv(config, learner_seat=learner_seat, seed=seed)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "reset":
+                conn.send(env.reset(seed=data))
+            elif command == "step":
+                conn.send(_step_autoreset(env, data))
+            elif command == "close":
+                break
+    finally:
+        conn.close()
+
+
+def _step_autoreset(env: BattleEnv, action_id: int):
+    """Step env, starting its next game as soon as one finishes (final info kept in info)"""
+    obs, reward, terminated, truncated, info = env.step(action_id)
+    if terminated or truncated:
+        final_turn = info["turn"]
+        obs, info = env.reset()
+        info["final_turn"] = final_turn
+    return obs, reward, terminated, truncated, info
+
+
+class VectorEnv:
+    """K BattleEnvs stepped in lockstep, returning batched arrays.
+
+    Observations are (K, STATE_SIZE) float32, masks (K, size) bool, rewards float32 and
+    the done flags bool. Finished games are reset automatically, so the returned
+    observation of a done env is the first one of its next game. With subprocess=True
+    every env runs in its own process and the K steps overlap.
+    """
+
+    def __init__(self, configs: Sequence[GameConfig], learner_seat: int = 0, seed: Optional[int] = None,
+                 subprocess: bool = False):
+        if np is None:
+            raise ImportError("VectorEnv requires numpy")
+        self.configs = list(configs)
+        self.num_envs = len(self.configs)
+        self.subprocess = subprocess
+        # Built before any worker starts so forked workers inherit them
+        self.actions = default_action_space()
+        encoder = default_encoder()
+
+        seeds = [game_seed(seed, i) if seed is not None else None for i in range(self.num_envs)]
+        self._envs: List[BattleEnv] = []
+        self._conns = []
+        self._processes = []
+        if subprocess:
+            for config, env_seed in zip(self.configs, seeds):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_env_worker, args=(child, config, learner_seat, env_seed),
+                                                  daemon=True)
+                process.start()
+                child.close()
+                self._conns.append(parent)
+                self._processes.append(process)
+        else:
+            self._envs = [BattleEnv(config, learner_seat=learner_seat, seed=env_seed,
+                                    encoder=encoder, actions=self.actions)
+                          for config, env_seed in zip(self.configs, seeds)]
+
+        self._obs = np.zeros((self.num_envs, STATE_SIZE), dtype=np.float32)
+        self._masks = np.zeros((self.num_envs, self.actions.size), dtype=bool)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple['np.ndarray', Dict[str, Any]]:
+        """Reset every env; returns observations and {"action_mask": masks}"""
+        seeds = [game_seed(seed, i) if seed is not None else None for i in range(self.num_envs)]
+        if self.subprocess:
+            for conn, env_seed in zip(self._conns, seeds):
+                conn.send(("reset", env_seed))
+            results = [conn.recv() for conn in self._conns]
+        else:
+            results = [env.reset(seed=env_seed) for env, env_seed in zip(self._envs, seeds)]
+        for i, (obs, info) in enumerate(results):
+            self._obs[i] = obs
+            self._masks[i] = info["action_mask"]
+        return self._obs.copy(), {"action_mask": self._masks.copy()}
+
+    def step(self, action_ids: Sequence[int]):
+        """Step every env with its action id; returns obs, rewards, terminated, truncated, infos"""
+        if self.subprocess:
+            for conn, action_id in zip(self._conns, action_ids):
+                conn.send(("step", int(action_id)))
+            results = [conn.recv() for conn in self._conns]
+        else:
+            results = [_step_autoreset(env, int(action_id)) for env, action_id in zip(self._envs, action_ids)]
+
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        for i, (obs, reward, term, trunc, info) in enumerate(results):
+            self._obs[i] = obs
+            self._masks[i] = info["action_mask"]
+            rewards[i] = reward
+            terminated[i] = term
+            truncated[i] = trunc
+        return self._obs.copy(), rewards, terminated, truncated, {"action_mask": self._masks.copy()}
+
+    def close(self):
+        for conn in self._conns:
+            conn.send(("close", None))
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._conns = []
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,8 +1,7 @@
 """Coin flip effect - handles coin flip mechanics for attacks"""
 from typing import Optional, TYPE_CHECKING
 import re
-import random
-from .effect import Effect
+from .effect import Effect, execute_effect
 
 if TYPE_CHECKING:
     from v3.models.match.player import Player
@@ -29,9 +28,9 @@ class CoinFlipEffect(Effect):
     def execute(self, player, battle_engine, source=None):
         """Execute coin flip"""
         # Flip coin: True = heads, False = tails
-        coin_flip = random.random() < 0.5
+        coin_flip = battle_engine.rng.random() < 0.5
         result = "heads" if coin_flip else "tails"
-        battle_engine.log(f"Coin flip: {result}")
+        battle_engine.log("Coin flip: %s", result)
         
         if self.effect_type == "prevent_attack":
             # If heads, prevent opponent from attacking next turn
@@ -39,14 +38,14 @@ class CoinFlipEffect(Effect):
             if coin_flip and opponent:
                 # Mark that opponent can't attack next turn
                 opponent.can_attack_next_turn = False
-                battle_engine.log(f"{opponent.name} can't attack during their next turn!")
+                battle_engine.log("%s can't attack during their next turn!", opponent.name)
             else:
                 battle_engine.log("Coin flip failed - no effect")
         
         elif self.effect_type == "extra_damage":
             # If heads, add extra damage (handled in attack execution)
             if coin_flip and self.success_effect:
-                self.success_effect.execute(player, battle_engine, source)
+                execute_effect(self.success_effect, player, battle_engine, source)
         
         elif self.effect_type == "conditional_damage":
             # If tails, attack does nothing (handled in attack execution)
@@ -57,9 +56,9 @@ class CoinFlipEffect(Effect):
         
         # Execute success/failure effects if provided
         if coin_flip and self.success_effect:
-            self.success_effect.execute(player, battle_engine, source)
+            execute_effect(self.success_effect, player, battle_engine, source)
         elif not coin_flip and self.failure_effect:
-            self.failure_effect.execute(player, battle_engine, source)
+            execute_effect(self.failure_effect, player, battle_engine, source)
         
         return coin_flip
     
@@ -21,7 +21,7 @@ class DiscardEffect(Effect):
                 if player.cards_in_hand:
                     card = player.cards_in_hand.pop()
                     player.discard_card(card)
-                    battle_engine.log(f"{player.name} discarded {card.name}")
+                    battle_engine.log("%s discarded %s", player.name, card.name)
         elif self.target == "energy" and source:
             # Discard energy from Pokemon
             from v3.models.cards.energy import Energy
@@ -53,11 +53,11 @@ class DiscardEffect(Effect):
                         if source.equipped_energies.get(energy_type_enum, 0) > 0:
                             source.equipped_energies[energy_type_enum] -= 1
                             discarded += 1
-                            battle_engine.log(f"{source.name} lost 1 {self.energy_type} energy")
+                            battle_engine.log("%s lost 1 %s energy", source.name, self.energy_type)
                     if discarded == 0:
-                        battle_engine.log(f"{source.name} has no {self.energy_type} energy to discard")
+                        battle_engine.log("%s has no %s energy to discard", source.name, self.energy_type)
                 else:
-                    battle_engine.log(f"Unknown energy type: {self.energy_type}")
+                    battle_engine.log("Unknown energy type: %s", self.energy_type)
             else:
                 # Discard any energy type (fallback)
                 for _ in range(min(self.amount, sum(source.equipped_energies.values()))):
@@ -66,7 +66,7 @@ class DiscardEffect(Effect):
                         if source.equipped_energies[energy_type] > 0:
                             source.equipped_energies[energy_type] -= 1
                             energy_name = energy_type.name.lower() if hasattr(energy_type, 'name') else str(energy_type)
-                            battle_engine.log(f"{source.name} lost 1 {energy_name} energy")
+                            battle_engine.log("%s lost 1 %s energy", source.name, energy_name)
                             break
     
     @classmethod
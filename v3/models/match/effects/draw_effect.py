@@ -23,7 +23,7 @@ class DrawEffect(Effect):
                     drawn += 1
                 except ValueError:
                     break
-        battle_engine.log(f"Drew {drawn} card(s)")
+        battle_engine.log("Drew %s card(s)", drawn)
     
     @classmethod
     def from_text(cls, effect_text: str) -> Optional['DrawEffect']:
@@ -2,6 +2,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
+from v3.models.match.game_profiler import clock
+
 if TYPE_CHECKING:
     from v3.models.match.player import Player
     from v3.models.match.battle_engine import BattleEngine
@@ -21,3 +23,15 @@ class Effect(ABC):
         """Parse effect from text string"""
         pass
 
+
+
+def execute_effect(effect: Effect, player: 'Player', battle_engine: 'BattleEngine', source: Optional['Pokemon'] = None):
+    """effect.execute(...), timed per effect class when the engine has a profiler enabled"""
+    profiler = getattr(battle_engine, 'profiler', None)
+    if profiler is None or not profiler.enabled:
+        return effect.execute(player, battle_engine, source)
+    start = clock()
+    try:
+        return effect.execute(player, battle_engine, source)
+    finally:
+        profiler.add_time("effect." + type(effect).__name__, clock() - start)
@@ -1,5 +1,5 @@
 """Effect parser - parses effect text into executable Effect objects"""
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from .effect import Effect
 from .heal_effect import HealEffect
 from .draw_effect import DrawEffect
@@ -27,6 +27,21 @@ class EffectParser:
         DiscardEffect,
         EnergyEffect,
     ]
+
+    # Effect text -> parsed effects. Card text never changes, so each distinct
+    # text is parsed once per process and the effect objects are shared
+    _compiled: Dict[str, Tuple[Effect, ...]] = {}
+
+    @classmethod
+    def compile(cls, effect_text: str) -> Tuple[Effect, ...]:
+        """Parse effect text once and return the cached, immutable tuple of effects"""
+        if not effect_text:
+            return ()
+        effects = cls._compiled.get(effect_text)
+        if effects is None:
+            effects = tuple(cls.parse_multiple(effect_text))
+            cls._compiled[effect_text] = effects
+        return effects
     
     @classmethod
     def parse_ability_effect(cls, effect_text: str) -> Optional[Effect]:
@@ -52,31 +52,31 @@ class EnergyEffect(Effect):
                         if consumed:
                             source.equipped_energies[energy_type_enum] = source.equipped_energies.get(energy_type_enum, 0) + 1
                             attached_count += 1
-                            battle_engine.log(f"Took {self.energy_type} energy from Energy Zone and attached to {source.name}")
+                            battle_engine.log("Took %s energy from Energy Zone and attached to %s", self.energy_type, source.name)
                         else:
                             # Failed to consume - break loop
                             break
                     else:
                         # Energy type doesn't match - can't attach this type
-                        battle_engine.log(f"Energy Zone has {current_energy.name if current_energy else 'None'}, but need {self.energy_type} - cannot attach")
+                        battle_engine.log("Energy Zone has %s, but need %s - cannot attach", current_energy.name if current_energy else 'None', self.energy_type)
                         break
                 else:
                     # No energy in zone
-                    battle_engine.log(f"No energy available in Energy Zone")
+                    battle_engine.log("No energy available in Energy Zone")
                     break
             
             if attached_count == 0:
                 # Fallback: just attach without consuming (for effects that don't specify "from Energy Zone")
                 # This handles backward compatibility for effects that just say "attach" without "from Energy Zone"
                 source.equipped_energies[energy_type_enum] = source.equipped_energies.get(energy_type_enum, 0) + self.amount
-                battle_engine.log(f"Attached {self.amount} {self.energy_type} energy to {source.name} (not from Energy Zone)")
+                battle_engine.log("Attached %s %s energy to %s (not from Energy Zone)", self.amount, self.energy_type, source.name)
             elif attached_count < self.amount:
                 # Partially attached - log warning
-                battle_engine.log(f"Warning: Only attached {attached_count} of {self.amount} {self.energy_type} energy")
+                battle_engine.log("Warning: Only attached %s of %s %s energy", attached_count, self.amount, self.energy_type)
         elif self.action == "search":
             # Search deck for energy cards (if we have energy cards)
             # For now, just log
-            battle_engine.log(f"Searched deck for {self.amount} {self.energy_type} energy")
+            battle_engine.log("Searched deck for %s %s energy", self.amount, self.energy_type)
     
     @classmethod
     def from_text(cls, effect_text: str):
@@ -26,7 +26,7 @@ class HealAllEffect(Effect):
             if pokemon.damage_taken > 0:
                 heal_amount = min(self.amount, pokemon.damage_taken)
                 pokemon.damage_taken -= heal_amount
-                battle_engine.log(f"Healed {heal_amount} damage from {pokemon.name}")
+                battle_engine.log("Healed %s damage from %s", heal_amount, pokemon.name)
     
     @classmethod
     def from_text(cls, effect_text: str):
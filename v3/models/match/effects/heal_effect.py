@@ -23,7 +23,7 @@ class HealEffect(Effect):
             old_damage = source.damage_taken
             source.damage_taken = max(0, source.damage_taken - self.amount)
             healed = old_damage - source.damage_taken
-            battle_engine.log(f"Healed {healed} damage from {source.name}")
+            battle_engine.log("Healed %s damage from %s", healed, source.name)
         elif self.target == "each":
             # Heal each Pokemon
             if source:
@@ -31,7 +31,7 @@ class HealEffect(Effect):
             for bench_pokemon in player.bench_pokemons:
                 if bench_pokemon:
                     bench_pokemon.damage_taken = max(0, bench_pokemon.damage_taken - self.amount)
-            battle_engine.log(f"Healed {self.amount} damage from each Pokemon")
+            battle_engine.log("Healed %s damage from each Pokemon", self.amount)
         elif self.target == "one":
             # Heal one Pokemon (player chooses, or auto-select if agent)
             # Get all eligible Pokemon
@@ -46,9 +46,9 @@ class HealEffect(Effect):
                     # Type restriction - check if matches
                     eligible_pokemon.append(("active", player.active_pokemon))
                     if battle_engine.debug:
-                        battle_engine.log(f"DEBUG: Active {player.active_pokemon.name} ({player.active_pokemon.element}) matches type {self.pokemon_type}")
+                        battle_engine.log("DEBUG: Active %s (%s) matches type %s", player.active_pokemon.name, player.active_pokemon.element, self.pokemon_type)
                 elif battle_engine.debug:
-                    battle_engine.log(f"DEBUG: Active {player.active_pokemon.name} ({player.active_pokemon.element}) does NOT match type {self.pokemon_type} - skipping")
+                    battle_engine.log("DEBUG: Active %s (%s) does NOT match type %s - skipping", player.active_pokemon.name, player.active_pokemon.element, self.pokemon_type)
             
             # Check bench Pokemon
             for i, bench_pokemon in enumerate(player.bench_pokemons):
@@ -60,12 +60,12 @@ class HealEffect(Effect):
                         # Type restriction - check if matches
                         eligible_pokemon.append((f"bench_{i}", bench_pokemon))
                         if battle_engine.debug:
-                            battle_engine.log(f"DEBUG: Bench {i} {bench_pokemon.name} ({bench_pokemon.element}) matches type {self.pokemon_type}")
+                            battle_engine.log("DEBUG: Bench %s %s (%s) matches type %s", i, bench_pokemon.name, bench_pokemon.element, self.pokemon_type)
                     elif battle_engine.debug:
-                        battle_engine.log(f"DEBUG: Bench {i} {bench_pokemon.name} ({bench_pokemon.element}) does NOT match type {self.pokemon_type} - skipping")
+                        battle_engine.log("DEBUG: Bench %s %s (%s) does NOT match type %s - skipping", i, bench_pokemon.name, bench_pokemon.element, self.pokemon_type)
             
             if battle_engine.debug:
-                battle_engine.log(f"DEBUG: Found {len(eligible_pokemon)} eligible Pokemon for healing (type restriction: {self.pokemon_type or 'none'})")
+                battle_engine.log("DEBUG: Found %s eligible Pokemon for healing (type restriction: %s)", len(eligible_pokemon), self.pokemon_type or 'none')
             
             if eligible_pokemon:
                 # For now, choose the most damaged eligible Pokemon
@@ -76,10 +76,10 @@ class HealEffect(Effect):
                 old_damage = target_pokemon.damage_taken
                 target_pokemon.damage_taken = max(0, target_pokemon.damage_taken - self.amount)
                 healed = old_damage - target_pokemon.damage_taken
-                battle_engine.log(f"Healed {healed} damage from {target_pokemon.name} ({location})")
+                battle_engine.log("Healed %s damage from %s (%s)", healed, target_pokemon.name, location)
             else:
                 type_msg = f" {self.pokemon_type}" if self.pokemon_type else ""
-                battle_engine.log(f"No damaged{type_msg} Pokemon to heal")
+                battle_engine.log("No damaged%s Pokemon to heal", type_msg)
     
     def _matches_type(self, pokemon, pokemon_type: str) -> bool:
         """Check if Pokemon matches the specified type"""
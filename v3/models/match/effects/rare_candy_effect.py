@@ -15,7 +15,7 @@ class RareCandyEffect(Effect):
     def execute(self, player, battle_engine, source=None):
         """Mark that Rare Candy was used, allowing Basic -> Stage 2 evolution this turn"""
         player.used_rare_candy_this_turn = True
-        battle_engine.log(f"{player.name} used Rare Candy - can evolve Basic Pokemon directly to Stage 2 this turn")
+        battle_engine.log("%s used Rare Candy - can evolve Basic Pokemon directly to Stage 2 this turn", player.name)
     
     @classmethod
     def from_text(cls, effect_text: str) -> Optional['RareCandyEffect']:
@@ -1,6 +1,5 @@
 """Search effect - searches deck for cards"""
 import re
-import random
 from typing import Optional, TYPE_CHECKING
 from .effect import Effect
 from v3.models.cards.pokemon import Pokemon
@@ -21,8 +20,8 @@ class SearchEffect(Effect):
     
     def execute(self, player, battle_engine, source=None):
         found = []
-        battle_engine.log(f"Searching deck for {self.amount} {self.card_type}...")
-        battle_engine.log(f"Deck size: {len(player.deck)}")
+        battle_engine.log("Searching deck for %s %s...", self.amount, self.card_type)
+        battle_engine.log("Deck size: %s", len(player.deck))
         
         for card in player.deck:
             if self.card_type == "BasicPokemon" and isinstance(card, Pokemon):
@@ -31,29 +30,29 @@ class SearchEffect(Effect):
                     if self.element is None or card.element == self.element:
                         found.append(card)
                         if battle_engine.debug:
-                            battle_engine.log(f"  Found Basic Pokemon: {card.name} (subtype: {card.subtype})")
+                            battle_engine.log("  Found Basic Pokemon: %s (subtype: %s)", card.name, card.subtype)
             elif self.card_type == "Pokemon" and isinstance(card, Pokemon):
                 # Any Pokemon (can filter by element)
                 if self.element is None or card.element == self.element:
                     found.append(card)
                     if battle_engine.debug:
-                        battle_engine.log(f"  Found Pokemon: {card.name}")
+                        battle_engine.log("  Found Pokemon: %s", card.name)
         
-        battle_engine.log(f"Found {len(found)} matching cards in deck")
+        battle_engine.log("Found %s matching cards in deck", len(found))
         
         # Take random cards up to amount
         if found:
             to_take = min(self.amount, len(found))
-            selected = random.sample(found, to_take)
+            selected = battle_engine.rng.sample(found, to_take)
             for card in selected:
                 player.deck.remove(card)
                 player.cards_in_hand.append(card)
                 card.card_position = Card.Position.HAND
-                battle_engine.log(f"Added {card.name} to {player.name}'s hand")
-            battle_engine.log(f"Put {len(selected)} {self.card_type} into hand (hand size: {len(player.cards_in_hand)})")
+                battle_engine.log("Added %s to %s's hand", card.name, player.name)
+            battle_engine.log("Put %s %s into hand (hand size: %s)", len(selected), self.card_type, len(player.cards_in_hand))
             # No hand size limit - players can have any number of cards in hand
         else:
-            battle_engine.log(f"No matching {self.card_type} found in deck")
+            battle_engine.log("No matching %s found in deck", self.card_type)
     
     @classmethod
     def from_text(cls, effect_text: str) -> Optional['SearchEffect']:
@@ -32,7 +32,7 @@ class StatusEffectEffect(Effect):
     def execute(self, player: 'Player', battle_engine: 'BattleEngine', source: Optional['Pokemon'] = None) -> None:
         """Apply status effect to target"""
         if not self.status_class:
-            battle_engine.log(f"Unknown status type: {self.status_type}")
+            battle_engine.log("Unknown status type: %s", self.status_type)
             return
         
         # Determine target Pokemon
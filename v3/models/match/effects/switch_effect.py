@@ -23,7 +23,7 @@ class SwitchEffect(Effect):
         # Check if opponent has bench Pokemon
         available_bench = [i for i, bench in enumerate(opponent.bench_pokemons) if bench is not None]
         if not available_bench:
-            battle_engine.log(f"{opponent.name} has no bench Pokemon to switch to")
+            battle_engine.log("%s has no bench Pokemon to switch to", opponent.name)
             return
         
         # For AI agents, choose the first available bench Pokemon
@@ -43,7 +43,7 @@ class SwitchEffect(Effect):
         opponent.active_pokemon = bench_pokemon
         bench_pokemon.card_position = Card.Position.ACTIVE
         
-        battle_engine.log(f"{opponent.name} switched {old_active.name} to bench, {bench_pokemon.name} to active")
+        battle_engine.log("%s switched %s to bench, %s to active", opponent.name, old_active.name, bench_pokemon.name)
     
     @classmethod
     def from_text(cls, effect_text: str):
@@ -5,10 +5,11 @@ from v3.models.cards.energy import Energy
 class EnergyZone:
     """Manages Energy Zone state and generation"""
     
-    def __init__(self, chosen_energies: List[Energy.Type]):
+    def __init__(self, chosen_energies: List[Energy.Type], rng: Optional[random.Random] = None):
         if not chosen_energies or len(chosen_energies) < 1:
             raise ValueError("Must choose at least 1 energy type")
         self.chosen_energies = chosen_energies
+        self.rng = rng if rng is not None else random  # Random stream used to roll energies
         self.current: Optional[Energy.Type] = None
         self.next: Optional[Energy.Type] = None
     
@@ -19,6 +20,19 @@ class EnergyZone:
         if self.next is None:
             self.next = self._random_energy()
     
+    def reset(self) -> None:
+        """Discard the pending energies and roll new ones"""
+        self.current = None
+        self.next = None
+        self.generate_energy()
+    
+    def clone(self, rng=None) -> 'EnergyZone':
+        """Copy of the zone state drawing from the given random stream"""
+        zone = EnergyZone(self.chosen_energies, rng=rng if rng is not None else self.rng)
+        zone.current = self.current
+        zone.next = self.next
+        return zone
+    
     def consume_current(self) -> Optional[Energy.Type]:
         """Consume current energy and shift"""
         energy = self.current
@@ -28,7 +42,7 @@ class EnergyZone:
         return energy
     
     def _random_energy(self) -> Energy.Type:
-        return random.choice(self.chosen_energies)
+        return self.rng.choice(self.chosen_energies)
     
     def has_energy(self) -> bool:
         return self.current is not None
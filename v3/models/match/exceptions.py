@@ -22,3 +22,12 @@ class StateError(BattleEngineError):
         self.message = message
         super().__init__(f"State error: {message}")
 
+class ReplayError(StateError):
+    """A replayed game diverged from its record"""
+    pass
+
+class UnsupportedMatchupError(BattleEngineError):
+    """The lockstep kernel cannot play a matchup (see lockstep_kernel.simulate_matchup)"""
+    def __init__(self, unsupported):
+        self.unsupported = list(unsupported)
+        super().__init__(f"Not supported by the lockstep kernel: {self.unsupported}")
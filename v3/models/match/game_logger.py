@@ -0,0 +1,56 @@
+from typing import Any, Dict, List, Tuple
+
+"""Game logging tiers: console output for debugging, nothing for headless runs, structured events for tools"""
+
+
+class NullLogger:
+    """Logger that drops every message - the default for headless simulation.
+
+    Messages use %-style arguments (log("Drew %s", card.name)) so nothing is
+    formatted unless a logger actually writes it.
+    """
+    enabled = False
+
+    def log(self, turn: int, message: str, *args: Any):
+        pass
+
+
+class ConsoleLogger(NullLogger):
+    """Prints "[Turn N] message" lines to stdout (debug mode)"""
+    enabled = True
+
+    def log(self, turn: int, message: str, *args: Any):
+        if args:
+            message = message % args
+        print(f"[Turn {turn}] {message}")
+
+
+NULL_LOGGER = NullLogger()
+
+
+class EventSink:
+    """Receives structured game events, e.g. emit(3, "knockout", {"player": "Player 1", ...}).
+
+    Events are only built when a sink is attached to the engine, so batch runs
+    without one pay nothing for them.
+    """
+
+    def emit(self, turn: int, event: str, data: Dict[str, Any]):
+        raise NotImplementedError
+
+
+class ListEventSink(EventSink):
+    """Collects events in memory as (turn, event, data) tuples"""
+
+    def __init__(self):
+        self.events: List[Tuple[int, str, Dict[str, Any]]] = []
+
+    def emit(self, turn: int, event: str, data: Dict[str, Any]):
+        self.events.append((turn, event, data))
+
+    def of_type(self, event: str) -> List[Dict[str, Any]]:
+        return [data for _, name, data in self.events if name == event]
+
+
+def default_logger(debug: bool) -> NullLogger:
+    return ConsoleLogger() if debug else NULL_LOGGER
@@ -0,0 +1,116 @@
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional
+
+"""Opt-in timers and counters for the battle engine: where a game spends its time"""
+
+# Timer clock; call sites only read it when the profiler is enabled
+clock = time.perf_counter
+
+
+class NullProfiler:
+    """Profiler that records nothing - the default.
+
+    The engine checks `enabled` before reading the clock or building names, so a
+    game without a profiler pays one attribute check per instrumented point.
+    """
+    enabled = False
+
+    def add_time(self, name: str, seconds: float):
+        pass
+
+    def count(self, name: str, amount: int = 1):
+        pass
+
+
+class PhaseProfiler(NullProfiler):
+    """Accumulates time per named timer and totals per named counter.
+
+    Timer names used by the engine:
+      phase.setup / phase.draw / phase.main / phase.end  - turn phases
+      main.legal_actions   - enumerating and validating actions (Player.get_legal_actions)
+      main.agent_decision  - the agent picking an action
+      action.<type>        - executing an action of each ActionType
+      effect.<Class>       - executing an effect of each Effect class
+    Counters: games, turns, actions.generated, actions.valid, actions.rejected (freshly
+    validated candidates) and actions.reused (taken from the legal action cache).
+    One profiler can be shared by many games, and profilers from other processes
+    are combined with merge() (or merge_profiles for their to_dict() output).
+    """
+    enabled = True
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.counters: Dict[str, int] = defaultdict(int)
+
+    def add_time(self, name: str, seconds: float):
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def merge(self, other: 'PhaseProfiler') -> 'PhaseProfiler':
+        """Add other's totals to this profiler"""
+        for name, seconds in other.seconds.items():
+            self.seconds[name] += seconds
+        for name, calls in other.calls.items():
+            self.calls[name] += calls
+        for name, amount in other.counters.items():
+            self.counters[name] += amount
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready totals (sorted by name) plus per-turn averages of the counters"""
+        turns = self.counters.get("turns", 0)
+        return {
+            "timers": {name: {"seconds": self.seconds[name], "calls": self.calls[name],
+                              "mean_us": 1e6 * self.seconds[name] / self.calls[name] if self.calls[name] else 0.0}
+                       for name in sorted(self.seconds)},
+            "counters": dict(sorted(self.counters.items())),
+            "per_turn": {name: amount / turns for name, amount in sorted(self.counters.items())
+                         if turns and name not in ("games", "turns")},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PhaseProfiler':
+        """Rebuild a profiler from to_dict() output (e.g. sent back by a worker process)"""
+        profiler = cls()
+        for name, timer in data.get("timers", {}).items():
+            profiler.seconds[name] = timer["seconds"]
+            profiler.calls[name] = timer["calls"]
+        profiler.counters.update(data.get("counters", {}))
+        return profiler
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """JSON text of to_dict(), also written to path when given"""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+        return text
+
+    def report(self) -> str:
+        """Human-readable table, slowest timers first"""
+        lines = [f"{'timer':<32} {'seconds':>10} {'calls':>10} {'mean us':>10}"]
+        for name in sorted(self.seconds, key=self.seconds.get, reverse=True):
+            calls = self.calls[name]
+            mean = 1e6 * self.seconds[name] / calls if calls else 0.0
+            lines.append(f"{name:<32} {self.seconds[name]:>10.4f} {calls:>10} {mean:>10.1f}")
+        for name, amount in sorted(self.counters.items()):
+            lines.append(f"{name:<32} {amount:>10}")
+        return "\n".join(lines)
+
+
+def merge_profiles(profiles: Iterable[Optional[Dict[str, Any]]]) -> PhaseProfiler:
+    """Combine to_dict() outputs (None entries are skipped) into one profiler"""
+    merged = PhaseProfiler()
+    for data in profiles:
+        if data:
+            merged.merge(PhaseProfiler.from_dict(data))
+    return merged
+
+
+NULL_PROFILER = NullProfiler()
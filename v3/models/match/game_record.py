@@ -0,0 +1,180 @@
+import gzip
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from v3.models.match.actions.action import ActionType, SLOT_BENCH_0, pack_action
+from v3.models.match.game_logger import EventSink
+
+"""Compact NDJSON game records: what happened in a game, one JSON line per game"""
+
+RECORD_VERSION = 1
+
+
+def replace_active_code(bench_index: int) -> int:
+    """Decision code for promoting bench slot bench_index after a knockout (an ActionType.SWITCH code)"""
+    return pack_action(ActionType.SWITCH, SLOT_BENCH_0 + bench_index)
+
+
+@dataclass
+class GameRecord:
+    """Everything needed to replay one game, plus the state changes worth analysing.
+
+    decisions: [turn, seat, code] per chosen action, in play order. code is the
+        action's integer encoding (Action.encode - type, board slot and hand index),
+        or replace_active_code(i) when a player promotes bench slot i after a knockout.
+    deltas: [decision, kind, seat, card_id, amount] where decision indexes the
+        decision it followed, kind is "damage" (attack damage dealt to seat's Pokemon)
+        or "knockout" (seat's Pokemon knocked out, amount = prizes awarded).
+    Decks are card ids in the order the players were built with, before any shuffle.
+    tape is set when the game drew from RandomTape(seed) rather than a single seeded stream.
+    """
+    seed: Optional[int]
+    decks: List[List[str]]
+    energies: List[List[str]]
+    first_player: int
+    players: List[str] = field(default_factory=lambda: ["Player 1", "Player 2"])
+    decisions: List[List[int]] = field(default_factory=list)
+    deltas: List[List[Any]] = field(default_factory=list)
+    winner: Optional[int] = None  # Seat of the winner, None for a draw
+    turns: int = 0
+    points: List[int] = field(default_factory=lambda: [0, 0])
+    error: Optional[str] = None  # Set when the game was stopped by an engine error (a draw)
+    meta: Dict[str, Any] = field(default_factory=dict)  # Free-form, e.g. game index and agents
+    tape: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "v": RECORD_VERSION, "seed": self.seed, "decks": self.decks, "energies": self.energies,
+            "first": self.first_player, "players": self.players, "decisions": self.decisions,
+            "deltas": self.deltas, "winner": self.winner, "turns": self.turns, "points": self.points,
+            "error": self.error, "meta": self.meta, "tape": self.tape,
+        }
+
+    def to_json(self) -> str:
+        """One NDJSON line (no newline)"""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GameRecord':
+        version = data.get("v")
+        if version != RECORD_VERSION:
+            raise ValueError(f"Unsupported game record version: {version}")
+        return cls(seed=data["seed"], decks=data["decks"], energies=data["energies"],
+                   first_player=data["first"], players=data["players"], decisions=data["decisions"],
+                   deltas=data["deltas"], winner=data["winner"], turns=data["turns"],
+                   points=data["points"], error=data.get("error"), meta=data.get("meta", {}),
+                   tape=data.get("tape", False))
+
+    @classmethod
+    def from_json(cls, line: str) -> 'GameRecord':
+        return cls.from_dict(json.loads(line))
+
+
+class GameRecorder(EventSink):
+    """Event sink that turns a game's events into a GameRecord.
+
+    Attach it with BattleEngine(..., events=recorder). The finished record is kept in
+    `record` and, when a writer is given, written to it as the game ends; one recorder
+    can follow several games in a row.
+    """
+
+    def __init__(self, writer: Optional['RecordWriter'] = None, meta: Optional[Dict[str, Any]] = None):
+        self.writer = writer
+        self.meta = meta or {}
+        self.record: Optional[GameRecord] = None
+
+    def emit(self, turn: int, event: str, data: Dict[str, Any]):
+        if event == "game_start":
+            self.record = GameRecord(seed=data["seed"], decks=data["decks"], energies=data["energies"],
+                                     first_player=data["first_seat"], players=data["players"],
+                                     meta=dict(self.meta), tape=data.get("tape", False))
+            return
+        record = self.record
+        if record is None:
+            return
+        if event == "action":
+            record.decisions.append([turn, data["seat"], data["code"]])
+        elif event == "replace_active":
+            record.decisions.append([turn, data["seat"], replace_active_code(data["bench_index"])])
+        elif event == "damage":
+            record.deltas.append([len(record.decisions) - 1, "damage", data["owner_seat"], data["card_id"],
+                                  data["amount"]])
+        elif event == "knockout":
+            record.deltas.append([len(record.decisions) - 1, "knockout", data["owner_seat"], data["card_id"],
+                                  data["prizes"]])
+        elif event == "game_end":
+            record.winner = data["winner_seat"]
+            record.turns = turn
+            record.points = data["points"]
+            record.error = data.get("error")
+            if self.writer is not None:
+                self.writer.write(record)
+
+
+def _open_text(path: str, mode: str):
+    """Text file handle; gzip-compressed when the path ends in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordWriter:
+    """Buffered NDJSON writer for game records (gzip when the path ends in .gz).
+
+    Lines are collected in memory and written in blocks of buffer_size records, so a
+    batch pays one write call per block. Worker processes can serialize records
+    themselves (GameRecord.to_json) and the parent only calls write_line.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1024, append: bool = False):
+        self.path = path
+        self.buffer_size = max(1, buffer_size)
+        self.count = 0
+        self._buffer: List[str] = []
+        self._file = _open_text(path, "a" if append else "w")
+
+    def write(self, record: GameRecord):
+        self.write_line(record.to_json())
+
+    def write_line(self, line: str):
+        self._buffer.append(line)
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write("\n".join(self._buffer))
+            self._file.write("\n")
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_records(paths: Union[str, Iterable[str]], raw: bool = False) -> Iterator[Union[GameRecord, Dict[str, Any]]]:
+    """Lazily yield the records of one or more NDJSON files, one line at a time.
+
+    raw=True yields the parsed dicts instead of GameRecord objects (skips the
+    dataclass build when only a few fields are needed). Blank lines are skipped.
+    """
+    if isinstance(paths, (str, bytes)):
+        paths = [paths]
+    for path in paths:
+        with _open_text(path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                yield data if raw else GameRecord.from_dict(data)
@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from v3.importers.json_card_importer import JsonCardImporter
+from v3.models.agents.agent import Agent
+from v3.models.match.actions import Action, ActionType, decode_action
+from v3.models.match.actions.action import SLOT_BENCH_0, unpack_action
+from v3.models.match.battle_engine import BattleEngine
+from v3.models.match.exceptions import ReplayError
+from v3.models.match.game_record import GameRecord
+from v3.models.match.matchup_tables import MatchupTables
+from v3.models.match.player import Player
+from v3.models.match.random_tape import RandomTape
+
+"""Deterministic replay of recorded games: seed + decisions, no agents and no validation"""
+
+
+@dataclass
+class ReplayStep:
+    """One replayed decision; engine is the live game right after it was executed"""
+    index: int  # Position in GameRecord.decisions
+    turn: int
+    seat: int
+    action: Action
+    engine: BattleEngine
+    failed: bool = False  # The action raised; like the original game, its turn ends here
+
+
+class ReplayAgent(Agent):
+    """Seat filler for replays - answers the engine's knockout replacement prompts from the record"""
+
+    def __init__(self, player):
+        super().__init__(player)
+        self.replay: Optional['GameReplay'] = None
+
+    def get_action(self, state, valid_action_indices: List[int]) -> Optional[int]:
+        return self.replay._replacement(self.player)
+
+
+def _is_replacement(code: int) -> bool:
+    return unpack_action(code)[0] == ActionType.SWITCH
+
+
+class GameReplay:
+    """Plays a GameRecord back on a fresh BattleEngine.
+
+    The engine is seeded with the recorded seed (or its RandomTape), so shuffles, energy
+    rolls and coin flips repeat; the recorded decisions stand in for the agents. Decisions are decoded
+    against the current hand and executed directly - no legal action lists, validation,
+    agent heuristics, logging or board rendering. A decision that does not fit the
+    replayed game raises ReplayError. Games recorded as stopped by an engine error are
+    replayed up to their last decision and the turn the error hit.
+    """
+
+    def __init__(self, record: GameRecord, importer: Optional[JsonCardImporter] = None,
+                 matchup_tables: bool = True):
+        self.record = record
+        importer = importer or JsonCardImporter.shared()
+        decks = []
+        for deck in record.decks:
+            cards = [importer.find_card(card_id) for card_id in deck]
+            missing = [card_id for card_id, card in zip(deck, cards) if card is None]
+            if missing:
+                raise ReplayError(f"Unknown cards in recorded deck: {missing}")
+            decks.append(cards)
+
+        players = [Player(name, [card.instantiate() for card in deck], list(energies), agent=ReplayAgent)
+                   for name, deck, energies in zip(record.players, decks, record.energies)]
+        matchups = MatchupTables.for_decks(*decks) if matchup_tables else None
+        tape = RandomTape(record.seed) if record.tape else None
+        self.engine = BattleEngine(*players, seed=record.seed, matchups=matchups, tape=tape)
+        for player in players:
+            player.agent.replay = self
+        self._next = 0  # Index of the next decision to replay
+
+    def steps(self) -> Iterator[ReplayStep]:
+        """Replay the game, yielding after every decision (knockout replacements happen inside
+        the decision that caused them)"""
+        engine = self.engine
+        decisions = self.record.decisions
+
+        # Setup as in BattleEngine._setup_game: coin toss, opening hands, then turn zero
+        engine._determine_first_player()
+        if engine.first_player_index != self.record.first_player:
+            raise ReplayError(f"First player is seat {engine.first_player_index}, "
+                              f"record says {self.record.first_player}")
+        for player in engine.players:
+            engine._setup_player(player)
+        for _ in range(2):
+            seat = engine.current_player_index
+            while self._next < len(decisions) and decisions[self._next][:2] == [0, seat]:
+                yield self._execute_next()
+            engine._switch_players()
+        engine._begin_turn()
+
+        while not engine._is_game_over():
+            turn = engine.turn
+            # A turn's decisions run until it ends: an attack, the action limit, a failed
+            # action, or the record moving on (the agent ended the turn)
+            while (engine.turn == turn and self._next < len(decisions)
+                   and decisions[self._next][0] == turn and not _is_replacement(decisions[self._next][2])):
+                step = self._execute_next()
+                yield step
+                if step.action.action_type == ActionType.ATTACK or step.failed \
+                        or engine.main_phase_actions >= engine.MAX_MAIN_PHASE_ACTIONS:
+                    break
+            if self.record.error is not None and self._next == len(decisions) and turn >= self.record.turns:
+                return  # The recorded game stopped on an engine error here
+            if engine.turn == turn:
+                engine._next_turn()
+
+        if self._next != len(decisions):
+            raise ReplayError(f"Game ended after {self._next} of {len(decisions)} recorded decisions")
+
+    def run(self) -> BattleEngine:
+        """Replay to the end, check the outcome against the record and return the final engine"""
+        for _ in self.steps():
+            pass
+        engine = self.engine
+        winner = engine._determine_winner() if self.record.error is None else None
+        outcome = (engine.players.index(winner) if winner else None, engine.turn,
+                   [player.points for player in engine.players])
+        expected = (self.record.winner, self.record.turns, self.record.points)
+        if outcome != expected:
+            raise ReplayError(f"Replay ended as (winner, turns, points) {outcome}, record says {expected}")
+        return engine
+
+    def _execute_next(self) -> ReplayStep:
+        engine = self.engine
+        index = self._next
+        turn, seat, code = self.record.decisions[index]
+        if seat != engine.current_player_index:
+            raise ReplayError(f"Decision {index} is for seat {seat} but seat {engine.current_player_index} is to move")
+        self._next += 1
+        player = engine.players[seat]
+        try:
+            action = decode_action(code, player)
+        except ValueError as e:
+            raise ReplayError(f"Decision {index} does not fit the replayed hand: {e}")
+
+        step = ReplayStep(index, turn, seat, action, engine)
+        try:
+            engine._execute_chosen(action, player)
+        except ReplayError:
+            raise
+        except Exception:
+            # The recorded game hit the same error and ended the main phase there
+            step.failed = True
+        if turn > 0:
+            engine.main_phase_actions += 1
+        return step
+
+    def _replacement(self, player: Player) -> int:
+        """Index into the engine's replacement choices (occupied bench slots) of the recorded promotion"""
+        decisions = self.record.decisions
+        seat = self.engine.players.index(player)
+        if self._next >= len(decisions):
+            raise ReplayError("Record ended before a knockout replacement")
+        _, recorded_seat, code = decisions[self._next]
+        action_type, slot, _ = unpack_action(code)
+        if action_type != ActionType.SWITCH or recorded_seat != seat:
+            raise ReplayError(f"Decision {self._next} is not seat {seat}'s knockout replacement")
+        self._next += 1
+        bench_index = slot - SLOT_BENCH_0
+        occupied = [i for i, pokemon in enumerate(player.bench_pokemons) if pokemon is not None]
+        if bench_index not in occupied:
+            raise ReplayError(f"Recorded replacement from empty bench slot {bench_index}")
+        return occupied.index(bench_index)
+
+
+def replay_game(record: GameRecord, importer: Optional[JsonCardImporter] = None) -> BattleEngine:
+    """Replay a record to the end (checked against its outcome) and return the final engine"""
+    return GameReplay(record, importer).run()
@@ -1,8 +1,12 @@
 from enum import Enum
 from typing import TYPE_CHECKING
+from v3.models.cards.card import Card
 if TYPE_CHECKING:
     from v3.models.cards.pokemon import Pokemon
-    from v3.models.cards.card import Card
+
+# Subtype a normal evolution of each subtype has
+_STAGE_UP = {Card.Subtype.BASIC: Card.Subtype.STAGE_1, Card.Subtype.STAGE_1: Card.Subtype.STAGE_2}
+
 
 class GamePhase(Enum):
     SETUP = "setup"
@@ -39,47 +43,24 @@ class GameRules:
             target: The Pokemon to evolve
             evolution: The evolution card
             allow_rare_candy: If True, allows Basic -> Stage 2 evolution (Rare Candy effect)
+        
+        Imported cards carry their evolution lines as card ids (see evolution_graph), so
+        this is a set lookup; Rare Candy needs the Basic to be two steps down the Stage 2's line.
         """
         if not hasattr(target, 'turns_in_play') or target.turns_in_play < 1:
             return False
         
-        # Check evolution chain matches
-        if evolution.evolves_from and evolution.evolves_from != target.name:
-            return False
-        
-        # Map subtypes to stages
-        from v3.models.cards.card import Card
-        stage_map = {
-            Card.Subtype.BASIC: GameRules.BASIC,
-            Card.Subtype.STAGE_1: GameRules.STAGE1,
-            Card.Subtype.STAGE_2: GameRules.STAGE2,
-        }
+        evolves_from_ids = evolution.evolves_from_ids
+        if evolves_from_ids:
+            if target.id in evolves_from_ids:
+                return True
+            return allow_rare_candy and target.id in evolution.rare_candy_from_ids
         
-        target_stage = stage_map.get(target.subtype)
-        evolution_stage = stage_map.get(evolution.subtype)
-        
-        if target_stage == GameRules.BASIC and evolution_stage == GameRules.STAGE1:
-            return True
-        if target_stage == GameRules.STAGE1 and evolution_stage == GameRules.STAGE2:
-            return True
-        
-        # Rare Candy: Basic -> Stage 2 (if evolution chain matches)
-        if allow_rare_candy and target_stage == GameRules.BASIC and evolution_stage == GameRules.STAGE2:
-            # Check if the Stage 2 evolves from the Basic (via evolution chain)
-            # For example, Bulbasaur -> Venusaur (if Venusaur.evolves_from == "Bulbasaur" or "Ivysaur")
-            # We need to check if there's a valid evolution chain
-            if evolution.evolves_from:
-                # Check if evolution chain matches (e.g., Venusaur evolves from Ivysaur, which evolves from Bulbasaur)
-                # For Rare Candy, we allow if the Stage 2's evolves_from matches the Basic's name
-                # OR if we can trace the chain
-                if evolution.evolves_from == target.name:
-                    return True
-                # Also check if there's an intermediate stage that matches
-                # For now, we'll be lenient and allow if the name matches part of the chain
-                # This is a simplification - in real game, you'd need to check the full chain
-                return True  # Allow Basic -> Stage 2 with Rare Candy
-        
-        return False
+        # Cards built outside a card pool have no ids: match the name, one stage up
+        # (their Rare Candy ancestry is unknown)
+        if not evolution.evolves_from or evolution.evolves_from != target.name:
+            return False
+        return _STAGE_UP.get(target.subtype) == evolution.subtype
     
     @staticmethod
     def calculate_prize_value(pokemon: 'Pokemon') -> int:  # FIX: return type is int
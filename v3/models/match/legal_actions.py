@@ -0,0 +1,150 @@
+from typing import Callable, Dict, List, Tuple
+
+from v3.models.cards import energy_math
+from v3.models.match.actions import Action, EndTurnAction
+from v3.models.match.game_rules import GamePhase
+
+"""Incremental legal action generation: validated actions per action family, kept until an input changes"""
+
+
+class _Zones:
+    """The zone views the family keys are built from, read once per call"""
+    __slots__ = ('hand', 'slots', 'pokemon', 'definitions', 'occupancy', '_health')
+
+    def __init__(self, player):
+        self.hand = tuple(player.cards_in_hand)
+        self.slots = (player.active_pokemon, *player.bench_pokemons)
+        self.pokemon = tuple(p for p in self.slots if p is not None)
+        self.definitions = tuple(p.definition for p in self.pokemon)
+        self.occupancy = tuple(p is None for p in self.slots)
+        self._health = None
+
+    @property
+    def health(self) -> Tuple:
+        """Who is in play and how damaged (decides whether healing cards are offered)"""
+        if self._health is None:
+            self._health = (self.slots, self.definitions, tuple(p.damage_taken for p in self.pokemon))
+        return self._health
+
+
+# Each family lists the inputs its generator and its actions' validate() read. When a
+# family's key equals the one stored with its cached actions, those actions are reused.
+
+def _attack_key(player, engine, zones: _Zones) -> Tuple:
+    active = player.active_pokemon
+    if active is None:
+        return (None,)
+    energies = active.equipped_energies
+    packed = energies.packed if type(energies) is energy_math.EnergyCounter else tuple(energies.items())
+    opponent = engine._get_opponent(player)
+    return (active, active.definition, packed, active.attacked_this_turn, player.can_attack_next_turn,
+            opponent.active_pokemon is not None)
+
+
+def _play_pokemon_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.hand, zones.occupancy, player.played_pokemon_this_turn, engine.phase == GamePhase.SETUP)
+
+
+def _attach_energy_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.occupancy, player.energy_zone.has_energy(), engine.first_player_first_turn,
+            player.attached_energy_this_turn)
+
+
+def _evolve_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.hand, zones.slots, zones.definitions,
+            tuple((p.turns_in_play, p.placed_or_evolved_this_turn) for p in zones.pokemon),
+            engine.turn == 1, player.used_rare_candy_this_turn)
+
+
+def _retreat_key(player, engine, zones: _Zones) -> Tuple:
+    active = player.active_pokemon
+    if active is None:
+        return (None,)
+    return (active, active.definition, active.can_retreat(), energy_math.total(active.equipped_energies),
+            zones.occupancy)
+
+
+def _play_item_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.hand, player.can_play_trainer, zones.health)
+
+
+def _play_supporter_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.hand, player.can_play_trainer, player.played_supporter_this_turn, zones.health)
+
+
+def _attach_tool_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.hand, zones.slots, player.can_play_trainer, tuple(p.poketool for p in zones.pokemon))
+
+
+def _use_ability_key(player, engine, zones: _Zones) -> Tuple:
+    return (zones.health, tuple(p.used_ability_this_turn for p in zones.pokemon))
+
+
+# (family, Player generator method, key) in the order Player._generate_actions lists them
+FAMILIES: Tuple[Tuple[str, str, Callable], ...] = (
+    ("play_pokemon", "_generate_play_pokemon_actions", _play_pokemon_key),
+    ("attach_energy", "_generate_attach_energy_actions", _attach_energy_key),
+    ("evolve", "_generate_evolve_actions", _evolve_key),
+    ("retreat", "_generate_retreat_actions", _retreat_key),
+    ("play_item", "_generate_play_item_actions", _play_item_key),
+    ("play_supporter", "_generate_play_supporter_actions", _play_supporter_key),
+    ("attach_tool", "_generate_attach_tool_actions", _attach_tool_key),
+    ("use_ability", "_generate_use_ability_actions", _use_ability_key),
+)
+ATTACK_FAMILY = ("attack", "_generate_attack_actions", _attack_key)
+
+
+class LegalActionCache:
+    """Per-player cache of validated main phase actions, one entry per action family.
+
+    Each call rebuilds only the families whose inputs (hand, board, energy, turn flags)
+    changed since the last call, so the 5-15 actions of a main phase mostly reuse the
+    families the previous action did not touch. The result is the same list, in the same
+    order, as validating every candidate from Player._generate_actions.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple, List[Action]]] = {}
+        self._engine = None
+
+    def clear(self):
+        self._entries.clear()
+        self._engine = None
+
+    def legal_actions(self, player, battle_engine) -> List[Action]:
+        """Validated actions - attacks first, end turn last"""
+        if battle_engine is not self._engine:
+            self.clear()
+            self._engine = battle_engine
+        zones = _Zones(player)
+        profiler = getattr(battle_engine, 'profiler', None)
+        counting = profiler is not None and profiler.enabled
+
+        actions = []
+        for family in (ATTACK_FAMILY,) + FAMILIES:
+            name, generator, key_of = family
+            key = key_of(player, battle_engine, zones)
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == key:
+                actions.extend(entry[1])
+                if counting:
+                    profiler.count("actions.reused", len(entry[1]))
+                continue
+            candidates = getattr(player, generator)()
+            valid = [action for action in candidates if _is_valid(action, player, battle_engine)]
+            self._entries[name] = (key, valid)
+            actions.extend(valid)
+            if counting:
+                profiler.count("actions.generated", len(candidates))
+                profiler.count("actions.valid", len(valid))
+                profiler.count("actions.rejected", len(candidates) - len(valid))
+        actions.append(EndTurnAction())
+        return actions
+
+
+def _is_valid(action: Action, player, battle_engine) -> bool:
+    try:
+        is_valid, _ = action.validate(player, battle_engine)
+    except Exception:
+        return False  # Skip actions that cannot be checked
+    return is_valid
@@ -0,0 +1,789 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed to run the kernel
+    np = None
+
+from v3.models.cards.card import Card
+from v3.models.cards.energy_math import ENERGY_ORDER, unpack
+from v3.models.cards.item import Item
+from v3.models.cards.pokemon import Pokemon
+from v3.models.cards.supporter import Supporter
+from v3.models.cards.tool import Tool, ToolModifier
+from v3.models.match.batch_runner import RESULT_KEYS, BatchRunner, GameConfig, GameResult
+from v3.models.match.effects.coin_flip_effect import CoinFlipEffect
+from v3.models.match.effects.discard_effect import DiscardEffect
+from v3.models.match.effects.draw_effect import DrawEffect
+from v3.models.match.effects.energy_effect import EnergyEffect
+from v3.models.match.effects.heal_all_effect import HealAllEffect
+from v3.models.match.effects.heal_effect import HealEffect
+from v3.models.match.effects.rare_candy_effect import RareCandyEffect
+from v3.models.match.effects.search_effect import SearchEffect
+from v3.models.match.effects.status_effect_effect import StatusEffectEffect
+from v3.models.match.effects.switch_effect import SwitchEffect
+from v3.models.match.exceptions import UnsupportedMatchupError
+from v3.models.match.game_rules import GameRules
+from v3.models.match.matchup_tables import attack_base_damage
+
+"""Lockstep structure-of-arrays kernel: N games of one matchup advanced together with NumPy"""
+
+SLOTS = 1 + GameRules.MAX_BENCH_SIZE  # Slot 0 is the active spot
+ENERGY_INDEX = {energy_type: i for i, energy_type in enumerate(ENERGY_ORDER)}
+
+# Status condition bits (per slot)
+POISONED, BURNED, ASLEEP, PARALYZED = 1, 2, 4, 8
+STATUS_BITS = {'poisoned': POISONED, 'burned': BURNED, 'asleep': ASLEEP, 'paralyzed': PARALYZED}
+CANNOT_ATTACK = ASLEEP | PARALYZED
+
+# Trainer card operations
+OP_NONE, OP_SEARCH, OP_DRAW, OP_HEAL_ONE, OP_RARE_CANDY, OP_SWITCH_OPPONENT, OP_TOOL_HP = range(7)
+
+_STAGES = {Card.Subtype.BASIC: 0, Card.Subtype.STAGE_1: 1, Card.Subtype.STAGE_2: 2}
+
+
+def _energy_index(energy_type) -> Optional[int]:
+    return ENERGY_INDEX.get(str(energy_type).lower())
+
+
+class KernelCards:
+    """Per-card tables for the lockstep kernel, compiled from two decklists.
+
+    Rows are the distinct cards of both decks plus a last "empty" row, so slot and hand
+    lookups are plain array indexing. Effects come from the cards' compiled EffectParser
+    effects; a card using anything the kernel does not model is listed in `unsupported`
+    with the reason.
+    """
+
+    def __init__(self, deck1: Sequence[Card], deck2: Sequence[Card]):
+        cards: Dict[str, Card] = {}
+        for card in list(deck1) + list(deck2):
+            cards.setdefault(card.id, card)
+        self.ids: List[str] = list(cards)
+        self.index = {card_id: i for i, card_id in enumerate(self.ids)}
+        self.size = len(self.ids)
+        self.empty = self.size  # Row (and slot / hand value) meaning "no card"
+        self.unsupported: List[Tuple[str, str]] = []
+
+        rows = self.size + 1
+        attacks = max([len(card.attacks) for card in cards.values() if isinstance(card, Pokemon)] + [1])
+        types = len(ENERGY_ORDER)
+        self.is_pokemon = np.zeros(rows, bool)
+        self.is_basic = np.zeros(rows, bool)
+        self.stage = np.zeros(rows, np.int8)
+        self.hp = np.zeros(rows, np.int16)
+        self.element = np.full(rows, -1, np.int8)
+        self.weakness = np.full(rows, -2, np.int8)  # Never equal to an element
+        self.prize = np.zeros(rows, np.int8)
+        self.retreat_cost = np.zeros(rows, np.int8)
+        self.has_attack = np.zeros((rows, attacks), bool)
+        self.damage = np.zeros((rows, attacks), np.int16)
+        self.cost = np.zeros((rows, attacks, types), np.int8)  # Typed energy, Colorless excluded
+        self.cost_total = np.zeros((rows, attacks), np.int8)
+        self.attack_heal = np.zeros((rows, attacks), np.int16)  # Heals the attacker
+        self.attack_draw = np.zeros((rows, attacks), np.int8)
+        self.attack_status = np.zeros((rows, attacks), np.uint8)  # Given to the defender
+        self.attack_discard = np.zeros((rows, attacks), np.int8)  # Typed energy the attacker discards
+        self.attack_discard_type = np.zeros((rows, attacks), np.int8)
+        self.attack_attach = np.zeros((rows, attacks), np.int8)  # Energy taken from the zone to the attacker
+        self.attack_attach_type = np.zeros((rows, attacks), np.int8)
+        self.attack_search = np.full((rows, attacks), -1, np.int8)  # Index into search_targets
+        self.attack_search_amount = np.zeros((rows, attacks), np.int8)
+        self.ability_heal = np.zeros(rows, np.int16)  # "Heal N damage from each of your Pokemon"
+        self.op = np.zeros(rows, np.int8)
+        self.amount = np.zeros(rows, np.int16)
+        self.heal_element = np.full(rows, -1, np.int8)
+        self.is_supporter = np.zeros(rows, bool)
+        self.search = np.full(rows, -1, np.int8)  # Index into search_targets
+        self._search_specs: List[Tuple[bool, int]] = []  # (Basic only, element or -1)
+
+        for i, card in enumerate(cards.values()):
+            reason = self._compile(i, card)
+            if reason:
+                self.unsupported.append((card.id, reason))
+
+        # search_targets[n][kind]: kind is a card the n-th kind of search can find
+        self.search_targets = [(self.is_basic if basic_only else self.is_pokemon)
+                               & ((self.element == element) | (element < 0))
+                               for basic_only, element in self._search_specs]
+
+        # evolve[target, card]: card evolves target normally; candy: Basic -> Stage 2 with Rare Candy.
+        # Filled from GameRules.can_evolve so the kernel follows the same evolution rules
+        self.evolve = np.zeros((rows, rows), bool)
+        self.evolve_candy = np.zeros((rows, rows), bool)
+        pokemon = [(i, card) for i, card in enumerate(cards.values()) if isinstance(card, Pokemon)]
+        for i, target in pokemon:
+            target = target.instantiate()
+            target.turns_in_play = 1
+            for j, evolution in pokemon:
+                if GameRules.can_evolve(target, evolution):
+                    self.evolve[i, j] = True
+                elif self.stage[i] == 0 and self.stage[j] == 2 and \
+                        GameRules.can_evolve(target, evolution, allow_rare_candy=True):
+                    self.evolve_candy[i, j] = True
+
+    @property
+    def supported(self) -> bool:
+        return not self.unsupported
+
+    def _compile(self, i: int, card: Card) -> Optional[str]:
+        """Fill row i; returns why the card is unsupported, or None"""
+        if isinstance(card, Pokemon):
+            return self._compile_pokemon(i, card)
+        effects = card.ability.effects if card.ability and card.ability.effect else ()
+        if isinstance(card, Tool):
+            bonus = ToolModifier.of(card).hp_bonus
+            if effects and not bonus:
+                return "tool effect"
+            self.op[i], self.amount[i] = OP_TOOL_HP, bonus
+            return None
+        if not isinstance(card, (Item, Supporter)):
+            return "card type"
+        self.is_supporter[i] = isinstance(card, Supporter)
+        if len(effects) != 1:
+            return "trainer effect" if effects else None
+        effect = effects[0]
+        if isinstance(effect, SearchEffect):
+            search = self._search_spec(effect)
+            if search is None:
+                return "search"
+            self.op[i], self.amount[i], self.search[i] = OP_SEARCH, effect.amount, search
+        elif isinstance(effect, DrawEffect):
+            self.op[i], self.amount[i] = OP_DRAW, effect.amount
+        elif isinstance(effect, HealEffect) and effect.target == "one":
+            self.op[i], self.amount[i] = OP_HEAL_ONE, effect.amount
+            if effect.pokemon_type:
+                energy_type = effect.pokemon_type.lower()
+                if energy_type not in ENERGY_INDEX:
+                    return "heal type"
+                self.heal_element[i] = ENERGY_INDEX[energy_type]
+        elif isinstance(effect, RareCandyEffect):
+            self.op[i] = OP_RARE_CANDY
+        elif isinstance(effect, SwitchEffect) and effect.target == "opponent_active":
+            self.op[i] = OP_SWITCH_OPPONENT
+        else:
+            return f"trainer effect {type(effect).__name__}"
+        return None
+
+    def _search_spec(self, effect: SearchEffect) -> Optional[int]:
+        """Index of the search_targets entry for a Pokemon search, None for other searches"""
+        if effect.card_type not in ("BasicPokemon", "Pokemon"):
+            return None
+        element = _energy_index(effect.element) if effect.element else -1
+        if element is None:
+            return None
+        spec = (effect.card_type == "BasicPokemon", element)
+        if spec not in self._search_specs:
+            self._search_specs.append(spec)
+        return self._search_specs.index(spec)
+
+    def _compile_pokemon(self, i: int, card: Pokemon) -> Optional[str]:
+        if card.subtype not in _STAGES:
+            return "stage"
+        self.is_pokemon[i] = True
+        self.stage[i] = _STAGES[card.subtype]
+        self.is_basic[i] = self.stage[i] == 0
+        self.hp[i] = card.health
+        self.element[i] = ENERGY_INDEX.get(card.element, -1)
+        if card.weakness:
+            self.weakness[i] = ENERGY_INDEX.get(card.weakness, -2)
+        self.prize[i] = GameRules.calculate_prize_value(card)
+        self.retreat_cost[i] = card.retreat_cost or 0
+
+        for a, attack in enumerate(card.attacks):
+            self.has_attack[i, a] = True
+            self.damage[i, a] = attack_base_damage(attack)
+            for energy_type, count in unpack(attack.requirement.specific).items():
+                self.cost[i, a, ENERGY_INDEX[energy_type]] = count
+            self.cost_total[i, a] = attack.requirement.total
+            effects = attack.ability.effects if attack.ability and attack.ability.effect else ()
+            for effect in effects:
+                if isinstance(effect, HealEffect) and effect.target == "this":
+                    self.attack_heal[i, a] = effect.amount
+                elif isinstance(effect, DrawEffect):
+                    self.attack_draw[i, a] = effect.amount
+                elif isinstance(effect, StatusEffectEffect) and effect.target == "opponent_active" \
+                        and effect.status_type in STATUS_BITS:
+                    self.attack_status[i, a] |= STATUS_BITS[effect.status_type]
+                elif isinstance(effect, DiscardEffect) and effect.target == "energy" \
+                        and _energy_index(effect.energy_type) is not None:
+                    self.attack_discard[i, a] = effect.amount
+                    self.attack_discard_type[i, a] = _energy_index(effect.energy_type)
+                elif isinstance(effect, EnergyEffect) and effect.action == "attach" \
+                        and _energy_index(effect.energy_type) is not None:
+                    self.attack_attach[i, a] = effect.amount
+                    self.attack_attach_type[i, a] = _energy_index(effect.energy_type)
+                elif isinstance(effect, SearchEffect) and self._search_spec(effect) is not None:
+                    self.attack_search[i, a] = self._search_spec(effect)
+                    self.attack_search_amount[i, a] = effect.amount
+                elif isinstance(effect, CoinFlipEffect) and effect.effect_type == "prevent_attack" \
+                        and not (effect.success_effect or effect.failure_effect):
+                    # BattleEngine resets can_attack_next_turn as the attacker's turn ends,
+                    # so Tail Whip style flips never stop an attack there either
+                    continue
+                else:
+                    return f"attack effect {type(effect).__name__}"
+
+        for ability in card.abilities:
+            if not ability or not ability.effect:
+                continue
+            effects = ability.effects
+            if len(effects) == 1 and isinstance(effects[0], HealAllEffect):
+                self.ability_heal[i] = effects[0].amount
+            else:
+                return "ability"
+        return None
+
+
+class _Side:
+    """One player's half of every game, as arrays with one row per game"""
+
+    FIELDS = ('seat', 'deck', 'deck_size', 'top', 'hand', 'energies', 'energy_count', 'zone', 'zone_next',
+              'points', 'kind', 'damage', 'tool_hp', 'energy', 'turns', 'fresh', 'status')
+    SLOT_FIELDS = ('kind', 'damage', 'tool_hp', 'energy', 'turns', 'fresh', 'status')
+
+    def take(self, rows) -> '_Side':
+        side = _Side()
+        for name in self.FIELDS:
+            setattr(side, name, getattr(self, name)[rows])
+        return side
+
+    @classmethod
+    def select(cls, condition, when_true: '_Side', when_false: '_Side') -> '_Side':
+        """Per game: when_true's half where condition holds, else when_false's"""
+        side = cls()
+        for name in cls.FIELDS:
+            a, b = getattr(when_true, name), getattr(when_false, name)
+            mask = condition.reshape(condition.shape + (1,) * (a.ndim - 1))
+            setattr(side, name, np.where(mask, a, b))
+        return side
+
+
+@dataclass
+class LockstepResult:
+    """Outcome of a batch of games, by seat (0 = Player 1, 1 = Player 2)"""
+    winners: List[Optional[int]]  # Seat of each game's winner, None for a draw
+    turns: List[int]
+    points: List[Tuple[int, int]]
+    engine: str = "kernel"  # Greedy-policy kernel games; "scalar" for BattleEngine games (allow_fallback)
+    unsupported: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return len(self.winners)
+
+    def counts(self) -> Dict[str, int]:
+        """Wins per seat and draws, keyed like batch_runner.merge_results"""
+        counts = dict.fromkeys(RESULT_KEYS, 0)
+        for winner in self.winners:
+            counts[RESULT_KEYS[2] if winner is None else RESULT_KEYS[winner]] += 1
+        return counts
+
+    @classmethod
+    def from_game_results(cls, results: Sequence[GameResult], unsupported=()) -> 'LockstepResult':
+        results = sorted(results, key=lambda result: result.game_index)
+        winners = [RESULT_KEYS.index(result.winner) if result.winner != "Draw" else None for result in results]
+        return cls(winners, [result.turns for result in results], [(0, 0)] * len(results),
+                   engine="scalar", unsupported=list(unsupported))
+
+
+class LockstepBattle:
+    """N games of one matchup held as NumPy arrays and played turn by turn in lockstep.
+
+    Each player's half of all N games is a _Side: deck order, hand counts per card,
+    energy zone (current and next), points, and per-slot card, damage, tool HP, energy
+    counts per type, turns in play and a status bitmask. Every step of a turn - draw,
+    trainers, benching, evolution, energy attachment, attack, weakness
+    (GameRules.WEAKNESS_BONUS), knockouts, prizes and status damage - is one set of array
+    operations over every game still running; finished games are dropped between turns.
+    The halves are kept as "player to move" and "opponent" and swapped each turn, so every
+    step works on whole arrays whichever seat moved first in each game.
+
+    Both seats play a fixed greedy policy rather than an agent: search and draw trainers
+    whenever held, one supporter per turn (heal, then switch, then draw), bench every
+    Basic, evolve whenever possible (Rare Candy first), attach tools, heal abilities and
+    heal items when they heal in full, retreat an active with no damaging attack for a
+    benched Pokemon with one, attach energy to the first Pokemon that cannot yet use the
+    strongest attack its energy zone pays for, and always attack with the strongest
+    affordable attack. Rules follow BattleEngine (first-turn limits, no deck-out loss,
+    prizes, the turn limit draw) except that a knockout from poison or burn damage awards
+    prizes as usual, where a BattleEngine game ends in an error.
+
+    Kernel win rates are therefore their own metric - how two decks do when both play
+    this greedy policy - and are not interchangeable with BattleEngine/RandomAgent
+    results: they can even disagree on which deck is favored (basic_fire vs
+    generated_evolution_bulbasaur is about 73% for Player 1 here and 39% in RandomAgent
+    games). Compare kernel results only with other kernel results.
+
+    Only cards in KernelCards' supported subset can be simulated; simulate_matchup refuses
+    anything else unless the caller opts into BattleEngine games.
+    """
+
+    def __init__(self, deck1: Sequence[Card], deck2: Sequence[Card], energy1_types: Sequence[str],
+                 energy2_types: Sequence[str], cards: Optional[KernelCards] = None):
+        if np is None:
+            raise ImportError("LockstepBattle requires numpy")
+        self.cards = cards or KernelCards(deck1, deck2)
+        if not self.cards.supported:
+            raise ValueError(f"Cards not supported by the lockstep kernel: {self.cards.unsupported}")
+        self.decks = [np.array([self.cards.index[card.id] for card in deck], np.int16) for deck in (deck1, deck2)]
+        if not all(self.cards.is_basic[deck].any() for deck in self.decks):
+            raise ValueError("Both decks need a Basic Pokemon")
+        self.energy_types = [[_energy_index(energy_type) for energy_type in energies]
+                             for energies in (energy1_types, energy2_types)]
+        # target_attack[seat, kind]: the hardest hitting attack the seat's energy zone can pay
+        # for, which energy is attached towards (-1 damage when there is none)
+        targets = []
+        for types in self.energy_types:
+            foreign = np.ones(len(ENERGY_ORDER), bool)
+            foreign[types] = False
+            payable = self.cards.has_attack & (self.cards.cost[:, :, foreign] == 0).all(2)
+            targets.append(np.where(payable, self.cards.damage, -1))
+        self.target_damage = np.stack(targets).max(2)
+        self.target_attack = np.stack(targets).argmax(2)
+        self.rng = None
+
+    def run(self, games: int, seed: Optional[int] = None) -> LockstepResult:
+        """Play `games` games from scratch; the same seed and game count give the same results"""
+        rng = self.rng = np.random.default_rng(seed)
+        seats = [self._new_side(seat, games) for seat in (0, 1)]
+        first_is_p1 = rng.integers(0, 2, games) == 0
+        mover = _Side.select(first_is_p1, seats[0], seats[1])
+        other = _Side.select(first_is_p1, seats[1], seats[0])
+        for side in (mover, other):
+            self._turn_zero(side)
+
+        winners = np.full(games, -1, np.int8)
+        turns = np.full(games, GameRules.MAX_TURNS, np.int16)
+        points = np.zeros((games, 2), np.int8)
+        game_ids = np.arange(games)
+
+        # The turn limit ends every game still running in a draw (as BattleEngine._is_game_over)
+        for turn in range(1, GameRules.MAX_TURNS):
+            if game_ids.size == 0:
+                break
+            mover_won, other_won = self._play_turn(mover, other, turn)
+            over = mover_won | other_won
+            if over.any():
+                ended = game_ids[over]
+                winners[ended] = np.where(mover_won[over], mover.seat[over], other.seat[over])
+                turns[ended] = turn
+                for side in (mover, other):
+                    points[ended, side.seat[over]] = side.points[over]
+                keep = np.nonzero(~over)[0]
+                mover, other, game_ids = mover.take(keep), other.take(keep), game_ids[keep]
+            mover, other = other, mover
+
+        for side in (mover, other):
+            points[game_ids, side.seat] = side.points
+        return LockstepResult([int(w) if w >= 0 else None for w in winners], turns.tolist(),
+                              [tuple(p) for p in points.tolist()])
+
+    ########## Setup ##########
+
+    def _new_side(self, seat: int, games: int) -> _Side:
+        """Shuffled deck, opening hand with a Basic (reshuffling as needed) and energy zone"""
+        cards, rng = self.cards, self.rng
+        deck = self.decks[seat]
+        side = _Side()
+        side.seat = np.full(games, seat, np.int8)
+        # As wide as the longer deck so both seats' decks fit one array after select()
+        width = max(len(decklist) for decklist in self.decks)
+        side.deck = np.full((games, width), cards.empty, np.int16)
+        redo = np.arange(games)
+        hand_size = min(GameRules.INITIAL_HAND_SIZE, len(deck))
+        while redo.size:
+            order = rng.random((redo.size, len(deck))).argsort(1)
+            side.deck[redo, :len(deck)] = deck[order]
+            redo = redo[~cards.is_basic[side.deck[redo, :hand_size]].any(1)]
+        side.deck_size = np.full(games, len(deck), np.int16)
+        side.top = np.full(games, hand_size, np.int16)
+        side.hand = (side.deck[:, :hand_size, None] == np.arange(cards.size)).sum(1).astype(np.int8)
+
+        side.energies = np.tile(np.array(self.energy_types[seat], np.int8), (games, 1))
+        side.energy_count = np.full(games, len(self.energy_types[seat]), np.int8)
+        # Padded so both seats' choices fit one array after select()
+        width = max(len(types) for types in self.energy_types)
+        side.energies = np.pad(side.energies, ((0, 0), (0, width - side.energies.shape[1])), mode='edge')
+        side.zone = self._roll_energy(side, np.arange(games))
+        side.zone_next = self._roll_energy(side, np.arange(games))
+        side.points = np.zeros(games, np.int8)
+
+        side.kind = np.full((games, SLOTS), cards.empty, np.int16)
+        side.damage = np.zeros((games, SLOTS), np.int16)
+        side.tool_hp = np.zeros((games, SLOTS), np.int16)
+        side.energy = np.zeros((games, SLOTS, len(ENERGY_ORDER)), np.int8)
+        side.turns = np.zeros((games, SLOTS), np.int16)
+        side.fresh = np.zeros((games, SLOTS), bool)
+        side.status = np.zeros((games, SLOTS), np.uint8)
+        return side
+
+    def _turn_zero(self, side: _Side):
+        """A random Basic to the active spot, then every other Basic in hand to the bench"""
+        games = np.arange(side.kind.shape[0])
+        self._place_basic(side, games, 0)
+        for slot in range(1, SLOTS):
+            self._place_basic(side, games, slot)
+
+    ########## Helpers ##########
+
+    def _roll_energy(self, side: _Side, rows):
+        pick = (self.rng.random(rows.size) * side.energy_count[rows]).astype(np.int64)
+        return side.energies[rows, pick]
+
+    def _pick(self, mask):
+        """Random True column of each row of mask, and whether the row had one"""
+        keys = self.rng.random(mask.shape)
+        keys[~mask] = -1.0
+        return keys.argmax(1), mask.any(1)
+
+    def _draw(self, side: _Side, rows, count: int = 1):
+        for _ in range(count):
+            rows = rows[side.top[rows] < side.deck_size[rows]]
+            if rows.size == 0:
+                return
+            side.hand[rows, side.deck[rows, side.top[rows]]] += 1
+            side.top[rows] += 1
+
+    def _search(self, side: _Side, rows, search: int, count: int = 1):
+        """Put random matching Pokemon from the deck into the hand (SearchEffect)"""
+        targets = self.cards.search_targets[search]
+        positions = np.arange(side.deck.shape[1])
+        for _ in range(count):
+            remaining = (positions >= side.top[rows, None]) & (positions < side.deck_size[rows, None])
+            position, found = self._pick(remaining & targets[side.deck[rows]])
+            rows, position = rows[found], position[found]
+            top = side.top[rows]
+            # Swap the found card to the top of the deck and draw it
+            side.deck[rows, position], side.deck[rows, top] = side.deck[rows, top], side.deck[rows, position]
+            self._draw(side, rows)
+
+    def _place_basic(self, side: _Side, rows, slot: int):
+        rows = rows[side.kind[rows, slot] == self.cards.empty]
+        kind, has = self._pick((side.hand[rows] > 0) & self.cards.is_basic[:-1])
+        rows, kind = rows[has], kind[has]
+        side.hand[rows, kind] -= 1
+        side.kind[rows, slot] = kind
+        self._reset_slot(side, rows, slot)
+        side.fresh[rows, slot] = True
+
+    def _reset_slot(self, side: _Side, rows, slot):
+        side.damage[rows, slot] = 0
+        side.tool_hp[rows, slot] = 0
+        side.energy[rows, slot] = 0
+        side.turns[rows, slot] = 0
+        side.fresh[rows, slot] = False
+        side.status[rows, slot] = 0
+
+    def _max_hp(self, side: _Side):
+        return self.cards.hp[side.kind] + side.tool_hp
+
+    def _affordable(self, kind, energy):
+        """(games, attacks) mask of the attacks each Pokemon's energy pays for"""
+        cards = self.cards
+        typed = (energy[:, None, :] >= cards.cost[kind]).all(2)
+        return cards.has_attack[kind] & typed & (energy.sum(1)[:, None] >= cards.cost_total[kind])
+
+    def _heal_slots(self, side: _Side, rows, slots, amount):
+        side.damage[rows, slots] = np.maximum(0, side.damage[rows, slots] - amount)
+
+    def _knock_out(self, owner: _Side, scorer: _Side, rows, slot):
+        """Prizes for the knocked out Pokemon in slot (per row), then promote if it was active"""
+        slot = np.broadcast_to(slot, rows.shape)
+        scorer.points[rows] += self.cards.prize[owner.kind[rows, slot]]
+        owner.kind[rows, slot] = self.cards.empty
+        self._reset_slot(owner, rows, slot)
+        self._promote(owner, rows[slot == 0])
+
+    def _promote(self, side: _Side, rows):
+        """Random benched Pokemon into the empty active spot (none left: the game is lost)"""
+        bench, has = self._pick(side.kind[rows, 1:] != self.cards.empty)
+        rows, bench = rows[has], bench[has] + 1
+        for name in _Side.SLOT_FIELDS:
+            values = getattr(side, name)
+            values[rows, 0] = values[rows, bench]
+        side.kind[rows, bench] = self.cards.empty
+        self._reset_slot(side, rows, bench)
+
+    def _has_pokemon(self, side: _Side):
+        return (side.kind != self.cards.empty).any(1)
+
+    ########## Turn ##########
+
+    def _play_turn(self, me: _Side, opponent: _Side, turn: int):
+        """One turn of `me` in every game; returns (me won, opponent won) masks"""
+        cards = self.cards
+        games = np.arange(me.kind.shape[0])
+        empty = cards.empty
+
+        # Draw phase
+        self._draw(me, games)
+
+        # Trainers that only fetch cards: search and draw items, as many as held
+        for kind in np.nonzero((cards.op[:-1] == OP_SEARCH) & ~cards.is_supporter[:-1])[0]:
+            for _ in range(int(me.hand[:, kind].max(initial=0))):
+                rows = games[me.hand[:, kind] > 0]
+                me.hand[rows, kind] -= 1
+                self._search(me, rows, int(cards.search[kind]), int(cards.amount[kind]))
+        for kind in np.nonzero((cards.op[:-1] == OP_DRAW) & ~cards.is_supporter[:-1])[0]:
+            for _ in range(int(me.hand[:, kind].max(initial=0))):
+                rows = games[me.hand[:, kind] > 0]
+                me.hand[rows, kind] -= 1
+                self._draw(me, rows, int(cards.amount[kind]))
+
+        # One supporter: heal if it heals in full, else switch the opponent's active, else draw
+        played = np.zeros(games.size, bool)
+        for op in (OP_HEAL_ONE, OP_SWITCH_OPPONENT, OP_DRAW, OP_SEARCH):
+            for kind in np.nonzero((cards.op[:-1] == op) & cards.is_supporter[:-1])[0]:
+                usable = ~played & (me.hand[:, kind] > 0)
+                if op == OP_HEAL_ONE:
+                    usable &= self._heal_target(me, kind)[1]
+                elif op == OP_SWITCH_OPPONENT:
+                    usable &= (opponent.kind[:, 1:] != empty).any(1)
+                elif op in (OP_DRAW, OP_SEARCH):
+                    usable &= me.top < me.deck_size
+                rows = games[usable]
+                if rows.size == 0:
+                    continue
+                me.hand[rows, kind] -= 1
+                played[rows] = True
+                if op == OP_HEAL_ONE:
+                    self._play_heal(me, rows, kind)
+                elif op == OP_SWITCH_OPPONENT:
+                    self._switch_active(opponent, rows)
+                elif op == OP_DRAW:
+                    self._draw(me, rows, int(cards.amount[kind]))
+                else:
+                    self._search(me, rows, int(cards.search[kind]), int(cards.amount[kind]))
+
+        # Bench every Basic that fits
+        for slot in range(1, SLOTS):
+            self._place_basic(me, games, slot)
+
+        # Evolution (not on the first turn of the game)
+        if turn > 1:
+            candies = np.nonzero(cards.op[:-1] == OP_RARE_CANDY)[0]
+            for slot in range(SLOTS):
+                target = me.kind[:, slot]
+                ready = (target != empty) & (me.turns[:, slot] >= 1) & ~me.fresh[:, slot]
+                held = me.hand > 0
+                if candies.size:
+                    has_candy = held[:, candies].any(1)
+                    kind, has = self._pick(cards.evolve_candy[target][:, :-1] & held & (ready & has_candy)[:, None])
+                    rows = games[has]
+                    if rows.size:
+                        candy = candies[held[rows][:, candies].argmax(1)]
+                        me.hand[rows, candy] -= 1
+                        self._evolve(me, rows, slot, kind[has])
+                        ready[rows] = False
+                        held = me.hand > 0
+                kind, has = self._pick(cards.evolve[target][:, :-1] & held & ready[:, None])
+                self._evolve(me, games[has], slot, kind[has])
+
+        # Tools, active first
+        for kind in np.nonzero(cards.op[:-1] == OP_TOOL_HP)[0]:
+            for slot in range(SLOTS):
+                rows = games[(me.hand[:, kind] > 0) & (me.kind[:, slot] != empty) & (me.tool_hp[:, slot] == 0)]
+                me.hand[rows, kind] -= 1
+                me.tool_hp[rows, slot] = cards.amount[kind]
+
+        # Heal-all abilities, once per Pokemon, when something is damaged
+        occupied = me.kind != empty
+        for slot in range(SLOTS):
+            amount = cards.ability_heal[me.kind[:, slot]]
+            rows = games[(amount > 0) & ((me.damage > 0) & occupied).any(1)]
+            if rows.size:
+                me.damage[rows] = np.maximum(0, me.damage[rows] - amount[rows, None])
+
+        # Heal items, while one heals its full amount
+        for kind in np.nonzero((cards.op[:-1] == OP_HEAL_ONE) & ~cards.is_supporter[:-1])[0]:
+            for _ in range(int(me.hand[:, kind].max(initial=0))):
+                rows = games[(me.hand[:, kind] > 0) & self._heal_target(me, kind)[1]]
+                if rows.size == 0:
+                    break
+                me.hand[rows, kind] -= 1
+                self._play_heal(me, rows, kind)
+
+        # Retreat an active that cannot deal damage for one that can
+        self._retreat(me, games)
+
+        # Energy (the first player skips it on turn 1)
+        if turn > 1:
+            self._attach_energy(me, games)
+
+        # Attack with the strongest affordable attack
+        attacker = me.kind[:, 0]
+        affordable = self._affordable(attacker, me.energy[:, 0])
+        attack = np.where(affordable, cards.damage[attacker], -1).argmax(1)
+        attacking = affordable.any(1) & (attacker != empty) & (opponent.kind[:, 0] != empty) \
+            & (me.status[:, 0] & CANNOT_ATTACK == 0)
+        rows = games[attacking]
+        if rows.size:
+            attack = attack[rows]
+            attacker = attacker[rows]
+            defender = opponent.kind[rows, 0]
+            base = cards.damage[attacker, attack]
+            weak = (base > 0) & (cards.element[attacker] == cards.weakness[defender])
+            opponent.damage[rows, 0] += base + weak * GameRules.WEAKNESS_BONUS
+            # Attack effects, in the order BattleEngine._execute_attack runs them
+            self._heal_slots(me, rows, 0, cards.attack_heal[attacker, attack])
+            for amount in np.unique(cards.attack_draw[attacker, attack]):
+                if amount:
+                    self._draw(me, rows[cards.attack_draw[attacker, attack] == amount], int(amount))
+            opponent.status[rows, 0] |= cards.attack_status[attacker, attack]
+            energy_type = cards.attack_discard_type[attacker, attack]
+            me.energy[rows, 0, energy_type] = np.maximum(
+                0, me.energy[rows, 0, energy_type] - cards.attack_discard[attacker, attack])
+            attaching = cards.attack_attach[attacker, attack] > 0
+            if attaching.any():
+                self._attach_from_zone(me, rows[attaching], cards.attack_attach[attacker, attack][attaching],
+                                       cards.attack_attach_type[attacker, attack][attaching])
+            for search in np.unique(cards.attack_search[attacker, attack]):
+                if search >= 0:
+                    searching = cards.attack_search[attacker, attack] == search
+                    for amount in np.unique(cards.attack_search_amount[attacker, attack][searching]):
+                        self._search(me, rows[searching & (cards.attack_search_amount[attacker, attack] == amount)],
+                                     int(search), int(amount))
+            knocked = rows[opponent.damage[rows, 0] >= self._max_hp(opponent)[rows, 0]]
+            self._knock_out(opponent, me, knocked, 0)
+        over = (me.points >= GameRules.WINNING_POINTS) | ~self._has_pokemon(opponent)
+
+        # End phase for games still running: turn counters, then status conditions
+        rows = games[~over]
+        occupied = me.kind[rows] != empty
+        me.turns[rows] += occupied
+        me.fresh[rows] = False
+        self._apply_status(me, opponent, rows)
+
+        mover_won = (me.points >= GameRules.WINNING_POINTS) | ~self._has_pokemon(opponent)
+        other_won = ~mover_won & ((opponent.points >= GameRules.WINNING_POINTS) | ~self._has_pokemon(me))
+        return mover_won, other_won
+
+    def _evolve(self, side: _Side, rows, slot: int, kind):
+        """Evolve the Pokemon in slot: damage and energy stay, the tool and statuses go"""
+        side.hand[rows, kind] -= 1
+        side.kind[rows, slot] = kind
+        side.fresh[rows, slot] = True
+        side.tool_hp[rows, slot] = 0
+        side.status[rows, slot] = 0
+
+    def _heal_target(self, side: _Side, kind):
+        """Most damaged Pokemon a heal card may target, and whether healing it uses the full amount"""
+        cards = self.cards
+        eligible = side.kind != cards.empty
+        element = cards.heal_element[kind]
+        if element >= 0:
+            eligible &= cards.element[side.kind] == element
+        damage = np.where(eligible, side.damage, 0)
+        slot = damage.argmax(1)
+        return slot, damage.max(1) >= cards.amount[kind]
+
+    def _play_heal(self, side: _Side, rows, kind):
+        slot = self._heal_target(side, kind)[0][rows]
+        self._heal_slots(side, rows, slot, self.cards.amount[kind])
+
+    def _switch_active(self, side: _Side, rows, bench=None):
+        """Swap the active Pokemon with a benched one, by default the first (as SwitchEffect)"""
+        if bench is None:
+            bench = (side.kind[rows, 1:] != self.cards.empty).argmax(1) + 1
+        for name in _Side.SLOT_FIELDS:
+            values = getattr(side, name)
+            active = values[rows, 0].copy()
+            values[rows, 0] = values[rows, bench]
+            values[rows, bench] = active
+
+    def _retreat(self, side: _Side, rows):
+        """Swap an active with no damaging attack for the first benched Pokemon with one, paying
+        the retreat cost in ENERGY_ORDER lane order (as RetreatAction)"""
+        cards = self.cards
+        active = side.kind[rows, 0]
+        damaging = self.target_damage[side.seat[rows, None], side.kind[rows]] > 0
+        cost = cards.retreat_cost[active]
+        able = (active != cards.empty) & ~damaging[:, 0] & damaging[:, 1:].any(1) \
+            & (side.energy[rows, 0].sum(1) >= cost) & (side.status[rows, 0] & PARALYZED == 0)
+        rows, cost = rows[able], cost[able].astype(np.int16)
+        if rows.size == 0:
+            return
+        bench = damaging[able, 1:].argmax(1) + 1
+        for lane in range(len(ENERGY_ORDER)):
+            paid = np.minimum(side.energy[rows, 0, lane], cost)
+            side.energy[rows, 0, lane] -= paid.astype(np.int8)
+            cost -= paid
+        self._switch_active(side, rows, bench)
+
+    def _attach_energy(self, side: _Side, rows):
+        """Energy to the active if it cannot use its target attack yet, else the first such
+        benched Pokemon, else the active"""
+        cards = self.cards
+        kind = side.kind[rows]
+        seat = side.seat[rows, None]
+        best = self.target_attack[seat, kind]
+        needs = (kind != cards.empty) & (self.target_damage[seat, kind] >= 0)
+        for slot in range(SLOTS):
+            affordable = self._affordable(kind[:, slot], side.energy[rows, slot])
+            needs[:, slot] &= ~affordable[np.arange(rows.size), best[:, slot]]
+        slot = np.where(needs[:, 0], 0, np.where(needs.any(1), needs.argmax(1), 0))
+        keep = kind[np.arange(rows.size), slot] != cards.empty
+        rows, slot = rows[keep], slot[keep]
+        side.energy[rows, slot, side.zone[rows]] += 1
+        side.zone[rows] = side.zone_next[rows]
+        side.zone_next[rows] = self._roll_energy(side, rows)
+
+    def _attach_from_zone(self, side: _Side, rows, amount, energy_type):
+        """Attacks taking energy from the zone to the active (EnergyEffect "attach"): while the
+        current energy has the type; when none did, the full amount comes from outside the zone"""
+        attached = np.zeros(rows.size, np.int8)
+        taking = np.ones(rows.size, bool)
+        for step in range(int(amount.max())):
+            taking &= (step < amount) & (side.zone[rows] == energy_type)
+            take = rows[taking]
+            if take.size == 0:
+                break
+            side.zone[take] = side.zone_next[take]
+            side.zone_next[take] = self._roll_energy(side, take)
+            attached += taking
+        attached = np.where(attached == 0, amount, attached)
+        side.energy[rows, 0, energy_type] += attached
+
+    def _apply_status(self, side: _Side, opponent: _Side, rows):
+        """Status conditions of the player whose turn ends (as BattleEngine._apply_status_effects)"""
+        status = side.status[rows]
+        if not status.any():
+            return
+        heads = self.rng.random(status.shape) < 0.5
+        damage = 10 * ((status & POISONED) > 0) + 20 * (((status & BURNED) > 0) & heads)
+        side.damage[rows] += damage.astype(np.int16)
+        cured = ((status & BURNED) > 0) & ~heads
+        woke = ((status & ASLEEP) > 0) & (self.rng.random(status.shape) < 0.5)
+        status &= ~(BURNED * cured + ASLEEP * woke + PARALYZED).astype(np.uint8)
+        side.status[rows] = status
+        knocked = (side.damage[rows] >= self._max_hp(side)[rows]) & (side.kind[rows] != self.cards.empty)
+        # Bench first so an active knockout promotes a survivor
+        for slot in range(SLOTS - 1, -1, -1):
+            self._knock_out(side, opponent, rows[knocked[:, slot]], slot)
+
+
+def simulate_matchup(deck1: Sequence[Card], deck2: Sequence[Card], energy1_types: Sequence[str],
+                     energy2_types: Sequence[str], games: int, seed: Optional[int] = None,
+                     workers: Optional[int] = 1, allow_fallback: bool = False) -> LockstepResult:
+    """Play a matchup on the lockstep kernel.
+
+    When numpy is missing or a card is not supported this raises UnsupportedMatchupError,
+    since the only other way to play the batch is as BattleEngine games with RandomAgent
+    on both seats - another policy (and the engine's own rules), so its win rates are not
+    comparable with kernel results. With allow_fallback those games are played instead
+    (across `workers` processes) and the result is marked engine="scalar".
+    """
+    if np is not None:
+        cards = KernelCards(deck1, deck2)
+        if cards.supported:
+            return LockstepBattle(deck1, deck2, energy1_types, energy2_types, cards).run(games, seed)
+        unsupported = cards.unsupported
+    else:
+        unsupported = [("*", "numpy is not installed")]
+    if not allow_fallback:
+        raise UnsupportedMatchupError(unsupported)
+    runner = BatchRunner(GameConfig(list(deck1), list(deck2), list(energy1_types), list(energy2_types)),
+                         workers=workers, seed=seed)
+    return LockstepResult.from_game_results(list(runner.iter_results(games)), unsupported)
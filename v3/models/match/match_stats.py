@@ -0,0 +1,94 @@
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+"""Confidence intervals and sequential stopping rules for simulated win rates"""
+
+Z_95 = 1.959964  # Two-sided 95% normal quantile
+
+
+def wilson_interval(successes: float, trials: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval for a proportion (successes may be fractional, e.g. draws as half wins).
+
+    Unlike the normal approximation it stays inside [0, 1] and behaves at 0 or trials
+    successes; with no trials the interval is (0, 1).
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    z2 = z * z
+    denominator = 1 + z2 / trials
+    center = (p + z2 / (2 * trials)) / denominator
+    margin = z * math.sqrt(max(p * (1 - p), 0.0) / trials + z2 / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def mean_interval(values: Sequence[float], z: float = Z_95) -> Tuple[float, float]:
+    """Normal interval for the mean of values, e.g. per-tape score differences of a paired run"""
+    n = len(values)
+    if n == 0:
+        return -math.inf, math.inf
+    mean = sum(values) / n
+    if n == 1:
+        return mean, mean
+    variance = sum((value - mean) ** 2 for value in values) / (n - 1)
+    margin = z * math.sqrt(variance / n)
+    return mean - margin, mean + margin
+
+
+def sprt_llr(wins: int, losses: int, p0: float, p1: float) -> float:
+    """Log-likelihood ratio of win probability p1 against p0 after wins and losses"""
+    return wins * math.log(p1 / p0) + losses * math.log((1 - p1) / (1 - p0))
+
+
+@dataclass
+class SequentialStop:
+    """When a batch of games may end before its game budget runs out.
+
+    precision: stop once the Wilson interval of every outcome rate (Player 1 wins, Player 2
+    wins, draws) is at most this wide either side of its estimate.
+    sprt_delta: Wald's sequential probability ratio test on decisive games, Player 1
+    winning with probability 0.5 - delta (H0) against 0.5 + delta (H1), at error rates
+    alpha and beta; stops once either seat is shown to be the favorite.
+
+    With both set, whichever is met first stops the batch. Nothing stops before min_games.
+    """
+    precision: Optional[float] = None
+    sprt_delta: Optional[float] = None
+    alpha: float = 0.05
+    beta: float = 0.05
+    min_games: int = 100
+    z: float = Z_95
+
+    def __post_init__(self):
+        if self.precision is None and self.sprt_delta is None:
+            raise ValueError("SequentialStop needs a precision, an sprt_delta or both")
+        if self.precision is not None and not 0 < self.precision < 0.5:
+            raise ValueError(f"precision must be between 0 and 0.5, got {self.precision}")
+        if self.sprt_delta is not None and not 0 < self.sprt_delta < 0.5:
+            raise ValueError(f"sprt_delta must be between 0 and 0.5, got {self.sprt_delta}")
+
+    def sprt_bounds(self) -> Tuple[float, float]:
+        """(lower, upper) log-likelihood ratio bounds: accept H0 below, H1 above"""
+        return math.log(self.beta / (1 - self.alpha)), math.log((1 - self.beta) / self.alpha)
+
+    def half_width(self, wins: int, losses: int, draws: int) -> float:
+        """Widest interval half-width over the three outcome rates"""
+        games = wins + losses + draws
+        intervals = [wilson_interval(count, games, self.z) for count in (wins, losses, draws)]
+        return max(high - low for low, high in intervals) / 2
+
+    def decision(self, wins: int, losses: int, draws: int) -> Optional[str]:
+        """Why the batch can stop after these Player 1 wins, losses and draws, or None to go on"""
+        if wins + losses + draws < self.min_games:
+            return None
+        if self.sprt_delta is not None:
+            llr = sprt_llr(wins, losses, 0.5 - self.sprt_delta, 0.5 + self.sprt_delta)
+            lower, upper = self.sprt_bounds()
+            if llr >= upper:
+                return "sprt: Player 1 favored"
+            if llr <= lower:
+                return "sprt: Player 2 favored"
+        if self.precision is not None and self.half_width(wins, losses, draws) <= self.precision:
+            return "precision"
+        return None
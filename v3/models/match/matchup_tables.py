@@ -0,0 +1,137 @@
+"""Precomputed damage, prize and affordability tables for one pair of decks.
+
+Built once per deck pair (MatchupTables.for_decks) and shared by every game between
+them. Entries are keyed by card definition, which every copy of a card shares, so a
+lookup is one dict access. Definitions not in the decks (e.g. a card whose stats were
+changed mid-game) are computed on first use and added to the tables.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from v3.models.cards.card import CardDefinition
+from v3.models.cards.energy_math import EnergyCounter, pack
+from v3.models.cards.pokemon import Pokemon
+from v3.models.match.game_rules import GameRules
+
+# Tables for recently used deck pairs (decks are usually reused for a whole batch)
+_MAX_SHARED = 16
+_shared_tables: Dict[Tuple[int, ...], 'MatchupTables'] = {}
+
+
+def attack_base_damage(attack) -> int:
+    """Printed damage of attack as the battle engine reads it (0 for text like "30+")"""
+    if isinstance(attack.damage, int):
+        return attack.damage
+    return int(attack.damage) if str(attack.damage).isdigit() else 0
+
+
+def _prize_value(definition: CardDefinition) -> int:
+    if definition.is_ex or definition.name.endswith(' ex'):
+        return 2
+    return 1
+
+
+class MatchupTables:
+    """Per-definition and per attacker/defender pair lookups for the Pokemon in two decks"""
+
+    def __init__(self, pokemon: Iterable[Pokemon] = ()):
+        self.definitions: List[CardDefinition] = []
+        self._base_damage: Dict[CardDefinition, Tuple[int, ...]] = {}
+        self._max_damage: Dict[CardDefinition, int] = {}
+        self._prize_value: Dict[CardDefinition, int] = {}
+        # (attacker, defender) -> damage of each attack with weakness applied
+        self._damage: Dict[Tuple[CardDefinition, CardDefinition], Tuple[int, ...]] = {}
+        # (definition, packed energy) -> indices of the attacks that energy pays for
+        self._affordable: Dict[Tuple[CardDefinition, int], Tuple[int, ...]] = {}
+        for card in pokemon:
+            self._add(card.definition)
+        for attacker in self.definitions:
+            for defender in self.definitions:
+                self._add_pair(attacker, defender)
+
+    @classmethod
+    def from_decks(cls, deck1: Iterable, deck2: Iterable) -> 'MatchupTables':
+        """Tables for every Pokemon in two decklists (trainer cards are skipped)"""
+        return cls(card for deck in (deck1, deck2) for card in deck if isinstance(card, Pokemon))
+
+    @classmethod
+    def for_decks(cls, deck1: Iterable, deck2: Iterable) -> 'MatchupTables':
+        """Shared tables for two decklists, built on first use in this process"""
+        deck1, deck2 = list(deck1), list(deck2)
+        key = tuple(id(card.definition) for deck in (deck1, deck2) for card in deck)
+        tables = _shared_tables.get(key)
+        if tables is None:
+            if len(_shared_tables) >= _MAX_SHARED:
+                _shared_tables.pop(next(iter(_shared_tables)))
+            tables = _shared_tables[key] = cls.from_decks(deck1, deck2)
+        return tables
+
+    def _add(self, definition: CardDefinition):
+        if definition in self._prize_value:
+            return
+        self.definitions.append(definition)
+        damages = tuple(attack_base_damage(attack) for attack in definition.attacks)
+        self._base_damage[definition] = damages
+        self._max_damage[definition] = max(damages, default=0)
+        self._prize_value[definition] = _prize_value(definition)
+
+    def _add_pair(self, attacker: CardDefinition, defender: CardDefinition) -> Tuple[int, ...]:
+        self._add(attacker)
+        self._add(defender)
+        damages = self._base_damage[attacker]
+        if defender.weakness and attacker.element == defender.weakness:
+            # No weakness bonus for attacks that do no damage
+            damages = tuple(damage + GameRules.WEAKNESS_BONUS if damage > 0 else damage for damage in damages)
+        self._damage[(attacker, defender)] = damages
+        return damages
+
+    def base_damage(self, pokemon: Pokemon) -> Tuple[int, ...]:
+        """Printed damage of each of pokemon's attacks"""
+        damages = self._base_damage.get(pokemon.definition)
+        if damages is None:
+            self._add(pokemon.definition)
+            damages = self._base_damage[pokemon.definition]
+        return damages
+
+    def max_damage(self, pokemon: Pokemon) -> int:
+        """Highest printed damage among pokemon's attacks (0 without attacks)"""
+        damage = self._max_damage.get(pokemon.definition)
+        if damage is None:
+            self._add(pokemon.definition)
+            damage = self._max_damage[pokemon.definition]
+        return damage
+
+    def prize_value(self, pokemon: Pokemon) -> int:
+        """Prize points for knocking out pokemon (see GameRules.calculate_prize_value)"""
+        value = self._prize_value.get(pokemon.definition)
+        if value is None:
+            self._add(pokemon.definition)
+            value = self._prize_value[pokemon.definition]
+        return value
+
+    def damage(self, attacker: Pokemon, defender: Pokemon) -> Tuple[int, ...]:
+        """Damage of each of attacker's attacks against defender, weakness included.
+
+        Per-game modifiers (damage_nerf, effects) are not part of the table.
+        """
+        damages = self._damage.get((attacker.definition, defender.definition))
+        if damages is None:
+            damages = self._add_pair(attacker.definition, defender.definition)
+        return damages
+
+    def knocks_out(self, attacker: Pokemon, attack_index: int, defender: Pokemon) -> bool:
+        """True if the attack's table damage (after attacker's damage_nerf) knocks out defender now"""
+        damage = self.damage(attacker, defender)[attack_index]
+        return max(0, damage - attacker.damage_nerf) >= defender.current_health()
+
+    def affordable_attacks(self, pokemon: Pokemon) -> Tuple[int, ...]:
+        """Indices of the attacks pokemon's attached energy pays for"""
+        energies = pokemon.equipped_energies
+        packed = energies.packed if type(energies) is EnergyCounter else pack(energies)
+        key = (pokemon.definition, packed)
+        indices = self._affordable.get(key)
+        if indices is None:
+            counter = energies if type(energies) is EnergyCounter else EnergyCounter(energies)
+            indices = tuple(i for i, attack in enumerate(pokemon.attacks) if counter.can_afford(attack.requirement))
+            self._affordable[key] = indices
+        return indices
+
@@ -1,5 +1,6 @@
 from v3.models.agents.random_agent import RandomAgent
 
+import copy
 import random
 from typing import Optional, List
 from v3.models.agents.random_agent import RandomAgent as BotRandomAgent
@@ -7,11 +8,21 @@ from v3.models.agents.agent import Agent
 from v3.models.cards.pokemon import Pokemon
 from v3.models.cards.card import Card
 from v3.models.cards.energy import Energy
+from v3.models.cards import energy_math
 from v3.models.match.energy_zone import EnergyZone
+from v3.models.match.legal_actions import LegalActionCache
+from v3.models.match.actions import (
+    Action, EndTurnAction, PlayPokemonAction, AttachEnergyAction, AttackAction,
+    EvolveAction, RetreatAction, PlayItemAction, PlaySupporterAction, AttachToolAction, UseAbilityAction,
+)
 
 class Player:
-    def __init__(self, name: str, deck: list[Card], chosen_energies: list[Energy.Type], agent: Agent = None):
+    _EVOLUTION_SUBTYPES = (Card.Subtype.STAGE_1, Card.Subtype.STAGE_2)
+    
+    def __init__(self, name: str, deck: list[Card], chosen_energies: list[Energy.Type], agent: Agent = None,
+                 rng: Optional[random.Random] = None):
         self.name: str = name # Name of the player
+        self.rng = rng if rng is not None else random # Random stream for deck shuffles
         self.deck: list[Card] = deck # Original deck that the player has
         
         # Validate that chosen_energies is provided and not empty
@@ -27,7 +38,7 @@ class Player:
         # Note: Colorless energy requirements can be fulfilled by ANY energy type
         # So we don't need to add Normal/Colorless to the energy zone
         # The energy zone should only contain the energy types specified by the deck
-        self.energy_zone = EnergyZone(chosen_energies)
+        self.energy_zone = EnergyZone(chosen_energies, rng=rng)
 
         # Tracking the player's cards
         self.cards_in_hand: list[Card] = []
@@ -42,6 +53,7 @@ class Player:
         self.played_pokemon_this_turn: bool = False  # Limit: 1 Pokemon per turn
         self.used_rare_candy_this_turn: bool = False  # Track Rare Candy usage
         self.can_attack_next_turn: bool = True  # Can be set to False by effects like Tail Whip
+        self._legal_actions = LegalActionCache()  # Validated actions per family, see get_legal_actions
 
         # Methods to be called at the start of the game
         self._initialize_deck(deck)
@@ -79,120 +91,157 @@ class Player:
     
     def _get_turn_zero_actions(self) -> List[str]:
         """Get actions available during turn zero (only play Basic Pokemon)"""
+        return [action.to_string() for action in self._generate_turn_zero_actions()]
+    
+    def _generate_turn_zero_actions(self) -> List[Action]:
+        """Turn zero actions as Action objects (only play Basic Pokemon, or end turn)"""
         actions = []
         
         # Can only play Basic Pokemon
-        for card in self.cards_in_hand:
+        has_empty_bench = any(bench_pokemon is None for bench_pokemon in self.bench_pokemons)
+        for i, card in enumerate(self.cards_in_hand):
             if isinstance(card, Pokemon) and card.subtype == Card.Subtype.BASIC:
                 # Can play to active if empty
                 if self.active_pokemon is None:
-                    actions.append(f"play_pokemon_{card.id}_active")
+                    actions.append(PlayPokemonAction(card.id, "active", hand_index=i))
                 
                 # Can play to bench if slots available (will auto-fill from 0, 1, 2)
-                if any(bench_pokemon is None for bench_pokemon in self.bench_pokemons):
-                    actions.append(f"play_pokemon_{card.id}_bench")
+                if has_empty_bench:
+                    actions.append(PlayPokemonAction(card.id, "bench", hand_index=i))
         
         # Can always end turn
-        actions.append("end_turn")
+        actions.append(EndTurnAction())
         
         return actions
     
     def _get_actions(self, opponent_pokemon_locations: List[int] = None) -> List[str]:
         """Get all valid actions for current turn"""
+        return [action.to_string() for action in self._generate_actions()]
+    
+    def _generate_actions(self) -> List[Action]:
+        """Candidate actions for the current turn as Action objects (not yet validated)"""
         actions = []
         
         # Play Pokemon
-        actions.extend(self._get_play_pokemon_actions())
+        actions.extend(self._generate_play_pokemon_actions())
         
         # Attach Energy
-        actions.extend(self._get_attach_energy_actions())
+        actions.extend(self._generate_attach_energy_actions())
         
         # Evolve
-        actions.extend(self._get_evolve_actions())
+        actions.extend(self._generate_evolve_actions())
         
         # Retreat
-        actions.extend(self._get_retreat_actions())
+        actions.extend(self._generate_retreat_actions())
         
         # Play Trainers
-        actions.extend(self._get_play_item_actions())
-        actions.extend(self._get_play_supporter_actions())
-        actions.extend(self._get_attach_tool_actions())
+        actions.extend(self._generate_play_item_actions())
+        actions.extend(self._generate_play_supporter_actions())
+        actions.extend(self._generate_attach_tool_actions())
         
         # Use Abilities
-        actions.extend(self._get_use_ability_actions())
+        actions.extend(self._generate_use_ability_actions())
         
         # Attack
-        actions.extend(self._get_attack_actions())
+        actions.extend(self._generate_attack_actions())
         
         # End Turn
-        actions.append("end_turn")
+        actions.append(EndTurnAction())
         
         return actions
     
+    def get_legal_actions(self, battle_engine) -> List[Action]:
+        """Validated main phase actions - attacks first, end turn last.
+        
+        Families of actions whose inputs did not change since the last call are reused
+        (see LegalActionCache), so calling this after every action stays cheap.
+        """
+        return self._legal_actions.legal_actions(self, battle_engine)
+    
     def _get_play_pokemon_actions(self) -> List[str]:
         """Get actions to play Pokemon from hand"""
+        return [action.to_string() for action in self._generate_play_pokemon_actions()]
+    
+    def _generate_play_pokemon_actions(self) -> List[Action]:
         actions = []
-        for card in self.cards_in_hand:
+        # Check if there's any empty bench slot (will auto-fill from 0, 1, 2)
+        has_empty_bench = any(bench_pokemon is None for bench_pokemon in self.bench_pokemons)
+        for i, card in enumerate(self.cards_in_hand):
             if isinstance(card, Pokemon) and card.subtype == Card.Subtype.BASIC:
                 if self.active_pokemon is None:
-                    actions.append(f"play_pokemon_{card.id}_active")
-                # Check if there's any empty bench slot (will auto-fill from 0, 1, 2)
-                if any(bench_pokemon is None for bench_pokemon in self.bench_pokemons):
-                    actions.append(f"play_pokemon_{card.id}_bench")
+                    actions.append(PlayPokemonAction(card.id, "active", hand_index=i))
+                if has_empty_bench:
+                    actions.append(PlayPokemonAction(card.id, "bench", hand_index=i))
         return actions
     
     def _get_attach_energy_actions(self) -> List[str]:
         """Get actions to attach energy"""
+        return [action.to_string() for action in self._generate_attach_energy_actions()]
+    
+    def _generate_attach_energy_actions(self) -> List[Action]:
         actions = []
         if self.energy_zone.has_energy():
             if self.active_pokemon:
-                actions.append("attach_energy_active")
+                actions.append(AttachEnergyAction("active"))
             for i, bench_pokemon in enumerate(self.bench_pokemons):
                 if bench_pokemon:
-                    actions.append(f"attach_energy_bench_{i}")
+                    actions.append(AttachEnergyAction(f"bench_{i}"))
         return actions
     
     def _get_attack_actions(self) -> List[str]:
         """Get actions to attack"""
+        return [action.to_string() for action in self._generate_attack_actions()]
+    
+    def _generate_attack_actions(self) -> List[Action]:
         actions = []
         if self.active_pokemon:
             # Get all attacks and check which ones are possible
+            energies = self.active_pokemon.equipped_energies
             for i, attack in enumerate(self.active_pokemon.attacks):
-                if self.active_pokemon._can_afford_attack(attack):
-                    actions.append(f"attack_{i}")
+                if energy_math.can_afford(energies, attack.requirement):
+                    actions.append(AttackAction(i))
         return actions
     
     def _get_evolve_actions(self) -> List[str]:
         """Get actions to evolve Pokemon"""
+        return [action.to_string() for action in self._generate_evolve_actions()]
+    
+    def _generate_evolve_actions(self) -> List[Action]:
         actions = []
         from v3.models.match.game_rules import GameRules
         
-        for card in self.cards_in_hand:
-            if isinstance(card, Pokemon):
-                # Check if can evolve active
-                if self.active_pokemon and GameRules.can_evolve(self.active_pokemon, card):
-                    if self.active_pokemon.turns_in_play >= 1:
-                        actions.append(f"evolve_{card.id}_active")
-                
-                # Check if can evolve bench Pokemon
-                for i, bench_pokemon in enumerate(self.bench_pokemons):
-                    if bench_pokemon and GameRules.can_evolve(bench_pokemon, card):
-                        if bench_pokemon.turns_in_play >= 1:
-                            actions.append(f"evolve_{card.id}_bench_{i}")
+        # Only Pokemon in play since last turn can evolve (can_evolve checks this too)
+        targets = [("active", self.active_pokemon)]
+        targets.extend((f"bench_{i}", p) for i, p in enumerate(self.bench_pokemons))
+        targets = [(location, p) for location, p in targets if p and p.turns_in_play >= 1]
+        if not targets:
+            return actions
+        
+        # After Rare Candy a Stage 2 may also go straight onto a Basic of its line
+        rare_candy = self.used_rare_candy_this_turn
+        for hand_index, card in enumerate(self.cards_in_hand):
+            # Only Stage 1 and Stage 2 cards evolve anything
+            if isinstance(card, Pokemon) and card.subtype in self._EVOLUTION_SUBTYPES:
+                for location, pokemon in targets:
+                    if GameRules.can_evolve(pokemon, card, allow_rare_candy=rare_candy):
+                        actions.append(EvolveAction(card.id, location, hand_index=hand_index))
         return actions
     
     def _get_retreat_actions(self) -> List[str]:
         """Get actions to retreat active Pokemon"""
+        return [action.to_string() for action in self._generate_retreat_actions()]
+    
+    def _generate_retreat_actions(self) -> List[Action]:
         actions = []
         if self.active_pokemon and self.active_pokemon.can_retreat():
             retreat_cost = self.active_pokemon.retreat_cost
-            total_energy = sum(self.active_pokemon.equipped_energies.values())
+            total_energy = energy_math.total(self.active_pokemon.equipped_energies)
             
             if total_energy >= retreat_cost:
                 # Find empty bench slots
                 for i, bench_pokemon in enumerate(self.bench_pokemons):
                     if bench_pokemon is None:
-                        actions.append(f"retreat_{i}")
+                        actions.append(RetreatAction(i))
         return actions
     
     def _get_discard_actions(self) -> List[str]:
@@ -205,133 +254,103 @@ class Player:
     
     def _get_play_item_actions(self) -> List[str]:
         """Get actions to play Item cards"""
+        return [action.to_string() for action in self._generate_play_item_actions()]
+    
+    def _generate_play_item_actions(self) -> List[Action]:
         actions = []
         from v3.models.cards.item import Item
-        from v3.models.match.effects import EffectParser
-        from v3.models.match.effects.heal_effect import HealEffect
-        from v3.models.match.effects.heal_all_effect import HealAllEffect
         
         if self.can_play_trainer:
-            for card in self.cards_in_hand:
+            for i, card in enumerate(self.cards_in_hand):
                 if isinstance(card, Item):
-                    # Check if this is a healing item
-                    if self._has_healing_effect(card):
-                        # Only show if there are damaged Pokemon to heal
-                        # Parse the effect to get type restrictions
-                        effects = EffectParser.parse_multiple(card.ability.effect)
-                        has_healable_pokemon = False
-                        for effect in effects:
-                            if isinstance(effect, (HealEffect, HealAllEffect)):
-                                if self._has_damaged_pokemon_to_heal(effect):
-                                    has_healable_pokemon = True
-                                    break
-                        if not has_healable_pokemon:
-                            continue  # Skip this healing item
-                    actions.append(f"play_item_{card.id}")
+                    # Healing items are only offered when something can be healed
+                    if self._has_healing_effect(card) and not self._can_heal_with(card.ability.effects):
+                        continue
+                    actions.append(PlayItemAction(card.id, hand_index=i))
         return actions
     
     def _get_play_supporter_actions(self) -> List[str]:
         """Get actions to play Supporter cards"""
+        return [action.to_string() for action in self._generate_play_supporter_actions()]
+    
+    def _generate_play_supporter_actions(self) -> List[Action]:
         actions = []
         from v3.models.cards.supporter import Supporter
-        from v3.models.match.effects import EffectParser
-        from v3.models.match.effects.heal_effect import HealEffect
-        from v3.models.match.effects.heal_all_effect import HealAllEffect
         
         if self.can_play_trainer and not self.played_supporter_this_turn:
-            for card in self.cards_in_hand:
+            for i, card in enumerate(self.cards_in_hand):
                 if isinstance(card, Supporter):
-                    # Check if this is a healing supporter
-                    if self._has_healing_effect(card):
-                        # Only show if there are damaged Pokemon to heal
-                        # Parse the effect to get type restrictions
-                        effects = EffectParser.parse_multiple(card.ability.effect)
-                        has_healable_pokemon = False
-                        for effect in effects:
-                            if isinstance(effect, (HealEffect, HealAllEffect)):
-                                if self._has_damaged_pokemon_to_heal(effect):
-                                    has_healable_pokemon = True
-                                    break
-                        if not has_healable_pokemon:
-                            continue  # Skip this healing supporter
-                    actions.append(f"play_supporter_{card.id}")
+                    # Healing supporters are only offered when something can be healed
+                    if self._has_healing_effect(card) and not self._can_heal_with(card.ability.effects):
+                        continue
+                    actions.append(PlaySupporterAction(card.id, hand_index=i))
         return actions
     
     def _get_attach_tool_actions(self) -> List[str]:
         """Get actions to attach Tool cards"""
+        return [action.to_string() for action in self._generate_attach_tool_actions()]
+    
+    def _generate_attach_tool_actions(self) -> List[Action]:
         actions = []
         from v3.models.cards.tool import Tool
         if self.can_play_trainer:
-            for card in self.cards_in_hand:
+            for hand_index, card in enumerate(self.cards_in_hand):
                 if isinstance(card, Tool):
                     # Can attach to active
                     if self.active_pokemon and self.active_pokemon.poketool is None:
-                        actions.append(f"attach_tool_{card.id}_active")
+                        actions.append(AttachToolAction(card.id, "active", hand_index=hand_index))
                     # Can attach to bench Pokemon
                     for i, bench_pokemon in enumerate(self.bench_pokemons):
                         if bench_pokemon and bench_pokemon.poketool is None:
-                            actions.append(f"attach_tool_{card.id}_bench_{i}")
+                            actions.append(AttachToolAction(card.id, f"bench_{i}", hand_index=hand_index))
         return actions
     
     def _get_use_ability_actions(self) -> List[str]:
         """Get actions to use Pokemon abilities"""
+        return [action.to_string() for action in self._generate_use_ability_actions()]
+    
+    def _generate_use_ability_actions(self) -> List[Action]:
         actions = []
-        from v3.models.match.effects import EffectParser
         from v3.models.match.effects.heal_effect import HealEffect
         from v3.models.match.effects.heal_all_effect import HealAllEffect
         
-        # Check active Pokemon
-        if self.active_pokemon and not self.active_pokemon.used_ability_this_turn:
-            for i, ability in enumerate(self.active_pokemon.abilities):
-                # Check if this ability has a healing effect
+        locations = [("active", self.active_pokemon)]
+        locations.extend((f"bench_{i}", p) for i, p in enumerate(self.bench_pokemons))
+        for location, pokemon in locations:
+            if not pokemon or pokemon.used_ability_this_turn:
+                continue
+            for i, ability in enumerate(pokemon.abilities):
+                # Healing abilities are only offered when something can be healed
                 if ability and ability.effect:
-                    effects = EffectParser.parse_multiple(ability.effect)
+                    effects = ability.effects
                     is_healing_ability = any(isinstance(e, (HealEffect, HealAllEffect)) for e in effects)
-                    if is_healing_ability:
-                        # Only show if there are damaged Pokemon to heal
-                        has_healable_pokemon = False
-                        for effect in effects:
-                            if isinstance(effect, (HealEffect, HealAllEffect)):
-                                if self._has_damaged_pokemon_to_heal(effect):
-                                    has_healable_pokemon = True
-                                    break
-                        if not has_healable_pokemon:
-                            continue  # Skip this healing ability
-                actions.append(f"use_ability_active_{i}")
-        
-        # Check bench Pokemon
-        for bench_idx, bench_pokemon in enumerate(self.bench_pokemons):
-            if bench_pokemon and not bench_pokemon.used_ability_this_turn:
-                for i, ability in enumerate(bench_pokemon.abilities):
-                    # Check if this ability has a healing effect
-                    if ability and ability.effect:
-                        effects = EffectParser.parse_multiple(ability.effect)
-                        is_healing_ability = any(isinstance(e, (HealEffect, HealAllEffect)) for e in effects)
-                        if is_healing_ability:
-                            # Only show if there are damaged Pokemon to heal
-                            has_healable_pokemon = False
-                            for effect in effects:
-                                if isinstance(effect, (HealEffect, HealAllEffect)):
-                                    if self._has_damaged_pokemon_to_heal(effect):
-                                        has_healable_pokemon = True
-                                        break
-                            if not has_healable_pokemon:
-                                continue  # Skip this healing ability
-                    actions.append(f"use_ability_bench_{bench_idx}_{i}")
+                    if is_healing_ability and not self._can_heal_with(effects):
+                        continue
+                actions.append(UseAbilityAction(location, i))
         
         return actions
 
+    def _can_heal_with(self, effects) -> bool:
+        """Check if any healing effect in the list has a damaged Pokemon to heal"""
+        from v3.models.match.effects.heal_effect import HealEffect
+        from v3.models.match.effects.heal_all_effect import HealAllEffect
+        
+        for effect in effects:
+            if isinstance(effect, (HealEffect, HealAllEffect)):
+                if self._has_damaged_pokemon_to_heal(effect):
+                    return True
+        return False
+
     def _has_healing_effect(self, card) -> bool:
         """Check if a card (Item/Supporter) has a healing effect"""
-        from v3.models.match.effects import EffectParser
         from v3.models.match.effects.heal_effect import HealEffect
         from v3.models.match.effects.heal_all_effect import HealAllEffect
         
         if not card.ability or not card.ability.effect:
             return False
         
-        # Parse the effect to see if it's a healing effect
-        effects = EffectParser.parse_multiple(card.ability.effect)
+        # Check the (precompiled) effects for a healing effect
+        effects = card.ability.effects
         for effect in effects:
             if isinstance(effect, (HealEffect, HealAllEffect)):
                 return True
@@ -444,7 +463,42 @@ class Player:
 
     def _shuffle_deck(self):
         # Ensure all cards in deck have DECK position
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
+
+    def set_rng(self, rng: random.Random, agent_rng: Optional[random.Random] = None,
+                energy_rng: Optional[random.Random] = None):
+        """Route this player's randomness (shuffles, energy zone, agent) through the given streams"""
+        self.rng = rng
+        self.energy_zone.rng = energy_rng if energy_rng is not None else rng
+        if self.agent is not None:
+            self.agent.rng = agent_rng if agent_rng is not None else rng
+    
+    def clone(self, rng: random.Random, memo: Optional[dict] = None) -> 'Player':
+        """Copy of this player's game state (zones, energy zone, flags) bound to rng.
+        
+        Cards are copied through memo (see Card.clone); the agent is copied and re-bound
+        to the new player with a copy of its random stream.
+        """
+        memo = {} if memo is None else memo
+        player = copy.copy(self)
+        player.deck = [card.clone(memo) for card in self.deck]
+        player.cards_in_hand = [card.clone(memo) for card in self.cards_in_hand]
+        player.discard_pile = [card.clone(memo) for card in self.discard_pile]
+        player.active_pokemon = self.active_pokemon.clone(memo) if self.active_pokemon else None
+        player.bench_pokemons = [p.clone(memo) if p else None for p in self.bench_pokemons]
+        player.rng = rng
+        player.energy_zone = self.energy_zone.clone(rng)
+        player._legal_actions = LegalActionCache()
+        
+        if self.agent is not None:
+            agent = copy.copy(self.agent)
+            agent.player = player
+            agent_rng = getattr(self.agent, 'rng', None)
+            if isinstance(agent_rng, random.Random):
+                agent.rng = random.Random()
+                agent.rng.setstate(agent_rng.getstate())
+            player.agent = agent
+        return player
 
 
 
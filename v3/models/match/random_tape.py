@@ -0,0 +1,46 @@
+import random
+from dataclasses import dataclass
+
+"""Randomness tapes: one game's random streams, split by purpose so two games can share them"""
+
+
+@dataclass(frozen=True)
+class RandomTape:
+    """The random streams of one game, each derived from seed and its purpose alone.
+
+    A plain seeded BattleEngine draws every random decision from one stream, so as soon
+    as two games differ (another deck, another agent) every later shuffle, energy roll
+    and coin flip differs too. A tape gives each purpose its own pre-determined stream:
+
+    - first_player: the opening coin toss, by seat
+    - shuffle_rng(seat): that seat's deck shuffles (equal-size decks get the same permutations)
+    - energy_rng(seat): that seat's Energy Zone rolls
+    - coin_rng(): coin flips, status checks and random effect picks
+    - agent_rng(seat): that seat's agent
+
+    Games played on the same tape (BattleEngine(..., tape=...)) therefore see the same
+    randomness seat by seat however their decisions differ - common random numbers for
+    comparing two decks or agents (see batch_runner.run_paired). Streams are keyed by
+    strings, so a tape repeats across processes and Python runs.
+    """
+    seed: int
+
+    def _stream(self, purpose: str, seat: int = -1) -> random.Random:
+        return random.Random(f"tape:{self.seed}:{purpose}:{seat}")
+
+    @property
+    def first_player(self) -> int:
+        """Seat that goes first"""
+        return self._stream("first").randint(0, 1)
+
+    def shuffle_rng(self, seat: int) -> random.Random:
+        return self._stream("shuffle", seat)
+
+    def energy_rng(self, seat: int) -> random.Random:
+        return self._stream("energy", seat)
+
+    def coin_rng(self) -> random.Random:
+        return self._stream("coin")
+
+    def agent_rng(self, seat: int) -> random.Random:
+        return self._stream("agent", seat)
@@ -0,0 +1,240 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed to build state arrays
+    np = None
+
+import v2.game.ids.state as layout
+from v2.game.ids.state import STATE_SIZE
+from v2.game.ids.energy import ENERGY_TYPES
+from v3.models.cards.card import Card
+from v3.models.cards.energy import Energy
+from v3.models.match.status_effects.poisoned import Poisoned
+from v3.models.match.status_effects.burned import Burned
+from v3.models.match.status_effects.paralyzed import Paralyzed
+from v3.models.match.status_effects.asleep import Asleep
+from v3.models.match.status_effects.confused import Confused
+
+if TYPE_CHECKING:
+    from v3.models.cards.pokemon import Pokemon
+    from v3.models.match.battle_engine import BattleEngine
+    from v3.models.match.player import Player
+
+"""Flat float32 state encoding of a v3 game, using the v2 state index layout (v2/game/ids/state.py)"""
+
+# v2 energy names in layout order (grass .. normal) and the v3 type stored in each
+_ENERGY_NAMES = sorted(ENERGY_TYPES, key=ENERGY_TYPES.get)
+_V3_ENERGY = {
+    "Grass": Energy.Type.GRASS,
+    "Fire": Energy.Type.FIRE,
+    "Water": Energy.Type.WATER,
+    "Lightning": Energy.Type.ELECTRIC,
+    "Psychic": Energy.Type.PSYCHIC,
+    "Fighting": Energy.Type.ROCK,
+    "Darkness": Energy.Type.DARK,
+    "Metal": Energy.Type.METAL,
+    "Fairy": None,  # Not in v3
+    "Normal": Energy.Type.NORMAL,
+}
+ENERGY_ORDER = [_V3_ENERGY[name] for name in _ENERGY_NAMES]
+
+# Energy type -> value stored in element / weakness / energy zone fields (same values as v2)
+ENERGY_CODES = {_V3_ENERGY[name]: ENERGY_TYPES[name] for name in _ENERGY_NAMES if _V3_ENERGY[name]}
+
+STAGE_CODES = {Card.Subtype.BASIC: 0, Card.Subtype.STAGE_1: 1, Card.Subtype.STAGE_2: 2}
+
+# Layout order of the status flags (v3 has no Frozen)
+STATUS_ORDER = [Poisoned, Burned, Paralyzed, Asleep, Confused]
+
+# Per-card fields that never change during a game
+STATIC_FIELDS = ["id", "element", "stage", "attack_1", "attack_2", "retreat_cost",
+                 "weakness", "ability", "evolves_from", "is_ex"]
+
+
+def _indices(names: Iterable[str]) -> 'np.ndarray':
+    return np.array([getattr(layout, name) for name in names], dtype=np.intp)
+
+
+def _numbered(prefix: str) -> 'np.ndarray':
+    """Indices of prefix_0, prefix_1, ... in the layout"""
+    names = []
+    while hasattr(layout, f"{prefix}_{len(names)}"):
+        names.append(f"{prefix}_{len(names)}")
+    return _indices(names)
+
+
+class _SlotLayout:
+    """State indices of one Pokemon slot (e.g. "pa", "pb1", "oa", "ob3")"""
+
+    def __init__(self, prefix: str):
+        def field(name: str) -> Optional[int]:
+            return getattr(layout, f"{prefix}_pokemon_{name}", None)
+
+        self.static = _indices(f"{prefix}_pokemon_{name}" for name in STATIC_FIELDS)
+        self.energy = _indices(f"{prefix}_pokemon_energy_{name.lower()}" for name in _ENERGY_NAMES)
+        self.max_hp = field("max_hp")
+        self.poketool_id = field("poketool_id")
+        self.can_retreat = field("can_retreat")
+        self.damage_nerf = field("damage_nerf")
+        self.damage_taken = field("damage_taken")
+        # Only on the player's own slots / active slots
+        self.placed_or_evolved = field("placed_or_evolved_this_turn")
+        self.used_ability = field("used_ability_this_turn")
+        self.status = None
+        if field("status_poisoned") is not None:
+            self.status = _indices(f"{prefix}_pokemon_status_{name}"
+                                   for name in ("poisoned", "burned", "paralyzed", "asleep", "confused"))
+
+
+class StateEncoder:
+    """Writes a BattleEngine position into a float32 array of STATE_SIZE values.
+
+    Card ids are mapped to 1-based indices into a sorted card vocabulary (0 means empty).
+    Attack slots hold base damage and the ability field is 1 when the Pokemon has an
+    ability, since v3 attacks and abilities have no ids. Static per-card features are
+    computed once per card id and copied into the buffer with one fancy-index write.
+    """
+
+    def __init__(self, card_ids: Optional[Iterable[str]] = None, card_names: Optional[Dict[str, str]] = None):
+        if np is None:
+            raise ImportError("StateEncoder requires numpy")
+        if card_ids is None:
+            card_ids, card_names = self._load_card_db()
+        self.card_index: Dict[str, int] = {card_id: i + 1 for i, card_id in enumerate(sorted(set(card_ids)))}
+        # Pokemon name -> card index, for evolves_from (which stores a name)
+        self.name_index: Dict[str, int] = {}
+        for card_id, name in sorted((card_names or {}).items()):
+            self.name_index.setdefault(name, self.card_index[card_id])
+
+        self._player_slots = [_SlotLayout(prefix) for prefix in ("pa", "pb1", "pb2", "pb3")]
+        self._opponent_slots = [_SlotLayout(prefix) for prefix in ("oa", "ob1", "ob2", "ob3")]
+        self._hand = _numbered("p_hand_card_id")
+        self._deck = _numbered("p_deck_card_id")
+        self._opponent_cards = _numbered("o_original_card_id")
+        self._opponent_discard = _numbered("o_discard_pile_card_id")
+        self._static_cache: Dict[str, 'np.ndarray'] = {}
+
+    @staticmethod
+    def _load_card_db():
+        from v3.importers.json_card_importer import JsonCardImporter
+        importer = JsonCardImporter.shared()
+        cards = {**importer.pokemon, **importer.items, **importer.supporters, **importer.tools}
+        return list(cards), {card_id: card.name for card_id, card in importer.pokemon.items()}
+
+    def empty(self, n: Optional[int] = None) -> 'np.ndarray':
+        """Zeroed state buffer - one state, or (n, STATE_SIZE) for a batch"""
+        shape = STATE_SIZE if n is None else (n, STATE_SIZE)
+        return np.zeros(shape, dtype=np.float32)
+
+    def encode(self, engine: 'BattleEngine', player: Optional['Player'] = None,
+               out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """Encode the game from player's view (default: the player to move) into out"""
+        if out is None:
+            out = self.empty()
+        else:
+            out.fill(0.0)
+        if player is None:
+            player = engine._get_current_player()
+        opponent = engine._get_opponent(player)
+
+        for slot, pokemon in zip(self._player_slots, [player.active_pokemon] + player.bench_pokemons):
+            if pokemon is not None:
+                self._write_pokemon(out, slot, pokemon)
+        for slot, pokemon in zip(self._opponent_slots, [opponent.active_pokemon] + opponent.bench_pokemons):
+            if pokemon is not None:
+                self._write_pokemon(out, slot, pokemon)
+
+        # Zone contents; hidden orderings (deck, opponent's cards) are written sorted
+        out[layout.p_card_count] = len(player.cards_in_hand) + len(player.deck)
+        self._write_ids(out, self._hand, [card.id for card in player.cards_in_hand])
+        self._write_ids(out, self._deck, sorted(card.id for card in player.deck))
+        out[layout.probability_of_drawing_card] = 1.0 / len(player.deck) if player.deck else 0.0
+        self._write_ids(out, self._opponent_cards, sorted(card.id for card in self._all_cards(opponent)))
+        self._write_ids(out, self._opponent_discard, [card.id for card in opponent.discard_pile])
+
+        out[layout.p_hand_card_count] = len(player.cards_in_hand)
+        out[layout.p_deck_card_count] = len(player.deck)
+        out[layout.o_hand_card_count] = len(opponent.cards_in_hand)
+        out[layout.o_deck_card_count] = len(opponent.deck)
+        out[layout.p_energy_type_available_to_attach] = ENERGY_CODES.get(player.energy_zone.current, 0)
+        out[layout.p_next_turn_energy_type_available_to_attach] = ENERGY_CODES.get(player.energy_zone.next, 0)
+        out[layout.o_energy_type_available_to_attach] = ENERGY_CODES.get(opponent.energy_zone.current, 0)
+        out[layout.o_next_turn_energy_type_available_to_attach] = ENERGY_CODES.get(opponent.energy_zone.next, 0)
+        out[layout.p_score] = player.points
+        out[layout.o_score] = opponent.points
+        out[layout.turn_number] = engine.turn
+        return out
+
+    def encode_batch(self, engines: Sequence['BattleEngine'], players: Optional[Sequence['Player']] = None,
+                     out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """Encode many games into an (N, STATE_SIZE) array, one row per engine"""
+        if out is None:
+            out = self.empty(len(engines))
+        for i, engine in enumerate(engines):
+            self.encode(engine, players[i] if players is not None else None, out=out[i])
+        return out
+
+    def _write_pokemon(self, out: 'np.ndarray', slot: _SlotLayout, pokemon: 'Pokemon'):
+        out[slot.static] = self._static_features(pokemon)
+        energies = pokemon.equipped_energies
+        out[slot.energy] = [energies.get(energy_type, 0) if energy_type else 0 for energy_type in ENERGY_ORDER]
+        out[slot.max_hp] = pokemon.max_health()
+        out[slot.damage_taken] = pokemon.damage_taken
+        out[slot.damage_nerf] = pokemon.damage_nerf
+        out[slot.can_retreat] = pokemon.can_retreat()
+        if pokemon.poketool is not None:
+            out[slot.poketool_id] = self.card_index.get(pokemon.poketool.id, 0)
+        if slot.placed_or_evolved is not None:
+            out[slot.placed_or_evolved] = pokemon.placed_or_evolved_this_turn
+            out[slot.used_ability] = pokemon.used_ability_this_turn
+        if slot.status is not None and pokemon.status_effects:
+            out[slot.status] = [any(isinstance(s, status) for s in pokemon.status_effects)
+                                for status in STATUS_ORDER]
+
+    def _static_features(self, pokemon: 'Pokemon') -> 'np.ndarray':
+        features = self._static_cache.get(pokemon.id)
+        if features is None:
+            damages = [attack.damage or 0 for attack in pokemon.attacks[:2]]
+            damages += [0] * (2 - len(damages))
+            features = np.array([
+                self.card_index.get(pokemon.id, 0),
+                ENERGY_CODES.get(pokemon.element, 0),
+                STAGE_CODES.get(pokemon.subtype, 0),
+                damages[0],
+                damages[1],
+                pokemon.retreat_cost or 0,
+                ENERGY_CODES.get(pokemon.weakness, 0),
+                1 if pokemon.abilities else 0,
+                self.name_index.get(pokemon.evolves_from, 0),
+                1 if pokemon.is_ex else 0,
+            ], dtype=np.float32)
+            self._static_cache[pokemon.id] = features
+        return features
+
+    def _write_ids(self, out: 'np.ndarray', indices: 'np.ndarray', card_ids: List[str]):
+        count = min(len(indices), len(card_ids))
+        if count:
+            out[indices[:count]] = [self.card_index.get(card_id, 0) for card_id in card_ids[:count]]
+
+    @staticmethod
+    def _all_cards(player: 'Player') -> List[Card]:
+        """Every card the player owns, wherever it currently is"""
+        cards = list(player.deck) + list(player.cards_in_hand) + list(player.discard_pile)
+        for pokemon in [player.active_pokemon] + player.bench_pokemons:
+            if pokemon is not None:
+                cards.append(pokemon)
+                if pokemon.poketool is not None:
+                    cards.append(pokemon.poketool)
+        return cards
+
+
+_default_encoder: Optional[StateEncoder] = None
+
+
+def default_encoder() -> StateEncoder:
+    """Shared encoder over the full v3 card database (built on first use)"""
+    global _default_encoder
+    if _default_encoder is None:
+        _default_encoder = StateEncoder()
+    return _default_encoder
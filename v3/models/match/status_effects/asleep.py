@@ -1,5 +1,4 @@
 """Asleep status effect"""
-import random
 from .status_effect import StatusEffect
 
 class Asleep(StatusEffect):
@@ -10,12 +9,12 @@ class Asleep(StatusEffect):
             pokemon.status_effects = []
         if self not in pokemon.status_effects:
             pokemon.status_effects.append(self)
-            battle_engine.log(f"{pokemon.name} is now Asleep")
+            battle_engine.log("%s is now Asleep", pokemon.name)
     
     def check_removal(self, pokemon, battle_engine):
         # Coin flip: heads = wake up
-        if random.random() < 0.5:
-            battle_engine.log(f"{pokemon.name} woke up!")
+        if battle_engine.rng.random() < 0.5:
+            battle_engine.log("%s woke up!", pokemon.name)
             return True
         return False
     
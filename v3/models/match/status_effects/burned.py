@@ -1,5 +1,4 @@
 """Burned status effect"""
-import random
 from .status_effect import StatusEffect
 
 class Burned(StatusEffect):
@@ -10,7 +9,7 @@ class Burned(StatusEffect):
             pokemon.status_effects = []
         if self not in pokemon.status_effects:
             pokemon.status_effects.append(self)
-            battle_engine.log(f"{pokemon.name} is now Burned")
+            battle_engine.log("%s is now Burned", pokemon.name)
     
     def check_removal(self, pokemon, battle_engine):
         # Burn removal is handled in apply_damage
@@ -23,13 +22,13 @@ class Burned(StatusEffect):
     def apply_damage(self, pokemon, battle_engine):
         """Apply burn damage between turns"""
         # Heads = 20 damage, tails = remove
-        if random.random() < 0.5:
-            battle_engine.log(f"{pokemon.name} takes 20 damage from Burn")
+        if battle_engine.rng.random() < 0.5:
+            battle_engine.log("%s takes 20 damage from Burn", pokemon.name)
             pokemon.damage_taken += 20
             # Check for knockout
             if pokemon.damage_taken >= pokemon.health:
                 battle_engine._handle_knockout(pokemon, battle_engine._get_player_with_pokemon(pokemon))
         else:
-            battle_engine.log(f"{pokemon.name} recovered from Burn")
+            battle_engine.log("%s recovered from Burn", pokemon.name)
             self.remove(pokemon)
 
@@ -1,5 +1,4 @@
 """Confused status effect"""
-import random
 from .status_effect import StatusEffect
 
 class Confused(StatusEffect):
@@ -10,7 +9,7 @@ class Confused(StatusEffect):
             pokemon.status_effects = []
         if self not in pokemon.status_effects:
             pokemon.status_effects.append(self)
-            battle_engine.log(f"{pokemon.name} is now Confused")
+            battle_engine.log("%s is now Confused", pokemon.name)
     
     def check_removal(self, pokemon, battle_engine):
         # Confusion doesn't auto-remove
@@ -22,8 +21,8 @@ class Confused(StatusEffect):
     
     def check_attack_self(self, pokemon, battle_engine):
         """Check if Pokemon attacks itself (tails = attack self)"""
-        if random.random() < 0.5:
-            battle_engine.log(f"{pokemon.name} is confused and attacks itself!")
+        if battle_engine.rng.random() < 0.5:
+            battle_engine.log("%s is confused and attacks itself!", pokemon.name)
             pokemon.damage_taken += 30
             # Check for knockout
             if pokemon.damage_taken >= pokemon.health:
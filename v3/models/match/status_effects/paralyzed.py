@@ -9,7 +9,7 @@ class Paralyzed(StatusEffect):
             pokemon.status_effects = []
         if self not in pokemon.status_effects:
             pokemon.status_effects.append(self)
-            battle_engine.log(f"{pokemon.name} is now Paralyzed")
+            battle_engine.log("%s is now Paralyzed", pokemon.name)
     
     def check_removal(self, pokemon, battle_engine):
         # Removed after one turn
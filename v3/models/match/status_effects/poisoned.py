@@ -9,7 +9,7 @@ class Poisoned(StatusEffect):
             pokemon.status_effects = []
         if self not in pokemon.status_effects:
             pokemon.status_effects.append(self)
-            battle_engine.log(f"{pokemon.name} is Poisoned")
+            battle_engine.log("%s is Poisoned", pokemon.name)
     
     def check_removal(self, pokemon, battle_engine):
         # Poison doesn't auto-remove
@@ -21,7 +21,7 @@ class Poisoned(StatusEffect):
     
     def apply_damage(self, pokemon, battle_engine):
         """Apply poison damage between turns"""
-        battle_engine.log(f"{pokemon.name} takes 10 damage from Poison")
+        battle_engine.log("%s takes 10 damage from Poison", pokemon.name)
         pokemon.damage_taken += 10
         # Check for knockout
         if pokemon.damage_taken >= pokemon.health:
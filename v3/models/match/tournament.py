@@ -0,0 +1,273 @@
+import json
+import multiprocessing
+import os
+import queue
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from v3.models.agents.random_agent import RandomAgent
+from v3.models.match.batch_runner import GameConfig, GameResult, game_seed, play_game
+from v3.models.match.match_stats import Z_95, SequentialStop, wilson_interval
+
+"""Round-robin tournaments: every deck against every other deck, as a win-rate matrix"""
+
+
+@dataclass
+class Entrant:
+    """A deck taking part in a tournament"""
+    name: str
+    deck: List
+    energy_types: List[str]
+
+
+@dataclass
+class PairingResult:
+    """Tally of one pairing from deck1's side (deck1 always sits in seat Player 1)"""
+    deck1: str
+    deck2: str
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    stopped_by: Optional[str] = None  # SequentialStop reason when the pairing ended early
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def score(self) -> float:
+        """deck1's win rate with draws counted as half a win"""
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.5
+
+    def interval(self, z: float = Z_95) -> Tuple[float, float]:
+        return wilson_interval(self.wins + 0.5 * self.draws, self.games, z)
+
+    def width(self, z: float = Z_95) -> float:
+        low, high = self.interval(z)
+        return high - low
+
+    def add(self, result: GameResult):
+        if result.winner == "Player 1":
+            self.wins += 1
+        elif result.winner == "Player 2":
+            self.losses += 1
+        else:
+            self.draws += 1
+
+
+class TournamentResult:
+    """All pairing tallies of a tournament, readable as a deck x deck matrix"""
+
+    def __init__(self, names: List[str], pairings: Dict[Tuple[int, int], PairingResult], z: float = Z_95,
+                 games_per_pairing: Optional[int] = None):
+        self.names = names
+        self.pairings = pairings
+        self.z = z
+        self.games_per_pairing = games_per_pairing
+
+    def cell(self, row: int, column: int) -> Optional[Tuple[float, float, float]]:
+        """(score, low, high) of deck `row` against deck `column`, None if they never met"""
+        pairing = self.pairings.get((row, column))
+        if pairing is not None:
+            low, high = pairing.interval(self.z)
+            return pairing.score, low, high
+        pairing = self.pairings.get((column, row))
+        if pairing is not None:
+            # The other deck's view: its wins are our losses
+            low, high = pairing.interval(self.z)
+            return 1 - pairing.score, 1 - high, 1 - low
+        return None
+
+    def matrix(self) -> List[List[Optional[float]]]:
+        """Row deck's score against each column deck"""
+        size = len(self.names)
+        return [[(cell[0] if cell else None) for cell in (self.cell(r, c) for c in range(size))]
+                for r in range(size)]
+
+    def total_games(self) -> int:
+        return sum(pairing.games for pairing in self.pairings.values())
+
+    def games_saved(self) -> int:
+        """Games of the full budget not played because pairings stopped early"""
+        if self.games_per_pairing is None:
+            return 0
+        return len(self.pairings) * self.games_per_pairing - self.total_games()
+
+    def to_dict(self) -> Dict:
+        return {
+            "decks": self.names,
+            "z": self.z,
+            "pairings": [
+                {"deck1": p.deck1, "deck2": p.deck2, "wins": p.wins, "losses": p.losses, "draws": p.draws,
+                 "score": p.score, "low": p.interval(self.z)[0], "high": p.interval(self.z)[1],
+                 "stopped_by": p.stopped_by}
+                for _, p in sorted(self.pairings.items())
+            ],
+            "matrix": self.matrix(),
+            "games_saved": self.games_saved(),
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """JSON text of to_dict(), also written to path when given"""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+        return text
+
+    def format_table(self) -> str:
+        """Text matrix: row deck's score against column deck, with the interval half-width"""
+        width = max(len(name) for name in self.names)
+        columns = [str(i + 1) for i in range(len(self.names))]
+        lines = [" " * (width + 4) + "".join(f"{c:>11}" for c in columns)]
+        for r, name in enumerate(self.names):
+            cells = []
+            for c in range(len(self.names)):
+                cell = self.cell(r, c)
+                cells.append(f"{'-':>11}" if cell is None else
+                             f"{100 * cell[0]:>6.1f}±{50 * (cell[2] - cell[1]):<4.1f}")
+            lines.append(f"{r + 1:>2}. {name:<{width}}" + "".join(cells))
+        return "\n".join(lines)
+
+
+########## Worker Process ##########
+
+# Pairing configs, set once per worker by the pool initializer
+_worker_configs: Optional[List[GameConfig]] = None
+
+
+def _init_worker(configs: List[GameConfig]):
+    global _worker_configs
+    _worker_configs = configs
+
+
+def _run_pairing_chunk(task: Tuple[int, int, int, int]) -> Tuple[int, List[GameResult]]:
+    """Play games [start, start + count) of one pairing"""
+    pairing, start, count, pairing_seed = task
+    config = _worker_configs[pairing]
+    return pairing, [play_game(config, index, game_seed(pairing_seed, index)) for index in range(start, start + count)]
+
+
+class Tournament:
+    """Plays games_per_pairing games for every pair of entrants, across a process pool.
+
+    Games are handed out in chunks. With schedule="uncertainty" (the default) each new
+    chunk goes to the pairing whose win-rate interval is currently widest, so the most
+    uncertain cells fill first and a stopped or shortened run is spent where it matters;
+    "fixed" plays the pairings in order. Each game's seed comes from the tournament seed,
+    the pairing and the game index, so the final matrix does not depend on the schedule
+    or the worker count.
+
+    With a SequentialStop, a pairing gets no more chunks once its rule is met. The rule is
+    checked at every chunk boundary on the pairing's games in index order (chunks that
+    finish early wait for the ones before them), and games past the stopping chunk are
+    dropped, so early stops are as reproducible as the rest of the matrix.
+    """
+
+    SCHEDULES = ("uncertainty", "fixed")
+
+    def __init__(self, entrants: Sequence[Entrant], games_per_pairing: int = 100,
+                 workers: Optional[int] = None, seed: Optional[int] = None, mirrors: bool = False,
+                 chunk_size: Optional[int] = None, schedule: str = "uncertainty",
+                 agent1: Type = RandomAgent, agent2: Type = RandomAgent, z: float = Z_95,
+                 stop: Optional[SequentialStop] = None):
+        if schedule not in self.SCHEDULES:
+            raise ValueError(f"Unknown schedule '{schedule}' (choose from {', '.join(self.SCHEDULES)})")
+        self.entrants = list(entrants)
+        self.games_per_pairing = games_per_pairing
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.chunk_size = chunk_size or max(1, min(25, games_per_pairing // 4))
+        self.schedule = schedule
+        self.z = z
+        self.stop = stop
+
+        size = len(self.entrants)
+        self.pairs: List[Tuple[int, int]] = [(a, b) for a in range(size) for b in range(a if mirrors else a + 1, size)]
+        self.configs = [
+            GameConfig(self.entrants[a].deck, self.entrants[b].deck,
+                       self.entrants[a].energy_types, self.entrants[b].energy_types,
+                       agent1=agent1, agent2=agent2)
+            for a, b in self.pairs
+        ]
+        self.results = [PairingResult(self.entrants[a].name, self.entrants[b].name) for a, b in self.pairs]
+        self._scheduled = [0] * len(self.pairs)
+        self._pending: List[Dict[int, List[GameResult]]] = [{} for _ in self.pairs]  # Chunks by first game
+
+    def _pairing_seed(self, pairing: int) -> int:
+        return game_seed(self.seed, pairing)
+
+    def _next_task(self) -> Optional[Tuple[int, int, int, int]]:
+        """Next chunk to play, or None once every pairing has all its games scheduled"""
+        open_pairings = [i for i in range(len(self.pairs))
+                         if self._scheduled[i] < self.games_per_pairing and self.results[i].stopped_by is None]
+        if not open_pairings:
+            return None
+        if self.schedule == "uncertainty":
+            # Widest interval first; games already in flight count as a tie-break
+            pairing = max(open_pairings, key=lambda i: (self.results[i].width(self.z), -self._scheduled[i], -i))
+        else:
+            pairing = open_pairings[0]
+        start = self._scheduled[pairing]
+        count = min(self.chunk_size, self.games_per_pairing - start)
+        self._scheduled[pairing] += count
+        return pairing, start, count, self._pairing_seed(pairing)
+
+    def _record(self, pairing: int, results: List[GameResult]):
+        """Count a finished chunk once every chunk before it in the pairing is counted"""
+        tally, pending = self.results[pairing], self._pending[pairing]
+        if tally.stopped_by is not None:
+            return
+        pending[results[0].game_index] = results
+        while tally.games in pending:
+            for result in pending.pop(tally.games):
+                tally.add(result)
+            if self.stop is not None:
+                tally.stopped_by = self.stop.decision(tally.wins, tally.losses, tally.draws)
+                if tally.stopped_by is not None:
+                    pending.clear()
+                    break
+
+    def run(self, progress: Optional[Callable[['Tournament'], None]] = None) -> TournamentResult:
+        """Play every pairing; progress (if given) is called after each finished chunk"""
+        if self.workers == 1:
+            _init_worker(self.configs)
+            while True:
+                task = self._next_task()
+                if task is None:
+                    break
+                self._record(*_run_pairing_chunk(task))
+                if progress:
+                    progress(self)
+            return self.result()
+
+        finished: 'queue.Queue' = queue.Queue()
+        in_flight = 0
+        # A couple of chunks per worker keeps the pool busy while leaving later
+        # chunks free to go to whichever pairing is most uncertain by then
+        max_in_flight = self.workers * 2
+        with multiprocessing.Pool(processes=self.workers, initializer=_init_worker,
+                                  initargs=(self.configs,)) as pool:
+            while True:
+                while in_flight < max_in_flight:
+                    task = self._next_task()
+                    if task is None:
+                        break
+                    pool.apply_async(_run_pairing_chunk, (task,), callback=finished.put,
+                                     error_callback=finished.put)
+                    in_flight += 1
+                if in_flight == 0:
+                    break
+                outcome = finished.get()
+                in_flight -= 1
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                self._record(*outcome)
+                if progress:
+                    progress(self)
+        return self.result()
+
+    def result(self) -> TournamentResult:
+        return TournamentResult([entrant.name for entrant in self.entrants],
+                                dict(zip(self.pairs, self.results)), self.z, self.games_per_pairing)